@@ -1,7 +1,10 @@
-from typing import Any
+import time
+from typing import Any, Callable
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.routing import APIRoute
 
+from app.core.observability import metrics_registry
 from app.infrastructure.external.synapse_acl import (
     SynapseACL,
     SynapseACLError,
@@ -12,7 +15,35 @@ from app.infrastructure.external.synapse_acl import (
 SynapseGatewayService = SynapseACL
 GatewayProxyError = SynapseACLError
 
-router = APIRouter(tags=["gateway"])
+
+class _TimedProxyRoute(APIRoute):
+    """프록시 라우트 지연을 경로 템플릿/메서드/상태 코드별 히스토그램으로 기록한다."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        route = self.path_format
+
+        async def timed_handler(request: Request) -> Response:
+            start = time.perf_counter()
+            status = 500
+            try:
+                response = await handler(request)
+                status = response.status_code
+                return response
+            except HTTPException as err:
+                status = err.status_code
+                raise
+            finally:
+                metrics_registry.observe(
+                    "core_gateway_proxy_duration_seconds",
+                    time.perf_counter() - start,
+                    {"route": route, "method": request.method, "status": status},
+                )
+
+        return timed_handler
+
+
+router = APIRouter(tags=["gateway"], route_class=_TimedProxyRoute)
 
 
 def get_synapse_gateway() -> SynapseACL:
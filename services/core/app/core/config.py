@@ -45,6 +45,9 @@ class Settings(BaseSettings):
     MCP_EXECUTE_PATH: str = "/tools/execute"
     MCP_TIMEOUT_SECONDS: float = 15.0
 
+    # WorkItem Event Store: N개 이벤트마다 Aggregate 스냅샷 저장 (0이면 스냅샷 없이 전체 리플레이)
+    EVENT_STORE_SNAPSHOT_INTERVAL: int = 100
+
     # Seed dev user (only when SEED_DEV_USER=1 and no users exist)
     SEED_DEV_USER: bool = False
     SEED_DEV_EMAIL: str = "admin@local.axiom"
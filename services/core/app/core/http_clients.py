@@ -0,0 +1,227 @@
+"""서비스 간 호출용 공유 HTTP 클라이언트 레지스트리.
+
+호출마다 ``httpx.AsyncClient``를 새로 만들면 매 홉마다 TCP(+TLS) 연결을 다시 맺고
+keep-alive를 잃는다. 이 모듈은 대상 서비스(target)별로 연결 풀을 하나씩 유지하고
+
+  - 대상별 연결 한도 / keep-alive / 기본 타임아웃
+  - 멱등 요청(GET/HEAD/OPTIONS/PUT/DELETE)의 재시도 — 재시도 예산(최근 요청 대비 비율)으로 폭주 방지
+  - 대상별 CircuitBreaker — 연결 실패/5xx가 누적되면 빠르게 실패
+
+를 제공한다. 클라이언트는 첫 사용 시 지연 생성하고, 앱 종료 시 ``http_clients.aclose()``로 닫는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from app.core.resilience import CircuitBreaker, CircuitOpenException
+
+logger = logging.getLogger("axiom.http")
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRYABLE_STATUS = frozenset({502, 503, 504})
+
+
+@dataclass(frozen=True)
+class TargetConfig:
+    """대상 서비스별 연결/타임아웃/재시도 설정."""
+
+    timeout: float = 10.0
+    connect_timeout: float = 3.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    max_retries: int = 2
+    retry_backoff: float = 0.2
+    # 재시도는 최근 요청 수 × ratio 만큼만 허용 (+ min_retry_tokens 여유분)
+    retry_budget_ratio: float = 0.2
+    min_retry_tokens: float = 10.0
+    breaker_failures: int = 5
+    breaker_reset_seconds: int = 30
+
+
+class RetryBudget:
+    """요청마다 ratio 만큼 토큰을 적립하고 재시도 1회에 토큰 1개를 쓴다.
+
+    장애 시 모든 요청이 재시도로 부하를 몇 배로 키우는 것을 막는다.
+    """
+
+    def __init__(self, ratio: float, min_tokens: float) -> None:
+        self._ratio = ratio
+        self._max_tokens = max(min_tokens, 1.0)
+        self._tokens = self._max_tokens
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_request(self) -> None:
+        self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class ServiceClient:
+    """대상 서비스 하나의 풀링된 클라이언트 + 재시도 예산 + 서킷 브레이커."""
+
+    def __init__(
+        self,
+        name: str,
+        config: TargetConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.name = name
+        self.config = config or TargetConfig()
+        self._transport = transport
+        self.breaker = CircuitBreaker(
+            self.config.breaker_failures, self.config.breaker_reset_seconds, name=f"http:{name}",
+        )
+        self.retry_budget = RetryBudget(self.config.retry_budget_ratio, self.config.min_retry_tokens)
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def _build_client(self) -> httpx.AsyncClient:
+        cfg = self.config
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(cfg.timeout, connect=cfg.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=cfg.max_connections,
+                max_keepalive_connections=cfg.max_keepalive_connections,
+                keepalive_expiry=cfg.keepalive_expiry,
+            ),
+            transport=self._transport,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 연결 풀은 이벤트 루프에 묶이므로 루프가 바뀌면(테스트/스크립트) 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                self._close_stale(self._client, self._loop, loop)
+            self._client = self._build_client()
+            self._loop = loop
+        return self._client
+
+    def _close_stale(
+        self,
+        stale: httpx.AsyncClient,
+        stale_loop: asyncio.AbstractEventLoop | None,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """루프가 바뀌어 버려지는 클라이언트의 연결 풀을 닫는다 (누수 방지).
+
+        이전 루프가 아직 돌고 있으면(다른 스레드) 그 루프에서, 아니면 현재 루프에서 닫는다.
+        """
+        async def close() -> None:
+            try:
+                await stale.aclose()
+            except Exception:  # 이미 닫힌 루프에 묶인 소켓 등 — 정리는 best-effort
+                logger.debug("stale http client %s close failed", self.name, exc_info=True)
+
+        if stale_loop is not None and stale_loop.is_running() and not stale_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(close(), stale_loop)
+            return
+        task = loop.create_task(close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: float | None = None,
+        retry: bool | None = None,
+        max_retries: int | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """요청을 보내고 응답을 그대로 반환한다 (상태 코드 해석은 호출자 몫).
+
+        retry=None이면 멱등 메서드만 재시도한다. max_retries는 대상 기본값을 호출 단위로 덮어쓴다.
+        서킷이 열려 있으면 CircuitOpenException, 연결 오류/타임아웃은 재시도 후에도
+        실패하면 httpx 예외를 그대로 올린다.
+        """
+        if not self.breaker.allow_request():
+            raise CircuitOpenException(f"Circuit for {self.name} is OPEN. Failing fast.")
+
+        method = method.upper()
+        retryable = method in _IDEMPOTENT_METHODS if retry is None else retry
+        retries = self.config.max_retries if max_retries is None else max_retries
+        attempts = 1 + (retries if retryable else 0)
+        if timeout is not None:
+            kwargs["timeout"] = httpx.Timeout(timeout, connect=min(self.config.connect_timeout, timeout))
+        self.retry_budget.record_request()
+
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as exc:
+                self.breaker.record_failure()
+                if last or not self.retry_budget.try_spend():
+                    raise
+                logger.warning("http %s %s retry %d/%d: %s", self.name, method, attempt + 1, attempts - 1, exc)
+            else:
+                if response.status_code not in _RETRYABLE_STATUS:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if last or not self.retry_budget.try_spend():
+                    return response
+                await response.aclose()
+                logger.warning(
+                    "http %s %s retry %d/%d: status %d", self.name, method, attempt + 1, attempts - 1,
+                    response.status_code,
+                )
+            await asyncio.sleep(self.config.retry_backoff * (2 ** attempt))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def aclose(self) -> None:
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._closing if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+class HttpClientRegistry:
+    """이름 → ServiceClient. 설정은 configure()로 등록하고 없으면 기본값."""
+
+    def __init__(self) -> None:
+        self._configs: dict[str, TargetConfig] = {}
+        self._clients: dict[str, ServiceClient] = {}
+
+    def configure(self, name: str, config: TargetConfig) -> None:
+        """대상 설정 등록 — 첫 get() 이전(모듈 import 시점)에 호출해야 적용된다."""
+        self._configs[name] = config
+
+    def get(self, name: str) -> ServiceClient:
+        client = self._clients.get(name)
+        if client is None:
+            client = ServiceClient(name, self._configs.get(name))
+            self._clients[name] = client
+        return client
+
+    async def aclose(self) -> None:
+        for client in list(self._clients.values()):
+            try:
+                await client.aclose()
+            except Exception:
+                logger.warning("http client %s close failed", client.name, exc_info=True)
+        self._clients.clear()
+
+
+http_clients = HttpClientRegistry()
@@ -1,28 +1,240 @@
+"""Core 인프로세스 메트릭 레지스트리 (Prometheus text exposition).
+
+counter/gauge는 단순 dict이고, histogram은 스레드별 샤드에 누적해
+관측 경로에서 락을 잡지 않는다. 샤드는 렌더링 시점에만 합산한다.
+"""
 from __future__ import annotations
 
+import functools
+import inspect
+import math
+import threading
+import time
+from bisect import bisect_left
 from collections import defaultdict
+from typing import Any, Callable, Iterable
+
+# 지연(초) 기본 버킷 — 게이트웨이/워커/외부 호출 공통
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = tuple[tuple[str, Any], ...]
+
+
+def _label_key(labels: dict[str, Any] | None) -> LabelKey:
+    # 값의 str() 변환은 렌더링 시점으로 미룬다 (관측 핫패스 비용 절감)
+    if not labels:
+        return ()
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(key: LabelKey, extra: tuple[str, str] | None = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+class _HistogramShard:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class Histogram:
+    """누적 버킷 히스토그램.
+
+    관측은 현재 스레드의 (라벨별) 샤드만 갱신하므로 락이 없다.
+    샤드 생성(스레드·라벨 조합당 1회)과 렌더링 합산만 락을 잡는다.
+    """
+
+    def __init__(self, name: str, help_text: str = "", buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.help = help_text or name
+        self.buckets: tuple[float, ...] = tuple(sorted({float(b) for b in buckets if b != math.inf}))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: dict[LabelKey, list[_HistogramShard]] = {}
+
+    def _new_shard(self, key: LabelKey) -> _HistogramShard:
+        shards = getattr(self._local, "shards", None)
+        if shards is None:
+            shards = self._local.shards = {}
+        shard = _HistogramShard(len(self.buckets) + 1)
+        with self._lock:
+            self._shards.setdefault(key, []).append(shard)
+        shards[key] = shard
+        return shard
+
+    def observe(self, value: float, labels: dict[str, Any] | None = None) -> None:
+        self.observe_key(value, _label_key(labels))
+
+    def observe_key(self, value: float, key: LabelKey = ()) -> None:
+        """미리 만든 라벨 키로 관측 (핫패스에서 dict→tuple 변환 생략)."""
+        try:
+            shard = self._local.shards[key]
+        except (AttributeError, KeyError):
+            shard = self._new_shard(key)
+        # 버킷 상한은 le(<=)이므로 bisect_left — 마지막 칸은 +Inf
+        shard.counts[bisect_left(self.buckets, value)] += 1
+        shard.sum += value
+
+    def snapshot(self, labels: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """라벨 조합 하나의 합산 결과 {"buckets": [(le, 누적)], "sum", "count"}."""
+        return self._merge(_label_key(labels))
+
+    def label_keys(self) -> list[LabelKey]:
+        with self._lock:
+            return sorted(self._shards, key=str)
+
+    def _merge(self, key: LabelKey) -> dict[str, Any] | None:
+        with self._lock:
+            shards = list(self._shards.get(key, ()))
+        if not shards:
+            return None
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        for shard in shards:
+            for i, c in enumerate(shard.counts):
+                counts[i] += c
+            total += shard.sum
+        cumulative, running = [], 0
+        for bound, c in zip(self.buckets + (math.inf,), counts):
+            running += c
+            cumulative.append((bound, running))
+        return {"buckets": cumulative, "sum": total, "count": running}
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key in self.label_keys():
+            merged = self._merge(key)
+            if merged is None:
+                continue
+            for bound, cumulative in merged["buckets"]:
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(merged['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {merged['count']}")
+        return lines
+
+
+class _Timer:
+    """with 블록 소요 시간을 히스토그램에 기록 (동기/비동기 코드 모두 사용 가능)."""
+
+    __slots__ = ("_histogram", "_key", "_start")
+
+    def __init__(self, histogram: Histogram, key: LabelKey) -> None:
+        self._histogram = histogram
+        self._key = key
+        self._start = 0.0
+
+    def __enter__(self) -> _Timer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        self._histogram.observe_key(time.perf_counter() - self._start, self._key)
+        return False
 
 
 class MetricsRegistry:
     def __init__(self) -> None:
         self._counters: dict[str, float] = defaultdict(float)
         self._gauges: dict[str, float] = defaultdict(float)
+        self._labelled_counters: dict[str, dict[LabelKey, float]] = defaultdict(lambda: defaultdict(float))
+        self._labelled_gauges: dict[str, dict[LabelKey, float]] = defaultdict(dict)
+        self._histograms: dict[str, Histogram] = {}
+        self._help: dict[str, str] = {}
+        self._lock = threading.Lock()
 
-    def inc(self, name: str, value: float = 1.0) -> None:
-        self._counters[name] += value
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
 
-    def set_gauge(self, name: str, value: float) -> None:
-        self._gauges[name] = value
+    def inc(self, name: str, value: float = 1.0, labels: dict[str, Any] | None = None) -> None:
+        if labels:
+            self._labelled_counters[name][_label_key(labels)] += value
+        else:
+            self._counters[name] += value
 
-    def get_counter(self, name: str) -> float:
+    def set_gauge(self, name: str, value: float, labels: dict[str, Any] | None = None) -> None:
+        if labels:
+            self._labelled_gauges[name][_label_key(labels)] = value
+        else:
+            self._gauges[name] = value
+
+    def get_counter(self, name: str, labels: dict[str, Any] | None = None) -> float:
+        if labels:
+            return self._labelled_counters.get(name, {}).get(_label_key(labels), 0.0)
         return self._counters.get(name, 0.0)
 
-    def get_gauge(self, name: str) -> float:
+    def get_gauge(self, name: str, labels: dict[str, Any] | None = None) -> float:
+        if labels:
+            return self._labelled_gauges.get(name, {}).get(_label_key(labels), 0.0)
         return self._gauges.get(name, 0.0)
 
+    # ── Histogram ──
+
+    def histogram(self, name: str, help_text: str = "", buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        """이름으로 히스토그램을 얻거나 만든다 (버킷은 최초 등록 시에만 적용)."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = Histogram(name, help_text or self._help.get(name, ""), buckets)
+                    self._histograms[name] = histogram
+        return histogram
+
+    def observe(self, name: str, value: float, labels: dict[str, Any] | None = None) -> None:
+        histogram = self._histograms.get(name) or self.histogram(name)
+        histogram.observe_key(value, _label_key(labels))
+
+    def time(self, name: str, labels: dict[str, Any] | None = None) -> _Timer:
+        """``with metrics_registry.time("x_seconds"):`` — 블록 소요 시간을 관측."""
+        return _Timer(self._histograms.get(name) or self.histogram(name), _label_key(labels))
+
+    def timed(self, name: str, labels: dict[str, Any] | None = None) -> Callable[[Callable], Callable]:
+        """함수(동기/async) 호출 시간을 관측하는 데코레이터."""
+        key = _label_key(labels)
+
+        def decorator(func: Callable) -> Callable:
+            histogram = self.histogram(name)
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    with _Timer(histogram, key):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with _Timer(histogram, key):
+                    return func(*args, **kwargs)
+            return wrapper
+
+        return decorator
+
+    def get_histogram(self, name: str, labels: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        histogram = self._histograms.get(name)
+        return histogram.snapshot(labels) if histogram else None
+
     def reset(self) -> None:
         self._counters.clear()
         self._gauges.clear()
+        self._labelled_counters.clear()
+        self._labelled_gauges.clear()
+        with self._lock:
+            self._histograms.clear()
 
     def render_prometheus(self) -> str:
         lines = [
@@ -68,7 +280,38 @@ class MetricsRegistry:
             "# TYPE core_legacy_write_violations_total counter",
             f"core_legacy_write_violations_total {self.get_counter('core_legacy_write_violations_total')}",
         ]
+        lines.extend(self._render_dynamic(lines))
         return "\n".join(lines)
 
+    def _render_dynamic(self, fixed: list[str]) -> list[str]:
+        """위 고정 목록에 없는 counter/gauge, 라벨 시리즈, 히스토그램."""
+        declared = {line.split()[2] for line in fixed if line.startswith("# TYPE ")}
+        lines: list[str] = []
+        series: dict[str, tuple[str, dict[LabelKey, float]]] = {}
+        for kind, plain, labelled in (
+            ("counter", self._counters, self._labelled_counters),
+            ("gauge", self._gauges, self._labelled_gauges),
+        ):
+            for name, value in plain.items():
+                if name not in declared:
+                    series.setdefault(name, (kind, {}))[1][()] = value
+            for name, values in labelled.items():
+                series.setdefault(name, (kind, {}))[1].update(values)
+        for name in sorted(series):
+            kind, values = series[name]
+            lines.append(f"# HELP {name} {self._help.get(name, name)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key in sorted(values, key=str):
+                lines.append(f"{name}{_format_labels(key)} {_format_value(values[key])}")
+        for name in sorted(self._histograms):
+            lines.extend(self._histograms[name].render())
+        return lines
+
 
 metrics_registry = MetricsRegistry()
+
+metrics_registry.describe("core_worker_task_duration_seconds", "Worker task latency including retries")
+metrics_registry.describe("core_worker_task_retries_total", "Worker task retry attempts")
+metrics_registry.describe("core_gateway_proxy_duration_seconds", "Gateway proxy route latency")
+metrics_registry.describe("core_circuit_breaker_transitions_total", "Circuit breaker state transitions")
+metrics_registry.describe("core_circuit_breaker_state", "Circuit breaker state (0=closed, 1=half_open, 2=open)")
@@ -0,0 +1,197 @@
+"""Transactional Outbox 공용 릴레이 — 일괄 claim + Redis 파이프라인 발행.
+
+Core SyncWorker와 Synapse SynapseRelayWorker가 같은 릴레이 루틴을 쓴다.
+서비스 간 공유 패키지가 없으므로 Core(app/core/outbox_relay.py)와
+Synapse(app/events/outbox_relay.py)에 같은 내용으로 두고 함께 수정한다.
+
+한 번의 relay_once는 DB 왕복 2~3회 + Redis 왕복 1회로 끝난다.
+  1. claim   : SELECT ... WHERE status = 'PENDING' ORDER BY created_at
+               LIMIT $1 FOR UPDATE SKIP LOCKED  (여러 릴레이 인스턴스가 겹치지 않음)
+  2. publish : 모든 XADD를 파이프라인 하나로 전송 (transaction=False, 명령별 오류 수집)
+  3. mark    : UPDATE ... WHERE id = ANY($1)  (발행 성공분 일괄)
+               UPDATE ... FROM unnest(...)   (실패분 retry_count/status 일괄)
+
+conn은 asyncpg 스타일 인터페이스(fetch/execute, $n 플레이스홀더)를 가진 비동기 커넥션이며
+claim과 mark가 같은 트랜잭션이어야 한다 (트랜잭션 시작/커밋은 호출부 책임).
+SQL에는 '::' 캐스트 대신 CAST(...)를 써서 SQLAlchemy text() 어댑터로도 실행할 수 있다.
+"""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Protocol, Sequence
+
+MAX_RETRY = 3
+STREAM_MAXLEN = 10000
+
+
+class OutboxConnection(Protocol):
+    async def fetch(self, sql: str, *args: Any) -> Sequence[Any]: ...
+
+    async def execute(self, sql: str, *args: Any) -> Any: ...
+
+
+@dataclass
+class OutboxRow:
+    id: str
+    event_type: str
+    aggregate_type: str
+    aggregate_id: str
+    tenant_id: str
+    payload: str                      # JSON 문자열 (스트림 메시지에 그대로 실림)
+    created_at: datetime | None = None
+    retry_count: int = 0
+
+    @classmethod
+    def from_record(cls, record: Any) -> OutboxRow:
+        payload = record["payload"]
+        if not isinstance(payload, str):
+            payload = json.dumps(payload, ensure_ascii=True)
+        created_at = record["created_at"]
+        if created_at is not None and created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return cls(
+            id=record["id"],
+            event_type=record["event_type"],
+            aggregate_type=record["aggregate_type"],
+            aggregate_id=record["aggregate_id"],
+            tenant_id=record["tenant_id"] or "",
+            payload=payload,
+            created_at=created_at,
+            retry_count=record["retry_count"] or 0,
+        )
+
+    def body(self) -> dict[str, str]:
+        """Redis Stream 메시지 필드."""
+        return {
+            "event_id": self.id,
+            "event_type": self.event_type,
+            "aggregate_type": self.aggregate_type,
+            "aggregate_id": self.aggregate_id,
+            "tenant_id": self.tenant_id,
+            "payload": self.payload,
+        }
+
+
+@dataclass
+class RelayFailure:
+    row: OutboxRow
+    stream: str
+    error: str
+    retry_count: int                  # 이번 실패를 반영한 값
+    status: str                       # FAILED | DEAD_LETTER
+
+
+@dataclass
+class RelayResult:
+    published: list[OutboxRow] = field(default_factory=list)
+    failures: list[RelayFailure] = field(default_factory=list)
+    lags: list[float] = field(default_factory=list)   # 발행 시각 - created_at (초)
+
+    @property
+    def claimed(self) -> int:
+        return len(self.published) + len(self.failures)
+
+    @property
+    def max_lag(self) -> float | None:
+        return max(self.lags) if self.lags else None
+
+
+class OutboxRelay:
+    """outbox 테이블 하나를 Redis Streams로 릴레이한다."""
+
+    def __init__(
+        self,
+        table: str,
+        resolve_stream: Callable[[str], str],
+        max_retry: int = MAX_RETRY,
+        maxlen: int = STREAM_MAXLEN,
+    ) -> None:
+        self._table = table
+        self._resolve_stream = resolve_stream
+        self._max_retry = max_retry
+        self._maxlen = maxlen
+
+    async def claim(self, conn: OutboxConnection, limit: int) -> list[OutboxRow]:
+        records = await conn.fetch(
+            f"""
+            SELECT id, event_type, aggregate_type, aggregate_id, tenant_id,
+                   payload, created_at, retry_count
+            FROM {self._table}
+            WHERE status = 'PENDING'
+            ORDER BY created_at ASC
+            LIMIT $1
+            FOR UPDATE SKIP LOCKED
+            """,
+            limit,
+        )
+        return [OutboxRow.from_record(r) for r in records]
+
+    async def relay_once(self, conn: OutboxConnection, redis: Any, limit: int) -> RelayResult:
+        """PENDING 행을 claim → 파이프라인 발행 → 상태 일괄 갱신."""
+        rows = await self.claim(conn, limit)
+        result = RelayResult()
+        if not rows:
+            return result
+
+        streams = [self._resolve_stream(row.event_type) for row in rows]
+        errors = await self._publish(redis, rows, streams)
+        now = datetime.now(timezone.utc)
+
+        for row, stream, error in zip(rows, streams, errors):
+            if error is None:
+                result.published.append(row)
+                if row.created_at is not None:
+                    result.lags.append((now - row.created_at).total_seconds())
+                continue
+            retry = row.retry_count + 1
+            result.failures.append(RelayFailure(
+                row=row,
+                stream=stream,
+                error=error[:500],
+                retry_count=retry,
+                status="DEAD_LETTER" if retry >= self._max_retry else "FAILED",
+            ))
+
+        await self.mark(conn, result)
+        return result
+
+    async def mark(self, conn: OutboxConnection, result: RelayResult) -> None:
+        if result.published:
+            await conn.execute(
+                f"""
+                UPDATE {self._table}
+                SET status = 'PUBLISHED', published_at = now()
+                WHERE id = ANY(CAST($1 AS varchar[]))
+                """,
+                [row.id for row in result.published],
+            )
+        if result.failures:
+            await conn.execute(
+                f"""
+                UPDATE {self._table} AS o
+                SET status = f.status, retry_count = f.retry_count, last_error = f.last_error
+                FROM unnest(
+                    CAST($1 AS varchar[]), CAST($2 AS varchar[]),
+                    CAST($3 AS integer[]), CAST($4 AS text[])
+                ) AS f(id, status, retry_count, last_error)
+                WHERE o.id = f.id
+                """,
+                [f.row.id for f in result.failures],
+                [f.status for f in result.failures],
+                [f.retry_count for f in result.failures],
+                [f.error for f in result.failures],
+            )
+
+    async def _publish(self, redis: Any, rows: list[OutboxRow], streams: list[str]) -> list[str | None]:
+        """XADD 전체를 파이프라인 한 번으로 보내고 행별 오류 메시지(성공은 None)를 돌려준다."""
+        pipe = redis.pipeline(transaction=False)
+        for row, stream in zip(rows, streams):
+            pipe.xadd(stream, row.body(), maxlen=self._maxlen, approximate=True)
+        try:
+            replies = await pipe.execute(raise_on_error=False)
+        except Exception as err:
+            # 연결 자체가 실패하면 이번 배치 전체를 실패로 기록한다
+            return [str(err)] * len(rows)
+        return [str(reply) if isinstance(reply, Exception) else None for reply in replies]
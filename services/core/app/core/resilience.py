@@ -1,11 +1,17 @@
 import time
 from functools import wraps
 
+from app.core.observability import metrics_registry
+
+# core_circuit_breaker_state 게이지 값
+_STATE_VALUES = {"CLOSED": 0.0, "HALF_OPEN": 1.0, "OPEN": 2.0}
+
 class CircuitOpenException(Exception):
     pass
 
 class CircuitBreaker:
-    def __init__(self, max_failures: int = 3, reset_timeout: int = 60):
+    def __init__(self, max_failures: int = 3, reset_timeout: int = 60, name: str = "default"):
+        self.name = name
         self.max_failures = max_failures
         self.reset_timeout = reset_timeout
         self.failure_count = 0
@@ -16,11 +22,22 @@ class CircuitBreaker:
         self.failure_count += 1
         self.last_failure_time = time.time()
         if self.failure_count >= self.max_failures:
-            self.state = "OPEN"
+            self._transition("OPEN")
 
     def record_success(self):
         self.failure_count = 0
-        self.state = "CLOSED"
+        self._transition("CLOSED")
+
+    def _transition(self, new_state: str) -> None:
+        """상태 변경 시에만 전이 카운터/상태 게이지를 기록한다."""
+        if new_state == self.state:
+            return
+        metrics_registry.inc(
+            "core_circuit_breaker_transitions_total",
+            labels={"breaker": self.name, "from_state": self.state, "to_state": new_state},
+        )
+        metrics_registry.set_gauge("core_circuit_breaker_state", _STATE_VALUES[new_state], labels={"breaker": self.name})
+        self.state = new_state
 
     def allow_request(self) -> bool:
         if self.state == "CLOSED":
@@ -28,17 +45,20 @@ class CircuitBreaker:
             
         if self.state == "OPEN":
             if time.time() - self.last_failure_time > self.reset_timeout:
-                self.state = "HALF_OPEN"
+                self._transition("HALF_OPEN")
                 return True
             return False
             
         # HALF_OPEN
         return True
 
-def circuit_breaker(max_failures=3, reset_timeout=60):
-    cb = CircuitBreaker(max_failures, reset_timeout)
+def circuit_breaker(max_failures=3, reset_timeout=60, name: str | None = None):
+    cb = CircuitBreaker(max_failures, reset_timeout, name=name or "default")
     
     def decorator(func):
+        if name is None:
+            # 메트릭 라벨은 기본적으로 감싼 함수 이름
+            cb.name = func.__qualname__
         @wraps(func)
         async def wrapper(*args, **kwargs):
             if not cb.allow_request():
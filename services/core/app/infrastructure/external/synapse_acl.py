@@ -8,9 +8,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
-import httpx
-
 from app.core.config import settings
+from app.core.http_clients import ServiceClient, TargetConfig, http_clients
+from app.core.resilience import CircuitOpenException
+
+# Synapse 대상 풀 설정 — 게이트웨이 프록시가 동시에 몰리므로 keep-alive를 넉넉히 유지
+http_clients.configure(
+    "synapse",
+    TargetConfig(timeout=180.0, max_connections=200, max_keepalive_connections=50),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -72,6 +78,17 @@ class SynapseACL:
         self._base_url = (base_url or settings.SYNAPSE_BASE_URL).rstrip("/")
         self._service_token = service_token or settings.SYNAPSE_SERVICE_TOKEN
 
+    @property
+    def _http(self) -> ServiceClient:
+        return http_clients.get("synapse")
+
+    async def _send(self, method: str, url: str, **kwargs: Any):
+        """공유 풀로 요청. 서킷이 열려 있으면 503 SynapseACLError."""
+        try:
+            return await self._http.request(method, url, **kwargs)
+        except CircuitOpenException as exc:
+            raise SynapseACLError(503, str(exc)) from exc
+
     def _headers(self, tenant_id: str, extra: dict[str, str] | None = None) -> dict[str, str]:
         headers = {
             "Authorization": f"Bearer {self._service_token}",
@@ -87,15 +104,18 @@ class SynapseACL:
         self, query: str, tenant_id: str, timeout: float = 10.0
     ) -> list[OntologySearchResult]:
         """Synapse 그래프 검색 결과를 Core 내부 OntologySearchResult로 변환."""
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.post(
-                f"{self._base_url}/api/v3/synapse/graph/search",
-                json={"query": query},
-                headers=self._headers(tenant_id),
-            )
-            if resp.status_code >= 400:
-                raise SynapseACLError(resp.status_code, resp.text)
-            raw = resp.json()
+        # 검색은 읽기 전용이므로 POST여도 재시도 허용
+        resp = await self._send(
+            "POST",
+            f"{self._base_url}/api/v3/synapse/graph/search",
+            json={"query": query},
+            headers=self._headers(tenant_id),
+            timeout=timeout,
+            retry=True,
+        )
+        if resp.status_code >= 400:
+            raise SynapseACLError(resp.status_code, resp.text)
+        raw = resp.json()
 
         return self._translate_search_results(raw)
 
@@ -135,16 +155,17 @@ class SynapseACL:
         self, model_id: str, tenant_id: str, timeout: float = 10.0
     ) -> ProcessModelInfo | None:
         """Synapse의 프로세스 모델을 Core 내부 ProcessModelInfo로 변환."""
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.get(
-                f"{self._base_url}/api/v1/mining/models/{model_id}",
-                headers=self._headers(tenant_id),
-            )
-            if resp.status_code == 404:
-                return None
-            if resp.status_code >= 400:
-                raise SynapseACLError(resp.status_code, resp.text)
-            raw = resp.json()
+        resp = await self._send(
+            "GET",
+            f"{self._base_url}/api/v1/mining/models/{model_id}",
+            headers=self._headers(tenant_id),
+            timeout=timeout,
+        )
+        if resp.status_code == 404:
+            return None
+        if resp.status_code >= 400:
+            raise SynapseACLError(resp.status_code, resp.text)
+        raw = resp.json()
 
         return self._translate_process_model(raw)
 
@@ -185,12 +206,13 @@ class SynapseACL:
         if auth_header:
             headers["Authorization"] = auth_header
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.post(
-                f"{self._base_url}/api/v3/synapse/event-logs/ingest",
-                content=raw_body,
-                headers=headers,
-            )
+        resp = await self._send(
+            "POST",
+            f"{self._base_url}/api/v3/synapse/event-logs/ingest",
+            content=raw_body,
+            headers=headers,
+            timeout=timeout,
+        )
 
         try:
             payload = resp.json()
@@ -245,14 +267,14 @@ class SynapseACL:
         if auth_header:
             headers["Authorization"] = auth_header
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=json_body if raw_body is None else None,
-                content=raw_body,
-            )
+        response = await self._send(
+            method,
+            url,
+            headers=headers,
+            json=json_body if raw_body is None else None,
+            content=raw_body,
+            timeout=timeout,
+        )
 
         try:
             payload = response.json()
@@ -95,3 +95,10 @@ async def startup_event():
     from app.workers.sync import SyncWorker
     relay = SyncWorker(poll_interval_seconds=5, max_batch=100)
     asyncio.create_task(relay.run())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 서비스 간 호출용 공유 HTTP 연결 풀 정리
+    from app.core.http_clients import http_clients
+    await http_clients.aclose()
@@ -7,7 +7,8 @@ PoC 범위:
   - core.work_item_events 테이블에 순서(version)대로 이벤트 저장
   - 낙관적 동시성 제어 (expected_version)
   - 이벤트 리플레이로 WorkItem Aggregate 복원
-  - Snapshot 없이 시작 (이벤트 수가 적으므로)
+  - N개 이벤트마다 core.work_item_snapshots에 Aggregate 스냅샷 저장
+    (EVENT_STORE_SNAPSHOT_INTERVAL) → load는 최신 스냅샷 이후 이벤트만 리플레이
 """
 from __future__ import annotations
 
@@ -20,6 +21,7 @@ from typing import Any
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.modules.process.domain.aggregates.work_item import (
     AgentMode,
     WorkItem,
@@ -54,11 +56,17 @@ CREATE TABLE IF NOT EXISTS work_item_events (
 );
 CREATE INDEX IF NOT EXISTS idx_work_item_events_aggregate
     ON work_item_events (aggregate_id, version);
+CREATE TABLE IF NOT EXISTS work_item_snapshots (
+    aggregate_id VARCHAR PRIMARY KEY,
+    version INTEGER NOT NULL,
+    state JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
 """
 
 
 async def ensure_event_store_table(db: AsyncSession) -> None:
-    """work_item_events 테이블이 없으면 생성."""
+    """work_item_events / work_item_snapshots 테이블이 없으면 생성."""
     for stmt in WORK_ITEM_EVENTS_DDL.strip().split(";"):
         stmt = stmt.strip()
         if stmt:
@@ -95,7 +103,16 @@ _EVENT_STATUS_MAP: dict[str, WorkItemStatus] = {
 # ── WorkItemEventStore ───────────────────────────────────
 
 class WorkItemEventStore:
-    """WorkItem Aggregate의 이벤트를 저장하고, 리플레이로 상태를 복원한다."""
+    """WorkItem Aggregate의 이벤트를 저장하고, 리플레이로 상태를 복원한다.
+
+    snapshot_interval개 이벤트마다 Aggregate 상태를 스냅샷으로 남겨(aggregate당 최신 1행)
+    load가 스냅샷 이후 이벤트만 리플레이하게 한다. 0이면 스냅샷을 쓰지 않는다.
+    """
+
+    def __init__(self, snapshot_interval: int | None = None) -> None:
+        self.snapshot_interval = (
+            settings.EVENT_STORE_SNAPSHOT_INTERVAL if snapshot_interval is None else snapshot_interval
+        )
 
     async def append(
         self,
@@ -109,66 +126,123 @@ class WorkItemEventStore:
         Raises:
             ValueError: version 충돌 (concurrent modification)
         """
-        event_type = type(event).__name__
-        event_data = _serialize_event(event)
+        await self.append_events(db, aggregate_id, [event], expected_version)
 
+    async def append_events(
+        self,
+        db: AsyncSession,
+        aggregate_id: str,
+        events: list[DomainEvent],
+        starting_version: int,
+    ) -> int:
+        """여러 이벤트를 multi-row INSERT 한 번으로 추가. 다음 version을 반환.
+
+        현재 최종 version이 starting_version - 1일 때만 삽입한다 (낙관적 동시성 제어).
+        동시에 같은 version을 쓰는 경합은 (aggregate_id, version) UNIQUE 제약이 막는다.
+
+        Raises:
+            ValueError: version 충돌 (concurrent modification)
+        """
+        if not events:
+            return starting_version
+        rows = [
+            {
+                "event_type": type(event).__name__,
+                "event_data": _serialize_event(event),
+                "version": starting_version + i,
+                "created_at": event.occurred_at.isoformat(),
+            }
+            for i, event in enumerate(events)
+        ]
+        conflict = ValueError(
+            f"Optimistic concurrency conflict: aggregate={aggregate_id}, "
+            f"expected_version={starting_version}"
+        )
         try:
-            await db.execute(
+            result = await db.execute(
                 text("""
                     INSERT INTO work_item_events
                         (aggregate_id, event_type, event_data, version, created_at)
-                    VALUES (:aggregate_id, :event_type, :event_data::jsonb, :version, :created_at)
+                    SELECT :aggregate_id, e.event_type, e.event_data, e.version, e.created_at
+                    FROM jsonb_to_recordset(CAST(:events AS jsonb))
+                        AS e(event_type VARCHAR, event_data JSONB, version INTEGER, created_at TIMESTAMPTZ)
+                    WHERE (
+                        SELECT COALESCE(MAX(version), 0) FROM work_item_events
+                        WHERE aggregate_id = :aggregate_id
+                    ) = :current_version
                 """),
                 {
                     "aggregate_id": aggregate_id,
-                    "event_type": event_type,
-                    "event_data": json.dumps(event_data, ensure_ascii=False, default=str),
-                    "version": expected_version,
-                    "created_at": event.occurred_at,
+                    "events": json.dumps(rows, ensure_ascii=False, default=str),
+                    "current_version": starting_version - 1,
                 },
             )
         except Exception as e:
             if "unique" in str(e).lower() or "duplicate" in str(e).lower():
-                raise ValueError(
-                    f"Optimistic concurrency conflict: aggregate={aggregate_id}, "
-                    f"expected_version={expected_version}"
-                ) from e
+                raise conflict from e
             raise
+        if result.rowcount != len(rows):
+            raise conflict
 
-    async def append_events(
-        self,
-        db: AsyncSession,
-        aggregate_id: str,
-        events: list[DomainEvent],
-        starting_version: int,
-    ) -> int:
-        """여러 이벤트를 일괄 추가. 최종 version을 반환."""
-        version = starting_version
-        for event in events:
-            await self.append(db, aggregate_id, event, version)
-            version += 1
-        return version
+        last_version = starting_version + len(rows) - 1
+        interval = self.snapshot_interval
+        if interval > 0 and last_version // interval > (starting_version - 1) // interval:
+            await self._snapshot(db, aggregate_id)
+        return last_version + 1
 
     async def load(self, db: AsyncSession, aggregate_id: str) -> WorkItem | None:
-        """이벤트 리플레이로 WorkItem Aggregate 복원.
+        """최신 스냅샷 + 이후 이벤트 리플레이로 WorkItem Aggregate 복원.
 
         Returns:
             WorkItem or None if no events found.
         """
+        snapshot = None
+        if self.snapshot_interval > 0:
+            result = await db.execute(
+                text("""
+                    SELECT version, state FROM work_item_snapshots
+                    WHERE aggregate_id = :aggregate_id
+                """),
+                {"aggregate_id": aggregate_id},
+            )
+            snapshot_rows = result.fetchall()
+            if snapshot_rows:
+                snapshot = _restore_snapshot(aggregate_id, snapshot_rows[0])
+
         result = await db.execute(
             text("""
                 SELECT event_type, event_data, version, created_at
                 FROM work_item_events
-                WHERE aggregate_id = :aggregate_id
+                WHERE aggregate_id = :aggregate_id AND version > :after_version
                 ORDER BY version
             """),
-            {"aggregate_id": aggregate_id},
+            {"aggregate_id": aggregate_id, "after_version": snapshot.version if snapshot else 0},
         )
         rows = result.fetchall()
-        if not rows:
+        if not rows and snapshot is None:
             return None
 
-        return _replay_events(aggregate_id, rows)
+        return _replay_events(aggregate_id, rows, snapshot)
+
+    async def _snapshot(self, db: AsyncSession, aggregate_id: str) -> None:
+        """현재 상태를 스냅샷으로 저장 (더 최신 스냅샷이 이미 있으면 유지)."""
+        wi = await self.load(db, aggregate_id)
+        if wi is None:
+            return
+        await db.execute(
+            text("""
+                INSERT INTO work_item_snapshots (aggregate_id, version, state, created_at)
+                VALUES (:aggregate_id, :version, CAST(:state AS jsonb), now())
+                ON CONFLICT (aggregate_id) DO UPDATE
+                    SET version = EXCLUDED.version, state = EXCLUDED.state, created_at = EXCLUDED.created_at
+                    WHERE work_item_snapshots.version < EXCLUDED.version
+            """),
+            {
+                "aggregate_id": aggregate_id,
+                "version": wi.version,
+                "state": json.dumps(_snapshot_state(wi), ensure_ascii=False, default=str),
+            },
+        )
 
     async def get_events(
         self,
@@ -218,9 +292,40 @@ def _serialize_event(event: DomainEvent) -> dict[str, Any]:
     return data
 
 
-def _replay_events(aggregate_id: str, rows: list) -> WorkItem:
-    """이벤트 목록을 리플레이하여 WorkItem Aggregate를 복원."""
-    wi: WorkItem | None = None
+def _snapshot_state(wi: WorkItem) -> dict[str, Any]:
+    """WorkItem Aggregate → 스냅샷 JSON (도메인 이벤트 버퍼 제외)."""
+    return {
+        "proc_inst_id": wi.proc_inst_id,
+        "activity_name": wi.activity_name,
+        "activity_type": wi.activity_type,
+        "assignee_id": wi.assignee_id,
+        "agent_mode": wi.agent_mode.value,
+        "status": wi.status.value,
+        "result_data": wi.result_data,
+        "tenant_id": wi.tenant_id,
+    }
+
+
+def _restore_snapshot(aggregate_id: str, row: Any) -> WorkItem:
+    """work_item_snapshots 행 → WorkItem Aggregate."""
+    state = row.state if isinstance(row.state, dict) else json.loads(row.state)
+    return WorkItem(
+        id=aggregate_id,
+        proc_inst_id=state.get("proc_inst_id"),
+        activity_name=state.get("activity_name"),
+        activity_type=state.get("activity_type", "humanTask"),
+        assignee_id=state.get("assignee_id"),
+        agent_mode=AgentMode(state.get("agent_mode", "MANUAL")),
+        status=WorkItemStatus(state["status"]),
+        result_data=state.get("result_data"),
+        tenant_id=state.get("tenant_id", ""),
+        version=row.version,
+    )
+
+
+def _replay_events(aggregate_id: str, rows: list, snapshot: WorkItem | None = None) -> WorkItem:
+    """이벤트 목록을 리플레이하여 WorkItem Aggregate를 복원 (snapshot이 있으면 그 상태에서 이어서)."""
+    wi: WorkItem | None = snapshot
     version = 0
 
     for row in rows:
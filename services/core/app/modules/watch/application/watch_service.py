@@ -3,8 +3,12 @@ from datetime import datetime, timezone
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.events import EventPublisher
 from app.models.base_models import WatchAlert, WatchRule, WatchSubscription
 
+# 구독 생성/수정/삭제 시 outbox로 발행 — WatchCepWorker가 tenant 구독 캐시를 비운다
+SUBSCRIPTION_CHANGED_EVENT = "WATCH_SUBSCRIPTION_CHANGED"
+
 
 class WatchDomainError(Exception):
     def __init__(self, status_code: int, code: str, message: str):
@@ -31,6 +35,24 @@ class WatchService:
             if not all((rule or {}).get(key) is not None for key in ("window_hours", "min_count")):
                 raise WatchDomainError(400, "INVALID_RULE", "pattern rule requires window_hours/min_count")
 
+    @staticmethod
+    async def _publish_subscription_changed(
+        db: AsyncSession, subscription: WatchSubscription, action: str, tenant_id: str,
+    ) -> None:
+        ts_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+        await EventPublisher.publish(
+            session=db,
+            event_type=SUBSCRIPTION_CHANGED_EVENT,
+            aggregate_type="WatchSubscription",
+            aggregate_id=subscription.id,
+            payload={
+                "action": action,
+                "event_type": subscription.event_type,
+                "idempotency_key": f"{SUBSCRIPTION_CHANGED_EVENT}:{subscription.id}:{ts_ms}",
+            },
+            tenant_id=tenant_id,
+        )
+
     @staticmethod
     async def create_subscription(
         db: AsyncSession,
@@ -77,6 +99,7 @@ class WatchService:
         )
         db.add(subscription)
         await db.flush()
+        await WatchService._publish_subscription_changed(db, subscription, "created", tenant_id)
         return subscription
 
     @staticmethod
@@ -118,6 +141,7 @@ class WatchService:
         if severity_override is not None:
             subscription.severity_override = severity_override
         await db.flush()
+        await WatchService._publish_subscription_changed(db, subscription, "updated", tenant_id)
         return subscription
 
     @staticmethod
@@ -132,6 +156,7 @@ class WatchService:
         if not subscription:
             raise WatchDomainError(404, "SUBSCRIPTION_NOT_FOUND", "subscription not found")
         await db.delete(subscription)
+        await WatchService._publish_subscription_changed(db, subscription, "deleted", tenant_id)
 
     @staticmethod
     async def list_alerts(
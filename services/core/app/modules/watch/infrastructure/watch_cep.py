@@ -2,16 +2,26 @@
 Watch CEP Worker (worker-system.md §3.2).
 axiom:watches 스트림 소비, CEP 룰 평가 및 알림 생성·발송.
 Consumer Group: watch_cep_group. CEP·알림 로직 구현.
+
+처리량:
+  - xreadgroup 한 번에 READ_COUNT건, 같은 (tenant, aggregate_id)는 같은 샤드로 보내
+    샤드 MAX_CONCURRENCY개를 동시에 처리 (키별 순서 보존), ACK는 배치당 XACK 1회
+  - 구독 목록은 (tenant, event_type) 단위로 캐시 — WATCH_SUBSCRIPTION_CHANGED 이벤트
+    (구독 생성/수정/삭제 시 outbox로 같은 스트림에 발행)를 만나면 해당 tenant 캐시를 비운다
 """
 from __future__ import annotations
 
 import asyncio
 import json
 import logging
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any
 
 from app.core.database import AsyncSessionLocal
 from app.core.redis_client import get_redis
-from app.modules.watch.application.watch_service import WatchService
+from app.modules.watch.application.watch_service import SUBSCRIPTION_CHANGED_EVENT, WatchService
 from app.workers.base import BaseWorker
 
 logger = logging.getLogger("axiom.workers")
@@ -21,6 +31,10 @@ CONSUMER_GROUP = "watch_cep_group"
 CONSUMER_NAME = "watch_cep_worker_1"
 BLOCK_MS = 5000
 IDEMPOTENCY_TTL_SECONDS = 86400  # 24h
+READ_COUNT = 500
+MAX_CONCURRENCY = 32
+# 변경 이벤트를 놓쳐도(스트림 트림 등) 이 시간이 지나면 DB에서 다시 읽는다
+SUBSCRIPTION_CACHE_TTL_SECONDS = 300.0
 
 
 def _evaluate_rule(rule: dict, payload: dict) -> bool:
@@ -75,11 +89,100 @@ def _action_url_from_payload(payload: dict) -> str | None:
     return (payload or {}).get("action_url")
 
 
+@dataclass(frozen=True)
+class CachedSubscription:
+    """세션과 분리된 구독 스냅샷 (CEP 평가·알림 생성에 필요한 필드만)."""
+    id: str
+    case_id: str | None
+    rule: dict | None
+    channels: list[str] | None
+    severity_override: str | None
+
+    @classmethod
+    def from_model(cls, sub: Any) -> CachedSubscription:
+        return cls(
+            id=sub.id,
+            case_id=sub.case_id,
+            rule=sub.rule,
+            channels=list(sub.channels or []),
+            severity_override=sub.severity_override,
+        )
+
+
+class SubscriptionCache:
+    """(tenant_id, event_type) → 활성 구독 목록. 같은 키 동시 미스는 DB 조회 1회로 합친다."""
+
+    def __init__(self, ttl_seconds: float = SUBSCRIPTION_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[tuple[str, str], tuple[float, list[CachedSubscription]]] = {}
+        self._loading: dict[tuple[str, str], asyncio.Future] = {}
+        self._generation = 0
+        self.loads = 0
+
+    async def get(self, tenant_id: str, event_type: str, case_id: str | None) -> list[CachedSubscription]:
+        key = (tenant_id, event_type)
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            subs = await self._load(key)
+        else:
+            subs = entry[1]
+        if case_id is None:
+            return subs
+        return [s for s in subs if s.case_id is None or s.case_id == case_id]
+
+    async def _load(self, key: tuple[str, str]) -> list[CachedSubscription]:
+        pending = self._loading.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        generation = self._generation
+        try:
+            async with AsyncSessionLocal() as db:
+                rows = await WatchService.list_subscriptions_for_event(
+                    db=db, tenant_id=key[0], event_type=key[1], case_id=None,
+                )
+            subs = [CachedSubscription.from_model(row) for row in rows]
+            self.loads += 1
+            if generation == self._generation:  # 조회 중 무효화됐으면 결과를 캐시하지 않는다
+                self._entries[key] = (time.monotonic(), subs)
+            future.set_result(subs)
+            return subs
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # 대기자가 없어도 "never retrieved" 경고가 나지 않게
+            raise
+        finally:
+            self._loading.pop(key, None)
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        self._generation += 1
+        if tenant_id is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == tenant_id]:
+            del self._entries[key]
+
+
+def _shard_key(entry_id: str, data: dict) -> str:
+    """순서를 지켜야 하는 단위 — 같은 tenant의 같은 aggregate (없으면 메시지 단독)."""
+    aggregate_id = data.get("aggregate_id") or ""
+    return f"{data.get('tenant_id') or ''}:{aggregate_id}" if aggregate_id else str(entry_id)
+
+
 class WatchCepWorker(BaseWorker):
     """axiom:watches 소비, CEP 평가·알림 DB 저장·채널 발송(인앱=DB, 이메일/SMS/Slack은 재시도 후 로깅)."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        read_count: int = READ_COUNT,
+        concurrency: int = MAX_CONCURRENCY,
+        subscription_cache: SubscriptionCache | None = None,
+    ):
         super().__init__("watch_cep")
+        self.read_count = read_count
+        self.concurrency = max(1, concurrency)
+        self.subscriptions = subscription_cache or SubscriptionCache()
 
     async def run(self):
         redis = get_redis()
@@ -94,19 +197,63 @@ class WatchCepWorker(BaseWorker):
                     groupname=CONSUMER_GROUP,
                     consumername=CONSUMER_NAME,
                     streams={STREAM_KEY: ">"},
-                    count=10,
+                    count=self.read_count,
                     block=BLOCK_MS,
                 )
                 for _stream, entries in messages:
-                    for entry_id, data in entries:
-                        await self.process_with_retry(self._handle_message, entry_id, data)
-                        await redis.xack(STREAM_KEY, CONSUMER_GROUP, entry_id)
+                    await self.process_batch(redis, entries)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.exception("WatchCepWorker error: %s", e)
                 await asyncio.sleep(1)
 
+    async def process_batch(self, redis, entries: list[tuple[str, dict]]) -> list[str]:
+        """한 번 읽은 메시지 묶음을 처리하고 성공한 entry_id를 XACK 1회로 확인한다.
+
+        구독 변경 이벤트는 배치를 구간으로 나눈다 — 앞 구간을 모두 처리한 뒤 캐시를 비우고
+        다음 구간을 처리하므로, 변경 이후 이벤트가 이전 구독 목록으로 평가되지 않는다.
+        """
+        acked: list[str] = []
+        segment: list[tuple[str, dict]] = []
+        for entry_id, data in entries:
+            if data.get("event_type") == SUBSCRIPTION_CHANGED_EVENT:
+                acked += await self._process_segment(segment)
+                segment = []
+                self.subscriptions.invalidate((data.get("tenant_id") or "").strip() or None)
+                acked.append(entry_id)
+            else:
+                segment.append((entry_id, data))
+        acked += await self._process_segment(segment)
+        if acked:
+            await redis.xack(STREAM_KEY, CONSUMER_GROUP, *acked)
+        return acked
+
+    async def _process_segment(self, entries: list[tuple[str, dict]]) -> list[str]:
+        shards: dict[int, list[tuple[str, dict]]] = {}
+        for entry_id, data in entries:
+            shard = zlib.crc32(_shard_key(entry_id, data).encode()) % self.concurrency
+            shards.setdefault(shard, []).append((entry_id, data))
+        results = await asyncio.gather(*(self._process_shard(items) for items in shards.values()))
+        return [entry_id for done in results for entry_id in done]
+
+    async def _process_shard(self, entries: list[tuple[str, dict]]) -> list[str]:
+        """샤드 안에서는 순서대로. 재시도 후에도 실패한 키의 이후 메시지는 ACK하지 않고 남긴다 (키별 순서 보존)."""
+        done: list[str] = []
+        failed_keys: set[str] = set()
+        for entry_id, data in entries:
+            key = _shard_key(entry_id, data)
+            if key in failed_keys:
+                continue
+            try:
+                await self.process_with_retry(self._handle_message, entry_id, data)
+            except Exception as e:
+                logger.exception("WatchCepWorker message failed: entry_id=%s error=%s", entry_id, e)
+                failed_keys.add(key)
+                continue
+            done.append(entry_id)
+        return done
+
     async def _handle_message(self, entry_id: str, data: dict) -> None:
         """메시지 1건: CEP 룰 평가 → 알림 생성(멱등) → 채널 발송."""
         event_id = data.get("event_id") or entry_id
@@ -123,21 +270,16 @@ class WatchCepWorker(BaseWorker):
             logger.debug("watch_cep skip event missing tenant_id: entry_id=%s", entry_id)
             return
 
-        async with AsyncSessionLocal() as db:
-            subs = await WatchService.list_subscriptions_for_event(
-                db=db,
-                tenant_id=tenant_id,
-                event_type=event_type,
-                case_id=aggregate_id or None,
+        subs = await self.subscriptions.get(tenant_id, event_type, aggregate_id or None)
+        if not subs:
+            logger.debug(
+                "watch_cep no subscriptions event_type=%s tenant_id=%s",
+                event_type,
+                tenant_id,
             )
-            if not subs:
-                logger.debug(
-                    "watch_cep no subscriptions event_type=%s tenant_id=%s",
-                    event_type,
-                    tenant_id,
-                )
-                return
+            return
 
+        async with AsyncSessionLocal() as db:
             redis = get_redis()
             for sub in subs:
                 if not _evaluate_rule(sub.rule or {}, payload):
@@ -1,35 +1,497 @@
+"""시나리오 기반 멀티 엔드포인트 부하 테스트 하네스.
+
+로컬에서 띄운 서비스(docker-compose 기본 포트, Oracle은 Mock LLM)에 실제 핫패스 요청을 섞어 보내고
+시나리오별 처리량, p50/p95/p99/max 지연, 에러율을 출력한 뒤 JSON 결과 파일을 남긴다.
+커밋 간 회귀 비교는 --compare 로 이전 결과 파일을 넘기면 된다.
+
+시나리오 (--scenarios 로 선택, 가중치는 name=weight):
+  - oracle_ask          : POST Oracle /text2sql/ask (Mock LLM 파이프라인)
+  - vision_pivot        : POST Vision /api/v3/pivot/query (첫 번째 등록 큐브)
+  - synapse_ingest      : POST Synapse /api/v3/synapse/event-logs/ingest (CSV multipart)
+  - synapse_statistics  : GET  Synapse /api/v3/synapse/event-logs/{log_id}/statistics
+  - weaver_logs_ingest  : POST Weaver /api/insight/logs:ingest (배치 50건)
+  - core_gateway        : GET  Core /api/v1/event-logs/{log_id}/statistics (Core → Synapse 프록시)
+
+준비 단계에서 시나리오에 필요한 리소스(이벤트 로그, 큐브)를 한 번 만들고,
+준비에 실패한 시나리오는 건너뛰고 사유를 결과에 기록한다.
+
+사용:
+  docker compose up -d postgres-db redis-bus neo4j-db synapse-svc vision-svc core-svc weaver-svc oracle-svc
+  cd services/core
+  PYTHONPATH=. python3 -m app.scripts.load_test --duration 60 --concurrency 32 \\
+      --output load_results/$(git rev-parse --short HEAD).json
+  PYTHONPATH=. python3 -m app.scripts.load_test --duration 60 --compare load_results/<base>.json
+"""
+from __future__ import annotations
+
+import argparse
 import asyncio
-import httpx
-import time
+import json
 import logging
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+import httpx
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("load_tester")
+# 요청마다 찍히는 httpx INFO 로그는 측정 자체를 느리게 하므로 끈다
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+DEFAULT_URLS = {
+    "core": os.getenv("LOAD_CORE_URL", "http://localhost:9002"),
+    "synapse": os.getenv("LOAD_SYNAPSE_URL", "http://localhost:9003"),
+    "vision": os.getenv("LOAD_VISION_URL", "http://localhost:9100"),
+    "weaver": os.getenv("LOAD_WEAVER_URL", "http://localhost:9001"),
+    "oracle": os.getenv("LOAD_ORACLE_URL", "http://localhost:9004"),
+}
+
+DEFAULT_WEIGHTS = {
+    "oracle_ask": 1,
+    "vision_pivot": 3,
+    "synapse_ingest": 1,
+    "synapse_statistics": 3,
+    "weaver_logs_ingest": 2,
+    "core_gateway": 3,
+}
+
+_CSV_HEADER = "case_id,activity,timestamp,resource\n"
+_ORACLE_QUESTIONS = [
+    "지난달 부서별 매출 합계를 알려줘",
+    "최근 7일 동안 처리 지연이 가장 긴 프로세스는?",
+    "고객 등급별 평균 주문 금액을 보여줘",
+]
+
+
+# ═══════════════════════════════════════════════════════════════
+# 결과 집계
+# ═══════════════════════════════════════════════════════════════
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """선형 보간 백분위수 (sorted_values는 오름차순)."""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+@dataclass
+class ScenarioStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    status_counts: dict[str, int] = field(default_factory=dict)
+
+    def record(self, latency: float, status: int | str, ok: bool) -> None:
+        self.latencies.append(latency)
+        key = str(status)
+        self.status_counts[key] = self.status_counts.get(key, 0) + 1
+        if not ok:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        values = sorted(self.latencies)
+        count = len(values)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+            "status_counts": self.status_counts,
+        }
+
+
+def compare_results(
+    current: dict[str, Any], baseline: dict[str, Any], max_regression_pct: float,
+) -> tuple[list[dict[str, Any]], bool]:
+    """시나리오별 p95/처리량/에러율 변화를 비교. (행 목록, 회귀 여부) 반환."""
+    rows: list[dict[str, Any]] = []
+    regressed = False
+    for name, cur in current.get("scenarios", {}).items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or not base.get("requests") or not cur.get("requests"):
+            continue
+        p95_change = _pct_change(cur["p95_ms"], base["p95_ms"])
+        rps_change = _pct_change(cur["throughput_rps"], base["throughput_rps"])
+        row = {
+            "scenario": name,
+            "p95_ms": [base["p95_ms"], cur["p95_ms"]],
+            "p95_change_pct": p95_change,
+            "throughput_rps": [base["throughput_rps"], cur["throughput_rps"]],
+            "throughput_change_pct": rps_change,
+            "error_rate": [base["error_rate"], cur["error_rate"]],
+        }
+        row["regressed"] = (
+            p95_change > max_regression_pct
+            or rps_change < -max_regression_pct
+            or cur["error_rate"] > base["error_rate"] + 0.01
+        )
+        regressed = regressed or row["regressed"]
+        rows.append(row)
+    return rows, regressed
+
+
+def _pct_change(current: float, base: float) -> float:
+    if base == 0:
+        return 0.0
+    return round((current - base) / base * 100.0, 1)
+
+
+# ═══════════════════════════════════════════════════════════════
+# 시나리오
+# ═══════════════════════════════════════════════════════════════
+
+
+@dataclass
+class Scenario:
+    name: str
+    service: str
+    # (client, ctx) -> 응답. 상태 코드 판정은 ok_status로
+    send: Callable[[httpx.AsyncClient, "LoadContext"], Awaitable[httpx.Response]]
+    ok_status: tuple[int, ...] = (200,)
+    setup: Callable[[httpx.AsyncClient, "LoadContext"], Awaitable[None]] | None = None
+
+
+@dataclass
+class LoadContext:
+    urls: dict[str, str]
+    token: str
+    tenant_id: str
+    case_id: str
+    oracle_datasource: str
+    csv_rows: int
+    log_id: str | None = None
+    cube: dict[str, Any] | None = None
+
+    def headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "X-Tenant-Id": self.tenant_id,
+            "X-Request-Id": f"load-{uuid.uuid4().hex[:12]}",
+        }
+
+
+@lru_cache(maxsize=4)
+def _event_log_csv(rows: int) -> bytes:
+    lines = [_CSV_HEADER]
+    activities = ["접수", "검토", "승인", "지급", "종결"]
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+    for i in range(rows):
+        case = f"C{i // len(activities):05d}"
+        ts = datetime.fromtimestamp(base + i * 60, tz=timezone.utc).isoformat()
+        lines.append(f"{case},{activities[i % len(activities)]},{ts},R{i % 7}\n")
+    return "".join(lines).encode("utf-8")
+
+
+async def _post_event_log(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    metadata = {
+        "source_type": "csv",
+        "case_id": ctx.case_id,
+        "name": f"load-{uuid.uuid4().hex[:8]}",
+        "column_mapping": {
+            "case_id_column": "case_id", "activity_column": "activity",
+            "timestamp_column": "timestamp", "resource_column": "resource",
+        },
+    }
+    return await client.post(
+        f"{ctx.urls['synapse']}/api/v3/synapse/event-logs/ingest",
+        headers=ctx.headers(),
+        data={"metadata": json.dumps(metadata, ensure_ascii=False)},
+        files={"file": ("load.csv", _event_log_csv(ctx.csv_rows), "text/csv")},
+    )
+
+
+async def _setup_event_log(client: httpx.AsyncClient, ctx: LoadContext) -> None:
+    if ctx.log_id:
+        return
+    resp = await _post_event_log(client, ctx)
+    resp.raise_for_status()
+    ctx.log_id = resp.json()["data"]["log_id"]
+
+
+async def _setup_cube(client: httpx.AsyncClient, ctx: LoadContext) -> None:
+    resp = await client.get(f"{ctx.urls['vision']}/api/v3/cubes", headers=ctx.headers())
+    resp.raise_for_status()
+    cubes = [c for c in resp.json().get("cubes", []) if c.get("dimensions") and c.get("measures")]
+    if not cubes:
+        raise RuntimeError("등록된 큐브가 없습니다 (POST /api/v3/cubes/schema/upload 먼저)")
+    ctx.cube = cubes[0]
+
+
+async def _oracle_ask(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    return await client.post(
+        f"{ctx.urls['oracle']}/text2sql/ask",
+        headers=ctx.headers(),
+        json={
+            "question": random.choice(_ORACLE_QUESTIONS),
+            "datasource_id": ctx.oracle_datasource,
+            "options": {"use_cache": False, "include_viz": False, "row_limit": 100},
+        },
+    )
+
+
+async def _vision_pivot(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    cube = ctx.cube or {}
+    return await client.post(
+        f"{ctx.urls['vision']}/api/v3/pivot/query",
+        headers=ctx.headers(),
+        json={
+            "cube_name": cube["name"],
+            "rows": [random.choice(cube["dimensions"])],
+            "measures": cube["measures"][:2],
+            "limit": 100,
+        },
+    )
+
+
+async def _synapse_statistics(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    return await client.get(
+        f"{ctx.urls['synapse']}/api/v3/synapse/event-logs/{ctx.log_id}/statistics",
+        headers=ctx.headers(),
+    )
+
+
+async def _weaver_logs_ingest(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    now = datetime.now(timezone.utc).isoformat()
+    logs = [
+        {
+            "raw_sql": f"SELECT dept, SUM(amount) FROM sales WHERE region_id = {random.randint(1, 500)} GROUP BY dept",
+            "datasource_id": ctx.oracle_datasource,
+            "executed_at": now,
+            "duration_ms": random.randint(5, 500),
+            "request_id": uuid.uuid4().hex,
+        }
+        for _ in range(50)
+    ]
+    return await client.post(
+        f"{ctx.urls['weaver']}/api/insight/logs:ingest",
+        headers=ctx.headers(),
+        json={"logs": logs, "source": "load_test"},
+    )
+
+
+async def _core_gateway(client: httpx.AsyncClient, ctx: LoadContext) -> httpx.Response:
+    return await client.get(
+        f"{ctx.urls['core']}/api/v1/event-logs/{ctx.log_id}/statistics",
+        headers=ctx.headers(),
+    )
+
+
+SCENARIOS: dict[str, Scenario] = {
+    s.name: s
+    for s in (
+        Scenario("oracle_ask", "oracle", _oracle_ask),
+        Scenario("vision_pivot", "vision", _vision_pivot, setup=_setup_cube),
+        Scenario("synapse_ingest", "synapse", _post_event_log, ok_status=(200, 202)),
+        Scenario("synapse_statistics", "synapse", _synapse_statistics, setup=_setup_event_log),
+        Scenario("weaver_logs_ingest", "weaver", _weaver_logs_ingest, ok_status=(200, 201)),
+        Scenario("core_gateway", "core", _core_gateway, setup=_setup_event_log),
+    )
+}
+
+
+# ═══════════════════════════════════════════════════════════════
+# 실행
+# ═══════════════════════════════════════════════════════════════
+
+
+def _access_token(tenant_id: str) -> str:
+    from app.core.security import create_access_token
+
+    return create_access_token(
+        user_id=str(uuid.uuid4()), email="load@axiom.local", tenant_id=tenant_id, role="admin",
+    )
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=5,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def parse_weights(specs: list[str] | None) -> dict[str, int]:
+    """["oracle_ask=2", "core_gateway"] → {"oracle_ask": 2, "core_gateway": 기본값}."""
+    if not specs:
+        return dict(DEFAULT_WEIGHTS)
+    weights: dict[str, int] = {}
+    for spec in specs:
+        name, _, weight = spec.partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"unknown scenario: {name} (choices: {', '.join(SCENARIOS)})")
+        weights[name] = int(weight) if weight else DEFAULT_WEIGHTS[name]
+    return weights
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    ctx: LoadContext,
+    names: list[str],
+    weights: list[int],
+    stats: dict[str, ScenarioStats],
+    deadline: float,
+    budget: list[int],
+) -> None:
+    while time.perf_counter() < deadline:
+        if budget[0] <= 0:
+            return
+        budget[0] -= 1
+        scenario = SCENARIOS[random.choices(names, weights)[0]]
+        start = time.perf_counter()
+        try:
+            resp = await scenario.send(client, ctx)
+            stats[scenario.name].record(time.perf_counter() - start, resp.status_code, resp.status_code in scenario.ok_status)
+        except httpx.HTTPError as exc:
+            stats[scenario.name].record(time.perf_counter() - start, type(exc).__name__, False)
+
+
+async def run_load_test(args: argparse.Namespace) -> dict[str, Any]:
+    tenant_id = args.tenant_id or str(uuid.uuid4())
+    ctx = LoadContext(
+        urls={**DEFAULT_URLS, **{k: v for k, v in (u.split("=", 1) for u in args.url or [])}},
+        token=args.token or _access_token(tenant_id),
+        tenant_id=tenant_id,
+        case_id=args.case_id,
+        oracle_datasource=args.oracle_datasource,
+        csv_rows=args.csv_rows,
+    )
+    weights = parse_weights(args.scenarios)
+    skipped: dict[str, str] = {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        for name in list(weights):
+            setup = SCENARIOS[name].setup
+            if setup is None:
+                continue
+            try:
+                await setup(client, ctx)
+            except Exception as exc:
+                skipped[name] = f"{type(exc).__name__}: {exc}"
+                logger.warning("scenario %s skipped: %s", name, skipped[name])
+                del weights[name]
+        if not weights:
+            raise SystemExit("no runnable scenarios")
+
+        stats = {name: ScenarioStats() for name in weights}
+        names, weight_values = list(weights), list(weights.values())
+        budget = [args.requests if args.requests else sys.maxsize]
+
+        if args.warmup > 0:
+            warm = {name: ScenarioStats() for name in weights}
+            warm_deadline = time.perf_counter() + args.warmup
+            await asyncio.gather(*(
+                _worker(client, ctx, names, weight_values, warm, warm_deadline, [sys.maxsize])
+                for _ in range(args.concurrency)
+            ))
+
+        logger.info("running %s for %.0fs with concurrency=%d", ", ".join(names), args.duration, args.concurrency)
+        started = time.perf_counter()
+        deadline = started + (args.duration if args.duration > 0 else float("inf"))
+        await asyncio.gather(*(
+            _worker(client, ctx, names, weight_values, stats, deadline, budget)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    all_stats = ScenarioStats()
+    for s in stats.values():
+        all_stats.latencies.extend(s.latencies)
+        all_stats.errors += s.errors
+        for k, v in s.status_counts.items():
+            all_stats.status_counts[k] = all_stats.status_counts.get(k, 0) + v
+    return {
+        "revision": _git_revision(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "duration_s": args.duration, "requests": args.requests, "concurrency": args.concurrency,
+            "weights": weights, "urls": ctx.urls, "csv_rows": args.csv_rows,
+        },
+        "elapsed_s": round(elapsed, 2),
+        "total": all_stats.summary(elapsed),
+        "scenarios": {name: s.summary(elapsed) for name, s in stats.items()},
+        "skipped": skipped,
+    }
+
+
+def _print_report(result: dict[str, Any]) -> None:
+    header = f"{'scenario':<20}{'req':>8}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'err%':>7}"
+    logger.info(header)
+    for name, s in [*result["scenarios"].items(), ("TOTAL", result["total"])]:
+        logger.info(
+            f"{name:<20}{s['requests']:>8}{s['throughput_rps']:>9.1f}{s['p50_ms']:>9.1f}"
+            f"{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['max_ms']:>9.1f}{s['error_rate'] * 100:>7.2f}"
+        )
+    for name, reason in result["skipped"].items():
+        logger.info(f"skipped {name}: {reason}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Axiom multi-service load test")
+    parser.add_argument("--scenarios", nargs="+", help="name[=weight] ... (default: all)")
+    parser.add_argument("--duration", type=float, default=30.0, help="measurement seconds (0 = until --requests)")
+    parser.add_argument("--requests", type=int, default=0, help="stop after N requests (0 = no limit)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=float, default=5.0, help="warm-up seconds excluded from results")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--url", action="append", help="service=base_url override, e.g. core=http://localhost:8002")
+    parser.add_argument("--token", help="bearer token (default: mint an admin token with JWT_SECRET_KEY)")
+    parser.add_argument("--tenant-id")
+    parser.add_argument("--case-id", default="load-test-case")
+    parser.add_argument("--oracle-datasource", default=os.getenv("LOAD_ORACLE_DATASOURCE", "default"))
+    parser.add_argument("--csv-rows", type=int, default=2000, help="rows per ingested event-log CSV")
+    parser.add_argument("--output", help="write JSON results to this path")
+    parser.add_argument("--compare", help="baseline JSON results to diff against")
+    parser.add_argument("--max-regression", type=float, default=10.0, help="allowed p95/throughput regression (%%)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.duration <= 0 and args.requests <= 0:
+        parser.error("either --duration or --requests must be positive")
+
+    random.seed(args.seed)
+    result = asyncio.run(run_load_test(args))
+    _print_report(result)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(result, fh, ensure_ascii=False, indent=2)
+        logger.info("results written to %s", args.output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        rows, regressed = compare_results(result, baseline, args.max_regression)
+        for row in rows:
+            logger.log(
+                logging.WARNING if row["regressed"] else logging.INFO,
+                "compare %s: p95 %.1f -> %.1f ms (%+.1f%%), rps %.1f -> %.1f (%+.1f%%), err %.2f%% -> %.2f%%%s",
+                row["scenario"], *row["p95_ms"], row["p95_change_pct"],
+                *row["throughput_rps"], row["throughput_change_pct"],
+                row["error_rate"][0] * 100, row["error_rate"][1] * 100,
+                " REGRESSED" if row["regressed"] else "",
+            )
+        if regressed:
+            logger.error("regression beyond %.1f%% vs %s", args.max_regression, baseline.get("revision", args.compare))
+            return 1
+    return 0
 
-async def hit_health_endpoint(client: httpx.AsyncClient, i: int):
-    start = time.time()
-    resp = await client.get("http://localhost:8000/api/v1/health/live")
-    elapsed = time.time() - start
-    return resp.status_code, elapsed
-
-async def run_load_test(requests: int = 100):
-    logger.info(f"Starting load test with {requests} requests...")
-    start_total = time.time()
-    
-    async with httpx.AsyncClient() as client:
-        tasks = [hit_health_endpoint(client, i) for i in range(requests)]
-        results = await asyncio.gather(*tasks)
-        
-    total_time = time.time() - start_total
-    
-    successes = sum(1 for r, _ in results if r == 200)
-    avg_latency = sum(lat for _, lat in results) / len(results) if results else 0
-    
-    logger.info(f"Requests: {requests}")
-    logger.info(f"Success Ratio: {successes}/{requests} ({(successes/requests)*100:.1f}%)")
-    logger.info(f"Total Time: {total_time:.2f}s")
-    logger.info(f"Avg Latency: {avg_latency*1000:.2f}ms")
-    logger.info(f"Throughput: {requests/total_time:.2f} req/s")
 
 if __name__ == "__main__":
-    asyncio.run(run_load_test(200))
+    raise SystemExit(main())
@@ -1,7 +1,10 @@
 import asyncio
 import logging
+import time
 from typing import Callable, Any
 
+from app.core.observability import metrics_registry
+
 logger = logging.getLogger("axiom.workers")
 
 class BaseWorker:
@@ -21,16 +24,30 @@ class BaseWorker:
         self._running = False
 
     async def process_with_retry(self, func: Callable, *args: Any, max_retries: int = 3):
-        for attempt in range(max_retries):
-            try:
-                return await func(*args)
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    logger.error(f"Worker task failed permanently after {max_retries} attempts.")
-                    raise
-                wait = 2 ** attempt
-                logger.warning(f"Retry {attempt+1}/{max_retries} for {func.__name__}: {e}")
-                await asyncio.sleep(wait)
+        # 재시도 대기를 포함한 전체 소요 시간을 결과(success/failure)별로 기록
+        task = getattr(func, "__name__", type(func).__name__)
+        start = time.perf_counter()
+        outcome = "failure"
+        try:
+            for attempt in range(max_retries):
+                try:
+                    result = await func(*args)
+                    outcome = "success"
+                    return result
+                except Exception as e:
+                    if attempt == max_retries - 1:
+                        logger.error(f"Worker task failed permanently after {max_retries} attempts.")
+                        raise
+                    wait = 2 ** attempt
+                    logger.warning(f"Retry {attempt+1}/{max_retries} for {task}: {e}")
+                    metrics_registry.inc("core_worker_task_retries_total", labels={"worker": self.name, "task": task})
+                    await asyncio.sleep(wait)
+        finally:
+            metrics_registry.observe(
+                "core_worker_task_duration_seconds",
+                time.perf_counter() - start,
+                {"worker": self.name, "task": task, "outcome": outcome},
+            )
 
     async def process_event_idempotent(self, redis, event_id: str, handler: Callable):
         """Idempotency wrapper using Redis SETNX."""
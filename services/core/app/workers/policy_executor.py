@@ -7,9 +7,9 @@ GWT Engine과의 차이:
 
 실행 흐름:
   Redis Stream 이벤트 수신
-  → Neo4j에서 매칭 Policy 조회 (case_id + trigger_event)
-  → 트리거 조건 평가 (field/op/value 비교)
-  → 쿨다운 확인 (Redis SETEX 기반)
+  → 메모리 Policy 인덱스에서 매칭 ((tenant_id, case_id, trigger_event) 키, 버전 변경 시 Neo4j 재적재)
+  → 트리거 조건 평가 (적재 시 미리 파싱한 field/op/value 비교)
+  → 쿨다운 + 일일 한도 확인 (매칭된 정책 전체를 Lua 스크립트 1회로)
   → 커맨드 페이로드 구성 ($trigger.payload.xxx 변수 치환)
   → POLICY_COMMAND 이벤트를 Core EventOutbox에 발행
 
@@ -20,7 +20,10 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from datetime import datetime, timezone, date
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, date
+from typing import Any, Callable
 
 from app.workers.base import BaseWorker
 
@@ -41,6 +44,190 @@ CONSUMER_NAME = "policy-executor-1"
 BLOCK_MS = 1000       # xreadgroup 블로킹 대기 시간 (밀리초)
 BATCH_SIZE = 50       # 한 번에 읽는 이벤트 수
 
+# Policy 인덱스 버전 확인 주기 — 이 간격마다 Neo4j에 (개수, 최신 updated_at)만 조회하고
+# 값이 바뀌었을 때만 활성 정책 전체를 다시 적재한다
+POLICY_INDEX_REFRESH_SECONDS = 5.0
+
+COOLDOWN_KEY = "axiom:policy:cooldown:{policy_id}"
+DAILY_KEY = "axiom:policy:daily:{policy_id}:{day}"
+
+# 매칭된 정책 전체의 쿨다운 + 일일 한도를 한 번에 판정한다.
+#   KEYS: 정책마다 [cooldown_key, daily_key]
+#   ARGV: 정책마다 [cutoff, max_per_day]
+#     cutoff — (now - cooldown_seconds)의 UTC ISO 문자열, 쿨다운이 없으면 "".
+#              쿨다운 값도 UTC ISO 문자열이므로 문자열 비교 last > cutoff 가 "아직 쿨다운 중"과 같다.
+# 반환: 정책별 1(실행 가능) / 0(쿨다운 중) / -1(일일 한도 초과).
+# 쿨다운 중인 정책은 이전 구현처럼 일일 카운터를 증가시키지 않는다.
+_ADMIT_SCRIPT = """
+local result = {}
+for i = 1, #KEYS, 2 do
+  local cutoff = ARGV[i]
+  local max_per_day = tonumber(ARGV[i + 1])
+  local status = 1
+  if cutoff ~= "" then
+    local last = redis.call("GET", KEYS[i])
+    if last and last > cutoff then
+      status = 0
+    end
+  end
+  if status == 1 and max_per_day > 0 then
+    local count = redis.call("INCR", KEYS[i + 1])
+    if count == 1 then
+      redis.call("EXPIRE", KEYS[i + 1], 86400)
+    end
+    if count > max_per_day then
+      status = -1
+    end
+  end
+  result[#result + 1] = status
+end
+return result
+"""
+
+
+def _load_json(raw: Any) -> dict:
+    """Neo4j에 JSON 문자열로 저장된 정책 필드를 dict로 파싱 (실패 시 빈 dict)"""
+    if not isinstance(raw, str):
+        return raw or {}
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError:
+        return {}
+
+
+def _compile_condition(condition: dict) -> Callable[[dict], bool] | None:
+    """트리거 조건을 payload → bool 함수로 변환 — 빈 조건은 None (항상 통과)
+
+    숫자 비교의 기대값은 여기서 한 번만 float로 변환한다.
+    변환이 안 되는 값은 이벤트마다 _eval_condition으로 평가해 이전과 같은 경고를 남긴다.
+    """
+    if not condition:
+        return None
+    field_name = condition.get("field", "")
+    op = condition.get("op", "==")
+    expected = condition.get("value")
+
+    if op == "==":
+        return lambda payload: (actual := payload.get(field_name)) is not None and actual == expected
+    if op == "!=":
+        return lambda payload: (actual := payload.get(field_name)) is not None and actual != expected
+    compare = {
+        ">": float.__gt__, "<": float.__lt__, ">=": float.__ge__, "<=": float.__le__,
+    }.get(op)
+    if compare is None:
+        return lambda payload: False
+    try:
+        threshold = float(expected)
+    except (TypeError, ValueError):
+        return lambda payload: PolicyExecutorWorker._eval_condition(condition, payload)
+
+    def _match(payload: dict) -> bool:
+        actual = payload.get(field_name)
+        if actual is None:
+            return False
+        try:
+            return compare(float(actual), threshold)
+        except (TypeError, ValueError):
+            return PolicyExecutorWorker._eval_condition(condition, payload)
+
+    return _match
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """인덱스에 적재된 Policy — 조건·템플릿은 적재 시 한 번만 파싱한다"""
+
+    id: str
+    name: str
+    condition: Callable[[dict], bool] | None
+    template: dict
+    target_service: str
+    target_command: str
+    cooldown_seconds: int
+    max_executions_per_day: int
+
+    @classmethod
+    def from_node(cls, node: dict) -> "CompiledPolicy":
+        return cls(
+            id=node.get("id", ""),
+            name=node.get("name") or node.get("id", ""),
+            condition=_compile_condition(_load_json(node.get("trigger_condition", "{}"))),
+            template=_load_json(node.get("command_payload_template", "{}")),
+            target_service=node.get("target_service", "core"),
+            target_command=node.get("target_command", ""),
+            cooldown_seconds=node.get("cooldown_seconds") or 0,
+            max_executions_per_day=node.get("max_executions_per_day") or 0,
+        )
+
+    def matches(self, payload: dict) -> bool:
+        return self.condition is None or self.condition(payload)
+
+
+class PolicyIndex:
+    """활성 Policy의 메모리 인덱스 — (tenant_id, case_id, trigger_event) → 이름순 정책 목록
+
+    Neo4j 조회는 refresh_seconds마다 버전((개수, 최신 updated_at))만 확인하고,
+    Synapse에서 정책이 생성·수정·삭제되어 버전이 바뀐 경우에만 전체를 다시 적재한다.
+    적재 실패 시 직전 인덱스를 계속 사용하며, 한 번도 적재하지 못했다면 예외를 올려
+    이벤트가 재시도되도록 한다.
+    """
+
+    VERSION_QUERY = """
+    MATCH (p:Policy)
+    RETURN count(p) AS total, max(p.updated_at) AS latest
+    """
+    LOAD_QUERY = """
+    MATCH (p:Policy {enabled: true})
+    RETURN p
+    ORDER BY p.name
+    """
+
+    def __init__(self, refresh_seconds: float = POLICY_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self.version: tuple | None = None
+        self.loads = 0
+        self._by_key: dict[tuple[str, str, str], tuple[CompiledPolicy, ...]] = {}
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(policies) for policies in self._by_key.values())
+
+    def match(self, tenant_id: str, case_id: str, event_type: str) -> tuple[CompiledPolicy, ...]:
+        return self._by_key.get((tenant_id, case_id, event_type), ())
+
+    def replace(self, nodes: list[dict], version: tuple | None) -> None:
+        """정책 노드 목록(이름순)으로 인덱스를 통째로 교체"""
+        by_key: dict[tuple[str, str, str], list[CompiledPolicy]] = {}
+        for node in nodes:
+            key = (node.get("tenant_id", ""), node.get("case_id", ""), node.get("trigger_event", ""))
+            by_key.setdefault(key, []).append(CompiledPolicy.from_node(node))
+        self._by_key = {key: tuple(policies) for key, policies in by_key.items()}
+        self.version = version
+        self.loads += 1
+
+    async def ensure_fresh(self, neo4j_driver) -> None:
+        if self.version is not None and time.monotonic() - self._checked_at < self.refresh_seconds:
+            return
+        async with self._lock:
+            if self.version is not None and time.monotonic() - self._checked_at < self.refresh_seconds:
+                return
+            try:
+                async with neo4j_driver.session() as session:
+                    result = await session.run(self.VERSION_QUERY)
+                    row = await result.single()
+                    version = (row["total"], str(row["latest"]))
+                    if version != self.version:
+                        result = await session.run(self.LOAD_QUERY)
+                        nodes = [dict(record["p"]) async for record in result]
+                        self.replace(nodes, version)
+                        logger.info("Policy 인덱스 적재: %d건 (version=%s)", len(self), version)
+            except Exception as exc:
+                if self.version is None:
+                    raise
+                logger.error("Policy 인덱스 갱신 실패 — 기존 인덱스 유지: %s", exc)
+            self._checked_at = time.monotonic()
+
 
 class PolicyExecutorWorker(BaseWorker):
     """서비스 간 이벤트 반응형 오케스트레이션 워커
@@ -52,14 +239,17 @@ class PolicyExecutorWorker(BaseWorker):
     안전하게 동작한다.
     """
 
-    def __init__(self, neo4j_driver=None):
+    def __init__(self, neo4j_driver=None, policy_index: PolicyIndex | None = None):
         """
         Args:
             neo4j_driver: Neo4j AsyncDriver 인스턴스.
                           None이면 환경 변수에서 연결 정보를 읽어 자동 생성한다.
+            policy_index: 활성 Policy 메모리 인덱스. None이면 기본 갱신 주기로 생성한다.
         """
         super().__init__("policy_executor")
         self._neo4j_driver = neo4j_driver
+        self.policies = policy_index if policy_index is not None else PolicyIndex()
+        self._admit_script = None
 
     async def run(self):
         """메인 루프 — Redis Stream에서 이벤트를 읽고 정책을 실행한다"""
@@ -171,112 +361,87 @@ class PolicyExecutorWorker(BaseWorker):
             await redis.xack(stream_name, CONSUMER_GROUP, msg_id)
             return
 
-        # Neo4j에서 매칭되는 활성 Policy 조회 (tenant_id 격리 포함)
-        policies = await self._find_matching_policies(neo4j_driver, case_id, tenant_id, event_type)
+        # 메모리 인덱스에서 매칭 (tenant_id 격리 포함) → 조건 평가
+        await self.policies.ensure_fresh(neo4j_driver)
+        candidates = [
+            policy for policy in self.policies.match(tenant_id, case_id, event_type)
+            if policy.matches(payload)
+        ]
 
-        for policy in policies:
-            policy_id = policy.get("id", "")
-            cooldown_seconds = policy.get("cooldown_seconds", 0)
-
-            # 1. 쿨다운 확인 (Redis 기반)
-            if not await self._check_cooldown(redis, policy_id, cooldown_seconds):
-                logger.debug("Policy %s 쿨다운 중, 건너뜀", policy_id)
-                continue
-
-            # 1.5. 일일 실행 횟수 제한 확인 (Redis INCR 기반)
-            max_per_day = policy.get("max_executions_per_day", 0)
-            if max_per_day and max_per_day > 0:
-                if not await self._check_daily_limit(redis, policy_id, max_per_day):
-                    logger.warning(
-                        "Policy %s 일일 실행 한도(%d) 초과, 건너뜀",
-                        policy_id, max_per_day,
-                    )
-                    continue
-
-            # 2. 트리거 조건 평가
-            trigger_condition_raw = policy.get("trigger_condition", "{}")
-            try:
-                condition = json.loads(trigger_condition_raw) if isinstance(trigger_condition_raw, str) else trigger_condition_raw
-            except json.JSONDecodeError:
-                condition = {}
+        # 쿨다운 + 일일 한도 — 매칭된 정책 전체를 Redis 호출 1회로 판정
+        admitted = await self._admit(redis, candidates) if candidates else []
 
-            if condition and not self._eval_condition(condition, payload):
-                continue
-
-            # 3. 커맨드 페이로드 구성 ($trigger.payload.xxx 변수 치환)
-            template_raw = policy.get("command_payload_template", "{}")
-            try:
-                template = json.loads(template_raw) if isinstance(template_raw, str) else template_raw
-            except json.JSONDecodeError:
-                template = {}
-
-            command_payload = self._resolve_template(template, payload, case_id, tenant_id)
-
-            # 4. POLICY_COMMAND 이벤트를 Core EventOutbox에 발행
-            target_service = policy.get("target_service", "core")
-            target_command = policy.get("target_command", "")
-
-            await self._publish_policy_command(
-                event_type="POLICY_COMMAND",
-                aggregate_id=policy_id,
-                case_id=case_id,
-                tenant_id=tenant_id,
-                command=target_command,
-                target_service=target_service,
-                command_payload=command_payload,
-                triggered_by_event=event_type,
-                triggered_by_policy=policy_id,
-            )
-
-            # 5. 쿨다운 설정
-            effective_cooldown = cooldown_seconds if cooldown_seconds > 0 else 3600
-            await self._set_cooldown(redis, policy_id, effective_cooldown)
+        executed: list[CompiledPolicy] = []
+        try:
+            for policy in admitted:
+                command_payload = self._resolve_template(policy.template, payload, case_id, tenant_id)
 
-            logger.info(
-                "Policy 실행 완료: %s → %s.%s (case=%s)",
-                policy.get("name", policy_id),
-                target_service,
-                target_command,
-                case_id,
-            )
+                # POLICY_COMMAND 이벤트를 Core EventOutbox에 발행
+                await self._publish_policy_command(
+                    event_type="POLICY_COMMAND",
+                    aggregate_id=policy.id,
+                    case_id=case_id,
+                    tenant_id=tenant_id,
+                    command=policy.target_command,
+                    target_service=policy.target_service,
+                    command_payload=command_payload,
+                    triggered_by_event=event_type,
+                    triggered_by_policy=policy.id,
+                )
+                executed.append(policy)
+
+                logger.info(
+                    "Policy 실행 완료: %s → %s.%s (case=%s)",
+                    policy.name,
+                    policy.target_service,
+                    policy.target_command,
+                    case_id,
+                )
+        finally:
+            # 발행에 성공한 정책만 쿨다운 설정 — 중간 실패로 재시도돼도 이미 발행한 정책은 건너뛴다
+            if executed:
+                await self._set_cooldowns(redis, executed)
 
         # 모든 정책 처리 완료 — ACK
         await redis.xack(stream_name, CONSUMER_GROUP, msg_id)
 
-    async def _find_matching_policies(
-        self,
-        neo4j_driver,
-        case_id: str,
-        tenant_id: str,
-        event_type: str,
-    ) -> list[dict]:
-        """Neo4j에서 매칭되는 활성 Policy 노드 조회
+    async def _admit(self, redis, policies: list[CompiledPolicy]) -> list[CompiledPolicy]:
+        """쿨다운·일일 한도를 통과한 정책만 반환 — _ADMIT_SCRIPT 1회 실행
 
-        case_id, tenant_id, trigger_event가 일치하고 enabled=true인 정책만 반환한다.
-        tenant_id 필터로 크로스 테넌트 정책 실행을 방지한다.
-        """
-        query = """
-        MATCH (p:Policy {case_id: $case_id, tenant_id: $tenant_id, enabled: true})
-        WHERE p.trigger_event = $event_type
-        RETURN p
-        ORDER BY p.name
+        쿨다운 키: axiom:policy:cooldown:{policy_id} (값: 마지막 실행 UTC ISO 시각)
+        일일 키:   axiom:policy:daily:{policy_id}:{YYYY-MM-DD} (INCR, 첫 증가 시 EXPIRE 86400초)
         """
-        try:
-            async with neo4j_driver.session() as session:
-                result = await session.run(
-                    query,
-                    case_id=case_id,
-                    tenant_id=tenant_id,
-                    event_type=event_type,
+        if self._admit_script is None:
+            self._admit_script = redis.register_script(_ADMIT_SCRIPT)
+
+        now = datetime.now(timezone.utc)
+        today_str = date.today().isoformat()
+        keys: list[str] = []
+        args: list[Any] = []
+        for policy in policies:
+            keys.append(COOLDOWN_KEY.format(policy_id=policy.id))
+            keys.append(DAILY_KEY.format(policy_id=policy.id, day=today_str))
+            cutoff = ""
+            if policy.cooldown_seconds > 0:
+                cutoff = (now - timedelta(seconds=policy.cooldown_seconds)).isoformat()
+            args.append(cutoff)
+            args.append(max(policy.max_executions_per_day, 0))
+
+        statuses = await self._admit_script(keys=keys, args=args)
+
+        admitted = []
+        for policy, status in zip(policies, statuses):
+            status = int(status)
+            if status == 1:
+                admitted.append(policy)
+            elif status == 0:
+                logger.debug("Policy %s 쿨다운 중, 건너뜀", policy.id)
+            else:
+                logger.warning(
+                    "Policy %s 일일 실행 한도(%d) 초과, 건너뜀",
+                    policy.id, policy.max_executions_per_day,
                 )
-                records = [dict(record["p"]) async for record in result]
-                return records
-        except Exception as exc:
-            logger.error(
-                "Policy 조회 실패: case_id=%s, event_type=%s, error=%s",
-                case_id, event_type, exc,
-            )
-            return []
+        return admitted
 
     @staticmethod
     def _eval_condition(condition: dict, payload: dict) -> bool:
@@ -318,82 +483,19 @@ class PolicyExecutorWorker(BaseWorker):
         return False
 
     @staticmethod
-    async def _check_cooldown(redis, policy_id: str, cooldown_seconds: int) -> bool:
-        """쿨다운 확인 — Redis 기반 (워커 재시작/수평 확장 안전)
-
-        쿨다운 키가 존재하면 마지막 실행 시각을 확인하여
-        cooldown_seconds가 경과했는지 판단한다.
-        쿨다운이 0 이하이면 항상 실행 허용한다.
-        """
-        if cooldown_seconds <= 0:
-            return True
-
-        cooldown_key = f"axiom:policy:cooldown:{policy_id}"
-        last_raw = await redis.get(cooldown_key)
-
-        if not last_raw:
-            # 쿨다운 키 없음 — 첫 실행 허용
-            return True
-
-        try:
-            # decode_responses=True 설정이면 이미 str
-            last_str = last_raw if isinstance(last_raw, str) else last_raw.decode()
-            last = datetime.fromisoformat(last_str)
-            elapsed = (datetime.now(timezone.utc) - last).total_seconds()
-            return elapsed >= cooldown_seconds
-        except (ValueError, AttributeError) as exc:
-            logger.warning("쿨다운 시간 파싱 실패 (policy_id=%s): %s", policy_id, exc)
-            # 파싱 실패 시 안전하게 실행 허용
-            return True
-
-    @staticmethod
-    async def _set_cooldown(redis, policy_id: str, cooldown_seconds: int) -> None:
-        """쿨다운 설정 — Redis SETEX
+    async def _set_cooldowns(redis, policies: list[CompiledPolicy]) -> None:
+        """쿨다운 설정 — 실행한 정책 전체를 파이프라인 1회로 SETEX
 
         키: axiom:policy:cooldown:{policy_id}
         값: ISO 타임스탬프
-        TTL: cooldown_seconds (자동 만료)
-        """
-        cooldown_key = f"axiom:policy:cooldown:{policy_id}"
-        await redis.setex(
-            cooldown_key,
-            cooldown_seconds,
-            datetime.now(timezone.utc).isoformat(),
-        )
-
-    @staticmethod
-    async def _check_daily_limit(
-        redis,
-        policy_id: str,
-        max_executions_per_day: int,
-    ) -> bool:
-        """일일 실행 횟수 제한 확인 — Redis INCR 기반
-
-        키: axiom:policy:daily:{policy_id}:{YYYY-MM-DD}
-        INCR로 카운터를 증가시키고, 첫 증가 시 EXPIRE 86400초를 설정한다.
-        카운터가 max_executions_per_day를 초과하면 False를 반환하여 실행을 차단한다.
+        TTL: cooldown_seconds (0 이하이면 3600초, 자동 만료)
         """
-        today_str = date.today().isoformat()
-        daily_key = f"axiom:policy:daily:{policy_id}:{today_str}"
-
-        try:
-            current_count = await redis.incr(daily_key)
-            # 첫 번째 증가(1)이면 TTL 설정 — 자정 이후 자동 만료
-            if current_count == 1:
-                await redis.expire(daily_key, 86400)
-
-            if current_count > max_executions_per_day:
-                # 한도 초과 — INCR은 이미 실행되었으나 실제 커맨드 발행은 차단
-                return False
-
-            return True
-        except Exception as exc:
-            logger.warning(
-                "일일 실행 한도 확인 실패 (policy_id=%s): %s — 안전하게 실행 허용",
-                policy_id, exc,
-            )
-            # Redis 오류 시 안전하게 실행 허용 (가용성 우선)
-            return True
+        now_iso = datetime.now(timezone.utc).isoformat()
+        pipe = redis.pipeline(transaction=False)
+        for policy in policies:
+            effective_cooldown = policy.cooldown_seconds if policy.cooldown_seconds > 0 else 3600
+            pipe.setex(COOLDOWN_KEY.format(policy_id=policy.id), effective_cooldown, now_iso)
+        await pipe.execute()
 
     @staticmethod
     def _resolve_template(
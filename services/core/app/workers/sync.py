@@ -3,14 +3,16 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Any
+import re
+import time
+from typing import Any, Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 
 from app.core.observability import metrics_registry
+from app.core.outbox_relay import OutboxRelay, RelayFailure
 from app.core.redis_client import get_redis
-from app.core.database import AsyncSessionLocal
+from app.core.database import DATABASE_SCHEMA, AsyncSessionLocal
 from app.models.base_models import EventDeadLetter, EventOutbox
 from app.workers.base import BaseWorker
 
@@ -23,6 +25,30 @@ logger = logging.getLogger("axiom.workers.sync")
 #   FAILED  → DEAD_LETTER (retry_count >= MAX_RETRY)
 MAX_RETRY = 3
 
+_POSITIONAL = re.compile(r"\$(\d+)")
+
+
+class _SessionConnection:
+    """Adapts an AsyncSession to the asyncpg-style OutboxConnection ($n placeholders)."""
+
+    def __init__(self, session: Any) -> None:
+        self._session = session
+
+    @staticmethod
+    def _bind(sql: str, args: tuple[Any, ...]) -> tuple[Any, dict[str, Any]]:
+        return (
+            text(_POSITIONAL.sub(lambda m: f":p{m.group(1)}", sql)),
+            {f"p{i}": arg for i, arg in enumerate(args, start=1)},
+        )
+
+    async def fetch(self, sql: str, *args: Any) -> Sequence[Any]:
+        stmt, params = self._bind(sql, args)
+        return (await self._session.execute(stmt, params)).mappings().all()
+
+    async def execute(self, sql: str, *args: Any) -> Any:
+        stmt, params = self._bind(sql, args)
+        return await self._session.execute(stmt, params)
+
 
 class SyncWorker(BaseWorker):
     """
@@ -35,12 +61,24 @@ class SyncWorker(BaseWorker):
     3. Failure isolation: individual event failure doesn't block batch
     4. Dead Letter: events exceeding MAX_RETRY move to DEAD_LETTER status
     5. Metrics: published/failed/dlq counters and gauges
+    6. Throughput: one Redis pipeline per batch, bulk status UPDATEs, and the
+       run loop drains without sleeping while batches come back full
     """
 
-    def __init__(self, poll_interval_seconds: int = 5, max_batch: int = 100):
+    def __init__(
+        self,
+        poll_interval_seconds: int = 5,
+        max_batch: int = 100,
+        gauge_interval_seconds: float = 30.0,
+    ):
         super().__init__("sync")
         self.poll_interval_seconds = poll_interval_seconds
         self.max_batch = max_batch
+        self.gauge_interval_seconds = gauge_interval_seconds
+        self._gauges_refreshed_at: float | None = None
+        self._relay = OutboxRelay(
+            f"{DATABASE_SCHEMA}.event_outbox", self._resolve_stream, max_retry=MAX_RETRY,
+        )
 
     @staticmethod
     def _resolve_stream(event_type: str) -> str:
@@ -51,96 +89,48 @@ class SyncWorker(BaseWorker):
         return "axiom:core:events"
 
     async def publish_pending_once(self, limit: int | None = None) -> dict[str, int]:
-        """Fetch PENDING events and publish to Redis Streams."""
+        """Claim PENDING events and publish them to Redis Streams in one pipeline.
+
+        Claim, status updates and dead-letter inserts share one transaction;
+        see app.core.outbox_relay for the round-trip layout.
+        """
         batch_size = min(max(limit or self.max_batch, 1), 1000)
         redis = get_redis()
-        published = 0
-        failed = 0
 
         async with AsyncSessionLocal() as session:
-            rows = await session.execute(
-                select(EventOutbox)
-                .where(EventOutbox.status == "PENDING")
-                .order_by(EventOutbox.created_at.asc())
-                .limit(batch_size)
-                .with_for_update(skip_locked=True)
-            )
-            events = rows.scalars().all()
+            result = await self._relay.relay_once(_SessionConnection(session), redis, batch_size)
 
-            for event in events:
-                stream = self._resolve_stream(event.event_type)
-                body = {
-                    "event_id": event.id,
-                    "event_type": event.event_type,
-                    "aggregate_type": event.aggregate_type,
-                    "aggregate_id": event.aggregate_id,
-                    "tenant_id": event.tenant_id,
-                    "payload": json.dumps(event.payload, ensure_ascii=True),
-                }
-                try:
-                    await redis.xadd(stream, body, maxlen=10000, approximate=True)
-                    event.status = "PUBLISHED"
-                    now = datetime.now(timezone.utc)
-                    event.published_at = now
-                    # DDD-P3-05: Relay lag measurement
-                    if event.created_at:
-                        lag = (now - event.created_at).total_seconds()
-                        metrics_registry.set_gauge("core_relay_lag_seconds", lag)
-                    published += 1
-                    metrics_registry.inc("core_event_outbox_published_total")
-                except Exception as err:  # pragma: no cover - network/runtime branch
-                    event.retry_count = (event.retry_count or 0) + 1
-                    event.last_error = str(err)[:500]
-                    if event.retry_count >= MAX_RETRY:
-                        event.status = "DEAD_LETTER"
-                        # DDD-P3-05: Persist to EventDeadLetter DB table
-                        dl = EventDeadLetter(
-                            original_event_id=event.id,
-                            event_type=event.event_type,
-                            aggregate_type=event.aggregate_type,
-                            aggregate_id=event.aggregate_id,
-                            payload=event.payload,
-                            failure_reason=str(err)[:500],
-                            retry_count=event.retry_count,
-                            tenant_id=event.tenant_id,
-                        )
-                        session.add(dl)
-                        logger.error(
-                            "Event %s moved to DEAD_LETTER after %d retries: %s",
-                            event.id, event.retry_count, err,
-                        )
-                    else:
-                        event.status = "FAILED"
-                    failed += 1
-                    metrics_registry.inc("core_event_outbox_failed_total")
-                    # Push to DLQ stream for external monitoring
-                    try:
-                        await redis.xadd(
-                            "axiom:dlq:events",
-                            {
-                                **body,
-                                "target_stream": stream,
-                                "error": str(err),
-                                "retry_count": str(event.retry_count),
-                            },
-                            maxlen=10000,
-                            approximate=True,
-                        )
-                        metrics_registry.inc("core_dlq_messages_total")
-                    except Exception:  # pragma: no cover
-                        pass
+            dead = [f for f in result.failures if f.status == "DEAD_LETTER"]
+            for failure in dead:
+                # DDD-P3-05: Persist to EventDeadLetter DB table
+                row = failure.row
+                session.add(EventDeadLetter(
+                    original_event_id=row.id,
+                    event_type=row.event_type,
+                    aggregate_type=row.aggregate_type,
+                    aggregate_id=row.aggregate_id,
+                    payload=json.loads(row.payload),
+                    failure_reason=failure.error,
+                    retry_count=failure.retry_count,
+                    tenant_id=row.tenant_id,
+                ))
+                logger.error(
+                    "Event %s moved to DEAD_LETTER after %d retries: %s",
+                    row.id, failure.retry_count, failure.error,
+                )
             await session.commit()
 
-            pending_count = await session.scalar(
-                select(func.count()).select_from(EventOutbox).where(EventOutbox.status == "PENDING")
-            )
-            metrics_registry.set_gauge("core_event_outbox_pending", float(pending_count or 0))
+            if self._gauges_due():
+                await self._refresh_db_gauges(session)
 
-            # DDD-P3-05: Track unresolved DLQ DB count
-            dlq_db_count = await session.scalar(
-                select(func.count()).select_from(EventDeadLetter).where(EventDeadLetter.resolved_at.is_(None))
-            )
-            metrics_registry.set_gauge("core_dlq_db_unresolved", float(dlq_db_count or 0))
+        if result.published:
+            metrics_registry.inc("core_event_outbox_published_total", float(len(result.published)))
+        if result.max_lag is not None:
+            # DDD-P3-05: Relay lag measurement (oldest event in the batch)
+            metrics_registry.set_gauge("core_relay_lag_seconds", result.max_lag)
+        if result.failures:
+            metrics_registry.inc("core_event_outbox_failed_total", float(len(result.failures)))
+            await self._push_dlq(redis, result.failures)
 
         try:
             dlq_depth = await redis.xlen("axiom:dlq:events")
@@ -148,7 +138,50 @@ class SyncWorker(BaseWorker):
         except Exception:  # pragma: no cover - network/runtime branch
             pass
 
-        return {"published": published, "failed": failed}
+        return {"published": len(result.published), "failed": len(result.failures)}
+
+    async def _push_dlq(self, redis: Any, failures: list[RelayFailure]) -> None:
+        """Push failed events to the DLQ stream for external monitoring (one pipeline)."""
+        pipe = redis.pipeline(transaction=False)
+        for failure in failures:
+            pipe.xadd(
+                "axiom:dlq:events",
+                {
+                    **failure.row.body(),
+                    "target_stream": failure.stream,
+                    "error": failure.error,
+                    "retry_count": str(failure.retry_count),
+                },
+                maxlen=10000,
+                approximate=True,
+            )
+        try:
+            replies = await pipe.execute(raise_on_error=False)
+        except Exception:  # pragma: no cover - network/runtime branch
+            return
+        pushed = sum(1 for reply in replies if not isinstance(reply, Exception))
+        if pushed:
+            metrics_registry.inc("core_dlq_messages_total", float(pushed))
+
+    def _gauges_due(self) -> bool:
+        """COUNT(*) gauges are refreshed at most once per gauge_interval_seconds."""
+        now = time.monotonic()
+        if self._gauges_refreshed_at is not None and now - self._gauges_refreshed_at < self.gauge_interval_seconds:
+            return False
+        self._gauges_refreshed_at = now
+        return True
+
+    async def _refresh_db_gauges(self, session: Any) -> None:
+        pending_count = await session.scalar(
+            select(func.count()).select_from(EventOutbox).where(EventOutbox.status == "PENDING")
+        )
+        metrics_registry.set_gauge("core_event_outbox_pending", float(pending_count or 0))
+
+        # DDD-P3-05: Track unresolved DLQ DB count
+        dlq_db_count = await session.scalar(
+            select(func.count()).select_from(EventDeadLetter).where(EventDeadLetter.resolved_at.is_(None))
+        )
+        metrics_registry.set_gauge("core_dlq_db_unresolved", float(dlq_db_count or 0))
 
     async def retry_failed_once(self, limit: int = 200) -> int:
         """Reset FAILED events to PENDING for re-processing.
@@ -219,11 +252,14 @@ class SyncWorker(BaseWorker):
             self.poll_interval_seconds, self.max_batch, MAX_RETRY,
         )
         while self._running:
+            claimed = 0
             try:
-                await self.publish_pending_once(limit=self.max_batch)
+                result = await self.publish_pending_once(limit=self.max_batch)
+                claimed = result["published"] + result["failed"]
             except Exception:  # pragma: no cover
                 logger.exception("Outbox Relay Worker iteration failed")
-            await asyncio.sleep(self.poll_interval_seconds)
+            if claimed < self.max_batch:
+                await asyncio.sleep(self.poll_interval_seconds)
 
 
 if __name__ == "__main__":
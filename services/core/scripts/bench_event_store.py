@@ -0,0 +1,134 @@
+"""WorkItem Event Store 벤치마크 — 전체 리플레이 vs 스냅샷 + 이후 이벤트 리플레이.
+
+로컬 PostgreSQL(기본: DATABASE_URL)에 work_item_events / work_item_snapshots 테이블을 만들고
+이벤트 N개(기본 10,000)를 가진 WorkItem을 쌓은 뒤 load 지연(p50/p99)을 비교한다.
+  - append  : 이전 구현과 같은 이벤트당 INSERT 1회 vs append_events (배치당 multi-row INSERT 1회)
+  - load    : snapshot_interval=0 (전체 리플레이) vs 설정한 간격의 스냅샷
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_event_store.py --events 10000 --interval 100 --loads 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.modules.process.domain.events import WorkItemCreated, WorkItemReworkRequested, WorkItemStarted
+from app.modules.process.infrastructure.event_store import (
+    WorkItemEventStore,
+    _serialize_event,
+    ensure_event_store_table,
+)
+
+
+def _history(aggregate_id: str, n: int) -> list:
+    events = [WorkItemCreated(workitem_id=aggregate_id, tenant_id="bench", activity_name="Review",
+                              agent_mode="MANUAL")]
+    for i in range(1, n):
+        if i % 2:
+            events.append(WorkItemStarted(workitem_id=aggregate_id, tenant_id="bench"))
+        else:
+            events.append(WorkItemReworkRequested(workitem_id=aggregate_id, tenant_id="bench", reason=f"r{i}"))
+    return events
+
+
+async def _legacy_append(db: AsyncSession, aggregate_id: str, events: list) -> None:
+    """이전 append_events — 이벤트마다 INSERT 1회."""
+    for version, event in enumerate(events, start=1):
+        await db.execute(
+            text("""
+                INSERT INTO work_item_events (aggregate_id, event_type, event_data, version, created_at)
+                VALUES (:aggregate_id, :event_type, CAST(:event_data AS jsonb), :version, :created_at)
+            """),
+            {
+                "aggregate_id": aggregate_id,
+                "event_type": type(event).__name__,
+                "event_data": json.dumps(_serialize_event(event), default=str),
+                "version": version,
+                "created_at": event.occurred_at,
+            },
+        )
+
+
+async def _batched_append(db: AsyncSession, store: WorkItemEventStore, aggregate_id: str, events: list,
+                          batch: int) -> None:
+    version = 1
+    for i in range(0, len(events), batch):
+        version = await store.append_events(db, aggregate_id, events[i:i + batch], version)
+
+
+async def _time_loads(db: AsyncSession, store: WorkItemEventStore, aggregate_id: str, loads: int) -> list[float]:
+    samples = []
+    for _ in range(loads):
+        start = time.perf_counter()
+        wi = await store.load(db, aggregate_id)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert wi is not None
+    return sorted(samples)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    ids = {mode: f"bench-wi-{mode}-{uuid.uuid4()}" for mode in ("legacy", "batched")}
+    try:
+        async with AsyncSession(engine) as db:
+            await db.execute(text(f"SET search_path TO {settings.DATABASE_SCHEMA}, public"))
+            await ensure_event_store_table(db)
+            snapshot_store = WorkItemEventStore(snapshot_interval=args.interval)
+
+            start = time.perf_counter()
+            await _legacy_append(db, ids["legacy"], _history(ids["legacy"], args.events))
+            await db.commit()
+            t_legacy = time.perf_counter() - start
+
+            start = time.perf_counter()
+            await _batched_append(db, snapshot_store, ids["batched"], _history(ids["batched"], args.events),
+                                  args.batch)
+            await db.commit()
+            t_batched = time.perf_counter() - start
+            for mode, elapsed in (("legacy", t_legacy), ("batched", t_batched)):
+                print(json.dumps({"phase": "append", "mode": mode, "events": args.events,
+                                  "elapsed_s": round(elapsed, 3),
+                                  "events_per_sec": round(args.events / elapsed, 1)}))
+
+            for mode, store in (("full_replay", WorkItemEventStore(snapshot_interval=0)),
+                                ("snapshot", snapshot_store)):
+                samples = await _time_loads(db, store, ids["batched"], args.loads)
+                print(json.dumps({"phase": "load", "mode": mode, "events": args.events,
+                                  "interval": store.snapshot_interval,
+                                  "p50_ms": round(statistics.median(samples), 2),
+                                  "p99_ms": round(samples[int(len(samples) * 0.99) - 1], 2)}))
+                sys.stdout.flush()
+    finally:
+        async with AsyncSession(engine) as db:
+            await db.execute(text(f"SET search_path TO {settings.DATABASE_SCHEMA}, public"))
+            for aggregate_id in ids.values():
+                params = {"aggregate_id": aggregate_id}
+                await db.execute(text("DELETE FROM work_item_events WHERE aggregate_id = :aggregate_id"), params)
+                await db.execute(text("DELETE FROM work_item_snapshots WHERE aggregate_id = :aggregate_id"), params)
+            await db.commit()
+        await engine.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark WorkItem event store snapshots")
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--interval", type=int, default=settings.EVENT_STORE_SNAPSHOT_INTERVAL)
+    parser.add_argument("--batch", type=int, default=500, help="append_events batch size")
+    parser.add_argument("--loads", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
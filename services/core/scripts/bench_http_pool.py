@@ -0,0 +1,112 @@
+"""서비스 간 HTTP 호출 벤치마크 — 호출마다 새 AsyncClient vs 공유 풀(app.core.http_clients).
+
+로컬 스레드 HTTP/1.1 서버(keep-alive 지원)를 Synapse 대역으로 띄우고
+SynapseACL.proxy_request 경로로 N회(기본 1,000) 프록시 호출을 순차/동시 실행해 처리량을 비교한다.
+  - legacy: 이전 구현처럼 호출마다 httpx.AsyncClient 생성 → TCP 연결 수립 → 종료
+  - pooled: SynapseACL(공유 ServiceClient) — keep-alive 연결 재사용, 연결 한도, 재시도 예산, 서킷 브레이커
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_http_pool.py --calls 1000 --concurrency 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from app.core.http_clients import http_clients
+from app.infrastructure.external.synapse_acl import SynapseACL
+
+_BODY = json.dumps({"success": True, "data": {"log_id": "log-1", "rows": list(range(50))}}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 delayed-ACK 40ms 지연 방지
+
+    def do_GET(self) -> None:  # noqa: N802 — http.server 규약
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, *args) -> None:
+        return
+
+
+async def _legacy_call(base_url: str) -> None:
+    # 최적화 이전 SynapseACL.proxy_request와 같은 패턴
+    async with httpx.AsyncClient(timeout=180.0) as client:
+        response = await client.request("GET", f"{base_url}/api/v3/synapse/event-logs/log-1", headers={"X-Tenant-Id": "t"})
+    response.json()
+
+
+async def _pooled_call(acl: SynapseACL) -> None:
+    await acl.proxy_request("GET", "/api/v3/synapse/event-logs/log-1", tenant_id="t")
+
+
+async def _run(call, calls: int, concurrency: int) -> float:
+    start = time.perf_counter()
+    if concurrency <= 1:
+        for _ in range(calls):
+            await call()
+    else:
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one() -> None:
+            async with sem:
+                await call()
+
+        await asyncio.gather(*(_one() for _ in range(calls)))
+    return time.perf_counter() - start
+
+
+async def _bench(base_url: str, calls: int, concurrency: int) -> list[dict]:
+    acl = SynapseACL(base_url=base_url, service_token="bench")
+    modes = {
+        "legacy": lambda: _legacy_call(base_url),
+        "pooled": lambda: _pooled_call(acl),
+    }
+    results = []
+    try:
+        for label, conc in (("sequential", 1), ("concurrent", concurrency)):
+            for mode, call in modes.items():
+                await _run(call, min(20, calls), conc)  # 워밍업
+                elapsed = await _run(call, calls, conc)
+                results.append({
+                    "mode": mode, "pattern": label, "calls": calls, "concurrency": conc,
+                    "elapsed_s": round(elapsed, 3), "calls_per_s": round(calls / elapsed, 1),
+                })
+    finally:
+        await http_clients.aclose()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs per-call inter-service HTTP clients")
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        for result in asyncio.run(_bench(base_url, args.calls, args.concurrency)):
+            print(json.dumps(result, ensure_ascii=False))
+            sys.stdout.flush()
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+"""Outbox relay 벤치마크 — 행 단위 XADD/UPDATE vs 파이프라인 릴레이(OutboxRelay).
+
+로컬 PostgreSQL(기본: DATABASE_URL)과 Redis(REDIS_URL)에 벤치 전용 outbox 테이블을 만들고
+PENDING 이벤트 N개(기본 10,000)를 쌓은 뒤 모두 발행될 때까지 릴레이를 돌려
+처리량(events/sec)과 종단 지연(published_at - created_at)의 p50/p99/max를 비교한다.
+  - legacy   : 이전 SyncWorker와 같은 흐름 — 행마다 XADD 1회 + UPDATE 1회
+  - pipelined: app.core.outbox_relay.OutboxRelay — 배치당 claim 1회 + 파이프라인 1회 + UPDATE 1~2회
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_outbox_relay.py --events 10000 --batch 100 500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+
+import asyncpg
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.outbox_relay import OutboxRelay
+
+_DDL = """
+CREATE TABLE {table} (
+    id              VARCHAR PRIMARY KEY,
+    event_type      VARCHAR NOT NULL,
+    aggregate_type  VARCHAR NOT NULL,
+    aggregate_id    VARCHAR NOT NULL,
+    payload         JSONB   NOT NULL,
+    status          VARCHAR NOT NULL DEFAULT 'PENDING',
+    tenant_id       VARCHAR NOT NULL DEFAULT '',
+    created_at      TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp(),
+    published_at    TIMESTAMPTZ,
+    retry_count     INTEGER NOT NULL DEFAULT 0,
+    last_error      TEXT
+);
+CREATE INDEX ON {table} (created_at) WHERE status = 'PENDING';
+"""
+
+
+def _normalize_dsn(url: str) -> str:
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def _seed(conn: asyncpg.Connection, table: str, events: int) -> None:
+    await conn.execute(f"TRUNCATE {table}")
+    payload = json.dumps({"case_id": "bench", "amount": 1234, "note": "x" * 200})
+    await conn.executemany(
+        f"INSERT INTO {table} (id, event_type, aggregate_type, aggregate_id, payload, tenant_id) "
+        "VALUES ($1, 'PROCESS_INITIATED', 'WorkItem', $2, $3, 'bench')",
+        [(str(uuid.uuid4()), f"wi-{i}", payload) for i in range(events)],
+    )
+
+
+async def _legacy_once(conn: asyncpg.Connection, redis, table: str, stream: str, batch: int) -> int:
+    async with conn.transaction():
+        rows = await conn.fetch(
+            f"SELECT * FROM {table} WHERE status = 'PENDING' ORDER BY created_at LIMIT $1 FOR UPDATE SKIP LOCKED",
+            batch,
+        )
+        for row in rows:
+            body = {
+                "event_id": row["id"], "event_type": row["event_type"],
+                "aggregate_type": row["aggregate_type"], "aggregate_id": row["aggregate_id"],
+                "tenant_id": row["tenant_id"], "payload": row["payload"],
+            }
+            await redis.xadd(stream, body, maxlen=10000, approximate=True)
+            await conn.execute(f"UPDATE {table} SET status = 'PUBLISHED', published_at = now() WHERE id = $1", row["id"])
+    return len(rows)
+
+
+async def _drain(conn: asyncpg.Connection, redis, table: str, stream: str, batch: int, mode: str) -> float:
+    relay = OutboxRelay(table, lambda _event_type: stream)
+    start = time.perf_counter()
+    while True:
+        if mode == "legacy":
+            claimed = await _legacy_once(conn, redis, table, stream, batch)
+        else:
+            async with conn.transaction():
+                claimed = (await relay.relay_once(conn, redis, batch)).claimed
+        if claimed == 0:
+            return time.perf_counter() - start
+
+
+async def _lag(conn: asyncpg.Connection, table: str) -> dict:
+    row = await conn.fetchrow(
+        f"""
+        SELECT count(*) FILTER (WHERE status = 'PUBLISHED') AS published,
+               percentile_cont(0.5) WITHIN GROUP (ORDER BY extract(epoch FROM published_at - created_at)) AS p50,
+               percentile_cont(0.99) WITHIN GROUP (ORDER BY extract(epoch FROM published_at - created_at)) AS p99,
+               max(extract(epoch FROM published_at - created_at)) AS max
+        FROM {table}
+        """
+    )
+    return {
+        "published": row["published"],
+        "lag_p50_ms": round(float(row["p50"]) * 1000, 1),
+        "lag_p99_ms": round(float(row["p99"]) * 1000, 1),
+        "lag_max_ms": round(float(row["max"]) * 1000, 1),
+    }
+
+
+async def _run(args: argparse.Namespace) -> list[dict]:
+    table = f"public.bench_outbox_{uuid.uuid4().hex[:8]}"
+    stream = f"bench:outbox:{uuid.uuid4().hex[:8]}"
+    conn = await asyncpg.connect(_normalize_dsn(args.dsn))
+    redis = aioredis.from_url(args.redis_url, decode_responses=True)
+    results = []
+    try:
+        await conn.execute(_DDL.format(table=table))
+        for batch in args.batch:
+            for mode in ("legacy", "pipelined"):
+                await _seed(conn, table, args.events)
+                await redis.delete(stream)
+                elapsed = await _drain(conn, redis, table, stream, batch, mode)
+                results.append({
+                    "mode": mode,
+                    "events": args.events,
+                    "batch": batch,
+                    "events_per_s": round(args.events / elapsed, 1),
+                    **await _lag(conn, table),
+                })
+    finally:
+        await conn.execute(f"DROP TABLE IF EXISTS {table}")
+        await redis.delete(stream)
+        await redis.aclose()
+        await conn.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark outbox relay throughput and lag")
+    parser.add_argument("--dsn", default=settings.DATABASE_URL)
+    parser.add_argument("--redis-url", default=settings.REDIS_URL)
+    parser.add_argument("--events", type=int, default=10000, help="PENDING events queued per run")
+    parser.add_argument("--batch", type=int, nargs="+", default=[100, 500])
+    args = parser.parse_args()
+
+    for result in asyncio.run(_run(args)):
+        print(json.dumps(result, ensure_ascii=False))
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+"""PolicyExecutorWorker 벤치마크 — 이벤트당 Neo4j 조회 vs 메모리 Policy 인덱스 + Lua 판정.
+
+로컬 Neo4j(NEO4J_URI/NEO4J_USER/NEO4J_PASSWORD)에 벤치 전용 테넌트로 활성 Policy N개(기본 1,000)를
+만들고, Redis(REDIS_URL)를 쓰며 합성 이벤트 M개(기본 5,000)를 처리한 처리량(events/sec)을 비교한다.
+POLICY_COMMAND 발행(Outbox INSERT)은 두 모드 모두 카운터로 대체해 매칭·판정 경로만 측정한다.
+  - legacy : 이전 구현과 같은 흐름 — 이벤트마다 Cypher 1회, 정책마다 조건/템플릿 JSON 파싱 + GET/INCR/SETEX
+  - indexed: PolicyExecutorWorker._process_event — 메모리 인덱스 매칭 + 판정 Lua 1회 + SETEX 파이프라인 1회
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_policy_executor.py --policies 1000 --events 5000 --cases 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+
+import redis.asyncio as aioredis
+from neo4j import AsyncGraphDatabase
+
+from app.core.config import settings
+from app.workers.policy_executor import PolicyExecutorWorker, PolicyIndex
+
+EVENT_TYPES = ["SENSOR_READ", "ORDER_PLACED", "CASE_UPDATED", "DEADLINE_APPROACHING"]
+
+
+def _policy_rows(tenant_id: str, policies: int, cases: int) -> list[dict]:
+    rows = []
+    for i in range(policies):
+        rows.append({
+            "id": f"bench-policy-{tenant_id}-{i}",
+            "name": f"bench-{i:05d}",
+            "case_id": f"case-{i % cases}",
+            "tenant_id": tenant_id,
+            "trigger_event": EVENT_TYPES[i % len(EVENT_TYPES)],
+            "trigger_condition": json.dumps({"field": "value", "op": ">", "value": i % 100}),
+            "command_payload_template": json.dumps({"ref": "$trigger.payload.ref", "opts": {"n": i}}),
+            "cooldown_seconds": 0,
+            "max_executions_per_day": 1_000_000,
+        })
+    return rows
+
+
+def _events(tenant_id: str, events: int, cases: int, seed: int) -> list[dict]:
+    rnd = random.Random(seed)
+    return [{
+        "event_type": rnd.choice(EVENT_TYPES),
+        "tenant_id": tenant_id,
+        "payload": json.dumps({"case_id": f"case-{rnd.randrange(cases)}", "value": rnd.randrange(100),
+                               "ref": f"r-{i}"}),
+    } for i in range(events)]
+
+
+class _LegacyWorker(PolicyExecutorWorker):
+    """이전 _process_event — 이벤트마다 Neo4j 조회, 정책마다 JSON 파싱과 Redis 개별 호출."""
+
+    async def _process_event(self, redis, neo4j_driver, stream_name, msg_id, data):
+        payload = json.loads(data["payload"])
+        case_id, tenant_id, event_type = payload["case_id"], data["tenant_id"], data["event_type"]
+        async with neo4j_driver.session() as session:
+            result = await session.run(
+                """
+                MATCH (p:Policy {case_id: $case_id, tenant_id: $tenant_id, enabled: true})
+                WHERE p.trigger_event = $event_type
+                RETURN p
+                ORDER BY p.name
+                """,
+                case_id=case_id, tenant_id=tenant_id, event_type=event_type,
+            )
+            policies = [dict(record["p"]) async for record in result]
+        today = time.strftime("%Y-%m-%d")
+        for policy in policies:
+            cooldown_key = f"axiom:policy:cooldown:{policy['id']}"
+            if policy["cooldown_seconds"] > 0 and await redis.get(cooldown_key):
+                continue
+            daily_key = f"axiom:policy:daily:{policy['id']}:{today}"
+            if await redis.incr(daily_key) == 1:
+                await redis.expire(daily_key, 86400)
+            condition = json.loads(policy["trigger_condition"])
+            if condition and not self._eval_condition(condition, payload):
+                continue
+            template = json.loads(policy["command_payload_template"])
+            command_payload = self._resolve_template(template, payload, case_id, tenant_id)
+            await self._publish_policy_command(command_payload=command_payload, triggered_by_policy=policy["id"])
+            await redis.setex(cooldown_key, 3600, "1")
+
+
+async def _run_mode(worker: PolicyExecutorWorker, redis, driver, events: list[dict]) -> tuple[float, int]:
+    published = 0
+
+    async def _publish(**kwargs):
+        nonlocal published
+        published += 1
+
+    async def _no_ack(*args):
+        return 0
+
+    worker._publish_policy_command = _publish
+    redis.xack = _no_ack
+    start = time.perf_counter()
+    for i, data in enumerate(events):
+        await worker._process_event(redis, driver, "bench", f"{i}-0", data)
+    return time.perf_counter() - start, published
+
+
+async def _run(args: argparse.Namespace) -> None:
+    tenant_id = f"bench-{uuid.uuid4().hex[:8]}"
+    driver = AsyncGraphDatabase.driver(
+        os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD", "password")),
+    )
+    redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+    try:
+        async with driver.session() as session:
+            await session.run(
+                """
+                UNWIND $rows AS row
+                CREATE (p:Policy) SET p = row, p.enabled = true, p.layer = "kinetic",
+                                      p.created_at = datetime(), p.updated_at = datetime()
+                """,
+                rows=_policy_rows(tenant_id, args.policies, args.cases),
+            )
+        events = _events(tenant_id, args.events, args.cases, args.seed)
+        for mode in args.modes:
+            worker = _LegacyWorker(driver) if mode == "legacy" else PolicyExecutorWorker(driver, PolicyIndex())
+            if mode == "indexed":
+                await worker.policies.ensure_fresh(driver)
+            elapsed, published = await _run_mode(worker, redis, driver, events)
+            print(json.dumps({"mode": mode, "policies": args.policies, "events": args.events,
+                              "published": published, "elapsed_s": round(elapsed, 3),
+                              "events_per_sec": round(args.events / elapsed, 1)}))
+            sys.stdout.flush()
+    finally:
+        async with driver.session() as session:
+            await session.run("MATCH (p:Policy {tenant_id: $tenant_id}) DETACH DELETE p", tenant_id=tenant_id)
+        cursor = 0
+        while True:
+            cursor, keys = await redis.scan(cursor, match=f"axiom:policy:*bench-policy-{tenant_id}-*", count=1000)
+            if keys:
+                await redis.delete(*keys)
+            if cursor == 0:
+                break
+        await redis.aclose()
+        await driver.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark PolicyExecutorWorker policy matching")
+    parser.add_argument("--policies", type=int, default=1_000)
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--cases", type=int, default=50, help="policies are spread over this many case_ids")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--modes", nargs="+", choices=["legacy", "indexed"], default=["legacy", "indexed"])
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+"""WatchCepWorker 처리량·지연 테스트 — 로컬 Redis + PostgreSQL, 합성 이벤트 100k건.
+
+CORE_RUN_WATCH_LOAD=1 일 때만 실행 (DATABASE_URL / REDIS_URL 사용).
+전용 스트림·컨슈머 그룹에 이벤트를 쌓고 run()을 돌려 전부 ACK될 때까지의
+처리량(events/sec)과 XADD→ACK 지연 p50/p99를 출력한다.
+"""
+import asyncio
+import json
+import os
+import time
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from app.core.database import AsyncSessionLocal, engine, ensure_schema
+from app.core.redis_client import get_redis
+from app.models.base_models import Base, WatchAlert, WatchSubscription
+from app.modules.watch.infrastructure import watch_cep
+from app.modules.watch.infrastructure.watch_cep import WatchCepWorker
+
+EVENTS = int(os.getenv("WATCH_LOAD_EVENTS", "100000"))
+TENANTS = 10
+AGGREGATES = 5000
+
+
+def _enabled() -> bool:
+    return os.getenv("CORE_RUN_WATCH_LOAD", "").lower() in {"1", "true", "yes", "on"}
+
+
+@pytest_asyncio.fixture
+async def load_env(monkeypatch: pytest.MonkeyPatch):
+    if not _enabled():
+        pytest.skip("set CORE_RUN_WATCH_LOAD=1 (local Redis + PostgreSQL) to run")
+    if engine.url.get_backend_name() != "postgresql":
+        pytest.skip("postgres-only load test")
+    async with engine.begin() as conn:
+        await ensure_schema(conn)
+        await conn.run_sync(Base.metadata.create_all)
+
+    run_id = uuid.uuid4().hex[:8]
+    stream = f"axiom:watches:load:{run_id}"
+    tenants = [f"load-{run_id}-{i}" for i in range(TENANTS)]
+    monkeypatch.setattr(watch_cep, "STREAM_KEY", stream)
+    monkeypatch.setattr(watch_cep, "CONSUMER_GROUP", f"watch_cep_load_{run_id}")
+    monkeypatch.setattr(watch_cep, "BLOCK_MS", 200)
+    async with AsyncSessionLocal() as db:
+        for tenant in tenants:
+            # 이벤트 10건 중 1건만 임계값을 넘어 알림이 생성되도록
+            db.add(WatchSubscription(
+                user_id="load", event_type="AMOUNT_CHANGED", channels=["in_app"], case_id=None,
+                rule={"type": "threshold", "field": "amount", "operator": ">", "threshold": 900},
+                active=True, tenant_id=tenant,
+            ))
+        await db.commit()
+
+    redis = get_redis()
+    try:
+        yield stream, tenants, redis
+    finally:
+        await redis.delete(stream)
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(WatchAlert).where(WatchAlert.tenant_id.in_(tenants)))
+            await db.execute(delete(WatchSubscription).where(WatchSubscription.tenant_id.in_(tenants)))
+            await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_watch_cep_100k_events_throughput_and_lag(load_env):
+    stream, tenants, redis = load_env
+    pipe = redis.pipeline(transaction=False)
+    for i in range(EVENTS):
+        pipe.xadd(stream, {
+            "event_id": f"load-{i}",
+            "event_type": "AMOUNT_CHANGED",
+            "aggregate_id": f"case-{i % AGGREGATES}",
+            "tenant_id": tenants[i % TENANTS],
+            "payload": json.dumps({"amount": i % 1000, "seq": i}),
+        })
+        if i % 5000 == 4999:
+            await pipe.execute()
+    await pipe.execute()
+
+    worker = WatchCepWorker()
+    lags_ms: list[float] = []
+    process_batch = worker.process_batch
+
+    async def _timed_batch(r, entries):
+        acked = await process_batch(r, entries)
+        now_ms = time.time() * 1000
+        lags_ms.extend(now_ms - int(str(entry_id).split("-")[0]) for entry_id in acked)
+        return acked
+
+    worker.process_batch = _timed_batch
+    start = time.perf_counter()
+    task = asyncio.create_task(worker.run())
+    try:
+        while len(lags_ms) < EVENTS:
+            await asyncio.sleep(0.2)
+            assert time.perf_counter() - start < 600, f"only {len(lags_ms)} of {EVENTS} acked"
+    finally:
+        worker._shutdown()
+        await asyncio.wait_for(task, timeout=10)
+    elapsed = time.perf_counter() - start
+
+    pending = await redis.xpending(stream, watch_cep.CONSUMER_GROUP)
+    assert pending["pending"] == 0
+    lags_ms.sort()
+    print(json.dumps({
+        "events": EVENTS,
+        "elapsed_s": round(elapsed, 2),
+        "events_per_sec": round(EVENTS / elapsed, 1),
+        "subscription_loads": worker.subscriptions.loads,
+        "lag_p50_ms": round(lags_ms[len(lags_ms) // 2], 1),
+        "lag_p99_ms": round(lags_ms[int(len(lags_ms) * 0.99)], 1),
+    }))
+    # 구독은 (tenant, event_type)마다 한 번만 조회
+    assert worker.subscriptions.loads == TENANTS
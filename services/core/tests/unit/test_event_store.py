@@ -17,6 +17,7 @@ from app.modules.process.domain.events import (
     WorkItemCancelled,
     WorkItemCompleted,
     WorkItemCreated,
+    WorkItemReworkRequested,
     WorkItemStarted,
     WorkItemSubmitted,
 )
@@ -206,3 +207,88 @@ class TestWorkItemEventStoreLoad:
         store = WorkItemEventStore()
         count = await store.count_events(db, "wi-1")
         assert count == 5
+
+
+class _FakeEventDb:
+    """event_store의 SQL 4종만 해석하는 인메모리 AsyncSession 대역."""
+
+    def __init__(self):
+        self.events: dict[str, list[dict]] = {}
+        self.snapshots: dict[str, dict] = {}
+        self.inserts = 0
+        self.replayed_rows = 0
+
+    async def execute(self, stmt, params):
+        sql = str(stmt)
+        agg = params["aggregate_id"]
+        result = MagicMock()
+        if "INSERT INTO work_item_events" in sql:
+            self.inserts += 1
+            stored = self.events.setdefault(agg, [])
+            current = max((e["version"] for e in stored), default=0)
+            rows = json.loads(params["events"]) if current == params["current_version"] else []
+            if {r["version"] for r in rows} & {e["version"] for e in stored}:
+                raise Exception("duplicate key value violates unique constraint")
+            stored.extend(rows)
+            result.rowcount = len(rows)
+        elif "INSERT INTO work_item_snapshots" in sql:
+            existing = self.snapshots.get(agg)
+            if existing is None or existing["version"] < params["version"]:
+                self.snapshots[agg] = {"version": params["version"], "state": params["state"]}
+        elif "FROM work_item_snapshots" in sql:
+            snap = self.snapshots.get(agg)
+            result.fetchall.return_value = [MagicMock(**snap)] if snap else []
+        else:
+            rows = [
+                MagicMock(event_type=e["event_type"], event_data=e["event_data"], version=e["version"])
+                for e in self.events.get(agg, []) if e["version"] > params["after_version"]
+            ]
+            self.replayed_rows += len(rows)
+            result.fetchall.return_value = rows
+        return result
+
+
+def _history(n: int) -> list:
+    events = [WorkItemCreated(workitem_id="wi-1", tenant_id="t-1", activity_name="Review", agent_mode="MANUAL")]
+    for i in range(1, n):
+        if i % 2:
+            events.append(WorkItemStarted(workitem_id="wi-1", tenant_id="t-1"))
+        else:
+            events.append(WorkItemReworkRequested(workitem_id="wi-1", tenant_id="t-1", reason=f"r{i}"))
+    return events
+
+
+class TestWorkItemEventStoreSnapshots:
+    @pytest.mark.asyncio
+    async def test_append_events_single_statement_and_snapshot_every_n(self):
+        db = _FakeEventDb()
+        store = WorkItemEventStore(snapshot_interval=100)
+        history = _history(250)
+
+        assert await store.append_events(db, "wi-1", history[:120], starting_version=1) == 121
+        assert db.inserts == 1 and db.snapshots["wi-1"]["version"] == 120
+        assert await store.append_events(db, "wi-1", history[120:], starting_version=121) == 251
+        assert db.inserts == 2 and db.snapshots["wi-1"]["version"] == 250
+
+        await store.append(db, "wi-1", WorkItemStarted(workitem_id="wi-1", tenant_id="t-1"), 251)
+        db.replayed_rows = 0
+        wi = await store.load(db, "wi-1")
+        assert db.replayed_rows == 1  # 스냅샷(v250) 이후 이벤트만
+        assert wi.version == 251 and wi.status == WorkItemStatus.IN_PROGRESS
+
+        full = await WorkItemEventStore(snapshot_interval=0).load(db, "wi-1")
+        assert (full.status, full.version, full.result_data) == (wi.status, wi.version, wi.result_data)
+        assert full.result_data == {"rework_reason": "r248"}
+
+    @pytest.mark.asyncio
+    async def test_append_events_version_conflict(self):
+        db = _FakeEventDb()
+        store = WorkItemEventStore(snapshot_interval=0)
+        await store.append_events(db, "wi-1", _history(3), starting_version=1)
+
+        with pytest.raises(ValueError, match="Optimistic concurrency conflict"):
+            await store.append_events(db, "wi-1", [WorkItemCancelled(reason="late")], starting_version=3)
+        with pytest.raises(ValueError, match="Optimistic concurrency conflict"):
+            await store.append(db, "wi-1", WorkItemCancelled(reason="gap"), expected_version=5)
+        assert [e["version"] for e in db.events["wi-1"]] == [1, 2, 3]
+        assert db.snapshots == {}
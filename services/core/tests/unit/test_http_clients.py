@@ -0,0 +1,120 @@
+"""Unit tests for the pooled inter-service HTTP client registry (app.core.http_clients)."""
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.http_clients import HttpClientRegistry, ServiceClient, TargetConfig, http_clients
+from app.core.resilience import CircuitOpenException
+from app.infrastructure.external.synapse_acl import SynapseACL, SynapseACLError
+
+
+def _client(handler, **config) -> ServiceClient:
+    cfg = TargetConfig(retry_backoff=0.0, **config)
+    return ServiceClient("synapse", cfg, transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_pooled_client():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"ok": True})
+
+    svc = _client(handler)
+    first = await svc.request("GET", "http://synapse/a")
+    pooled = svc.client
+    await svc.request("GET", "http://synapse/b")
+
+    assert first.json() == {"ok": True} and calls == ["/a", "/b"]
+    assert svc.client is pooled
+    await svc.aclose()
+    assert pooled.is_closed
+
+
+def test_loop_change_closes_previous_client():
+    svc = _client(lambda request: httpx.Response(200))
+
+    async def use() -> httpx.AsyncClient:
+        await svc.request("GET", "http://synapse/a")
+        return svc.client
+
+    first = asyncio.run(use())
+
+    async def use_again() -> httpx.AsyncClient:
+        second = await use()
+        await svc.aclose()  # 이전 루프 클라이언트 정리 태스크까지 기다린다
+        return second
+
+    second = asyncio.run(use_again())
+    assert second is not first
+    assert first.is_closed and second.is_closed
+
+
+@pytest.mark.asyncio
+async def test_idempotent_requests_retry_5xx_but_posts_do_not():
+    statuses = iter([503, 200, 503])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses))
+
+    svc = _client(handler)
+    assert (await svc.request("GET", "http://synapse/x")).status_code == 200
+    assert (await svc.request("POST", "http://synapse/x")).status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_caps_retries_during_outage():
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(1)
+        raise httpx.ConnectError("refused", request=request)
+
+    svc = _client(handler, max_retries=3, retry_budget_ratio=0.0, min_retry_tokens=2, breaker_failures=100)
+    for _ in range(3):
+        with pytest.raises(httpx.ConnectError):
+            await svc.request("GET", "http://synapse/x")
+    # 첫 요청이 토큰 2개를 모두 써 3회 시도, 이후 요청은 재시도 없이 1회씩
+    assert len(attempts) == 3 + 1 + 1
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_failures_and_fails_fast():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502)
+
+    svc = _client(handler, max_retries=0, breaker_failures=2, breaker_reset_seconds=60)
+    await svc.request("GET", "http://synapse/x")
+    await svc.request("GET", "http://synapse/x")
+    with pytest.raises(CircuitOpenException):
+        await svc.request("GET", "http://synapse/x")
+
+
+@pytest.mark.asyncio
+async def test_synapse_acl_uses_registry_client_and_maps_open_circuit(monkeypatch: pytest.MonkeyPatch):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, str(request.url), request.headers.get("X-Tenant-Id")))
+        return httpx.Response(200, json={"data": {"log_id": "log-1", "status": "accepted"}})
+
+    registry = HttpClientRegistry()
+    svc = _client(handler)
+    monkeypatch.setattr(registry, "get", lambda name: svc)
+    monkeypatch.setattr("app.infrastructure.external.synapse_acl.http_clients", registry)
+    acl = SynapseACL(base_url="http://fake-synapse:8003")
+
+    payload = await acl.request("GET", "/api/v3/synapse/event-logs/log-1", incoming_headers={"X-Tenant-Id": "t1"})
+    assert payload["data"]["log_id"] == "log-1"
+    assert seen == [("GET", "http://fake-synapse:8003/api/v3/synapse/event-logs/log-1", "t1")]
+
+    svc.breaker.state, svc.breaker.last_failure_time = "OPEN", 10**12
+    with pytest.raises(SynapseACLError) as exc:
+        await acl.request("GET", "/api/v3/synapse/event-logs/log-1")
+    assert exc.value.status_code == 503
+
+
+def test_module_registry_has_synapse_target_config():
+    assert http_clients.get("synapse").config.timeout == 180.0
@@ -0,0 +1,43 @@
+"""Unit tests for the load-test harness aggregation and regression comparison."""
+import pytest
+
+from app.scripts.load_test import ScenarioStats, compare_results, parse_weights, percentile
+
+
+def test_percentile_interpolates_linearly():
+    values = [0.01 * i for i in range(1, 101)]
+    assert percentile(values, 50) == pytest.approx(0.505)
+    assert percentile(values, 99) == pytest.approx(0.9901)
+    assert percentile([], 95) == 0.0
+
+
+def test_scenario_summary_reports_latency_and_error_rate():
+    stats = ScenarioStats()
+    for i in range(9):
+        stats.record(0.010 * (i + 1), 200, True)
+    stats.record(1.0, 503, False)
+
+    summary = stats.summary(elapsed=2.0)
+    assert summary["requests"] == 10 and summary["errors"] == 1
+    assert summary["error_rate"] == 0.1 and summary["throughput_rps"] == 5.0
+    assert summary["p50_ms"] == pytest.approx(55.0) and summary["max_ms"] == 1000.0
+    assert summary["status_counts"] == {"200": 9, "503": 1}
+
+
+def _result(p95: float, rps: float, error_rate: float = 0.0) -> dict:
+    return {"scenarios": {"core_gateway": {"requests": 100, "p95_ms": p95, "throughput_rps": rps, "error_rate": error_rate}}}
+
+
+def test_compare_flags_latency_throughput_and_error_regressions():
+    rows, regressed = compare_results(_result(105, 98), _result(100, 100), max_regression_pct=10)
+    assert not regressed and rows[0]["p95_change_pct"] == 5.0
+
+    assert compare_results(_result(120, 100), _result(100, 100), 10)[1]
+    assert compare_results(_result(100, 80), _result(100, 100), 10)[1]
+    assert compare_results(_result(100, 100, 0.05), _result(100, 100), 10)[1]
+
+
+def test_parse_weights_validates_names():
+    assert parse_weights(["oracle_ask=4", "core_gateway"]) == {"oracle_ask": 4, "core_gateway": 3}
+    with pytest.raises(ValueError):
+        parse_weights(["nope=1"])
@@ -0,0 +1,150 @@
+"""Unit tests for MetricsRegistry histograms, timers and instrumentation hooks."""
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.observability import MetricsRegistry, metrics_registry
+from app.core.resilience import CircuitBreaker
+from app.workers.base import BaseWorker
+
+
+@pytest.fixture(autouse=True)
+def _clean_global_registry():
+    metrics_registry.reset()
+    yield
+    metrics_registry.reset()
+
+
+def test_histogram_buckets_are_cumulative_and_le_inclusive():
+    m = MetricsRegistry()
+    m.histogram("req_seconds", "Request latency", buckets=[0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 3.0):
+        m.observe("req_seconds", value, {"route": "/a"})
+
+    snap = m.get_histogram("req_seconds", {"route": "/a"})
+    assert snap["buckets"] == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert snap["count"] == 4 and snap["sum"] == pytest.approx(3.65)
+    assert m.get_histogram("req_seconds", {"route": "/b"}) is None
+
+
+def test_histogram_merges_per_thread_shards():
+    m = MetricsRegistry()
+    histogram = m.histogram("work_seconds", buckets=[1.0])
+
+    def _observe():
+        for _ in range(1000):
+            histogram.observe(0.5)
+
+    threads = [threading.Thread(target=_observe) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert m.get_histogram("work_seconds")["count"] == 4000
+
+
+def test_render_prometheus_exposes_bucket_sum_count_and_labelled_series():
+    m = MetricsRegistry()
+    m.histogram("core_x_seconds", "X latency", buckets=[0.5])
+    with m.time("core_x_seconds", {"route": '/a"b'}):
+        pass
+    m.inc("core_y_total", labels={"breaker": "acl"})
+    m.set_gauge("core_z", 2.0)
+
+    output = m.render_prometheus()
+    assert "# TYPE core_x_seconds histogram" in output
+    assert 'core_x_seconds_bucket{route="/a\\"b",le="0.5"} 1' in output
+    assert 'core_x_seconds_bucket{route="/a\\"b",le="+Inf"} 1' in output
+    assert 'core_x_seconds_count{route="/a\\"b"} 1' in output
+    assert 'core_y_total{breaker="acl"} 1.0' in output
+    assert "# TYPE core_z gauge" in output
+    # 고정 시리즈는 기존 형식 그대로 한 번만
+    assert output.count("# TYPE core_dlq_depth gauge") == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_decorator_supports_async_and_sync():
+    m = MetricsRegistry()
+
+    @m.timed("async_seconds")
+    async def _async():
+        return 1
+
+    @m.timed("sync_seconds", {"kind": "sync"})
+    def _sync():
+        return 2
+
+    assert await _async() == 1 and _sync() == 2
+    assert m.get_histogram("async_seconds")["count"] == 1
+    assert m.get_histogram("sync_seconds", {"kind": "sync"})["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_process_with_retry_records_duration_and_retries(monkeypatch):
+    async def _no_sleep(_seconds):
+        return None
+
+    monkeypatch.setattr("app.workers.base.asyncio.sleep", _no_sleep)
+    worker = BaseWorker("sync")
+    calls = {"n": 0}
+
+    async def flaky():
+        calls["n"] += 1
+        if calls["n"] < 2:
+            raise RuntimeError("boom")
+        return "ok"
+
+    assert await worker.process_with_retry(flaky) == "ok"
+    labels = {"worker": "sync", "task": "flaky", "outcome": "success"}
+    assert metrics_registry.get_histogram("core_worker_task_duration_seconds", labels)["count"] == 1
+    assert metrics_registry.get_counter("core_worker_task_retries_total", {"worker": "sync", "task": "flaky"}) == 1
+
+
+def test_circuit_breaker_records_transitions():
+    cb = CircuitBreaker(max_failures=1, reset_timeout=0, name="synapse")
+    cb.record_failure()
+    cb.allow_request()
+    cb.record_success()
+    cb.record_success()  # 이미 CLOSED — 전이 아님
+
+    def transitions(src, dst):
+        return metrics_registry.get_counter(
+            "core_circuit_breaker_transitions_total",
+            {"breaker": "synapse", "from_state": src, "to_state": dst},
+        )
+
+    assert transitions("CLOSED", "OPEN") == 1
+    assert transitions("OPEN", "HALF_OPEN") == 1
+    assert transitions("HALF_OPEN", "CLOSED") == 1
+    assert metrics_registry.get_gauge("core_circuit_breaker_state", {"breaker": "synapse"}) == 0.0
+
+
+def test_gateway_routes_are_timed_by_path_template():
+    from app.api.gateway.routes import get_synapse_gateway, router
+
+    class _Gateway:
+        async def request(self, **kwargs):
+            if kwargs["path"].endswith("/missing"):
+                from app.infrastructure.external.synapse_acl import SynapseACLError
+                raise SynapseACLError(404, "not found")
+            return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_synapse_gateway] = lambda: _Gateway()
+    client = TestClient(app)
+
+    assert client.get("/api/v1/event-logs/log-1").status_code == 200
+    assert client.get("/api/v1/event-logs/missing").status_code == 404
+
+    ok = metrics_registry.get_histogram(
+        "core_gateway_proxy_duration_seconds",
+        {"route": "/api/v1/event-logs/{log_id}", "method": "GET", "status": 200},
+    )
+    missing = metrics_registry.get_histogram(
+        "core_gateway_proxy_duration_seconds",
+        {"route": "/api/v1/event-logs/{log_id}", "method": "GET", "status": 404},
+    )
+    assert ok["count"] == 1 and missing["count"] == 1
@@ -9,7 +9,7 @@ Tests cover:
 NOTE: Integration test — requires live PostgreSQL.
       Run with Docker: docker exec axiom-core-svc-1 python -m pytest tests/unit/test_outbox_relay.py
 """
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
@@ -55,6 +55,17 @@ def _make_event(event_id: str, status: str = "PENDING", retry_count: int = 0, **
     )
 
 
+def _mock_redis(error: Exception | None = None) -> AsyncMock:
+    """Redis mock whose pipeline records XADDs; `error` fails the whole pipeline."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(side_effect=error or (lambda **_: [b"0-0"] * pipe.xadd.call_count))
+    mock_redis = AsyncMock()
+    mock_redis.pipeline = MagicMock(return_value=pipe)
+    mock_redis.xlen = AsyncMock(return_value=0)
+    mock_redis.xadd = pipe.xadd
+    return mock_redis
+
+
 class TestPublishPendingOnce:
     @pytest.mark.asyncio
     async def test_successful_publish_sets_published_at(self, db_session):
@@ -64,9 +75,7 @@ class TestPublishPendingOnce:
             session.add(_make_event("evt-1"))
             await session.commit()
 
-        mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock()
-        mock_redis.xlen = AsyncMock(return_value=0)
+        mock_redis = _mock_redis()
 
         with patch("app.workers.sync.get_redis", return_value=mock_redis), \
              patch("app.workers.sync.AsyncSessionLocal", Session):
@@ -91,9 +100,7 @@ class TestPublishPendingOnce:
             session.add(_make_event("evt-2"))
             await session.commit()
 
-        mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock(side_effect=ConnectionError("Redis down"))
-        mock_redis.xlen = AsyncMock(return_value=0)
+        mock_redis = _mock_redis(ConnectionError("Redis down"))
 
         with patch("app.workers.sync.get_redis", return_value=mock_redis), \
              patch("app.workers.sync.AsyncSessionLocal", Session):
@@ -118,9 +125,7 @@ class TestPublishPendingOnce:
             session.add(_make_event("evt-3", retry_count=MAX_RETRY - 1))
             await session.commit()
 
-        mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock(side_effect=ConnectionError("Redis down"))
-        mock_redis.xlen = AsyncMock(return_value=0)
+        mock_redis = _mock_redis(ConnectionError("Redis down"))
 
         with patch("app.workers.sync.get_redis", return_value=mock_redis), \
              patch("app.workers.sync.AsyncSessionLocal", Session):
@@ -143,9 +148,7 @@ class TestPublishPendingOnce:
             session.add(_make_event("evt-e", event_type="PROCESS_INITIATED"))
             await session.commit()
 
-        mock_redis = AsyncMock()
-        mock_redis.xadd = AsyncMock()
-        mock_redis.xlen = AsyncMock(return_value=0)
+        mock_redis = _mock_redis()
 
         with patch("app.workers.sync.get_redis", return_value=mock_redis), \
              patch("app.workers.sync.AsyncSessionLocal", Session):
@@ -0,0 +1,142 @@
+"""Unit tests for the shared pipelined outbox relay (app.core.outbox_relay).
+
+Runs without PostgreSQL/Redis: a fake asyncpg-style connection records SQL and
+a fake Redis pipeline records XADDs, so round trips per batch can be asserted.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.outbox_relay import OutboxRelay, OutboxRow
+
+
+def _record(i: int, retry_count: int = 0, payload=None) -> dict:
+    return {
+        "id": f"evt-{i}",
+        "event_type": "WATCH_ALERT" if i % 2 else "PROCESS_INITIATED",
+        "aggregate_type": "WorkItem",
+        "aggregate_id": f"wi-{i}",
+        "tenant_id": "t1",
+        "payload": payload if payload is not None else {"n": i, "name": "한글"},
+        "created_at": datetime.now(timezone.utc) - timedelta(seconds=2),
+        "retry_count": retry_count,
+    }
+
+
+class _FakeConn:
+    def __init__(self, records: list[dict]) -> None:
+        self.records = records
+        self.calls: list[tuple[str, tuple]] = []
+
+    async def fetch(self, sql: str, *args):
+        self.calls.append((sql, args))
+        return self.records[: args[0]]
+
+    async def execute(self, sql: str, *args):
+        self.calls.append((sql, args))
+        return "UPDATE"
+
+
+class _FakePipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._queued: list[tuple[str, dict]] = []
+
+    def xadd(self, stream, fields, maxlen=None, approximate=True):
+        self._queued.append((stream, fields))
+
+    async def execute(self, raise_on_error=True):
+        self._redis.round_trips += 1
+        if self._redis.down:
+            raise ConnectionError("Redis down")
+        replies = []
+        for stream, fields in self._queued:
+            if fields["event_id"] in self._redis.reject:
+                replies.append(ValueError("OOM command not allowed"))
+            else:
+                self._redis.added.append((stream, fields))
+                replies.append(f"{len(self._redis.added)}-0")
+        return replies
+
+
+class _FakeRedis:
+    def __init__(self, down: bool = False, reject: tuple[str, ...] = ()) -> None:
+        self.down = down
+        self.reject = set(reject)
+        self.added: list[tuple[str, dict]] = []
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        return _FakePipeline(self)
+
+
+def _relay() -> OutboxRelay:
+    return OutboxRelay(
+        "core.event_outbox",
+        lambda t: "axiom:watches" if t.startswith("WATCH_") else "axiom:core:events",
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_is_published_in_one_pipeline_and_marked_in_one_update():
+    conn, redis = _FakeConn([_record(i) for i in range(50)]), _FakeRedis()
+
+    result = await _relay().relay_once(conn, redis, limit=20)
+
+    assert len(result.published) == 20 and result.failures == []
+    assert redis.round_trips == 1
+    assert [f["event_id"] for _, f in redis.added] == [f"evt-{i}" for i in range(20)]
+    assert {s for s, _ in redis.added} == {"axiom:watches", "axiom:core:events"}
+    # claim + one bulk UPDATE
+    assert len(conn.calls) == 2
+    assert "FOR UPDATE SKIP LOCKED" in conn.calls[0][0] and conn.calls[0][1] == (20,)
+    assert "ANY(CAST($1 AS varchar[]))" in conn.calls[1][0]
+    assert conn.calls[1][1][0] == [f"evt-{i}" for i in range(20)]
+    assert result.max_lag is not None and result.max_lag >= 2
+
+
+@pytest.mark.asyncio
+async def test_per_command_errors_only_fail_their_rows():
+    records = [_record(0), _record(1, retry_count=2), _record(2)]
+    conn, redis = _FakeConn(records), _FakeRedis(reject=("evt-1",))
+
+    result = await _relay().relay_once(conn, redis, limit=10)
+
+    assert [r.id for r in result.published] == ["evt-0", "evt-2"]
+    [failure] = result.failures
+    assert (failure.row.id, failure.status, failure.retry_count) == ("evt-1", "DEAD_LETTER", 3)
+    assert failure.stream == "axiom:watches" and "OOM" in failure.error
+    sql, args = conn.calls[-1]
+    assert "unnest(" in sql
+    assert args == (["evt-1"], ["DEAD_LETTER"], [3], [failure.error])
+
+
+@pytest.mark.asyncio
+async def test_pipeline_connection_error_fails_whole_batch():
+    conn, redis = _FakeConn([_record(0), _record(2)]), _FakeRedis(down=True)
+
+    result = await _relay().relay_once(conn, redis, limit=10)
+
+    assert result.published == []
+    assert [(f.status, f.retry_count) for f in result.failures] == [("FAILED", 1), ("FAILED", 1)]
+    assert all("Redis down" in f.error for f in result.failures)
+    assert len(conn.calls) == 2  # claim + failure UPDATE only
+
+
+@pytest.mark.asyncio
+async def test_empty_claim_skips_redis():
+    conn, redis = _FakeConn([]), _FakeRedis()
+    result = await _relay().relay_once(conn, redis, limit=10)
+    assert result.claimed == 0 and redis.round_trips == 0 and len(conn.calls) == 1
+
+
+def test_row_body_keeps_string_payload_and_normalizes_naive_timestamps():
+    raw = _record(0, payload='{"already": "json"}')
+    raw["created_at"] = datetime(2024, 1, 1)
+    row = OutboxRow.from_record(raw)
+    assert row.body()["payload"] == '{"already": "json"}'
+    assert row.created_at.tzinfo is timezone.utc
+
+    encoded = OutboxRow.from_record(_record(1)).body()["payload"]
+    assert encoded == '{"n": 1, "name": "\\ud55c\\uae00"}'
@@ -0,0 +1,208 @@
+"""Unit tests for PolicyExecutorWorker policy index and batched admission (app.workers.policy_executor).
+
+Runs without Neo4j/Redis: a fake driver serves Policy nodes and counts queries,
+a fake Redis emulates the admission Lua script (GET cooldown / INCR daily) and records round-trips.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.workers import policy_executor
+from app.workers.policy_executor import PolicyExecutorWorker, PolicyIndex
+
+
+class _FakeResult:
+    def __init__(self, rows: list[dict]) -> None:
+        self._rows = rows
+
+    async def single(self):
+        return self._rows[0]
+
+    def __aiter__(self):
+        async def _gen():
+            for row in self._rows:
+                yield row
+        return _gen()
+
+
+class _FakeDriver:
+    def __init__(self, nodes: list[dict], updated_at: str = "v1") -> None:
+        self.nodes = nodes
+        self.updated_at = updated_at
+        self.queries: list[str] = []
+
+    def session(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def run(self, query, **params):
+        self.queries.append(query)
+        if "count(p)" in query:
+            return _FakeResult([{"total": len(self.nodes), "latest": self.updated_at}])
+        enabled = sorted((n for n in self.nodes if n.get("enabled", True)), key=lambda n: n["name"])
+        return _FakeResult([{"p": n} for n in enabled])
+
+
+class _FakePipeline:
+    def __init__(self, redis) -> None:
+        self.redis = redis
+
+    def setex(self, key, ttl, value):
+        self.redis.data[key] = value
+
+    async def execute(self):
+        self.redis.round_trips += 1
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.acks: list[str] = []
+        self.round_trips = 0
+
+    def register_script(self, script):
+        async def _run(keys, args):
+            self.round_trips += 1
+            statuses = []
+            for i in range(0, len(keys), 2):
+                cutoff, max_per_day = args[i], int(args[i + 1])
+                status = 1
+                last = self.data.get(keys[i])
+                if cutoff and last and last > cutoff:
+                    status = 0
+                if status == 1 and max_per_day > 0:
+                    self.data[keys[i + 1]] = int(self.data.get(keys[i + 1], 0)) + 1
+                    if self.data[keys[i + 1]] > max_per_day:
+                        status = -1
+                statuses.append(status)
+            return statuses
+        return _run
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    async def xack(self, stream, group, msg_id):
+        self.acks.append(msg_id)
+
+
+def _node(policy_id: str, **overrides) -> dict:
+    node = {
+        "id": policy_id, "name": policy_id, "case_id": "case-1", "tenant_id": "t1", "enabled": True,
+        "trigger_event": "SENSOR_READ", "trigger_condition": '{"field": "temp", "op": ">", "value": 80}',
+        "command_payload_template": '{"sensor": "$trigger.payload.sensor_id", "opts": {"mode": "auto"}}',
+        "target_service": "vision", "target_command": "inspect",
+        "cooldown_seconds": 60, "max_executions_per_day": 0,
+    }
+    node.update(overrides)
+    return node
+
+
+def _event(temp=90, tenant_id="t1", sensor_id="s-1"):
+    return {"event_type": "SENSOR_READ", "tenant_id": tenant_id,
+            "payload": f'{{"case_id": "case-1", "temp": {temp}, "sensor_id": "{sensor_id}"}}'}
+
+
+@pytest.fixture
+def published(monkeypatch: pytest.MonkeyPatch):
+    calls: list[dict] = []
+
+    async def _publish(self, **kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr(PolicyExecutorWorker, "_publish_policy_command", _publish)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_index_serves_events_without_per_event_queries(published):
+    driver = _FakeDriver([_node("p-a"), _node("p-b", trigger_condition="{}"), _node("p-other", case_id="case-2"),
+                          _node("p-off", enabled=False)])
+    redis = _FakeRedis()
+    worker = PolicyExecutorWorker(neo4j_driver=driver, policy_index=PolicyIndex(refresh_seconds=60))
+
+    for i in range(5):
+        await worker._process_event(redis, driver, "axiom:core:events", f"{i}-0", _event(temp=50 + i * 20))
+
+    assert len(driver.queries) == 2  # 버전 확인 1회 + 전체 적재 1회
+    assert worker.policies.loads == 1 and len(worker.policies) == 3
+    # p-b(조건 없음)는 첫 이벤트에서, p-a는 temp>80인 첫 이벤트(temp=90)에서 실행 후 쿨다운
+    assert [(c["triggered_by_policy"], c["command_payload"]["sensor"]) for c in published] == [
+        ("p-b", "s-1"), ("p-a", "s-1"),
+    ]
+    assert published[0]["command_payload"]["opts"]["mode"] == "auto"
+    assert published[0]["command_payload"]["tenant_id"] == "t1"
+    assert redis.acks == [f"{i}-0" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_admission_is_single_round_trip_and_respects_limits(published):
+    nodes = [_node(f"p-{i:02d}", trigger_condition="{}", cooldown_seconds=0, max_executions_per_day=2)
+             for i in range(20)]
+    nodes.append(_node("p-cool", trigger_condition="{}", cooldown_seconds=300))
+    driver = _FakeDriver(nodes)
+    redis = _FakeRedis()
+    redis.data["axiom:policy:cooldown:p-cool"] = (datetime.now(timezone.utc) - timedelta(seconds=10)).isoformat()
+    worker = PolicyExecutorWorker(neo4j_driver=driver, policy_index=PolicyIndex(refresh_seconds=60))
+
+    for i in range(3):
+        before = redis.round_trips
+        await worker._process_event(redis, driver, "axiom:core:events", f"{i}-0", _event())
+        # 판정 1회 + 쿨다운 SETEX 파이프라인 1회 (실행된 정책이 없으면 판정 1회)
+        assert redis.round_trips - before == (2 if i < 2 else 1)
+
+    assert len(published) == 40  # 일일 한도 2회 × 20개, 쿨다운 중인 p-cool은 제외
+    assert "axiom:policy:daily:p-cool:" not in "".join(redis.data)  # 쿨다운 중이면 카운터 증가 없음
+
+
+@pytest.mark.asyncio
+async def test_index_reloads_only_when_version_changes(published):
+    driver = _FakeDriver([_node("p-a", trigger_condition="{}", cooldown_seconds=0)])
+    redis = _FakeRedis()
+    index = PolicyIndex(refresh_seconds=0.0)
+    worker = PolicyExecutorWorker(neo4j_driver=driver, policy_index=index)
+
+    await worker._process_event(redis, driver, "s", "1-0", _event())
+    await worker._process_event(redis, driver, "s", "2-0", _event())
+    assert index.loads == 1
+
+    driver.nodes.append(_node("p-b", trigger_condition="{}", cooldown_seconds=0))
+    driver.updated_at = "v2"
+    await worker._process_event(redis, driver, "s", "3-0", _event())
+    assert index.loads == 2
+    assert [c["triggered_by_policy"] for c in published] == ["p-a", "p-a", "p-a", "p-b"]
+
+
+@pytest.mark.asyncio
+async def test_stale_index_kept_when_refresh_fails(published, monkeypatch: pytest.MonkeyPatch):
+    driver = _FakeDriver([_node("p-a", trigger_condition="{}", cooldown_seconds=0)])
+    index = PolicyIndex(refresh_seconds=0.0)
+    await index.ensure_fresh(driver)
+
+    async def _boom(query, **params):
+        raise RuntimeError("neo4j down")
+
+    monkeypatch.setattr(driver, "run", _boom)
+    await index.ensure_fresh(driver)
+    assert [p.id for p in index.match("t1", "case-1", "SENSOR_READ")] == ["p-a"]
+
+    with pytest.raises(RuntimeError):
+        await PolicyIndex().ensure_fresh(driver)
+
+
+def test_compiled_condition_matches_legacy_eval():
+    cases = [
+        ({"field": "v", "op": ">", "value": 10}, [{"v": 11}, {"v": "9"}, {"v": "abc"}, {}]),
+        ({"field": "v", "op": "==", "value": "x"}, [{"v": "x"}, {"v": "y"}, {}]),
+        ({"field": "v", "op": "!=", "value": 1}, [{"v": 2}, {"v": 1}]),
+        ({"field": "v", "op": "<=", "value": "bad"}, [{"v": 1}]),
+        ({"field": "v", "op": "~", "value": 1}, [{"v": 1}]),
+    ]
+    for condition, payloads in cases:
+        compiled = policy_executor._compile_condition(condition)
+        for payload in payloads:
+            assert compiled(payload) == PolicyExecutorWorker._eval_condition(condition, payload)
@@ -0,0 +1,162 @@
+"""Unit tests for WatchCepWorker batch handling (app.modules.watch.infrastructure.watch_cep).
+
+Runs without PostgreSQL/Redis: subscription lookups and the DB session are patched,
+a fake Redis records XACK calls, so caching, per-key ordering and ack batching can be asserted.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.watch.infrastructure import watch_cep
+from app.modules.watch.infrastructure.watch_cep import SubscriptionCache, WatchCepWorker
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.acks: list[tuple] = []
+        self.keys: set[str] = set()
+
+    async def xack(self, stream, group, *ids):
+        self.acks.append(ids)
+        return len(ids)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if key in self.keys:
+            return None
+        self.keys.add(key)
+        return True
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def commit(self):
+        return None
+
+
+class _Subscriptions:
+    """list_subscriptions_for_event 대역 — (tenant, event_type)별 구독을 바꿔 끼울 수 있다."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], list] = {}
+        self.calls = 0
+
+    async def __call__(self, db, tenant_id, event_type, case_id):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return list(self.rows.get((tenant_id, event_type), []))
+
+
+def _sub(sub_id: str, case_id=None, rule=None):
+    return SimpleNamespace(id=sub_id, case_id=case_id, rule=rule, channels=["in_app"], severity_override=None)
+
+
+def _entry(i: int, aggregate_id: str, event_type: str = "DEADLINE_APPROACHING", tenant_id: str = "t1", **payload):
+    return (f"{i}-0", {"event_id": f"evt-{i}", "event_type": event_type, "aggregate_id": aggregate_id,
+                       "tenant_id": tenant_id, "payload": json.dumps(payload)})
+
+
+@pytest.fixture
+def env(monkeypatch: pytest.MonkeyPatch):
+    subs = _Subscriptions()
+    alerts: list[dict] = []
+
+    async def _create_alert(db, **kwargs):
+        await asyncio.sleep(0)
+        alerts.append(kwargs)
+
+    redis = _FakeRedis()
+    monkeypatch.setattr(watch_cep, "AsyncSessionLocal", _FakeSession)
+    monkeypatch.setattr(watch_cep, "get_redis", lambda: redis)
+    monkeypatch.setattr(watch_cep.WatchService, "list_subscriptions_for_event", subs)
+    monkeypatch.setattr(watch_cep.WatchService, "create_alert", _create_alert)
+    return SimpleNamespace(subs=subs, alerts=alerts, redis=redis)
+
+
+@pytest.mark.asyncio
+async def test_batch_uses_cached_subscriptions_and_single_xack(env):
+    env.subs.rows[("t1", "DEADLINE_APPROACHING")] = [_sub("s-all"), _sub("s-case", case_id="case-3")]
+    worker = WatchCepWorker(concurrency=8)
+    entries = [_entry(i, f"case-{i % 5}") for i in range(200)]
+
+    acked = await worker.process_batch(env.redis, entries)
+
+    assert sorted(acked) == sorted(e[0] for e in entries)
+    assert env.redis.acks == [tuple(acked)]
+    assert env.subs.calls == 1  # 동시 미스도 DB 조회 1회
+    assert len(env.alerts) == 200 + 40  # case-3 이벤트만 s-case 알림 추가
+
+
+@pytest.mark.asyncio
+async def test_per_key_order_preserved_with_concurrency(env, monkeypatch: pytest.MonkeyPatch):
+    seen: dict[str, list[int]] = {}
+    active, peak = 0, 0
+
+    async def _handle(entry_id, data):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001 * (int(entry_id.split("-")[0]) % 3))
+        seen.setdefault(data["aggregate_id"], []).append(int(entry_id.split("-")[0]))
+        active -= 1
+
+    worker = WatchCepWorker(concurrency=16)
+    monkeypatch.setattr(worker, "_handle_message", _handle)
+    await worker.process_batch(env.redis, [_entry(i, f"case-{i % 40}") for i in range(400)])
+
+    assert peak > 1
+    assert all(ids == sorted(ids) for ids in seen.values()) and len(seen) == 40
+
+
+@pytest.mark.asyncio
+async def test_subscription_change_event_invalidates_tenant_cache(env):
+    env.subs.rows[("t1", "DEADLINE_APPROACHING")] = [_sub("s-old")]
+    worker = WatchCepWorker(concurrency=4)
+    await worker.process_batch(env.redis, [_entry(1, "case-1")])
+
+    env.subs.rows[("t1", "DEADLINE_APPROACHING")] = [_sub("s-new", rule={
+        "type": "threshold", "field": "amount", "operator": ">", "threshold": 10})]
+    acked = await worker.process_batch(env.redis, [
+        _entry(2, "case-2", amount=50),
+        _entry(3, "sub-1", event_type=watch_cep.SUBSCRIPTION_CHANGED_EVENT),
+        _entry(4, "case-2", amount=50),
+        _entry(5, "case-4", amount=1),
+    ])
+
+    assert len(acked) == 4 and env.subs.calls == 2
+    assert [(a["subscription_id"], a["meta"]["event_id"]) for a in env.alerts] == [
+        ("s-old", "evt-1"), ("s-old", "evt-2"), ("s-new", "evt-4"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_key_holds_back_later_messages(env, monkeypatch: pytest.MonkeyPatch):
+    async def _no_sleep(*_args):
+        return None
+
+    async def _handle(entry_id, data):
+        if data["event_id"] == "evt-1":
+            raise RuntimeError("db down")
+
+    monkeypatch.setattr("app.workers.base.asyncio.sleep", _no_sleep)
+    worker = WatchCepWorker(concurrency=1)
+    monkeypatch.setattr(worker, "_handle_message", _handle)
+    entries = [_entry(1, "case-a"), _entry(2, "case-b"), _entry(3, "case-a"), _entry(4, "case-b")]
+
+    acked = await worker.process_batch(env.redis, entries)
+    assert acked == ["2-0", "4-0"]
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl_expiry_reloads(env):
+    env.subs.rows[("t1", "E")] = [_sub("s1")]
+    cache = SubscriptionCache(ttl_seconds=0.0)
+    assert [s.id for s in await cache.get("t1", "E", None)] == ["s1"]
+    await cache.get("t1", "E", None)
+    assert env.subs.calls == 2
@@ -0,0 +1,153 @@
+"""데이터소스별 asyncpg 커넥션 풀 — direct 실행 모드용.
+
+기존 direct 경로는 쿼리마다 psycopg2.connect + asyncio.to_thread를 수행하고,
+데이터소스 → DB 이름을 찾기 위해 매번 list_datasources() 전체를 훑었다.
+
+이 모듈은:
+  - 데이터소스 목록을 TTL 캐시로 유지 (만료 시 한 번만 재구성)
+  - 데이터소스 ID별 크기 제한 asyncpg 풀을 지연 생성하고 재사용
+  - 주기적으로 SELECT 1 헬스체크를 수행해 끊어진 풀을 재생성
+을 담당한다. 접속 대상은 기존 direct 경로와 같은 QUERY_HISTORY_DATABASE_URL 하나이며,
+풀만 데이터소스 단위로 나눈다 (한 데이터소스의 부하가 다른 데이터소스의 커넥션을 잠식하지 않도록).
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import structlog
+
+from app.core.config import settings
+from app.infrastructure.acl.synapse_acl import DatasourceInfo, oracle_synapse_acl
+
+logger = structlog.get_logger()
+
+# 풀 헬스체크(SELECT 1) 타임아웃 (초)
+_HEALTH_CHECK_TIMEOUT_SEC = 2.0
+
+
+def _normalize_dsn(url: str) -> str:
+    """asyncpg는 SQLAlchemy 드라이버 접미사(+asyncpg 등)를 이해하지 못하므로 제거한다."""
+    scheme, sep, rest = url.partition("://")
+    return f"{scheme.split('+', 1)[0]}{sep}{rest}"
+
+
+class _PoolSlot:
+    """데이터소스별 풀과 마지막 헬스체크 시각."""
+
+    __slots__ = ("pool", "checked_at")
+
+    def __init__(self, pool: Any) -> None:
+        self.pool = pool
+        self.checked_at = time.monotonic()
+
+
+class DirectPgPools:
+    """데이터소스별 asyncpg 풀 레지스트리."""
+
+    def __init__(
+        self,
+        base_dsn: str | None = None,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        datasource_ttl_sec: float | None = None,
+        health_check_interval_sec: float | None = None,
+    ) -> None:
+        self._dsn = _normalize_dsn(base_dsn or settings.QUERY_HISTORY_DATABASE_URL)
+        self._min_size = min_size if min_size is not None else settings.ORACLE_DIRECT_PG_POOL_MIN_SIZE
+        self._max_size = max_size if max_size is not None else settings.ORACLE_DIRECT_PG_POOL_MAX_SIZE
+        self._datasource_ttl = (
+            datasource_ttl_sec if datasource_ttl_sec is not None
+            else settings.ORACLE_DATASOURCE_CACHE_TTL_SEC
+        )
+        self._health_interval = (
+            health_check_interval_sec if health_check_interval_sec is not None
+            else settings.ORACLE_DIRECT_PG_HEALTH_CHECK_SEC
+        )
+        self._datasources: dict[str, DatasourceInfo] = {}
+        self._datasources_loaded_at = float("-inf")
+        self._slots: dict[str, _PoolSlot] = {}
+        self._lock = asyncio.Lock()
+
+    # ── 데이터소스 목록 (TTL 캐시) ──
+
+    def get_datasource(self, datasource_id: str) -> DatasourceInfo | None:
+        """데이터소스 정보를 TTL 캐시에서 조회한다 (만료 시 한 번만 재구성)."""
+        now = time.monotonic()
+        if now - self._datasources_loaded_at >= self._datasource_ttl:
+            self._datasources = {ds.id: ds for ds in oracle_synapse_acl.list_datasources()}
+            self._datasources_loaded_at = now
+        return self._datasources.get(datasource_id)
+
+    def invalidate_datasources(self) -> None:
+        self._datasources_loaded_at = float("-inf")
+
+    # ── 풀 관리 ──
+
+    async def acquire_pool(self, datasource_id: str) -> Any:
+        """데이터소스의 풀을 반환한다. 없거나 헬스체크에 실패하면 새로 만든다."""
+        slot = self._slots.get(datasource_id)
+        if slot is not None and time.monotonic() - slot.checked_at < self._health_interval:
+            return slot.pool
+
+        async with self._lock:
+            slot = self._slots.get(datasource_id)
+            if slot is not None:
+                if time.monotonic() - slot.checked_at < self._health_interval:
+                    return slot.pool
+                if await self._is_healthy(slot.pool):
+                    slot.checked_at = time.monotonic()
+                    return slot.pool
+                logger.warning("direct_pg_pool_unhealthy", datasource_id=datasource_id)
+                self._slots.pop(datasource_id, None)
+                await self._terminate(slot.pool)
+
+            pool = await self._create_pool(self._dsn)
+            self._slots[datasource_id] = _PoolSlot(pool)
+            logger.info(
+                "direct_pg_pool_created",
+                datasource_id=datasource_id,
+                min_size=self._min_size,
+                max_size=self._max_size,
+            )
+            return pool
+
+    async def close(self) -> None:
+        async with self._lock:
+            slots, self._slots = list(self._slots.values()), {}
+        for slot in slots:
+            try:
+                await slot.pool.close()
+            except Exception as exc:
+                logger.warning("direct_pg_pool_close_failed", error=str(exc))
+
+    async def _create_pool(self, dsn: str) -> Any:
+        import asyncpg
+
+        return await asyncpg.create_pool(
+            dsn,
+            min_size=self._min_size,
+            max_size=self._max_size,
+            # 유휴 커넥션은 주기적으로 정리되어 서버측 끊김에 덜 취약하다
+            max_inactive_connection_lifetime=300.0,
+            server_settings={"default_transaction_read_only": "on"},
+        )
+
+    @staticmethod
+    async def _is_healthy(pool: Any) -> bool:
+        try:
+            await pool.fetchval("SELECT 1", timeout=_HEALTH_CHECK_TIMEOUT_SEC)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _terminate(pool: Any) -> None:
+        try:
+            pool.terminate()
+        except Exception:
+            pass
+
+
+direct_pg_pools = DirectPgPools()
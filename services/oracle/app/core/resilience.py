@@ -0,0 +1,39 @@
+"""서킷 브레이커 — 외부 서비스 연속 실패 시 빠르게 실패시킨다 (Core app.core.resilience와 같은 동작)."""
+from __future__ import annotations
+
+import time
+
+
+class CircuitOpenException(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, max_failures: int = 3, reset_timeout: int = 60, name: str = "default"):
+        self.name = name
+        self.max_failures = max_failures
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.last_failure_time = 0.0
+        self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+
+    def record_failure(self) -> None:
+        self.failure_count += 1
+        self.last_failure_time = time.time()
+        if self.failure_count >= self.max_failures:
+            self.state = "OPEN"
+
+    def record_success(self) -> None:
+        self.failure_count = 0
+        self.state = "CLOSED"
+
+    def allow_request(self) -> bool:
+        if self.state == "CLOSED":
+            return True
+        if self.state == "OPEN":
+            if time.time() - self.last_failure_time > self.reset_timeout:
+                self.state = "HALF_OPEN"
+                return True
+            return False
+        # HALF_OPEN
+        return True
@@ -0,0 +1,118 @@
+"""테넌트별 스키마 카탈로그 캐시 — NL2SQL 프롬프트 구성 가속.
+
+NL2SQL 파이프라인은 그래프 검색이 비었을 때 Synapse 스키마 카탈로그(테이블 목록 + 상세)를
+불러와 DDL 프롬프트를 만든다. 카탈로그는 요청마다 거의 변하지 않으므로
+테넌트별로 캐시하고, 다음 경우에만 다시 불러온다.
+
+  - Synapse가 SCHEMA_CATALOG_CHANGED 이벤트를 발행했을 때 (버전 증가)
+  - TTL(ORACLE_SCHEMA_CATALOG_TTL_SEC)이 지났을 때 (이벤트 누락 대비)
+
+버전 토큰: 로드 시작 시점의 버전을 받아 두었다가 저장 시 비교하므로,
+로드 도중 무효화 이벤트가 도착하면 오래된 결과가 캐시에 남지 않는다.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+SYNAPSE_EVENTS_STREAM = "axiom:synapse:events"
+SCHEMA_CHANGE_EVENT = "SCHEMA_CATALOG_CHANGED"
+
+
+@dataclass
+class _CatalogEntry:
+    version: int = 0
+    tables: list[Any] | None = None
+    loaded_at: float = 0.0
+
+
+class SchemaCatalogCache:
+    """테넌트 → (버전, 카탈로그) 캐시."""
+
+    def __init__(self, ttl_sec: float | None = None) -> None:
+        self._ttl = ttl_sec if ttl_sec is not None else settings.ORACLE_SCHEMA_CATALOG_TTL_SEC
+        self._entries: dict[str, _CatalogEntry] = {}
+
+    def get(self, tenant_id: str) -> list[Any] | None:
+        entry = self._entries.get(tenant_id)
+        if entry is None or entry.tables is None:
+            return None
+        if time.monotonic() - entry.loaded_at >= self._ttl:
+            return None
+        return entry.tables
+
+    def version(self, tenant_id: str) -> int:
+        """로드 시작 전에 받아 두는 버전 토큰."""
+        return self._entries.setdefault(tenant_id, _CatalogEntry()).version
+
+    def store(self, tenant_id: str, version: int, tables: list[Any]) -> bool:
+        """로드 도중 무효화되지 않았을 때만 저장한다."""
+        entry = self._entries.setdefault(tenant_id, _CatalogEntry())
+        if entry.version != version:
+            return False
+        entry.tables = list(tables)
+        entry.loaded_at = time.monotonic()
+        return True
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        """특정 테넌트(또는 전체) 캐시를 무효화하고 버전을 올린다."""
+        targets = [tenant_id] if tenant_id is not None else list(self._entries)
+        for tid in targets:
+            entry = self._entries.setdefault(tid, _CatalogEntry())
+            entry.version += 1
+            entry.tables = None
+
+
+schema_catalog_cache = SchemaCatalogCache()
+
+
+def _field(fields: dict[Any, Any], name: str) -> str:
+    value = fields.get(name, fields.get(name.encode()))
+    if isinstance(value, bytes):
+        return value.decode()
+    return str(value or "")
+
+
+def handle_synapse_event(fields: dict[Any, Any]) -> bool:
+    """Synapse 이벤트 스트림 메시지 하나를 처리한다. 무효화했으면 True."""
+    if _field(fields, "event_type") != SCHEMA_CHANGE_EVENT:
+        return False
+    tenant_id = _field(fields, "tenant_id")
+    if not tenant_id:
+        try:
+            tenant_id = str(json.loads(_field(fields, "payload") or "{}").get("tenant_id") or "")
+        except json.JSONDecodeError:
+            tenant_id = ""
+    schema_catalog_cache.invalidate(tenant_id or None)
+    logger.info("schema_catalog_invalidated", tenant_id=tenant_id or "*")
+    return True
+
+
+async def run_schema_change_listener(redis_client: Any, block_ms: int = 5000) -> None:
+    """axiom:synapse:events를 구독해 스키마 변경 시 카탈로그 캐시를 무효화한다.
+
+    캐시는 프로세스마다 따로 있으므로 컨슈머 그룹(메시지 분배) 대신
+    XREAD로 모든 인스턴스가 모든 이벤트를 받는다. 시작 시점 이후 이벤트만 읽는다.
+    """
+    last_id = "$"
+    while True:
+        try:
+            result = await redis_client.xread({SYNAPSE_EVENTS_STREAM: last_id}, count=100, block=block_ms)
+            for _stream, messages in result or []:
+                for msg_id, fields in messages:
+                    last_id = msg_id
+                    handle_synapse_event(fields)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("schema_change_listener_error", error=str(exc))
+            await asyncio.sleep(1.0)
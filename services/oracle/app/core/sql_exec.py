@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Any
+from uuid import UUID
 import re
 import time
 
@@ -10,7 +10,7 @@ from pydantic import BaseModel
 
 from app.core.auth import CurrentUser
 from app.core.config import settings
-from app.infrastructure.acl.synapse_acl import oracle_synapse_acl
+from app.core.pg_pool import direct_pg_pools
 from app.infrastructure.acl.weaver_acl import oracle_weaver_acl
 
 logger = structlog.get_logger()
@@ -60,11 +60,9 @@ class SQLExecutor:
         return [c for c in columns if c] or ["value"]
 
     def _resolve_database_name(self, datasource_id: str) -> str | None:
-        """ACL을 통해 데이터소스의 DB 이름 조회."""
-        for ds in oracle_synapse_acl.list_datasources():
-            if ds.id == datasource_id:
-                return ds.database or None
-        return None
+        """데이터소스의 DB 이름 조회 (TTL 캐시된 데이터소스 맵 사용)."""
+        ds = direct_pg_pools.get_datasource(datasource_id)
+        return (ds.database or None) if ds else None
 
     async def _execute_via_weaver(self, sql: str, datasource_id: str, user: CurrentUser, timeout: int) -> ExecutionResult:
         """ACL을 통해 Weaver에 SQL 실행 후 Oracle ExecutionResult로 변환."""
@@ -120,32 +118,45 @@ class SQLExecutor:
             return val.isoformat()
         if isinstance(val, (bytes, memoryview)):
             return str(val)
+        if isinstance(val, UUID):
+            return str(val)
         if isinstance(val, (dict, list)):
             return val
         return val
 
-    def _execute_direct_pg_sync(self, sql: str) -> ExecutionResult:
-        """PostgreSQL에 직접 SQL을 동기로 실행한다 (스레드 풀에서 호출).
+    @staticmethod
+    def _statement_timeout_ms(timeout_seconds: float) -> int:
+        timeout_ms = int(timeout_seconds * 1000)
+        if not (0 < timeout_ms <= 300_000):
+            raise ValueError(f"타임아웃 범위 초과: {timeout_ms}ms")
+        return timeout_ms
+
+    async def _execute_direct_pg(
+        self, sql: str, datasource_id: str, user: CurrentUser, timeout: int,
+    ) -> ExecutionResult:
+        """PostgreSQL 직접 실행 — 데이터소스별 asyncpg 풀 사용.
 
-        이벤트 루프 블로킹을 방지하기 위해 _execute_direct_pg에서
-        asyncio.to_thread로 위임받아 실행된다.
+        읽기 전용 트랜잭션 안에서 statement_timeout을 SET LOCAL로 걸고,
+        커서로 max_rows + 1행만 가져와 잘림(truncated) 여부를 판정한다.
         """
-        import psycopg2
-
-        db_url = settings.QUERY_HISTORY_DATABASE_URL
         started = time.perf_counter()
         try:
-            conn = psycopg2.connect(db_url)
-            try:
-                conn.set_session(readonly=True, autocommit=True)
-                with conn.cursor() as cur:
-                    cur.execute(sql)
-                    columns = [desc[0] for desc in cur.description] if cur.description else []
-                    rows_raw = cur.fetchmany(self.max_rows + 1)
-                    truncated = len(rows_raw) > self.max_rows
-                    rows = [[self._serialize_value(v) for v in r] for r in rows_raw[:self.max_rows]]
-            finally:
-                conn.close()
+            pool = await direct_pg_pools.acquire_pool(datasource_id)
+            async with pool.acquire() as conn:
+                async with conn.transaction(readonly=True):
+                    await conn.execute(
+                        f"SET LOCAL statement_timeout = {self._statement_timeout_ms(timeout)}"
+                    )
+                    stmt = await conn.prepare(sql)
+                    columns = [attr.name for attr in stmt.get_attributes()]
+                    if columns:
+                        cursor = await stmt.cursor()
+                        rows_raw = await cursor.fetch(self.max_rows + 1)
+                    else:
+                        # 결과 컬럼이 없는 문장도 실행은 한다 (커서는 행을 반환하는 문장에만 열 수 있음)
+                        rows_raw = await stmt.fetch()
+            truncated = len(rows_raw) > self.max_rows
+            rows = [[self._serialize_value(v) for v in r] for r in rows_raw[:self.max_rows]]
             elapsed_ms = max(int((time.perf_counter() - started) * 1000), 1)
             logger.info("sql_exec_direct_pg_ok", rows=len(rows), cols=len(columns), ms=elapsed_ms)
             return ExecutionResult(
@@ -161,14 +172,6 @@ class SQLExecutor:
             logger.error("sql_exec_direct_pg_failed", error=str(exc), ms=elapsed_ms)
             raise
 
-    async def _execute_direct_pg(self, sql: str, user: CurrentUser) -> ExecutionResult:
-        """PostgreSQL 직접 실행 (비동기 래퍼).
-
-        동기 psycopg2 호출을 asyncio.to_thread로 감싸서
-        이벤트 루프를 블로킹하지 않는다.
-        """
-        return await asyncio.to_thread(self._execute_direct_pg_sync, sql)
-
     async def execute_sql(self, sql: str, datasource_id: str, user: CurrentUser, timeout: int | None = None) -> ExecutionResult:
         logger.info("sql_exec_start", sql_len=len(sql), tenant=str(user.tenant_id))
         effective_timeout = timeout or settings.ORACLE_SQL_EXECUTION_TIMEOUT_SEC
@@ -179,7 +182,7 @@ class SQLExecutor:
 
         if self.execution_mode == "direct":
             try:
-                return await self._execute_direct_pg(sql, user)
+                return await self._execute_direct_pg(sql, datasource_id, user, effective_timeout)
             except Exception as exc:
                 logger.warning("sql_exec_direct_fallback_to_mock", reason=str(exc))
 
@@ -193,46 +196,35 @@ class SQLExecutor:
 
         return await self._execute_mock(sql, user)
 
-    def _execute_sql_with_params_sync(
+    async def execute_sql_with_params(
         self,
         sql: str,
         params: list[Any],
-        timeout_seconds: float,
+        datasource_id: str,
+        timeout_seconds: float = 2.0,
     ) -> ExecutionResult:
-        """파라미터 바인딩 SQL을 동기로 실행한다 (스레드 풀에서 호출).
-
-        이벤트 루프 블로킹을 방지하기 위해 execute_sql_with_params에서
-        asyncio.to_thread로 위임받아 실행된다.
+        """파라미터 바인딩을 사용하여 SQL을 실행한다 (데이터소스별 asyncpg 풀).
 
         보안 주의: sql에 사용자 입력을 직접 삽입하지 말 것.
                   반드시 params를 통해 파라미터 바인딩을 사용할 것.
-        """
-        import psycopg2
 
-        db_url = settings.QUERY_HISTORY_DATABASE_URL
+        Args:
+            sql: 파라미터 플레이스홀더($1, $2...)가 포함된 SQL
+            params: 바인딩할 파라미터 값 목록
+            datasource_id: 데이터소스 ID
+            timeout_seconds: 쿼리 타임아웃 (초)
+        """
+        timeout_ms = self._statement_timeout_ms(timeout_seconds)
         started = time.perf_counter()
-
-        conn = psycopg2.connect(db_url)
         try:
-            conn.set_session(readonly=True, autocommit=True)
-            with conn.cursor() as cur:
-                # psycopg2는 $1 대신 %s를 사용하므로 변환
-                pg_sql = re.sub(r'\$\d+', '%s', sql)
-
-                # 타임아웃 설정 — autocommit=True이므로 SET (LOCAL 아님) 사용
-                timeout_ms = int(timeout_seconds * 1000)
-                if not (0 < timeout_ms <= 300_000):
-                    raise ValueError(f"타임아웃 범위 초과: {timeout_ms}ms")
-                cur.execute("SET statement_timeout = %s", (timeout_ms,))
-
-                cur.execute(pg_sql, params)
-                columns = [desc[0] for desc in cur.description] if cur.description else []
-                rows_raw = cur.fetchall()
-                rows = [[self._serialize_value(v) for v in r] for r in rows_raw]
-
-                # 타임아웃 리셋 (후속 쿼리에 영향 방지)
-                cur.execute("SET statement_timeout = 0")
-
+            pool = await direct_pg_pools.acquire_pool(datasource_id)
+            async with pool.acquire() as conn:
+                async with conn.transaction(readonly=True):
+                    await conn.execute(f"SET LOCAL statement_timeout = {timeout_ms}")
+                    stmt = await conn.prepare(sql)
+                    columns = [attr.name for attr in stmt.get_attributes()]
+                    rows_raw = await stmt.fetch(*params)
+            rows = [[self._serialize_value(v) for v in r] for r in rows_raw]
             elapsed_ms = max(int((time.perf_counter() - started) * 1000), 1)
             return ExecutionResult(
                 columns=columns,
@@ -251,30 +243,5 @@ class SQLExecutor:
                 sql_len=len(sql),
             )
             raise
-        finally:
-            conn.close()
-
-    async def execute_sql_with_params(
-        self,
-        sql: str,
-        params: list[Any],
-        datasource_id: str,
-        timeout_seconds: float = 2.0,
-    ) -> ExecutionResult:
-        """파라미터 바인딩을 사용하여 SQL을 실행한다 (비동기 래퍼).
-
-        동기 psycopg2 호출을 asyncio.to_thread로 감싸서
-        이벤트 루프를 블로킹하지 않는다.
-
-        Args:
-            sql: 파라미터 플레이스홀더($1, $2...)가 포함된 SQL
-            params: 바인딩할 파라미터 값 목록
-            datasource_id: 데이터소스 ID
-            timeout_seconds: 쿼리 타임아웃 (초)
-        """
-        return await asyncio.to_thread(
-            self._execute_sql_with_params_sync, sql, params, timeout_seconds
-        )
-
 
 sql_executor = SQLExecutor()
@@ -13,9 +13,14 @@ import httpx
 import structlog
 
 from app.core.config import settings
+from app.core.http_clients import TargetConfig, http_clients
+from app.core.resilience import CircuitOpenException
 
 logger = structlog.get_logger()
 
+# NL2SQL 한 번에 스키마/온톨로지/값 매핑 조회가 연달아 일어나므로 keep-alive 유지
+http_clients.configure("synapse", TargetConfig(timeout=10.0, max_connections=100, max_keepalive_connections=30))
+
 
 # ---------------------------------------------------------------------------
 # Oracle 내부 도메인 모델 (Synapse 응답 형식에 의존하지 않음)
@@ -182,27 +187,21 @@ class OracleSynapseACL:
     ) -> dict[str, Any]:
         url = f"{self._base_url}{path}"
         headers = self._headers(tenant_id)
-        async with httpx.AsyncClient() as client:
-            for attempt in range(max_retries):
-                try:
-                    res = await client.request(method, url, headers=headers, **kwargs)
-                    res.raise_for_status()
-                    return res.json()
-                except httpx.RequestError as exc:
-                    logger.error("synapse_acl_error", attempt=attempt + 1, error=str(exc))
-                    if attempt == max_retries - 1:
-                        raise
-                    await asyncio.sleep(1)
-                except httpx.HTTPStatusError as exc:
-                    logger.error(
-                        "synapse_acl_http_error",
-                        attempt=attempt + 1,
-                        status=exc.response.status_code,
-                    )
-                    if attempt == max_retries - 1:
-                        raise
-                    await asyncio.sleep(0.5)
-        return {}  # unreachable but keeps type checker happy
+        # 연결 오류/502·503·504 재시도는 공유 클라이언트(재시도 예산 + 서킷 브레이커)가 맡는다
+        try:
+            res = await http_clients.get("synapse").request(
+                method, url, headers=headers, retry=True, max_retries=max_retries - 1, **kwargs,
+            )
+        except CircuitOpenException as exc:
+            # 호출자들은 httpx 오류를 잡아 폴백하므로 연결 실패로 변환
+            raise httpx.ConnectError(str(exc)) from exc
+        except httpx.RequestError as exc:
+            logger.error("synapse_acl_error", error=str(exc))
+            raise
+        if res.status_code >= 400:
+            logger.error("synapse_acl_http_error", status=res.status_code)
+        res.raise_for_status()
+        return res.json()
 
     # -- Graph Search (NL2SQL 스키마 탐색) ---------------------------------
 
@@ -386,6 +385,42 @@ class OracleSynapseACL:
         )
         return self._translate_table_detail(response, table_name)
 
+    async def get_table_details(self, tenant_id: str, table_names: list[str]) -> list[TableInfo]:
+        """여러 테이블 상세를 한 번에 조회한다.
+
+        Synapse 벌크 엔드포인트(POST .../tables/details)를 우선 사용하고,
+        실패하면(구버전 Synapse 등) 동시성 제한 gather로 개별 조회한다.
+        컬럼이 없는 테이블과 개별 조회에 실패한 테이블은 결과에서 제외된다.
+        """
+        if not table_names:
+            return []
+        try:
+            response = await self._request_with_retry(
+                "POST",
+                f"{self._schema_edit_base}/tables/details",
+                tenant_id=tenant_id,
+                max_retries=1,
+                json={"tables": list(table_names)},
+            )
+            rows = (response.get("data") or {}).get("tables") or []
+            details = [
+                self._translate_table_detail({"data": row}, str(row.get("name") or ""))
+                for row in rows
+                if isinstance(row, dict) and row.get("name")
+            ]
+            return [d for d in details if d is not None]
+        except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+            logger.info("synapse_acl_bulk_table_detail_fallback", reason=str(exc))
+
+        sem = asyncio.Semaphore(max(1, settings.ORACLE_SCHEMA_DETAIL_CONCURRENCY))
+
+        async def _one(name: str) -> TableInfo | None:
+            async with sem:
+                return await self.get_table_detail(tenant_id=tenant_id, table_name=name)
+
+        results = await asyncio.gather(*(_one(name) for name in table_names), return_exceptions=True)
+        return [r for r in results if isinstance(r, TableInfo)]
+
     @staticmethod
     def _translate_table_detail(response: dict[str, Any], table_name: str) -> TableInfo | None:
         data = response.get("data") or {}
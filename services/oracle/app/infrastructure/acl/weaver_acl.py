@@ -9,13 +9,16 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
-import httpx
 import structlog
 
 from app.core.config import settings
+from app.core.http_clients import TargetConfig, http_clients
 
 logger = structlog.get_logger()
 
+# 쿼리 실행은 멱등이 아니므로 재시도하지 않는다 (POST 기본값)
+http_clients.configure("weaver", TargetConfig(timeout=30.0, max_connections=100, max_keepalive_connections=30))
+
 
 # ---------------------------------------------------------------------------
 # Oracle 내부 도메인 모델 (Weaver 응답 형식에 의존하지 않음)
@@ -79,12 +82,11 @@ class OracleWeaverACL:
         }
 
         started = time.perf_counter()
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                self._query_url, json=payload, headers=headers
-            )
-            response.raise_for_status()
-            body = response.json()
+        response = await http_clients.get("weaver").request(
+            "POST", self._query_url, json=payload, headers=headers, timeout=timeout,
+        )
+        response.raise_for_status()
+        body = response.json()
         elapsed_ms = int((time.perf_counter() - started) * 1000)
 
         return self._translate_query_result(body, elapsed_ms)
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -282,6 +283,12 @@ async def lifespan(app: FastAPI):
     else:
         app.state.redis = None
 
+    # 스키마 카탈로그 캐시 무효화 리스너 (Synapse SCHEMA_CATALOG_CHANGED)
+    _schema_listener: asyncio.Task | None = None
+    if app.state.redis is not None:
+        from app.core.schema_catalog_cache import run_schema_change_listener
+        _schema_listener = asyncio.create_task(run_schema_change_listener(app.state.redis))
+
     # Enum cache bootstrap (#8 P1-1) -- best-effort, 실패해도 서비스 가동에 영향 없음
     from app.pipelines.enum_cache_bootstrap import enum_cache_bootstrap
     try:
@@ -299,6 +306,19 @@ async def lifespan(app: FastAPI):
     yield
 
     # ── Shutdown ──
+    if _schema_listener is not None:
+        _schema_listener.cancel()
+        try:
+            await _schema_listener
+        except asyncio.CancelledError:
+            pass
+
+    from app.core.pg_pool import direct_pg_pools
+    await direct_pg_pools.close()
+
+    from app.core.http_clients import http_clients
+    await http_clients.aclose()
+
     _redis_client = getattr(app.state, "redis", None)
     if _redis_client is not None:
         await _redis_client.aclose()
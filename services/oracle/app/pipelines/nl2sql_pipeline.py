@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import random
 from dataclasses import dataclass
@@ -20,11 +21,11 @@ from datetime import datetime, timezone
 from typing import Any, Dict
 from uuid import uuid4
 
-import httpx
-
 from app.core.auth import CurrentUser
 from app.core.config import settings
+from app.core.http_clients import TargetConfig, http_clients
 from app.core.llm_factory import llm_factory
+from app.core.schema_catalog_cache import schema_catalog_cache
 from app.core.sql_exec import sql_executor
 from app.core.sql_guard import GuardConfig, sql_guard
 from app.core.value_mapping import value_mapping_service
@@ -37,6 +38,12 @@ logger = logging.getLogger("oracle.nl2sql_pipeline")
 # Semaphore caps concurrent insight forwarding calls (E8 fix)
 _INSIGHT_SEMAPHORE = asyncio.Semaphore(10)
 
+# fire-and-forget 전달: 짧은 타임아웃, 재시도 없음, 동시 호출 수(세마포어)만큼만 연결 유지
+http_clients.configure(
+    "weaver_insight",
+    TargetConfig(timeout=3.0, connect_timeout=1.0, max_connections=10, max_keepalive_connections=10, max_retries=0),
+)
+
 
 async def _forward_to_insight(
     tenant_id: str,
@@ -66,16 +73,16 @@ async def _forward_to_insight(
 
     async with _INSIGHT_SEMAPHORE:
         try:
-            async with httpx.AsyncClient(timeout=3.0) as client:
-                await client.post(
-                    settings.WEAVER_INSIGHT_URL,
-                    json={"logs": [entry], "source": "oracle-nl2sql"},
-                    headers={
-                        "Authorization": f"Bearer {settings.WEAVER_INSIGHT_TOKEN}",
-                        "X-Tenant-Id": tenant_id,
-                        "X-Source": "oracle-nl2sql",
-                    },
-                )
+            await http_clients.get("weaver_insight").request(
+                "POST",
+                settings.WEAVER_INSIGHT_URL,
+                json={"logs": [entry], "source": "oracle-nl2sql"},
+                headers={
+                    "Authorization": f"Bearer {settings.WEAVER_INSIGHT_TOKEN}",
+                    "X-Tenant-Id": tenant_id,
+                    "X-Source": "oracle-nl2sql",
+                },
+            )
         except Exception as exc:
             # Sample 10% of failures to avoid log spam (E8)
             if random.random() < 0.1:
@@ -117,7 +124,12 @@ class NL2SQLPipeline:
     }
 
     async def _load_schema_catalog(self, tenant_id: str) -> tuple[list[TableSchema], str]:
-        """ACL을 통해 스키마 카탈로그 로드."""
+        """ACL을 통해 스키마 카탈로그 로드 (테넌트별 버전 캐시 우선)."""
+        cached = schema_catalog_cache.get(tenant_id)
+        if cached is not None:
+            return list(cached), "synapse"
+
+        version = schema_catalog_cache.version(tenant_id)
         catalog: list[TableSchema] = []
         schema_source = "fallback"
         try:
@@ -125,16 +137,16 @@ class NL2SQLPipeline:
             schema_source = "synapse"
         except Exception:
             tables = []
-        for table_info in tables:
+        if tables:
             try:
-                detail = await oracle_synapse_acl.get_table_detail(
-                    tenant_id=tenant_id, table_name=table_info.name
+                details = await oracle_synapse_acl.get_table_details(
+                    tenant_id=tenant_id, table_names=[t.name for t in tables]
                 )
-                if detail and detail.columns:
-                    catalog.append(_table_info_to_schema(detail))
+                catalog = [_table_info_to_schema(d) for d in details if d.columns]
             except Exception:
-                pass
+                catalog = []
         if catalog:
+            schema_catalog_cache.store(tenant_id, version, catalog)
             return catalog, schema_source
         return [TableSchema(name=name, columns=cols) for name, cols in self._FALLBACK_SCHEMAS.items()], "fallback"
 
@@ -149,16 +161,15 @@ class NL2SQLPipeline:
         "duration_minutes": "NUMERIC(10,2)",
     }
 
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _table_ddl(cls, name: str, columns: tuple[str, ...]) -> str:
+        """테이블 하나의 CREATE TABLE 문 (내용 기준 캐시 — 요청 간 재사용)."""
+        cols = ", ".join(f"{c} {cls._COLUMN_TYPE_HINTS.get(c, 'VARCHAR')}" for c in columns)
+        return f"CREATE TABLE {name} ({cols});"
+
     def _format_schema_ddl(self, schemas: list[TableSchema], value_mappings: list[Any], similar_queries: list[Any]) -> str:
-        lines = []
-        for s in schemas:
-            col_defs = []
-            for c in s.columns:
-                ctype = self._COLUMN_TYPE_HINTS.get(c, "VARCHAR")
-                col_defs.append(f"{c} {ctype}")
-            cols = ", ".join(col_defs)
-            lines.append(f"CREATE TABLE {s.name} ({cols});")
-        ddl = "\n".join(lines)
+        ddl = "\n".join(self._table_ddl(s.name, tuple(s.columns)) for s in schemas)
         if value_mappings:
             ddl += "\n\nValue mappings (natural language -> DB value):\n" + str(value_mappings)[:500]
         if similar_queries:
@@ -9,12 +9,18 @@ Phase 1의 해시 기반 정확 매칭에 추가하여,
 
 임베딩은 OpenAI text-embedding-3-small 모델을 사용하되,
 API 키가 없으면 Phase 1만 동작한다.
+
+2단계 조회는 항목별 Redis GET + 코사인 계산(선형 스캔) 대신,
+테넌트/프로젝트별 인프로세스 ANN 인덱스(app.services.vector_index)로
+최상위 후보를 찾고 그 후보의 응답만 Redis에서 읽는다.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import time
+from dataclasses import dataclass, field
 from typing import Any
 
 import structlog
@@ -25,6 +31,8 @@ logger = structlog.get_logger(__name__)
 try:
     import numpy as np
 
+    from app.services.vector_index import VectorIndex, from_blob, to_blob
+
     _HAS_NUMPY = True
 except ImportError:  # pragma: no cover
     np = None  # type: ignore[assignment]
@@ -38,6 +46,13 @@ _EMBED_INDEX_KEY = "axiom:oracle:embed-cache:index"
 # 유사도 임계값 — 이 값 이상이면 캐시 적중으로 판정
 DEFAULT_SIMILARITY_THRESHOLD = 0.92
 
+# 인프로세스 인덱스를 Redis 인덱스 셋과 다시 맞추는 주기 (초)
+_INDEX_REFRESH_SECONDS = 30.0
+# 만료 후보를 건너뛰기 위해 한 번에 가져오는 ANN 후보 수
+_SEARCH_CANDIDATES = 4
+# 동기화 시 HMGET 한 번에 요청하는 최대 키 수
+_SYNC_CHUNK = 1000
+
 
 def _embed_key(tenant_id: str, project_id: str, prompt_hash: str) -> str:
     """테넌트/프로젝트 격리된 임베딩 캐시 키를 생성한다."""
@@ -48,6 +63,11 @@ def _embed_index_key(tenant_id: str, project_id: str) -> str:
     """테넌트/프로젝트 격리된 임베딩 인덱스 키를 생성한다."""
     return f"{_EMBED_INDEX_KEY}:{tenant_id}:{project_id}"
 
+
+def _embed_vectors_key(tenant_id: str, project_id: str) -> str:
+    """테넌트/프로젝트 격리된 임베딩 blob 해시 키를 생성한다 (필드: 캐시 키)."""
+    return f"{_EMBED_INDEX_KEY}:{tenant_id}:{project_id}:vectors"
+
 # 임베딩 차원 (text-embedding-3-small)
 EMBEDDING_DIM = 1536
 
@@ -71,6 +91,76 @@ def _cosine_similarity(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
+@dataclass
+class _IndexEntry:
+    """테넌트/프로젝트별 인프로세스 ANN 인덱스와 마지막 Redis 동기화 시각."""
+
+    index: VectorIndex = field(default_factory=lambda: VectorIndex())
+    synced_at: float = 0.0
+
+
+# (tenant_id, project_id) → 인덱스 레지스트리
+_indexes: dict[tuple[str, str], _IndexEntry] = {}
+
+
+def _reset_indexes() -> None:
+    """인프로세스 인덱스 레지스트리를 비운다 (테스트용)."""
+    _indexes.clear()
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+async def _get_index(redis_client: Any, tenant_id: str, project_id: str) -> VectorIndex:
+    """테넌트/프로젝트 인덱스를 반환하고, 주기가 지났으면 Redis와 동기화한다.
+
+    다른 워커가 저장한 항목은 Redis 인덱스 셋에만 있으므로, 동기화 시
+    로컬에 없는 키의 벡터 blob을 HMGET으로 한 번에 적재한다.
+    blob이 없는 키는 이전 형식(JSON 내 embedding 리스트) 항목으로 보고
+    본문에서 임베딩을 읽으며, 본문마저 없으면 만료로 보고 셋에서 제거한다.
+    """
+    entry = _indexes.setdefault((tenant_id, project_id), _IndexEntry())
+    if time.monotonic() - entry.synced_at < _INDEX_REFRESH_SECONDS:
+        return entry.index
+
+    index = entry.index
+    index_key = _embed_index_key(tenant_id, project_id)
+    live = {_decode(m) for m in await redis_client.smembers(index_key)}
+    for key in index.keys():
+        if key not in live:
+            index.remove(key)
+
+    missing = [key for key in live if key not in index]
+    vectors_key = _embed_vectors_key(tenant_id, project_id)
+    for start in range(0, len(missing), _SYNC_CHUNK):
+        chunk = missing[start:start + _SYNC_CHUNK]
+        blobs = await redis_client.hmget(vectors_key, chunk)
+        for key, blob in zip(chunk, blobs):
+            if blob:
+                index.add(key, from_blob(blob))
+                continue
+            raw = await redis_client.get(key)
+            if not raw:
+                await redis_client.srem(index_key, key)
+                continue
+            embed = json.loads(_decode(raw)).get("embedding")
+            if embed:
+                index.add(key, embed)
+
+    entry.synced_at = time.monotonic()
+    return index
+
+
+async def _evict(
+    redis_client: Any, index: VectorIndex, tenant_id: str, project_id: str, key: str,
+) -> None:
+    """만료된 캐시 키를 로컬 인덱스와 Redis 인덱스 셋/벡터 해시에서 제거한다."""
+    index.remove(key)
+    await redis_client.srem(_embed_index_key(tenant_id, project_id), key)
+    await redis_client.hdel(_embed_vectors_key(tenant_id, project_id), key)
+
+
 async def _get_embedding(
     text: str,
     api_key: str,
@@ -111,8 +201,9 @@ async def semantic_cache_get(
 ) -> tuple[str | None, float]:
     """시맨틱 캐시에서 유사 프롬프트를 검색한다.
 
-    모든 캐시된 임베딩과 현재 프롬프트 임베딩 간의 코사인 유사도를 계산하고,
-    임계값 이상인 가장 유사한 응답을 반환한다.
+    테넌트/프로젝트별 인프로세스 ANN 인덱스(`VectorIndex`)에서
+    코사인 유사도가 가장 높은 후보를 찾고, 그 후보의 응답만 Redis에서 읽는다.
+    후보가 이미 만료되었으면 인덱스에서 정리하고 다음 후보로 넘어간다.
 
     Args:
         redis_client: Redis 비동기 클라이언트
@@ -134,33 +225,26 @@ async def semantic_cache_get(
         return None, 0.0
 
     try:
-        # 테넌트/프로젝트 격리된 인덱스에서 캐시 키 조회
-        index_key = _embed_index_key(tenant_id, project_id)
-        keys = await redis_client.smembers(index_key)
-        if not keys:
-            return None, 0.0
+        index = await _get_index(redis_client, tenant_id, project_id)
+        if index.needs_training():
+            # k-means 학습은 CPU 작업이므로 이벤트 루프 밖에서 수행
+            await asyncio.to_thread(index.train)
 
         best_score = 0.0
         best_response = None
 
-        for key_bytes in keys:
-            key = key_bytes.decode() if isinstance(key_bytes, bytes) else str(key_bytes)
+        for key, score in index.search(query_embed, k=_SEARCH_CANDIDATES):
             raw = await redis_client.get(key)
             if not raw:
-                # 만료된 키 — 인덱스에서 정리
-                await redis_client.srem(index_key, key)
+                # 만료된 키 — 인덱스에서 정리 후 다음 후보 확인
+                await _evict(redis_client, index, tenant_id, project_id, key)
                 continue
 
-            data = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
-            cached_embed = data.get("embedding")
-            if not cached_embed:
-                continue
-
-            score = _cosine_similarity(query_embed, cached_embed)
-            if score > best_score:
-                best_score = score
-                if score >= similarity_threshold:
-                    best_response = data.get("response", "")
+            best_score = score
+            if score >= similarity_threshold:
+                data = json.loads(raw.decode() if isinstance(raw, bytes) else raw)
+                best_response = data.get("response", "")
+            break
 
         if best_response is not None:
             logger.info(
@@ -193,8 +277,8 @@ async def semantic_cache_set(
 ) -> bool:
     """시맨틱 캐시에 응답을 저장한다 (임베딩 포함).
 
-    프롬프트의 임베딩을 생성하고 응답과 함께 Redis에 저장한다.
-    인덱스 셋에 키를 추가하여 나중에 검색할 수 있게 한다.
+    응답은 JSON으로, 임베딩은 float32 바이너리 blob으로 Redis에 저장한다.
+    인덱스 셋과 벡터 해시에 키를 추가하고, 이 프로세스의 ANN 인덱스에도 즉시 반영한다.
 
     Args:
         redis_client: Redis 비동기 클라이언트
@@ -222,15 +306,21 @@ async def semantic_cache_set(
 
         data = {
             "response": response,
-            "embedding": embed,
             "prompt_preview": prompt[:200],
             "cached_at": time.time(),
         }
         await redis_client.set(key, json.dumps(data), ex=ttl)
-        # 테넌트/프로젝트 격리된 인덱스에 키 등록 (검색 시 순회용)
+        # 테넌트/프로젝트 격리된 인덱스에 키 등록 (다른 워커의 인덱스 동기화용)
         index_key = _embed_index_key(tenant_id, project_id)
         await redis_client.sadd(index_key, key)
         await redis_client.expire(index_key, ttl)
+        vectors_key = _embed_vectors_key(tenant_id, project_id)
+        await redis_client.hset(vectors_key, key, to_blob(embed))
+        await redis_client.expire(vectors_key, ttl)
+
+        entry = _indexes.get((tenant_id, project_id))
+        if entry is not None:
+            entry.index.add(key, embed)
 
         logger.debug("semantic_cache_set", key=key[:40])
         return True
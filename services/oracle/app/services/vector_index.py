@@ -0,0 +1,210 @@
+"""인프로세스 근사 최근접 이웃(ANN) 벡터 인덱스 — 시맨틱 캐시 조회 가속.
+
+시맨틱 캐시 조회가 캐시 항목 수에 비례해 느려지지 않도록,
+테넌트/프로젝트별 임베딩을 float32 행렬로 메모리에 유지하고
+IVF-flat(Inverted File, 역파일) 방식으로 후보를 좁혀 검색한다.
+
+전략:
+  - 항목 수 < ivf_min_size: 정규화 행렬과의 단일 행렬곱(정확 검색)
+  - 항목 수 >= ivf_min_size: 구면 k-means 중심점(nlist개)을 학습하고,
+    질의와 가까운 nprobe개 리스트에 속한 행만 정확 내적으로 재순위
+
+벡터는 Redis에 float32 바이너리 blob(`to_blob`/`from_blob`)으로 영속화되어
+프로세스 재시작 시 JSON 디코딩 없이 한 번의 HMGET으로 복원된다.
+"""
+from __future__ import annotations
+
+import math
+import threading
+
+import numpy as np
+
+# IVF 학습을 시작하는 최소 항목 수 — 그 이하에서는 전수 행렬곱이 더 빠르다
+DEFAULT_IVF_MIN_SIZE = 4096
+# 질의당 탐색할 역리스트 수
+DEFAULT_NPROBE = 12
+# 구면 k-means 반복 횟수 / 리스트당 학습 샘플 수
+_KMEANS_ITERATIONS = 8
+_KMEANS_SAMPLES_PER_LIST = 48
+
+
+def to_blob(vector: list[float] | np.ndarray) -> bytes:
+    """임베딩을 float32 리틀엔디언 바이너리 blob으로 직렬화한다."""
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def from_blob(blob: bytes) -> np.ndarray:
+    """`to_blob`으로 직렬화된 blob을 float32 벡터로 복원한다."""
+    return np.frombuffer(blob, dtype="<f4")
+
+
+def _normalize(vector: list[float] | np.ndarray) -> np.ndarray | None:
+    """L2 정규화된 float32 벡터를 반환한다 (영벡터는 None)."""
+    arr = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(arr))
+    if norm == 0.0 or not math.isfinite(norm):
+        return None
+    return arr / norm
+
+
+class VectorIndex:
+    """키 → 임베딩 IVF-flat 인덱스.
+
+    모든 벡터는 삽입 시 L2 정규화되므로 내적이 곧 코사인 유사도다.
+    삭제는 마지막 행과 자리를 바꾸는 swap-remove로 O(1)에 처리한다.
+    학습(`train`)은 스냅샷 위에서 잠금 없이 수행되므로
+    `asyncio.to_thread`로 이벤트 루프 밖에서 실행할 수 있다.
+    """
+
+    def __init__(
+        self,
+        ivf_min_size: int = DEFAULT_IVF_MIN_SIZE,
+        nprobe: int = DEFAULT_NPROBE,
+    ) -> None:
+        self.ivf_min_size = ivf_min_size
+        self.nprobe = nprobe
+        self.dim: int | None = None
+        self._lock = threading.Lock()
+        self._keys: list[str] = []
+        self._rows = np.empty((0, 0), dtype=np.float32)
+        self._assign = np.empty(0, dtype=np.int32)
+        self._key_to_row: dict[str, int] = {}
+        self._centroids: np.ndarray | None = None
+        self._trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_to_row
+
+    def keys(self) -> list[str]:
+        return list(self._keys)
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(self, key: str, vector: list[float] | np.ndarray) -> bool:
+        """벡터를 추가(또는 교체)한다. 차원 불일치/영벡터면 False."""
+        normed = _normalize(vector)
+        if normed is None:
+            return False
+        with self._lock:
+            if self.dim is None:
+                self.dim = normed.shape[0]
+                self._rows = np.empty((16, self.dim), dtype=np.float32)
+                self._assign = np.zeros(16, dtype=np.int32)
+            if normed.shape[0] != self.dim:
+                return False
+
+            row = self._key_to_row.get(key)
+            if row is None:
+                row = len(self._keys)
+                if row >= self._rows.shape[0]:
+                    self._grow()
+                self._keys.append(key)
+                self._key_to_row[key] = row
+            self._rows[row] = normed
+            if self._centroids is not None:
+                self._assign[row] = int(np.argmax(self._centroids @ normed))
+            return True
+
+    def remove(self, key: str) -> bool:
+        """키를 제거한다 (swap-remove)."""
+        with self._lock:
+            row = self._key_to_row.pop(key, None)
+            if row is None:
+                return False
+            last = len(self._keys) - 1
+            if row != last:
+                moved = self._keys[last]
+                self._keys[row] = moved
+                self._rows[row] = self._rows[last]
+                self._assign[row] = self._assign[last]
+                self._key_to_row[moved] = row
+            self._keys.pop()
+            return True
+
+    def needs_training(self) -> bool:
+        """IVF 학습(또는 재학습)이 필요한지 판단한다.
+
+        최초로 ivf_min_size에 도달했거나, 마지막 학습 이후 크기가 2배로
+        늘어난 경우 중심점을 다시 학습한다.
+        """
+        size = len(self._keys)
+        if size < self.ivf_min_size:
+            return False
+        return self._centroids is None or size >= 2 * self._trained_size
+
+    def train(self, seed: int = 0) -> None:
+        """구면 k-means로 역리스트 중심점을 학습하고 전체 행을 재할당한다."""
+        with self._lock:
+            size = len(self._keys)
+            if size == 0:
+                return
+            snapshot = self._rows[:size].copy()
+
+        nlist = max(1, min(1024, int(math.sqrt(size))))
+        rng = np.random.default_rng(seed)
+        sample_size = min(size, nlist * _KMEANS_SAMPLES_PER_LIST)
+        sample = snapshot[rng.choice(size, sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # 빈 클러스터는 이전 중심점을 유지
+            empty = norms[:, 0] == 0
+            sums[empty] = centroids[empty]
+            norms[empty] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+
+        with self._lock:
+            size = len(self._keys)
+            self._assign[:size] = self._assign_rows(self._rows[:size], centroids)
+            self._centroids = centroids
+            self._trained_size = size
+
+    def search(self, vector: list[float] | np.ndarray, k: int = 1) -> list[tuple[str, float]]:
+        """코사인 유사도 상위 k개의 (키, 점수)를 내림차순으로 반환한다."""
+        query = _normalize(vector)
+        with self._lock:
+            size = len(self._keys)
+            if query is None or size == 0 or query.shape[0] != self.dim:
+                return []
+            rows = self._rows[:size]
+            if self._centroids is None:
+                candidates = None
+                scores = rows @ query
+            else:
+                nprobe = min(self.nprobe, self._centroids.shape[0])
+                probes = np.argpartition(self._centroids @ query, -nprobe)[-nprobe:]
+                candidates = np.flatnonzero(np.isin(self._assign[:size], probes))
+                if candidates.size == 0:
+                    return []
+                scores = rows[candidates] @ query
+
+            k = min(k, scores.shape[0])
+            top = np.argpartition(scores, -k)[-k:]
+            top = top[np.argsort(scores[top])[::-1]]
+            rows_idx = top if candidates is None else candidates[top]
+            return [(self._keys[int(r)], float(s)) for r, s in zip(rows_idx, scores[top])]
+
+    # ── internal ──
+
+    def _grow(self) -> None:
+        capacity = self._rows.shape[0] * 2
+        rows = np.empty((capacity, self.dim or 0), dtype=np.float32)
+        rows[: self._rows.shape[0]] = self._rows
+        assign = np.zeros(capacity, dtype=np.int32)
+        assign[: self._assign.shape[0]] = self._assign
+        self._rows, self._assign = rows, assign
+
+    @staticmethod
+    def _assign_rows(rows: np.ndarray, centroids: np.ndarray, chunk: int = 8192) -> np.ndarray:
+        out = np.empty(rows.shape[0], dtype=np.int32)
+        for start in range(0, rows.shape[0], chunk):
+            out[start:start + chunk] = np.argmax(rows[start:start + chunk] @ centroids.T, axis=1)
+        return out
@@ -0,0 +1,99 @@
+"""direct 실행 모드 동시성 벤치마크 — 쿼리당 psycopg2.connect vs asyncpg 풀.
+
+로컬 PostgreSQL(기본: QUERY_HISTORY_DATABASE_URL)에 동시 요청 N개를 보내
+처리량(qps)과 p50/p99 지연을 비교한다.
+  - legacy: 이전 구현과 동일하게 asyncio.to_thread 안에서 매번 connect/close
+  - pooled: SQLExecutor.execute_sql (direct 모드, 데이터소스별 asyncpg 풀)
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_direct_pg.py --concurrency 1 16 64 --requests 2000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+import numpy as np
+
+from app.core.auth import CurrentUser
+from app.core.config import settings
+from app.core.pg_pool import _normalize_dsn, direct_pg_pools
+from app.core.sql_exec import SQLExecutor
+
+
+def _legacy_query(dsn: str, sql: str, max_rows: int) -> int:
+    import psycopg2
+
+    conn = psycopg2.connect(dsn)
+    try:
+        conn.set_session(readonly=True, autocommit=True)
+        with conn.cursor() as cur:
+            cur.execute(sql)
+            return len(cur.fetchmany(max_rows + 1))
+    finally:
+        conn.close()
+
+
+async def _drive(call, total: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one() -> None:
+        nonlocal errors
+        async with sem:
+            start = time.perf_counter()
+            try:
+                await call()
+            except Exception:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    ms = np.asarray(latencies) * 1000.0
+    return {
+        "qps": round(total / elapsed, 1),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p99_ms": round(float(np.percentile(ms, 99)), 2),
+        "errors": errors,
+    }
+
+
+async def _main(args: argparse.Namespace) -> None:
+    dsn = _normalize_dsn(settings.QUERY_HISTORY_DATABASE_URL)
+    executor = SQLExecutor(max_rows=args.max_rows)
+    executor.execution_mode = "direct"
+    user = CurrentUser(user_id=uuid.uuid4(), tenant_id=uuid.uuid4(), role="admin")
+
+    async def _legacy() -> None:
+        await asyncio.to_thread(_legacy_query, dsn, args.sql, args.max_rows)
+
+    async def _pooled() -> None:
+        res = await executor._execute_direct_pg(args.sql, args.datasource_id, user, timeout=15)
+        assert res.backend == "direct_pg"
+
+    for concurrency in args.concurrency:
+        for name, call in (("legacy", _legacy), ("pooled", _pooled)):
+            result = await _drive(call, args.requests, concurrency)
+            print(json.dumps({"mode": name, "concurrency": concurrency, **result}))
+    await direct_pg_pools.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Oracle direct PostgreSQL execution")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--sql", default="SELECT g AS id, md5(g::text) AS name FROM generate_series(1, 50) g")
+    parser.add_argument("--max-rows", type=int, default=10000)
+    parser.add_argument("--datasource-id", default="")
+    asyncio.run(_main(parser.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
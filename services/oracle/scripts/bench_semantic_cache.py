@@ -0,0 +1,113 @@
+"""시맨틱 캐시 조회 벤치마크 — 기존 선형 스캔 vs ANN 인덱스.
+
+캐시 항목 수(기본 1k/10k/100k)별로 다음을 비교한다.
+  - scan: 기존 방식. 항목별 JSON 디코딩 + 코사인 계산 (Redis 왕복 비용은 제외하므로 하한값)
+  - ann : app.services.vector_index.VectorIndex (IVF-flat, 학습 시간 별도 표기)
+
+recall@1은 정확 검색(정규화 행렬곱)의 최상위 키와 ANN 최상위 키가 일치하는 비율이다.
+합성 임베딩은 실제 질문 분포처럼 군집을 이루도록 중심점 주변 잡음으로 생성하고,
+질의는 저장된 항목을 살짝 흔든 "바꿔 말한 질문"으로 만든다.
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_semantic_cache.py --sizes 1000 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from app.services.embedding_cache import _cosine_similarity
+from app.services.vector_index import VectorIndex
+
+
+def _make_dataset(size: int, dim: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    topics = rng.normal(size=(max(8, size // 50), dim)).astype(np.float32)
+    labels = rng.integers(0, topics.shape[0], size)
+    return topics[labels] + 0.35 * rng.normal(size=(size, dim)).astype(np.float32)
+
+
+def _make_queries(data: np.ndarray, count: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed + 1)
+    picks = data[rng.integers(0, data.shape[0], count)]
+    return picks + 0.1 * rng.normal(size=picks.shape).astype(np.float32)
+
+
+def _legacy_scan(entries: list[str], query: list[float]) -> int:
+    """기존 semantic_cache_get 루프와 동일하게 항목마다 JSON을 디코딩해 비교한다."""
+    best, best_i = 0.0, -1
+    for i, raw in enumerate(entries):
+        score = _cosine_similarity(query, json.loads(raw)["embedding"])
+        if score > best:
+            best, best_i = score, i
+    return best_i
+
+
+def _p99_ms(samples: list[float]) -> float:
+    return float(np.percentile(np.asarray(samples) * 1000.0, 99))
+
+
+def _run(size: int, dim: int, queries: int, scan_queries: int, nprobe: int) -> dict:
+    data = _make_dataset(size, dim, seed=size)
+    qs = _make_queries(data, queries, seed=size)
+    normed = data / np.linalg.norm(data, axis=1, keepdims=True)
+    truth = np.argmax(qs @ normed.T, axis=1)
+
+    index = VectorIndex(nprobe=nprobe)
+    for i, v in enumerate(data):
+        index.add(str(i), v)
+    train_start = time.perf_counter()
+    if index.needs_training():
+        index.train()
+    train_s = time.perf_counter() - train_start
+
+    ann_times, ann_hits = [], 0
+    for q, t in zip(qs, truth):
+        start = time.perf_counter()
+        key = index.search(q, k=1)[0][0]
+        ann_times.append(time.perf_counter() - start)
+        ann_hits += int(key) == int(t)
+
+    entries = [json.dumps({"response": "", "embedding": v.tolist()}) for v in data]
+    scan_times, scan_hits = [], 0
+    for q, t in zip(qs[:scan_queries], truth[:scan_queries]):
+        ql = q.tolist()
+        start = time.perf_counter()
+        found = _legacy_scan(entries, ql)
+        scan_times.append(time.perf_counter() - start)
+        scan_hits += found == int(t)
+
+    return {
+        "size": size,
+        "dim": dim,
+        "ivf_trained": index.is_trained,
+        "train_s": round(train_s, 3),
+        "ann_recall@1": round(ann_hits / len(qs), 4),
+        "ann_p99_ms": round(_p99_ms(ann_times), 3),
+        "scan_recall@1": round(scan_hits / max(1, len(scan_times)), 4),
+        "scan_p99_ms": round(_p99_ms(scan_times), 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Oracle semantic cache lookup")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dim", type=int, default=256, help="embedding dimension (production: 1536)")
+    parser.add_argument("--queries", type=int, default=200, help="ANN queries per size")
+    parser.add_argument("--scan-queries", type=int, default=20, help="legacy scan queries per size")
+    parser.add_argument("--nprobe", type=int, default=VectorIndex().nprobe)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        result = _run(size, args.dim, args.queries, args.scan_queries, args.nprobe)
+        print(json.dumps(result, ensure_ascii=False))
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
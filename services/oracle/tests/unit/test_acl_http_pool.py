@@ -0,0 +1,75 @@
+"""Oracle ACL 공유 HTTP 풀 단위 테스트.
+
+Synapse/Weaver ACL이 요청마다 클라이언트를 만들지 않고 레지스트리의 풀링된 클라이언트를 쓰는지,
+재시도와 서킷 브레이커가 기존 폴백 경로(httpx 예외 → 폴백)와 맞물리는지 검증한다.
+"""
+import httpx
+import pytest
+
+import app.infrastructure.acl.synapse_acl as synapse_acl_mod
+import app.infrastructure.acl.weaver_acl as weaver_acl_mod
+from app.core.http_clients import ServiceClient, TargetConfig
+from app.infrastructure.acl.synapse_acl import OracleSynapseACL
+from app.infrastructure.acl.weaver_acl import OracleWeaverACL
+
+
+class _Registry:
+    def __init__(self, client: ServiceClient) -> None:
+        self.client = client
+        self.names: list[str] = []
+
+    def get(self, name: str) -> ServiceClient:
+        self.names.append(name)
+        return self.client
+
+
+def _service(handler, **config) -> ServiceClient:
+    return ServiceClient("t", TargetConfig(retry_backoff=0.0, **config), transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_synapse_acl_retries_5xx_on_pooled_client(monkeypatch: pytest.MonkeyPatch):
+    statuses = iter([503, 200, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["X-Tenant-Id"] == "t1"
+        return httpx.Response(next(statuses), json={"success": True, "data": {"tables": []}})
+
+    svc = _service(handler)
+    registry = _Registry(svc)
+    monkeypatch.setattr(synapse_acl_mod, "http_clients", registry)
+    acl = OracleSynapseACL(base_url="http://fake-synapse:8003")
+
+    assert await acl.list_tables("t1") == []
+    pooled = svc.client
+    await acl.list_tables("t1")
+    assert svc.client is pooled and registry.names == ["synapse", "synapse"]
+
+
+@pytest.mark.asyncio
+async def test_synapse_acl_open_circuit_falls_back(monkeypatch: pytest.MonkeyPatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("must not be called while the circuit is open")
+
+    svc = _service(handler)
+    svc.breaker.state, svc.breaker.last_failure_time = "OPEN", 10**12
+    monkeypatch.setattr(synapse_acl_mod, "http_clients", _Registry(svc))
+    acl = OracleSynapseACL(base_url="http://fake-synapse:8003")
+
+    result = await acl.search_schema_context("매출", tenant_id="t1")
+    assert result is OracleSynapseACL._SEARCH_FALLBACK
+
+
+@pytest.mark.asyncio
+async def test_weaver_acl_posts_once_without_retry(monkeypatch: pytest.MonkeyPatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"columns": ["n"], "data": [[1]], "row_count": 1})
+
+    monkeypatch.setattr(weaver_acl_mod, "http_clients", _Registry(_service(handler)))
+    acl = OracleWeaverACL(query_url="http://fake-weaver:8001/api/query", bearer_token="tok")
+
+    result = await acl.execute_query("SELECT 1", tenant_id="t1")
+    assert result.rows == [[1]] and calls == ["/api/query"]
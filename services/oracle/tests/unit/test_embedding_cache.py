@@ -16,10 +16,21 @@ from app.services.embedding_cache import (
     _cosine_similarity,
     _embed_index_key,
     _embed_key,
+    _embed_vectors_key,
+    _reset_indexes,
     semantic_cache_get,
     semantic_cache_set,
     DEFAULT_SIMILARITY_THRESHOLD,
 )
+from app.services.vector_index import VectorIndex, from_blob, to_blob
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    """테스트 간 인프로세스 ANN 인덱스 상태가 공유되지 않도록 초기화한다."""
+    _reset_indexes()
+    yield
+    _reset_indexes()
 
 
 # ──────────────────────────────────────────────────────────────
@@ -29,13 +40,14 @@ from app.services.embedding_cache import (
 class MockRedis:
     """인메모리 Redis 모방 객체.
 
-    비동기 인터페이스(get, set, sadd, srem, smembers, expire, delete)를
-    딕셔너리 기반으로 구현하여 외부 Redis 의존성 없이 테스트한다.
+    비동기 인터페이스(get, set, sadd, srem, smembers, hset, hmget, hdel,
+    expire, delete)를 딕셔너리 기반으로 구현하여 외부 Redis 의존성 없이 테스트한다.
     """
 
     def __init__(self):
         self._store: dict[str, bytes] = {}
         self._sets: dict[str, set[str]] = {}
+        self._hashes: dict[str, dict[str, bytes]] = {}
 
     async def get(self, key: str) -> bytes | None:
         return self._store.get(key)
@@ -57,6 +69,17 @@ class MockRedis:
     async def smembers(self, key: str) -> set[str]:
         return self._sets.get(key, set())
 
+    async def hset(self, key: str, field: str, value: bytes) -> None:
+        self._hashes.setdefault(key, {})[field] = value
+
+    async def hmget(self, key: str, fields: list[str]) -> list[bytes | None]:
+        h = self._hashes.get(key, {})
+        return [h.get(f) for f in fields]
+
+    async def hdel(self, key: str, *fields: str) -> None:
+        for f in fields:
+            self._hashes.get(key, {}).pop(f, None)
+
     async def expire(self, key: str, seconds: int) -> None:
         pass  # TTL은 테스트에서 무시
 
@@ -282,3 +305,120 @@ class TestExpiredKeyCleanup:
         # 만료된 키가 인덱스에서 제거되었는지 확인
         remaining = await redis.smembers(index_key)
         assert fake_cache_key not in remaining, "만료된 키가 인덱스에서 정리되어야 한다"
+
+
+# ──────────────────────────────────────────────────────────────
+# 다른 워커가 저장한 항목 / 이전 형식 항목 동기화 테스트
+# ──────────────────────────────────────────────────────────────
+
+class TestIndexSync:
+    """인프로세스 인덱스가 Redis 인덱스 셋/벡터 해시와 동기화되는지 검증."""
+
+    @pytest.mark.asyncio
+    async def test_다른_워커_저장분_blob으로_적재(self):
+        """로컬 인덱스에 없는 키는 벡터 해시의 float32 blob으로 적재된다."""
+        redis = MockRedis()
+        key = _embed_key("t1", "p1", "other_worker")
+        await redis.set(key, json.dumps({"response": "다른 워커 응답"}))
+        await redis.sadd(_embed_index_key("t1", "p1"), key)
+        await redis.hset(_embed_vectors_key("t1", "p1"), key, to_blob(_EMBED_FULL))
+
+        with patch(
+            "app.services.embedding_cache._get_embedding",
+            new_callable=AsyncMock,
+            return_value=_EMBED_FULL,
+        ):
+            result, score = await semantic_cache_get(
+                redis, "q", api_key="sk-test", tenant_id="t1", project_id="p1",
+            )
+        assert result == "다른 워커 응답"
+        assert abs(score - 1.0) < 1e-5
+
+    @pytest.mark.asyncio
+    async def test_이전_형식_JSON_임베딩_호환(self):
+        """blob이 없는 이전 형식 항목은 JSON 본문의 embedding으로 적재된다."""
+        redis = MockRedis()
+        key = _embed_key("t1", "p1", "legacy")
+        await redis.set(key, json.dumps({"response": "legacy", "embedding": _EMBED_FULL}))
+        await redis.sadd(_embed_index_key("t1", "p1"), key)
+
+        with patch(
+            "app.services.embedding_cache._get_embedding",
+            new_callable=AsyncMock,
+            return_value=_EMBED_SIMILAR,
+        ):
+            result, _ = await semantic_cache_get(
+                redis, "q", api_key="sk-test", tenant_id="t1", project_id="p1",
+                similarity_threshold=0.90,
+            )
+        assert result == "legacy"
+
+    @pytest.mark.asyncio
+    async def test_저장_시_embedding은_blob으로만_보관(self):
+        """새 항목은 JSON 본문 대신 벡터 해시에 float32 blob으로 임베딩을 저장한다."""
+        redis = MockRedis()
+        with patch(
+            "app.services.embedding_cache._get_embedding",
+            new_callable=AsyncMock,
+            return_value=_VEC_A,
+        ):
+            await semantic_cache_set(
+                redis, "p", "r", api_key="sk-test", tenant_id="t1", project_id="p1",
+            )
+        (key,) = await redis.smembers(_embed_index_key("t1", "p1"))
+        assert "embedding" not in json.loads(await redis.get(key))
+        (blob,) = await redis.hmget(_embed_vectors_key("t1", "p1"), [key])
+        assert from_blob(blob).tolist() == _VEC_A
+
+
+# ──────────────────────────────────────────────────────────────
+# VectorIndex (IVF-flat) 테스트
+# ──────────────────────────────────────────────────────────────
+
+class TestVectorIndex:
+    """VectorIndex — 전수 검색/IVF 검색/삭제 동작 검증."""
+
+    def test_전수_검색_상위_k(self):
+        index = VectorIndex()
+        index.add("a", _VEC_A)
+        index.add("b", _VEC_B)
+        index.add("c", [0.9, 0.1, 0.0])
+        hits = index.search(_VEC_A, k=2)
+        assert [k for k, _ in hits] == ["a", "c"]
+        assert abs(hits[0][1] - 1.0) < 1e-6
+
+    def test_영벡터_차원불일치_거부(self):
+        index = VectorIndex()
+        assert index.add("a", _VEC_A) is True
+        assert index.add("zero", _VEC_ZERO) is False
+        assert index.add("wrong-dim", [1.0, 0.0]) is False
+        assert len(index) == 1
+
+    def test_삭제_후_검색_제외(self):
+        index = VectorIndex()
+        index.add("a", _VEC_A)
+        index.add("b", _VEC_B)
+        index.add("c", _VEC_OPPOSITE)
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        assert "a" not in index
+        assert index.search(_VEC_A, k=1)[0][0] == "b"
+        assert index.search(_VEC_OPPOSITE, k=1)[0][0] == "c"
+
+    def test_IVF_학습_후_자기_자신_검색(self):
+        """학습 후에도 저장된 벡터로 질의하면 자기 자신이 최상위로 나온다."""
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(600, 16)).astype(np.float32)
+        index = VectorIndex(ivf_min_size=256, nprobe=4)
+        for i, v in enumerate(vectors):
+            index.add(f"k{i}", v)
+        assert index.needs_training()
+        index.train()
+        assert index.is_trained and not index.needs_training()
+
+        index.add("late", vectors[0] * 2)  # 학습 이후 추가분도 리스트에 할당
+        hits = sum(index.search(v, k=1)[0][0] == f"k{i}" for i, v in enumerate(vectors[:100]))
+        assert hits >= 95
+        assert {k for k, _ in index.search(vectors[0], k=2)} == {"k0", "late"}
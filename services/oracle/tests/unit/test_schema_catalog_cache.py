@@ -0,0 +1,150 @@
+"""스키마 카탈로그 로딩 단위 테스트.
+
+ACL 벌크 상세 조회 + 개별 조회 폴백, 테넌트별 버전 캐시,
+SCHEMA_CATALOG_CHANGED 이벤트 무효화, NL2SQL 파이프라인의 캐시 재사용을 검증한다.
+"""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.core.schema_catalog_cache import SchemaCatalogCache, handle_synapse_event, schema_catalog_cache
+from app.infrastructure.acl.synapse_acl import ColumnInfo, OracleSynapseACL, TableInfo
+from app.pipelines.nl2sql_pipeline import NL2SQLPipeline
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    schema_catalog_cache.invalidate()
+    yield
+    schema_catalog_cache.invalidate()
+
+
+@pytest.fixture
+def acl():
+    return OracleSynapseACL(base_url="http://fake-synapse:8003", service_token="test-token")
+
+
+def _table(name: str) -> TableInfo:
+    return TableInfo(name=name, columns=[ColumnInfo(name="id"), ColumnInfo(name="amount")])
+
+
+# ---------------------------------------------------------------------------
+# ACL get_table_details
+# ---------------------------------------------------------------------------
+
+
+class TestGetTableDetails:
+    @pytest.mark.asyncio
+    async def test_bulk_endpoint(self, acl: OracleSynapseACL):
+        response = {"data": {"tables": [
+            {"name": "sales", "columns": [{"name": "id"}, {"name": "revenue"}]},
+            {"name": "empty", "columns": []},
+        ]}}
+        with patch.object(acl, "_request_with_retry", new=AsyncMock(return_value=response)) as req:
+            details = await acl.get_table_details("t1", ["sales", "empty"])
+        assert [d.name for d in details] == ["sales"]
+        assert req.await_count == 1
+        assert req.await_args.kwargs["json"] == {"tables": ["sales", "empty"]}
+
+    @pytest.mark.asyncio
+    async def test_fallback_to_bounded_gather(self, acl: OracleSynapseACL):
+        request = httpx.Request("POST", "http://fake-synapse:8003/x")
+        not_found = httpx.HTTPStatusError("404", request=request, response=httpx.Response(404, request=request))
+        in_flight = 0
+        peak = 0
+
+        async def _detail(tenant_id: str, table_name: str):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if table_name == "broken":
+                raise httpx.ConnectError("down")
+            return _table(table_name)
+
+        names = [f"t{i}" for i in range(20)] + ["broken"]
+        with patch.object(acl, "_request_with_retry", new=AsyncMock(side_effect=not_found)), \
+                patch.object(acl, "get_table_detail", side_effect=_detail), \
+                patch("app.infrastructure.acl.synapse_acl.settings.ORACLE_SCHEMA_DETAIL_CONCURRENCY", 4):
+            details = await acl.get_table_details("t1", names)
+        assert [d.name for d in details] == names[:-1]
+        assert peak <= 4
+
+
+# ---------------------------------------------------------------------------
+# SchemaCatalogCache
+# ---------------------------------------------------------------------------
+
+
+class TestSchemaCatalogCache:
+    def test_store_and_get(self):
+        cache = SchemaCatalogCache(ttl_sec=60)
+        token = cache.version("t1")
+        assert cache.store("t1", token, ["a"]) is True
+        assert cache.get("t1") == ["a"]
+        assert cache.get("t2") is None
+
+    def test_invalidation_during_load_discards_result(self):
+        cache = SchemaCatalogCache(ttl_sec=60)
+        token = cache.version("t1")
+        cache.invalidate("t1")
+        assert cache.store("t1", token, ["stale"]) is False
+        assert cache.get("t1") is None
+
+    def test_ttl_expiry(self):
+        cache = SchemaCatalogCache(ttl_sec=0)
+        cache.store("t1", cache.version("t1"), ["a"])
+        assert cache.get("t1") is None
+
+    def test_schema_change_event_invalidates_tenant(self):
+        schema_catalog_cache.store("t1", schema_catalog_cache.version("t1"), ["a"])
+        schema_catalog_cache.store("t2", schema_catalog_cache.version("t2"), ["b"])
+        assert handle_synapse_event({b"event_type": b"ONTOLOGY_NODE_UPDATED", b"tenant_id": b"t1"}) is False
+        assert schema_catalog_cache.get("t1") == ["a"]
+        assert handle_synapse_event({b"event_type": b"SCHEMA_CATALOG_CHANGED", b"tenant_id": b"t1"}) is True
+        assert schema_catalog_cache.get("t1") is None
+        assert schema_catalog_cache.get("t2") == ["b"]
+
+
+# ---------------------------------------------------------------------------
+# NL2SQLPipeline._load_schema_catalog
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_pipeline_reuses_catalog_until_schema_change():
+    pipeline = NL2SQLPipeline()
+    with patch(
+        "app.pipelines.nl2sql_pipeline.oracle_synapse_acl.list_tables",
+        new=AsyncMock(return_value=[TableInfo(name="sales"), TableInfo(name="costs")]),
+    ) as list_tables, patch(
+        "app.pipelines.nl2sql_pipeline.oracle_synapse_acl.get_table_details",
+        new=AsyncMock(return_value=[_table("sales"), _table("costs")]),
+    ) as details:
+        first, source = await pipeline._load_schema_catalog("t1")
+        second, _ = await pipeline._load_schema_catalog("t1")
+        assert source == "synapse"
+        assert [t.name for t in first] == [t.name for t in second] == ["sales", "costs"]
+        assert list_tables.await_count == 1 and details.await_count == 1
+
+        handle_synapse_event({"event_type": "SCHEMA_CATALOG_CHANGED", "tenant_id": "t1"})
+        await pipeline._load_schema_catalog("t1")
+        assert details.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_fallback_not_cached():
+    pipeline = NL2SQLPipeline()
+    with patch(
+        "app.pipelines.nl2sql_pipeline.oracle_synapse_acl.list_tables",
+        new=AsyncMock(side_effect=httpx.ConnectError("down")),
+    ):
+        catalog, source = await pipeline._load_schema_catalog("t1")
+    assert source == "fallback"
+    assert {t.name for t in catalog} == {"sales", "operations"}
+    assert schema_catalog_cache.get("t1") is None
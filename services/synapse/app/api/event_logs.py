@@ -1,5 +1,5 @@
 import json
-from typing import Any
+from typing import Any, BinaryIO
 
 from fastapi import APIRouter, HTTPException, Request
 
@@ -16,50 +16,41 @@ def _error_to_http(err: EventLogDomainError) -> HTTPException:
     return HTTPException(status_code=err.status_code, detail={"code": err.code, "message": err.message})
 
 
-def _parse_multipart_payload(raw: bytes, content_type: str) -> tuple[dict[str, Any], bytes | None]:
-    boundary_key = "boundary="
-    if boundary_key not in content_type:
-        raise EventLogDomainError(400, "INVALID_REQUEST", "multipart boundary missing")
-    boundary = content_type.split(boundary_key, 1)[1].strip()
-    delimiter = ("--" + boundary).encode()
-    parts = raw.split(delimiter)
-
-    metadata_text: str | None = None
-    file_bytes: bytes | None = None
-    for part in parts:
-        chunk = part.strip()
-        if not chunk or chunk == b"--":
-            continue
-        if b"\r\n\r\n" not in chunk:
-            continue
-        head, body = chunk.split(b"\r\n\r\n", 1)
-        body = body.rstrip(b"\r\n")
-        headers_text = head.decode(errors="ignore")
-        if 'name="metadata"' in headers_text:
-            metadata_text = body.decode("utf-8", errors="ignore")
-        elif 'name="file"' in headers_text:
-            file_bytes = body
-
-    if metadata_text is None:
+def _parse_multipart_form(form: Any) -> tuple[dict[str, Any], BinaryIO | None]:
+    """multipart 폼에서 metadata(JSON)와 업로드 파일 스트림을 꺼낸다.
+
+    업로드 파일은 Starlette가 SpooledTemporaryFile로 받아 일정 크기를 넘으면 디스크에 두므로
+    요청 본문 전체를 메모리에 올리지 않는다.
+    """
+    metadata = form.get("metadata")
+    if metadata is None:
         raise EventLogDomainError(400, "INVALID_REQUEST", "metadata is required in multipart request")
+    if not isinstance(metadata, str):
+        metadata = metadata.file.read().decode("utf-8", errors="ignore")
     try:
-        payload = json.loads(metadata_text)
+        payload = json.loads(metadata)
     except json.JSONDecodeError as exc:
         raise EventLogDomainError(400, "INVALID_REQUEST", "metadata must be valid json") from exc
-    return payload, file_bytes
+    upload = form.get("file")
+    file_obj = None if upload is None or isinstance(upload, str) else upload.file
+    return payload, file_obj
 
 
 @router.post("/ingest", status_code=202)
 async def ingest_event_log(
     request: Request,
 ):
+    form = None
     try:
         parsed_payload: dict[str, Any]
-        file_bytes: bytes | None = None
+        file_obj: BinaryIO | None = None
         content_type = request.headers.get("content-type", "")
         if "multipart/form-data" in content_type:
-            raw = await request.body()
-            parsed_payload, file_bytes = _parse_multipart_payload(raw, content_type)
+            try:
+                form = await request.form()
+            except Exception as exc:
+                raise EventLogDomainError(400, "INVALID_REQUEST", "invalid multipart request") from exc
+            parsed_payload, file_obj = _parse_multipart_form(form)
         else:
             try:
                 parsed_payload = await request.json()
@@ -69,11 +60,14 @@ async def ingest_event_log(
         result = event_log_service.ingest(
             tenant_id=_tenant(request),
             payload=parsed_payload,
-            file_bytes=file_bytes,
+            file_obj=file_obj,
         )
         return {"success": True, "data": result}
     except EventLogDomainError as err:
         raise _error_to_http(err)
+    finally:
+        if form is not None:
+            await form.close()
 
 
 @router.get("/")
@@ -34,6 +34,7 @@ from app.services.gwt_engine import (
     GWTEngine,
     GWTRule,
     GWTRuleManager,
+    gwt_rule_registry,
 )
 
 logger = logging.getLogger(__name__)
@@ -370,7 +371,9 @@ async def test_action_dry_run(action_id: str, request: Request, body: DryRunRequ
     tenant_id = _tenant(request)
 
     # dry_run 모드 — Neo4j 쓰기/이벤트 발행 없음. publisher=None 허용
-    engine = GWTEngine(neo4j_client, async_publisher=None, dry_run=True)
+    engine = GWTEngine(
+        neo4j_client, async_publisher=None, dry_run=True, rule_registry=gwt_rule_registry,
+    )
 
     try:
         results = await engine.handle_event(
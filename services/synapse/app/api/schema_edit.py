@@ -23,6 +23,17 @@ async def list_tables(request: Request):
         _raise(e)
 
 
+@router.post("/tables/details")
+async def get_table_details(payload: dict[str, Any], request: Request):
+    try:
+        names = (payload or {}).get("tables") or []
+        if not isinstance(names, list):
+            names = []
+        return {"success": True, "data": schema_edit_service.get_tables(_tenant(request), names)}
+    except SchemaEditDomainError as e:
+        _raise(e)
+
+
 @router.get("/tables/{table_name}")
 async def get_table(table_name: str, request: Request):
     try:
@@ -18,6 +18,13 @@ class Settings(BaseSettings):
     REDIS_URL: str = ""
     # O3: Neo4j fulltext 기반 ontology context (context_v2)
     FEATURE_SEARCH_V2: bool = False
+    # 이벤트 로그 청크 리더: 통계/변형/병목 분석 시 한 번에 읽는 이벤트 수
+    EVENT_LOG_READ_CHUNK_SIZE: int = 5000
+    # GWT 룰 레지스트리: (tenant, case, event_type)별 룰 캐시 TTL (다른 프로세스의 룰 변경 반영 상한)
+    GWT_RULE_CACHE_TTL_SEC: float = 30.0
+    # Graph Projector 마이크로 배치: 최대 이벤트 수 / 첫 이벤트 이후 최대 대기 시간
+    GRAPH_PROJECTOR_BATCH_SIZE: int = 500
+    GRAPH_PROJECTOR_FLUSH_INTERVAL_SEC: float = 0.2
 
     model_config = ConfigDict(env_file=".env")
 
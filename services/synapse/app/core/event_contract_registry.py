@@ -1,6 +1,6 @@
 """Synapse 서비스 이벤트 계약 레지스트리 (DDD-P3-01).
 
-Synapse가 소유(발행)하는 도메인 이벤트 4종의 스키마·버전·멱등성 규칙을 정의한다.
+Synapse가 소유(발행)하는 도메인 이벤트 5종의 스키마·버전·멱등성 규칙을 정의한다.
 """
 from __future__ import annotations
 
@@ -53,6 +53,13 @@ EVENT_CONTRACTS: dict[str, EventContract] = {
         payload_schema="synapse/conformance_check_completed/v1",
         idempotency_key_rule="event_type:aggregate_id",
     ),
+    "SCHEMA_CATALOG_CHANGED": EventContract(
+        event_name="SCHEMA_CATALOG_CHANGED",
+        owner_service="synapse",
+        version="1.0.0",
+        payload_schema="synapse/schema_catalog_changed/v1",
+        idempotency_key_rule="event_type:aggregate_id:timestamp_ms",
+    ),
 }
 
 
@@ -3,7 +3,8 @@
 Synapse 서비스에서 발행하는 도메인 이벤트를 PostgreSQL outbox 테이블에 기록하고,
 Relay 워커가 Redis Streams(axiom:synapse:events)로 발행한다.
 
-DB 접속은 Synapse가 이미 사용하는 psycopg2 + SCHEMA_EDIT_DATABASE_URL을 재활용한다.
+DB 접속은 Synapse가 이미 사용하는 SCHEMA_EDIT_DATABASE_URL을 재활용한다.
+INSERT(EventPublisher)는 psycopg2, Relay 워커는 asyncpg 풀 + 공용 OutboxRelay를 사용한다.
 """
 from __future__ import annotations
 
@@ -16,6 +17,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from app.core.event_contract_registry import EventContractError, enforce_event_contract
+from app.events.outbox_relay import OutboxRelay
 
 logger = logging.getLogger("axiom.synapse.outbox")
 
@@ -128,22 +130,50 @@ class EventPublisher:
 
 # ── Relay Worker (async background task) ────────────────────────── #
 
+_pool = None
+
+
+async def _get_pool():
+    """Relay 전용 asyncpg 풀 — 이벤트 루프를 막지 않고 claim/발행/갱신을 한 트랜잭션으로 처리."""
+    global _pool
+    if _pool is not None:
+        return _pool
+    import asyncpg
+    _pool = await asyncpg.create_pool(dsn=_db_url(), min_size=1, max_size=2)
+    return _pool
+
+
+async def close_relay_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
 class SynapseRelayWorker:
-    """synapse.event_outbox → axiom:synapse:events Redis Stream 발행 워커."""
+    """synapse.event_outbox → axiom:synapse:events Redis Stream 발행 워커.
+
+    claim(FOR UPDATE SKIP LOCKED) → 파이프라인 XADD → 일괄 UPDATE는 OutboxRelay가 담당한다.
+    배치가 가득 차면 쉬지 않고 다음 배치를 이어서 처리한다.
+    """
 
     def __init__(self, poll_interval: int = 5, max_batch: int = 100):
         self._poll = poll_interval
         self._batch = max_batch
         self._running = True
+        self._relay = OutboxRelay("synapse.event_outbox", lambda _event_type: STREAM_KEY, max_retry=MAX_RETRY)
 
     async def run(self) -> None:
         logger.info("SynapseRelayWorker started (poll=%ds, batch=%d)", self._poll, self._batch)
         while self._running:
+            claimed = 0
             try:
-                await self._publish_once()
+                result = await self._publish_once()
+                claimed = result["published"] + result["failed"]
             except Exception:
                 logger.exception("SynapseRelayWorker iteration failed")
-            await asyncio.sleep(self._poll)
+            if claimed < self._batch:
+                await asyncio.sleep(self._poll)
 
     async def _publish_once(self) -> dict[str, int]:
         from app.core.redis_client import get_redis
@@ -151,52 +181,17 @@ class SynapseRelayWorker:
         if redis is None:
             return {"published": 0, "failed": 0}
 
-        psycopg2, RealDictCursor = _import_psycopg2()
-        published = 0
-        failed = 0
-
-        with psycopg2.connect(_db_url()) as conn:
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-            cur.execute(
-                """
-                SELECT * FROM synapse.event_outbox
-                WHERE status = 'PENDING'
-                ORDER BY created_at ASC
-                LIMIT %s
-                FOR UPDATE SKIP LOCKED
-                """,
-                (self._batch,),
-            )
-            rows = cur.fetchall()
-
-            for row in rows:
-                body = {
-                    "event_id": row["id"],
-                    "event_type": row["event_type"],
-                    "aggregate_type": row["aggregate_type"],
-                    "aggregate_id": row["aggregate_id"],
-                    "tenant_id": row["tenant_id"] or "",
-                    "payload": row["payload"] if isinstance(row["payload"], str) else json.dumps(row["payload"], ensure_ascii=True),
-                }
-                try:
-                    await redis.xadd(STREAM_KEY, body, maxlen=10000, approximate=True)
-                    cur.execute(
-                        "UPDATE synapse.event_outbox SET status='PUBLISHED', published_at=now() WHERE id=%s",
-                        (row["id"],),
-                    )
-                    published += 1
-                except Exception as err:
-                    retry = (row["retry_count"] or 0) + 1
-                    new_status = "DEAD_LETTER" if retry >= MAX_RETRY else "FAILED"
-                    cur.execute(
-                        "UPDATE synapse.event_outbox SET status=%s, retry_count=%s, last_error=%s WHERE id=%s",
-                        (new_status, retry, str(err)[:500], row["id"]),
-                    )
-                    failed += 1
-            cur.close()
-            conn.commit()
-
-        return {"published": published, "failed": failed}
+        pool = await _get_pool()
+        async with pool.acquire() as conn, conn.transaction():
+            result = await self._relay.relay_once(conn, redis, self._batch)
+
+        for failure in result.failures:
+            if failure.status == "DEAD_LETTER":
+                logger.error(
+                    "Event %s moved to DEAD_LETTER after %d retries: %s",
+                    failure.row.id, failure.retry_count, failure.error,
+                )
+        return {"published": len(result.published), "failed": len(result.failures)}
 
     def shutdown(self) -> None:
         self._running = False
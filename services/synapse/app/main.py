@@ -18,7 +18,7 @@ from app.api.kinetic import router as kinetic_router
 from app.api.schema_navigation import router as schema_navigation_router
 from app.api.dmn import router as dmn_router
 from app.events.consumer import run_ontology_ingest_consumer
-from app.events.outbox import SynapseRelayWorker, ensure_outbox_table
+from app.events.outbox import SynapseRelayWorker, close_relay_pool, ensure_outbox_table
 import structlog
 
 logger = structlog.get_logger()
@@ -133,6 +133,7 @@ async def lifespan(app: FastAPI):
                 await task
             except asyncio.CancelledError:
                 pass
+    await close_relay_pool()
     await close_redis()
     await neo4j_client.close()
 
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
 from collections import defaultdict
-from pydantic import BaseModel
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
+from pydantic import BaseModel
+
 
 class Deviation(BaseModel):
     """API 명세: process-mining-api §3.2 case_diagnostics.deviations."""
@@ -37,16 +45,110 @@ class ConformanceResult(BaseModel):
     case_diagnostics: list[CaseDiagnostic]
     deviation_statistics: dict[str, dict[str, int]]
 
+# 케이스 수가 이 값 이상이고 workers > 1이면 케이스 청크를 프로세스 풀에서 병렬 채점
+_PARALLEL_MIN_CASES = 50_000
+
+
+@dataclass
+class _ChunkScore:
+    """케이스 청크 채점 결과 (인덱스는 모두 전역 기준)."""
+    missing: np.ndarray            # (cases,) 케이스별 누락 설계 활동 수
+    extra: np.ndarray              # (cases,) 케이스별 설계 외 이벤트 수
+    missing_mask: np.ndarray       # (cases, designed) 설계 위치별 누락 여부
+    skipped_count: np.ndarray      # (designed,) 설계 위치별 누락 케이스 수
+    skipped_first: np.ndarray      # (designed,) 처음 누락된 케이스 (없으면 큰 값)
+    unexpected_count: np.ndarray   # (vocab,) 활동별 설계 외 발생 수
+    unexpected_first: np.ndarray   # (vocab,) 처음 발생한 이벤트 위치 (없으면 큰 값)
+
+
+_NEVER = np.iinfo(np.int64).max
+
+
+def _score_chunk(
+    codes: np.ndarray,
+    case_of_event: np.ndarray,
+    event_offset: int,
+    case_offset: int,
+    n_cases: int,
+    designed_ids: np.ndarray,
+    n_designed_vocab: int,
+    n_vocab: int,
+) -> _ChunkScore:
+    """정수 인코딩된 케이스 청크 하나를 벡터 연산으로 채점한다.
+
+    활동 id는 설계 활동이 0..n_designed_vocab-1, 그 외가 뒤에 온다.
+    case_of_event는 청크 내부 케이스 번호(0..n_cases-1)이다.
+    """
+    in_design = codes < n_designed_vocab
+    extra = np.bincount(case_of_event[~in_design], minlength=n_cases)
+
+    present = np.zeros((n_cases, max(1, n_designed_vocab)), dtype=bool)
+    present[case_of_event[in_design], codes[in_design]] = True
+    missing_mask = ~present[:, designed_ids]
+    missing = missing_mask.sum(axis=1)
+
+    skipped_count = missing_mask.sum(axis=0)
+    skipped_first = np.where(skipped_count > 0, missing_mask.argmax(axis=0) + case_offset, _NEVER)
+
+    extra_codes = codes[~in_design]
+    unexpected_count = np.bincount(extra_codes, minlength=n_vocab)
+    unexpected_first = np.full(n_vocab, _NEVER, dtype=np.int64)
+    if extra_codes.size:
+        uniq, first_idx = np.unique(extra_codes, return_index=True)
+        unexpected_first[uniq] = np.flatnonzero(~in_design)[first_idx] + event_offset
+
+    return _ChunkScore(
+        missing=missing,
+        extra=extra,
+        missing_mask=missing_mask,
+        skipped_count=skipped_count,
+        skipped_first=skipped_first.astype(np.int64),
+        unexpected_count=unexpected_count,
+        unexpected_first=unexpected_first,
+    )
+
+
+def _merge_scores(scores: list[_ChunkScore]) -> _ChunkScore:
+    if len(scores) == 1:
+        return scores[0]
+    return _ChunkScore(
+        missing=np.concatenate([s.missing for s in scores]),
+        extra=np.concatenate([s.extra for s in scores]),
+        missing_mask=np.concatenate([s.missing_mask for s in scores]),
+        skipped_count=np.sum([s.skipped_count for s in scores], axis=0),
+        skipped_first=np.min([s.skipped_first for s in scores], axis=0),
+        unexpected_count=np.sum([s.unexpected_count for s in scores], axis=0),
+        unexpected_first=np.min([s.unexpected_first for s in scores], axis=0),
+    )
+
+
+def _ordered_stats(names: list[str], counts: np.ndarray, first_seen: np.ndarray) -> dict[str, int]:
+    """처음 관측된 순서대로 이름별 합계 dict 생성 (기존 루프의 삽입 순서 재현).
+
+    first_seen이 같으면 인덱스 오름차순을 유지한다 (stable 정렬).
+    """
+    stats: dict[str, int] = {}
+    hit = np.flatnonzero(counts > 0)
+    for i in hit[np.argsort(first_seen[hit], kind="stable")].tolist():
+        stats[names[i]] = stats.get(names[i], 0) + int(counts[i])
+    return stats
+
+
 def check_conformance(
     events: list[dict[str, Any]],
     designed_activities: list[str],
     include_case_diagnostics: bool = True,
     max_diagnostics_cases: int = 100,
+    *,
+    workers: int | None = None,
 ) -> ConformanceResult:
     """
     Lightweight token-style conformance scoring.
     - reference net 대신 설계 활동 시퀀스를 기준으로 적합도 계산
     - case 단위 trace 비교로 fitness/diagnostics 생성
+    - 활동을 정수 id로 인코딩해 누락/설계 외 활동을 케이스 전체에 대해 한 번에 벡터 계산
+      (대규모 로그는 케이스 청크를 프로세스 풀에서 병렬 처리, workers=None이면 CPU 수)
+    - Deviation 객체는 반환되는 진단 케이스(max_diagnostics_cases)에 대해서만 만든다
     """
     if not events:
         raise ValueError("events is empty")
@@ -56,74 +158,105 @@ def check_conformance(
     grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for event in events:
         grouped[str(event["case_id"])].append(event)
-    for case_id in grouped:
-        grouped[case_id].sort(key=lambda item: item["timestamp"])
+    by_timestamp = itemgetter("timestamp")
+    get_activity = itemgetter("activity")
+    case_ids = list(grouped)
+    traces: list[list[str]] = []
+    for case_id in case_ids:
+        trace_events = grouped[case_id]
+        trace_events.sort(key=by_timestamp)
+        traces.append(list(map(get_activity, trace_events)))
+
+    # 활동 사전: 설계 활동(중복 제거)이 앞쪽 id, 그 외 활동은 뒤쪽 id
+    vocab: dict[str, int] = {}
+    for activity in designed_activities:
+        vocab.setdefault(activity, len(vocab))
+    n_designed_vocab = len(vocab)
+    designed_ids = np.fromiter((vocab[a] for a in designed_activities), dtype=np.int64, count=len(designed_activities))
+
+    flat = list(chain.from_iterable(traces))
+    for activity in set(flat).difference(vocab):
+        vocab[activity] = len(vocab)
+    lengths = np.fromiter(map(len, traces), dtype=np.int64, count=len(traces))
+    codes = np.fromiter(map(vocab.__getitem__, flat), dtype=np.int64, count=len(flat))
+    names = list(vocab)
+    total_cases = len(case_ids)
+    case_starts = np.concatenate(([0], np.cumsum(lengths)))
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    n_chunks = min(n_workers, total_cases // max(1, _PARALLEL_MIN_CASES // 2)) if total_cases >= _PARALLEL_MIN_CASES else 1
+    bounds = np.linspace(0, total_cases, max(1, n_chunks) + 1, dtype=np.int64)
+    chunk_args = []
+    for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        ev_lo, ev_hi = int(case_starts[lo]), int(case_starts[hi])
+        chunk_args.append((
+            codes[ev_lo:ev_hi],
+            np.repeat(np.arange(hi - lo, dtype=np.int64), lengths[lo:hi]),
+            ev_lo, lo, hi - lo, designed_ids, n_designed_vocab, len(vocab),
+        ))
+    if len(chunk_args) > 1:
+        # 이벤트 루프/스레드를 가진 API 프로세스에서 fork하지 않도록 spawn 사용
+        with ProcessPoolExecutor(
+            max_workers=len(chunk_args), mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            score = _merge_scores(list(pool.map(_score_chunk, *zip(*chunk_args))))
+    else:
+        score = _score_chunk(*chunk_args[0])
+
+    produced_tokens = len(designed_activities)
+    consumed = lengths
+    denom = np.maximum(1, consumed + produced_tokens)
+    trace_fitness = np.maximum(0.0, 1.0 - ((score.missing + score.extra) / denom))
+    fit_mask = (score.missing == 0) & (score.extra == 0)
+    conformant_cases = int(fit_mask.sum())
+    # 기존 루프와 같은 좌→우 누적 합 (반올림 결과 동일 보장)
+    fitness_sum = sum(trace_fitness.tolist())
 
-    total_cases = len(grouped)
-    conformant_cases = 0
     diagnostics: list[CaseDiagnostic] = []
-    skipped_stats: dict[str, int] = defaultdict(int)
-    unexpected_stats: dict[str, int] = defaultdict(int)
-    fitness_sum = 0.0
-
-    for case_id, trace_events in grouped.items():
-        trace = [item["activity"] for item in trace_events]
-        missing = [a for a in designed_activities if a not in trace]
-        extra_set = {a for a in trace if a not in designed_activities}
-        extra_list = [a for a in trace if a not in designed_activities]
-        missing_tokens = len(missing)
-        remaining_tokens = len(extra_list)
-        consumed_tokens = len(trace)
-        produced_tokens = len(designed_activities)
-        denom = max(1, consumed_tokens + produced_tokens)
-        trace_fitness = max(0.0, 1.0 - ((missing_tokens + remaining_tokens) / denom))
-        is_fit = (missing_tokens == 0) and (remaining_tokens == 0)
-        if is_fit:
-            conformant_cases += 1
-        for activity in missing:
-            skipped_stats[activity] += 1
-        for activity in extra_list:
-            unexpected_stats[activity] += 1
-        fitness_sum += trace_fitness
-
-        deviations: list[Deviation] = []
-        for idx, activity in enumerate(designed_activities):
-            if activity not in trace:
-                deviations.append(
-                    Deviation(
-                        position=idx,
-                        expected=activity,
-                        actual="(누락)",
-                        type="skipped_activity",
-                        description=f"'{activity}' 활동이 누락됨",
-                    )
+    if include_case_diagnostics:
+        n_diag = min(max_diagnostics_cases, total_cases)
+        in_design = codes < n_designed_vocab
+        for ci in range(n_diag):
+            trace = traces[ci]
+            deviations: list[Deviation] = [
+                Deviation(
+                    position=idx,
+                    expected=designed_activities[idx],
+                    actual="(누락)",
+                    type="skipped_activity",
+                    description=f"'{designed_activities[idx]}' 활동이 누락됨",
                 )
-        for idx, activity in enumerate(trace):
-            if activity in extra_set:
-                deviations.append(
-                    Deviation(
-                        position=idx,
-                        expected="(설계에 없음)",
-                        actual=activity,
-                        type="unexpected_activity",
-                        description=f"설계에 없는 '{activity}' 활동이 발생",
-                    )
+                for idx in np.flatnonzero(score.missing_mask[ci]).tolist()
+            ]
+            start = int(case_starts[ci])
+            deviations.extend(
+                Deviation(
+                    position=idx,
+                    expected="(설계에 없음)",
+                    actual=trace[idx],
+                    type="unexpected_activity",
+                    description=f"설계에 없는 '{trace[idx]}' 활동이 발생",
                 )
-        if include_case_diagnostics and len(diagnostics) < max_diagnostics_cases:
+                for idx in np.flatnonzero(~in_design[start:start + len(trace)]).tolist()
+            )
             diagnostics.append(
                 CaseDiagnostic(
-                    instance_case_id=case_id,
-                    is_fit=is_fit,
-                    trace_fitness=round(trace_fitness, 3),
+                    instance_case_id=case_ids[ci],
+                    is_fit=bool(fit_mask[ci]),
+                    trace_fitness=round(float(trace_fitness[ci]), 3),
                     trace=trace,
                     deviations=deviations,
-                    missing_tokens=missing_tokens,
-                    remaining_tokens=remaining_tokens,
-                    consumed_tokens=consumed_tokens,
+                    missing_tokens=int(score.missing[ci]),
+                    remaining_tokens=int(score.extra[ci]),
+                    consumed_tokens=int(consumed[ci]),
                     produced_tokens=produced_tokens,
                 )
             )
 
+    # 같은 첫 누락 케이스 안에서는 설계 위치 순 (stable 정렬이 보장)
+    skipped_stats = _ordered_stats(designed_activities, score.skipped_count, score.skipped_first)
+    unexpected_stats = _ordered_stats(names, score.unexpected_count, score.unexpected_first)
+
     avg_fitness = fitness_sum / max(1, total_cases)
     precision = max(0.0, min(1.0, 1.0 - (sum(unexpected_stats.values()) / max(1, total_cases * len(designed_activities)))))
     generalization = max(0.0, min(1.0, avg_fitness - 0.03))
@@ -138,7 +271,7 @@ def check_conformance(
         conformant_cases=conformant_cases,
         case_diagnostics=diagnostics,
         deviation_statistics={
-            "skipped_activities": dict(skipped_stats),
-            "unexpected_activities": dict(unexpected_stats),
+            "skipped_activities": skipped_stats,
+            "unexpected_activities": unexpected_stats,
         },
     )
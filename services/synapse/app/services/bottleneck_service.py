@@ -5,12 +5,16 @@ ProcessMiningService에서 추출한 bottleneck 분석 책임.
 """
 from __future__ import annotations
 
+from collections import defaultdict
+from itertools import chain
 from statistics import median
-from typing import Any
+from typing import Any, Iterable
 
+from app.core.config import settings
 from app.services.mining_utils import (
-    activity_duration_stats,
+    add_activity_durations,
     build_case_paths,
+    iter_case_paths,
     parse_ts,
     utcnow_iso,
 )
@@ -25,12 +29,25 @@ class BottleneckService:
     def analyze(
         self, events: list[dict[str, Any]], sort_by: str, _sla_source: str,
     ) -> dict[str, Any]:
+        return self.analyze_cases(build_case_paths(events).items(), sort_by=sort_by, _sla_source=_sla_source)
+
+    def analyze_cases(
+        self, cases: Iterable[tuple[str, list[dict[str, Any]]]], sort_by: str, _sla_source: str,
+    ) -> dict[str, Any]:
+        """(case_id, 시간순 경로) 스트림에서 병목을 계산한다. 케이스 경로는 하나씩만 유지."""
         from app.services.mining_task_coordinator import MiningTaskError
         if sort_by not in {"bottleneck_score_desc", "avg_duration_desc", "violation_rate_desc"}:
             raise MiningTaskError(400, "INVALID_REQUEST", "invalid sort_by")
 
-        case_paths = build_case_paths(events)
-        durations_by_activity = activity_duration_stats(case_paths)
+        durations_by_activity: dict[str, list[float]] = defaultdict(list)
+        process_durations: list[float] = []
+        period_start = period_end = None
+        for _case_id, path in cases:
+            add_activity_durations(durations_by_activity, path)
+            first, last = parse_ts(path[0]["timestamp"]), parse_ts(path[-1]["timestamp"])
+            process_durations.append((last - first).total_seconds() if len(path) >= 2 else 0.0)
+            period_start = first if period_start is None or first < period_start else period_start
+            period_end = last if period_end is None or last > period_end else period_end
         if not durations_by_activity:
             return {
                 "bottlenecks": [],
@@ -92,19 +109,10 @@ class BottleneckService:
         for idx, item in enumerate(rows, start=1):
             item["bottleneck_rank"] = idx
 
-        process_durations = []
-        for path in case_paths.values():
-            if len(path) < 2:
-                process_durations.append(0.0)
-                continue
-            process_durations.append(
-                (parse_ts(path[-1]["timestamp"]) - parse_ts(path[0]["timestamp"])).total_seconds()
-            )
         process_durations.sort()
         compliance_rate = 1.0 - (total_violations / max(1, sum(len(v) for v in durations_by_activity.values())))
-        timestamps = sorted(parse_ts(event["timestamp"]) for event in events)
         return {
-            "analysis_period": {"start": timestamps[0].isoformat(), "end": timestamps[-1].isoformat()},
+            "analysis_period": {"start": period_start.isoformat(), "end": period_end.isoformat()},
             "bottlenecks": rows,
             "overall_process": {
                 "avg_duration_seconds": round(sum(process_durations) / max(1, len(process_durations)), 2),
@@ -129,18 +137,23 @@ class BottleneckService:
 
         self._coord.require_rate_limit()
         try:
-            ep = event_log_service.get_events_for_mining(tenant_id, log_id)
+            ep = event_log_service.stream_events_for_mining(
+                tenant_id, log_id, chunk_size=settings.EVENT_LOG_READ_CHUNK_SIZE,
+            )
         except EventLogDomainError as err:
             if err.code == "LOG_NOT_FOUND":
                 raise MiningTaskError(404, "LOG_NOT_FOUND", "event log not found") from err
             raise MiningTaskError(400, "INVALID_LOG_FORMAT", "invalid event log") from err
-        events = ep["events"]
-        if not events:
+        chunks = iter(ep["chunks"])
+        first_chunk = next(chunks, None)
+        if not first_chunk:
             raise MiningTaskError(400, "EMPTY_EVENT_LOG", "event log has no events")
 
         task = self._coord.create_task(tenant_id, "bottlenecks", case_id, log_id, requested_by)
         self._coord.set_running(task)
-        result = self.analyze(events, sort_by=sort_by, _sla_source=sla_source)
+        result = self.analyze_cases(
+            iter_case_paths(chain([first_chunk], chunks)), sort_by=sort_by, _sla_source=sla_source,
+        )
         result["completed_at"] = utcnow_iso()
         self._coord.set_completed(task, result)
         return {"task_id": task.task_id, "status": "queued", "created_at": task.created_at}
@@ -154,15 +167,15 @@ class BottleneckService:
         if not case_id or not log_id:
             raise MiningTaskError(400, "INVALID_REQUEST", "case_id and log_id are required")
         try:
-            ep = event_log_service.get_events_for_mining(tenant_id, log_id)
+            ep = event_log_service.stream_events_for_mining(
+                tenant_id, log_id, chunk_size=settings.EVENT_LOG_READ_CHUNK_SIZE,
+            )
         except EventLogDomainError as err:
             if err.code == "LOG_NOT_FOUND":
                 raise MiningTaskError(404, "LOG_NOT_FOUND", "event log not found") from err
             raise MiningTaskError(400, "INVALID_LOG_FORMAT", "invalid event log") from err
-        event_case_id = ep["case_id"]
-        events = ep["events"]
-        if case_id != event_case_id:
+        if case_id != ep["case_id"]:
             raise MiningTaskError(404, "LOG_NOT_FOUND", "log does not belong to case_id")
-        data = self.analyze(events, sort_by=sort_by, _sla_source=sla_source)
+        data = self.analyze_cases(iter_case_paths(ep["chunks"]), sort_by=sort_by, _sla_source=sla_source)
         data["log_id"] = log_id
         return data
@@ -0,0 +1,123 @@
+"""추출 카탈로그 ↔ 현재 Neo4j 그래프 차이 계산.
+
+카탈로그 재추출 시 DataSource 하위 그래프를 통째로 지우고 다시 쓰는 대신,
+현재 그래프와 새 카탈로그를 비교해 추가/변경/삭제분만 반영하기 위한 순수 함수 모음.
+Neo4j 접근은 호출자(metadata_graph_service)가 담당한다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+TableKey = tuple[str, str]  # (schema, table)
+ColumnKey = tuple[str, str, str]  # (schema, table, column)
+ColumnProps = tuple[str, bool]  # (dtype, nullable)
+
+
+@dataclass
+class CatalogState:
+    schemas: set[str] = field(default_factory=set)
+    tables: set[TableKey] = field(default_factory=set)
+    columns: dict[ColumnKey, ColumnProps] = field(default_factory=dict)
+
+
+@dataclass
+class CatalogDiff:
+    schemas_added: list[str]
+    schemas_removed: list[str]
+    tables_added: list[TableKey]
+    tables_removed: list[TableKey]
+    columns_added: list[tuple[ColumnKey, ColumnProps]]
+    columns_changed: list[tuple[ColumnKey, ColumnProps]]
+    columns_removed: list[ColumnKey]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (
+            self.schemas_added or self.schemas_removed or self.tables_added or self.tables_removed
+            or self.columns_added or self.columns_changed or self.columns_removed
+        )
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "schemas_added": len(self.schemas_added),
+            "schemas_removed": len(self.schemas_removed),
+            "tables_added": len(self.tables_added),
+            "tables_removed": len(self.tables_removed),
+            "columns_added": len(self.columns_added),
+            "columns_changed": len(self.columns_changed),
+            "columns_removed": len(self.columns_removed),
+        }
+
+
+def desired_state(catalog: dict[str, dict[str, list[dict[str, Any]]]]) -> CatalogState:
+    """추출 카탈로그 → CatalogState. 기존 save_extracted_catalog와 같은 규칙으로 잘못된 항목은 건너뛴다."""
+    state = CatalogState()
+    for schema_name, tables in catalog.items():
+        if not isinstance(tables, dict):
+            continue
+        sn = str(schema_name).strip()
+        if not sn:
+            continue
+        state.schemas.add(sn)
+        for table_name, columns in tables.items():
+            if not isinstance(columns, list):
+                continue
+            tn = str(table_name).strip()
+            if not tn:
+                continue
+            state.tables.add((sn, tn))
+            for col in columns:
+                if not isinstance(col, dict):
+                    continue
+                cn = str(col.get("name") or "").strip()
+                if not cn:
+                    continue
+                dtype = str(col.get("data_type") or col.get("type") or "string")
+                state.columns[(sn, tn, cn)] = (dtype, bool(col.get("nullable", True)))
+    return state
+
+
+def current_state(rows: Iterable[dict[str, Any]]) -> CatalogState:
+    """Schema-OPTIONAL Table-OPTIONAL Column 조회 결과 행 → CatalogState."""
+    state = CatalogState()
+    for row in rows:
+        sn = row.get("schema_name")
+        if sn is None:
+            continue
+        state.schemas.add(sn)
+        tn = row.get("table_name")
+        if tn is None:
+            continue
+        state.tables.add((sn, tn))
+        cn = row.get("column_name")
+        if cn is None:
+            continue
+        nullable = row.get("nullable")
+        state.columns[(sn, tn, cn)] = (str(row.get("dtype")), True if nullable is None else bool(nullable))
+    return state
+
+
+def diff_catalog(current: CatalogState, desired: CatalogState) -> CatalogDiff:
+    columns_added: list[tuple[ColumnKey, ColumnProps]] = []
+    columns_changed: list[tuple[ColumnKey, ColumnProps]] = []
+    for key, props in desired.columns.items():
+        existing = current.columns.get(key)
+        if existing is None:
+            columns_added.append((key, props))
+        elif existing != props:
+            columns_changed.append((key, props))
+    return CatalogDiff(
+        schemas_added=sorted(desired.schemas - current.schemas),
+        schemas_removed=sorted(current.schemas - desired.schemas),
+        tables_added=sorted(desired.tables - current.tables),
+        tables_removed=sorted(current.tables - desired.tables),
+        columns_added=columns_added,
+        columns_changed=columns_changed,
+        columns_removed=sorted(current.columns.keys() - desired.columns.keys()),
+    )
+
+
+def chunked(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
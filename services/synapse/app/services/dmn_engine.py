@@ -7,14 +7,18 @@ ObjectType의 Behavior(Rule 타입)를 DMN 결정 테이블로 실행한다.
   - 결정 테이블 평가 (조건 매칭 → 결과 반환)
   - 다중 규칙 결합 (First, Collect, Priority)
   - 변수 바인딩 및 표현식 평가
+  - 컴파일된 결정 테이블 (조건 사전 파싱 + 등호 컬럼 해시 인덱스 + DataFrame 일괄 평가)
 """
 from __future__ import annotations
 
 import ast
+import functools
 import operator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Iterable
 
+import numpy as np
+import pandas as pd
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -94,59 +98,121 @@ def _parse_rhs(rhs: str) -> Any:
     return int(rhs)
 
 
-def _evaluate_condition(condition: str, value: Any) -> bool:
-    """단일 조건을 평가한다.
+@dataclass(frozen=True)
+class CompiledCondition:
+    """사전 파싱된 조건 — 평가 시 문자열 파싱/literal_eval 없이 test(value)만 호출한다.
 
-    지원 형식:
-      - "> 100"         → value > 100
-      - "== 'VIP'"      → value == 'VIP'
-      - "in [1, 2, 3]"  → value in [1, 2, 3]
-      - "-" 또는 ""     → 항상 True (와일드카드)
-      - "not in [...]"  → value not in [...]
+    kind: any(와일드카드) | never(파싱 실패) | eq | in | not_in | cmp | str_eq
+    keys: eq/in 조건의 해시 인덱스 키 (해시 불가 값이 섞이면 None)
     """
-    condition = condition.strip()
+    kind: str
+    test: Callable[[Any], bool]
+    rhs: Any = None
+    op: Callable[[Any, Any], bool] | None = None
+    keys: frozenset | None = None
 
-    # 와일드카드 — 빈 문자열 또는 대시
-    if not condition or condition == "-":
-        return True
 
-    # in 연산자
-    if condition.startswith("in "):
+def _always(value: Any) -> bool:
+    return True
+
+
+def _never(value: Any) -> bool:
+    return False
+
+
+def _hashable_keys(values: Iterable[Any]) -> frozenset | None:
+    try:
+        return frozenset(values)
+    except TypeError:
+        return None
+
+
+def _membership(container: Any, negate: bool) -> CompiledCondition:
+    """in / not in 조건 — 리스트·튜플·집합은 frozenset 멤버십으로 바꾼다."""
+    keys = _hashable_keys(container) if isinstance(container, (list, tuple, set, frozenset)) else None
+    lookup = keys if keys is not None else container
+
+    def _test(value: Any) -> bool:
         try:
-            list_str = condition[3:].strip()
-            # 안전성: ast.literal_eval로 리터럴만 파싱 (코드 실행 방지)
-            check_list = ast.literal_eval(list_str)
-            return value in check_list
+            found = value in lookup
+        except TypeError:
+            # 해시 불가 값(list/dict) — frozenset 대신 원래 리스트·튜플에서 == 비교로 찾는다
+            if not isinstance(container, (list, tuple)):
+                return False
+            found = value in container
         except Exception:
             return False
+        return not found if negate else found
+
+    if negate:
+        return CompiledCondition("not_in", _test, rhs=container)
+    return CompiledCondition("in", _test, rhs=container, keys=keys)
+
 
-    # not in 연산자
-    if condition.startswith("not in "):
+def _comparison(op_str: str, op_func: Callable[[Any, Any], bool], rhs_raw: str) -> CompiledCondition:
+    try:
+        rhs = _parse_rhs(rhs_raw)
+    except (ValueError, TypeError):
+        return CompiledCondition("never", _never)
+
+    def _test(value: Any) -> bool:
         try:
-            list_str = condition[7:].strip()
-            # 안전성: ast.literal_eval로 리터럴만 파싱 (코드 실행 방지)
-            check_list = ast.literal_eval(list_str)
-            return value not in check_list
-        except Exception:
+            return op_func(value, rhs)
+        except (ValueError, TypeError):
             return False
 
+    if op_str == "==":
+        return CompiledCondition("eq", _test, rhs=rhs, op=op_func, keys=_hashable_keys((rhs,)))
+    return CompiledCondition("cmp", _test, rhs=rhs, op=op_func)
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_condition(condition: str) -> CompiledCondition:
+    """조건 문자열을 한 번만 파싱해 CompiledCondition으로 만든다 (문자열 단위 캐시)."""
+    condition = condition.strip()
+
+    # 와일드카드 — 빈 문자열 또는 대시
+    if not condition or condition == "-":
+        return CompiledCondition("any", _always)
+
+    # in / not in 연산자 — ast.literal_eval로 리터럴만 파싱 (코드 실행 방지)
+    for prefix, negate in (("in ", False), ("not in ", True)):
+        if condition.startswith(prefix):
+            try:
+                container = ast.literal_eval(condition[len(prefix):].strip())
+            except Exception:
+                return CompiledCondition("never", _never)
+            return _membership(container, negate)
+
     # 비교 연산자 — 긴 접두사부터 순서대로 매칭
     for op_str, op_func in _OPS:
         if condition.startswith(op_str):
-            rhs_raw = condition[len(op_str):].strip()
-            try:
-                rhs_val = _parse_rhs(rhs_raw)
-                return op_func(value, rhs_val)
-            except (ValueError, TypeError):
-                return False
+            return _comparison(op_str, op_func, condition[len(op_str):].strip())
 
     # 연산자 없는 단순 값 — 등호 비교
-    try:
-        if condition.startswith("'") and condition.endswith("'"):
-            return value == condition[1:-1]
-        return str(value) == condition
-    except Exception:
-        return False
+    if condition.startswith("'") and condition.endswith("'"):
+        return _comparison("==", operator.eq, condition)
+
+    def _str_eq(value: Any) -> bool:
+        try:
+            return str(value) == condition
+        except Exception:
+            return False
+
+    return CompiledCondition("str_eq", _str_eq, rhs=condition)
+
+
+def _evaluate_condition(condition: str, value: Any) -> bool:
+    """단일 조건을 평가한다.
+
+    지원 형식:
+      - "> 100"         → value > 100
+      - "== 'VIP'"      → value == 'VIP'
+      - "in [1, 2, 3]"  → value in [1, 2, 3]
+      - "-" 또는 ""     → 항상 True (와일드카드)
+      - "not in [...]"  → value not in [...]
+    """
+    return compile_condition(condition).test(value)
 
 
 def _evaluate_rule(rule: DecisionRule, context: dict[str, Any]) -> bool:
@@ -195,6 +261,179 @@ def execute_decision_table(
         return [m[1] for m in matched]
 
 
+# ─── 컴파일된 결정 테이블 ──────────────────────────────────
+
+# 규칙의 절반 이상이 등호/in 조건을 가진 입력 컬럼에 해시 인덱스를 만든다
+INDEX_MIN_EQ_RATIO = 0.5
+INDEX_MIN_EQ_RULES = 2
+
+
+def _iter_bits(mask: int):
+    """비트마스크의 켜진 비트 위치를 오름차순으로 순회한다."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _evaluate_series(cond: CompiledCondition, series: pd.Series | None, n: int) -> np.ndarray:
+    """조건을 입력 컬럼 전체에 대해 평가한 bool 배열.
+
+    비교·멤버십은 pandas 연산으로 한 번에 처리하고, 타입이 섞여 연산이 실패하면
+    원소별 test()로 되돌아가 단건 평가와 같은 결과를 낸다.
+    """
+    if cond.kind == "any":
+        return np.ones(n, dtype=bool)
+    if cond.kind == "never":
+        return np.zeros(n, dtype=bool)
+    if series is None:
+        # 컨텍스트에 없는 입력은 단건 평가와 마찬가지로 None
+        return np.full(n, cond.test(None), dtype=bool)
+    try:
+        if cond.kind in ("eq", "cmp"):
+            result = cond.op(series, cond.rhs)
+        elif cond.kind in ("in", "not_in") and isinstance(cond.rhs, (list, tuple, set, frozenset)):
+            result = series.isin(list(cond.rhs))
+            if cond.kind == "not_in":
+                result = ~result
+        else:
+            # str_eq 는 str(value) 비교라 dtype 업캐스트(1 → 1.0 → "1.0")에 민감 — 원소별 평가
+            raise TypeError(cond.kind)
+        return np.asarray(result, dtype=bool)
+    except Exception:
+        return np.fromiter((cond.test(v) for v in series.tolist()), dtype=bool, count=n)
+
+
+def _contexts_frame(contexts: list[dict[str, Any]]) -> pd.DataFrame:
+    """dict 목록 → object dtype DataFrame (없는 키는 NaN이 아닌 None)."""
+    columns: dict[str, None] = {}
+    for ctx in contexts:
+        columns.update(dict.fromkeys(ctx))
+    return pd.DataFrame(
+        {name: [ctx.get(name) for ctx in contexts] for name in columns},
+        index=range(len(contexts)),
+        dtype=object,
+    )
+
+
+class CompiledDecisionTable:
+    """DecisionTable을 한 번 컴파일해 반복 실행하는 평가기.
+
+    - 모든 조건은 compile_condition으로 사전 파싱 (in [...] 은 frozenset 멤버십)
+    - 등호 위주 입력 컬럼은 값 → 규칙 비트마스크 해시 인덱스로 후보 규칙을 교집합으로 찾는다
+    - PRIORITY 테이블은 규칙을 (priority, 정의 순서)로 미리 정렬해 FIRST와 같은 방식으로 평가한다
+    """
+
+    def __init__(self, table: DecisionTable):
+        self.name = table.name
+        self.hit_policy = table.hit_policy
+        order = list(range(len(table.rules)))
+        if table.hit_policy == HitPolicy.PRIORITY:
+            # sort는 안정 정렬 — 같은 priority면 정의 순서 유지 (기존 결과와 동일)
+            order.sort(key=lambda i: table.rules[i].priority)
+        rules = [table.rules[i] for i in order]
+
+        self._outputs: list[dict[str, Any]] = [rule.outputs for rule in rules]
+        self._conditions: list[list[tuple[str, CompiledCondition]]] = [
+            [(name, compile_condition(cond)) for name, cond in rule.conditions.items()]
+            for rule in rules
+        ]
+        self._all_mask = (1 << len(rules)) - 1
+        self._indexes: list[tuple[str, dict[Any, int], int]] = []
+        self._residual: list[list[tuple[str, CompiledCondition]]] = []
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        n = len(self._conditions)
+        eq_rules: dict[str, list[int]] = {}
+        for i, conds in enumerate(self._conditions):
+            for name, cond in conds:
+                if cond.keys is not None:
+                    eq_rules.setdefault(name, []).append(i)
+
+        indexed: set[str] = set()
+        for name, rule_ids in eq_rules.items():
+            if len(rule_ids) < INDEX_MIN_EQ_RULES or len(rule_ids) < n * INDEX_MIN_EQ_RATIO:
+                continue
+            buckets: dict[Any, int] = {}
+            for i in rule_ids:
+                cond = next(c for col, c in self._conditions[i] if col == name)
+                for key in cond.keys:
+                    buckets[key] = buckets.get(key, 0) | (1 << i)
+            # 이 컬럼에 등호 조건이 없는 규칙은 값과 무관하게 후보로 남는다
+            other = self._all_mask
+            for i in rule_ids:
+                other &= ~(1 << i)
+            self._indexes.append((name, buckets, other))
+            indexed.add(name)
+
+        self._residual = [
+            [(name, cond) for name, cond in conds
+             if cond.kind != "any" and not (name in indexed and cond.keys is not None)]
+            for conds in self._conditions
+        ]
+
+    def _candidates(self, context: dict[str, Any]) -> int:
+        mask = self._all_mask
+        for name, buckets, other in self._indexes:
+            value = context.get(name)
+            try:
+                hit = buckets.get(value, 0)
+            except TypeError:
+                hit = 0
+            mask &= hit | other
+            if not mask:
+                break
+        return mask
+
+    def execute(self, context: dict[str, Any]) -> list[dict[str, Any]]:
+        """execute_decision_table과 같은 결과를 반환한다."""
+        first_only = self.hit_policy in (HitPolicy.FIRST, HitPolicy.PRIORITY)
+        results: list[dict[str, Any]] = []
+        for i in _iter_bits(self._candidates(context)):
+            if all(cond.test(context.get(name)) for name, cond in self._residual[i]):
+                results.append(self._outputs[i])
+                if first_only:
+                    break
+        if not results:
+            logger.debug("dmn_no_match", table=self.name, context_keys=list(context.keys()))
+        return results
+
+    def execute_batch(self, contexts: pd.DataFrame | Iterable[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """입력 DataFrame(행 = 컨텍스트)을 한 번에 평가해 행별 결과 리스트를 반환한다.
+
+        규칙 × 조건마다 컬럼 단위로 bool 마스크를 계산하고 (같은 조건 문자열은 한 번만),
+        hit_policy에 따라 행별 첫 매칭 또는 전체 매칭을 고른다.
+        dict 목록을 넘기면 object dtype DataFrame으로 변환한다 — 값의 타입을 그대로 두고
+        (int 컬럼이 결측 때문에 float64로 바뀌지 않도록) 없는 키는 단건 평가처럼 None이 된다.
+        """
+        frame = contexts if isinstance(contexts, pd.DataFrame) else _contexts_frame(list(contexts))
+        n = len(frame)
+        if n == 0:
+            return []
+        hits = np.ones((n, len(self._conditions)), dtype=bool)
+        masks: dict[tuple[str, int], np.ndarray] = {}
+        for j, conds in enumerate(self._conditions):
+            for name, cond in conds:
+                key = (name, id(cond))
+                if key not in masks:
+                    masks[key] = _evaluate_series(cond, frame[name] if name in frame.columns else None, n)
+                hits[:, j] &= masks[key]
+
+        if self.hit_policy in (HitPolicy.FIRST, HitPolicy.PRIORITY):
+            if not self._conditions:
+                return [[] for _ in range(n)]
+            matched = hits.any(axis=1)
+            first = hits.argmax(axis=1)
+            return [[self._outputs[j]] if ok else [] for ok, j in zip(matched.tolist(), first.tolist())]
+        return [[self._outputs[j] for j in np.flatnonzero(row)] for row in hits]
+
+
+def compile_decision_table(table: DecisionTable) -> CompiledDecisionTable:
+    """결정 테이블을 컴파일한다 — 같은 테이블을 여러 컨텍스트에 반복 적용할 때 사용."""
+    return CompiledDecisionTable(table)
+
+
 # ─── 편의 함수 ─────────────────────────────────────────────
 
 def create_table_from_dict(definition: dict) -> DecisionTable:
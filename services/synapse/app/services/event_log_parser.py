@@ -2,6 +2,10 @@
 EventLogParser — CSV/XES/DB 파싱 전담 (DDD-P2-04).
 
 EventLogService에서 추출한 파싱·검증·정규화 책임.
+
+파일 업로드는 iter_csv_batches / iter_xes_batches로 고정 크기 배치 단위로 읽는다.
+csv.reader와 ET.iterparse(요소 clear)를 사용하므로 파일 크기와 무관하게
+배치 하나 분량만 메모리에 둔다. parse_csv / parse_xes는 이를 모아 리스트로 반환한다.
 """
 from __future__ import annotations
 
@@ -10,9 +14,19 @@ import io
 import uuid
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
 MAX_FILE_SIZE_BYTES = 500 * 1024 * 1024
+# 스트리밍 파싱 배치 크기 (이벤트 수)
+EVENT_BATCH_SIZE = 10_000
+
+XES_MAPPING: dict[str, Any] = {
+    "case_id_column": "case_id",
+    "activity_column": "concept:name",
+    "timestamp_column": "time:timestamp",
+    "resource_column": "org:resource",
+    "additional_columns": [],
+}
 
 
 class EventLogParseError(Exception):
@@ -54,9 +68,10 @@ class EventLogParser:
                 raise EventLogParseError(400, "MISSING_COLUMN", f"{col} is missing")
 
     @staticmethod
-    def build_canonical_events(
+    def canonical_batch(
         raw_events: list[dict[str, Any]], mapping: dict[str, Any],
     ) -> list[dict[str, Any]]:
+        """원본 행을 같은 순서의 정규 이벤트로 변환 (정렬하지 않음 — 배치 단위 변환용)."""
         converted: list[dict[str, Any]] = []
         case_col = mapping["case_id_column"]
         act_col = mapping["activity_column"]
@@ -73,61 +88,126 @@ class EventLogParser:
                 "resource": row.get(resource_col) if resource_col else None,
                 "attributes": attributes,
             })
+        return converted
+
+    @classmethod
+    def build_canonical_events(
+        cls, raw_events: list[dict[str, Any]], mapping: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        converted = cls.canonical_batch(raw_events, mapping)
         converted.sort(key=lambda item: (item["case_id"], item["timestamp"]))
         return converted
 
-    def parse_csv(
-        self, payload: bytes, mapping: dict[str, Any],
-    ) -> tuple[list[dict[str, Any]], set[str], list[dict[str, Any]]]:
+    def iter_csv_batches(
+        self, stream: BinaryIO, mapping: dict[str, Any], batch_size: int = EVENT_BATCH_SIZE,
+    ) -> tuple[set[str], Iterator[list[dict[str, Any]]]]:
+        """CSV 헤더를 읽어 매핑을 검증하고, 원본 행 배치 이터레이터를 반환한다."""
+        text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        reader = csv.reader(text)
         try:
-            text = payload.decode("utf-8")
-            reader = csv.DictReader(io.StringIO(text))
-            rows = list(reader)
-        except Exception as exc:
+            header = next(reader, None)
+        except (UnicodeDecodeError, csv.Error) as exc:
             raise EventLogParseError(400, "INVALID_CSV_FORMAT", "csv parse failed") from exc
-        if not rows:
+        if not header:
             raise EventLogParseError(400, "INVALID_CSV_FORMAT", "csv has no rows")
-        source_columns = set(rows[0].keys())
+        source_columns = set(header)
         self.validate_mapping(source_columns, mapping)
-        return self.build_canonical_events(rows, mapping), source_columns, rows
 
-    def parse_xes(
-        self, payload: bytes,
-    ) -> tuple[list[dict[str, Any]], set[str], list[dict[str, Any]], dict[str, Any]]:
+        def _batches() -> Iterator[list[dict[str, Any]]]:
+            width = len(header)
+            batch: list[dict[str, Any]] = []
+            seen = False
+            try:
+                for values in reader:
+                    if not values:
+                        continue
+                    if len(values) < width:
+                        values = values + [None] * (width - len(values))
+                    batch.append(dict(zip(header, values)))
+                    if len(batch) >= batch_size:
+                        seen = True
+                        yield batch
+                        batch = []
+            except (UnicodeDecodeError, csv.Error) as exc:
+                raise EventLogParseError(400, "INVALID_CSV_FORMAT", "csv parse failed") from exc
+            if batch:
+                yield batch
+            elif not seen:
+                raise EventLogParseError(400, "INVALID_CSV_FORMAT", "csv has no rows")
+
+        return source_columns, _batches()
+
+    def iter_xes_batches(
+        self, stream: BinaryIO, batch_size: int = EVENT_BATCH_SIZE,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """XES를 iterparse로 읽어 원본 행 배치를 yield한다 (매핑은 XES_MAPPING 고정).
+
+        처리가 끝난 event/trace 요소는 clear하므로 트리가 누적되지 않는다.
+        필수 속성 검증은 전체 속성 합집합이 필요하므로 마지막 배치 이후에 수행한다.
+        """
+        source_columns: set[str] = set()
+        batch: list[dict[str, Any]] = []
+        trace_rows: list[dict[str, Any]] = []
+        trace_case: str | None = None
+        in_trace = in_event = False
+        emitted = 0
+        root: ET.Element | None = None
         try:
-            root = ET.fromstring(payload)
+            for kind, elem in ET.iterparse(stream, events=("start", "end")):
+                tag = elem.tag.rsplit("}", 1)[-1]
+                if kind == "start":
+                    if root is None:
+                        root = elem
+                    if tag == "trace":
+                        in_trace, trace_case, trace_rows = True, None, []
+                    elif tag == "event" and in_trace:
+                        in_event = True
+                    continue
+                if tag == "event" and in_event:
+                    row: dict[str, Any] = {}
+                    for attr in elem:
+                        key = attr.attrib.get("key")
+                        value = attr.attrib.get("value")
+                        if key and value is not None:
+                            row[key] = value
+                    trace_rows.append(row)
+                    in_event = False
+                    elem.clear()
+                elif tag == "string" and in_trace and not in_event and trace_case is None \
+                        and elem.attrib.get("key") == "concept:name":
+                    trace_case = elem.attrib.get("value")
+                elif tag == "trace":
+                    case_id = trace_case or str(uuid.uuid4())
+                    for row in trace_rows:
+                        row = {"case_id": case_id, **row}
+                        source_columns.update(row)
+                        batch.append(row)
+                    in_trace, trace_rows = False, []
+                    # 처리한 trace가 루트 아래 쌓이지 않도록 루트 자식을 비운다
+                    root.clear()
+                    if len(batch) >= batch_size:
+                        emitted += len(batch)
+                        yield batch
+                        batch = []
         except ET.ParseError as exc:
             raise EventLogParseError(400, "INVALID_XES_FORMAT", "xes parse failed") from exc
-
-        rows: list[dict[str, Any]] = []
-        for trace in root.findall(".//trace"):
-            case_id = None
-            for child in trace:
-                if child.tag.endswith("string") and child.attrib.get("key") == "concept:name":
-                    case_id = child.attrib.get("value")
-                    break
-            if not case_id:
-                case_id = str(uuid.uuid4())
-
-            for event in trace.findall("./event"):
-                row: dict[str, Any] = {"case_id": case_id}
-                for attr in event:
-                    key = attr.attrib.get("key")
-                    value = attr.attrib.get("value")
-                    if key and value is not None:
-                        row[key] = value
-                rows.append(row)
-
-        if not rows:
+        if not batch and not emitted:
             raise EventLogParseError(400, "INVALID_XES_FORMAT", "xes has no events")
+        self.validate_mapping(source_columns, XES_MAPPING)
+        if batch:
+            yield batch
+
+    def parse_csv(
+        self, payload: bytes, mapping: dict[str, Any],
+    ) -> tuple[list[dict[str, Any]], set[str], list[dict[str, Any]]]:
+        source_columns, batches = self.iter_csv_batches(io.BytesIO(payload), mapping)
+        rows = [row for batch in batches for row in batch]
+        return self.build_canonical_events(rows, mapping), source_columns, rows
 
-        mapping = {
-            "case_id_column": "case_id",
-            "activity_column": "concept:name",
-            "timestamp_column": "time:timestamp",
-            "resource_column": "org:resource",
-            "additional_columns": [],
-        }
+    def parse_xes(
+        self, payload: bytes,
+    ) -> tuple[list[dict[str, Any]], set[str], list[dict[str, Any]], dict[str, Any]]:
+        rows = [row for batch in self.iter_xes_batches(io.BytesIO(payload)) for row in batch]
+        mapping = dict(XES_MAPPING)
         source_columns = set().union(*(set(r.keys()) for r in rows))
-        self.validate_mapping(source_columns, mapping)
         return self.build_canonical_events(rows, mapping), source_columns, rows, mapping
@@ -8,7 +8,7 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from app.services.event_log_store import get_event_log_store
 
@@ -84,9 +84,9 @@ class EventLogRepository:
     def store(self):
         return self._store
 
-    def get(self, tenant_id: str, log_id: str) -> EventLogRecord:
+    def get(self, tenant_id: str, log_id: str, include_events: bool = True) -> EventLogRecord:
         if self._store:
-            row = self._store.get(tenant_id, log_id)
+            row = self._store.get(tenant_id, log_id, include_events=include_events)
             if not row:
                 raise EventLogRepoError(404, "LOG_NOT_FOUND", "event log not found")
             return record_from_store_row(row)
@@ -95,6 +95,14 @@ class EventLogRepository:
             raise EventLogRepoError(404, "LOG_NOT_FOUND", "event log not found")
         return record
 
+    def iter_events(self, tenant_id: str, log_id: str, chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+        """이벤트를 case_id 순 청크로 반환 (같은 case는 연속). 존재 확인은 호출 측에서 get()으로."""
+        if self._store:
+            return self._store.iter_events(tenant_id, log_id, chunk_size=chunk_size)
+        record = self.get(tenant_id, log_id)
+        ordered = sorted(record.events, key=lambda item: (str(item["case_id"]), item["timestamp"]))
+        return (ordered[i:i + chunk_size] for i in range(0, len(ordered), chunk_size))
+
     def save(self, record: EventLogRecord) -> str:
         task_id = f"task-ingest-{uuid.uuid4()}"
         if self._store:
@@ -118,6 +126,40 @@ class EventLogRepository:
             self._task_to_log[task_id] = record.log_id
         return task_id
 
+    def save_batches(
+        self,
+        record: EventLogRecord,
+        batches: Iterable[tuple[list[dict[str, Any]], list[dict[str, Any]]]],
+    ) -> str:
+        """(원본 행, 정규 이벤트) 배치 스트림으로 로그를 저장한다. record의 이벤트 필드는 무시."""
+        task_id = f"task-ingest-{uuid.uuid4()}"
+        if self._store:
+            self._store.insert_batches(
+                log_id=record.log_id,
+                tenant_id=record.tenant_id,
+                case_id=record.case_id,
+                name=record.name,
+                source_type=record.source_type,
+                status=record.status,
+                source_config=record.source_config,
+                options=record.options,
+                filter_config=record.filter,
+                column_mapping=record.column_mapping,
+                batches=batches,
+            )
+            return task_id
+        raw_events: list[dict[str, Any]] = []
+        events: list[dict[str, Any]] = []
+        for raws, items in batches:
+            raw_events.extend(raws)
+            events.extend(items)
+        events.sort(key=lambda item: (item["case_id"], item["timestamp"]))
+        record.raw_events, record.events = raw_events, events
+        record.source_columns = set().union(*(row.keys() for row in raw_events))
+        self._logs[record.log_id] = record
+        self._task_to_log[task_id] = record.log_id
+        return task_id
+
     def update_events_and_mapping(
         self,
         tenant_id: str,
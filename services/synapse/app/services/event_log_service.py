@@ -1,16 +1,22 @@
 """EventLogService — Facade (DDD-P2-04). 내부를 전문 서비스에 위임."""
 from __future__ import annotations
 
+import io
+import os
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator
 
+from app.core.config import settings
 from app.services.event_log_db import EventLogDbError, fetch_database_rows  # noqa: F401 — re-export for test patches
-from app.services.event_log_parser import EventLogParseError, EventLogParser
+from app.services.event_log_parser import XES_MAPPING, EventLogParseError, EventLogParser, parse_timestamp
 from app.services.event_log_repository import EventLogRecord, EventLogRepoError, EventLogRepository
-from app.services.event_log_statistics import EventLogStatistics
+from app.services.event_log_statistics import EventLogStatistics, EventLogStatsAccumulator
 
 MAX_FILE_SIZE_BYTES = 500 * 1024 * 1024
+# 수집 시 계산해 둔 통계를 보관하는 로그 수 (LRU)
+STATS_CACHE_SIZE = 256
 
 
 class EventLogDomainError(Exception):
@@ -25,6 +31,22 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _stream_size(stream: BinaryIO) -> int:
+    """현재 위치를 유지한 채 스트림 전체 크기를 구한다."""
+    pos = stream.tell()
+    size = stream.seek(0, os.SEEK_END)
+    stream.seek(pos)
+    return size
+
+
+def _version(updated_at: Any) -> Any:
+    """updated_at 비교용 정규화 (store는 datetime, 인메모리는 ISO 문자열)."""
+    try:
+        return parse_timestamp(updated_at)
+    except Exception:
+        return str(updated_at)
+
+
 def _wrap(err: EventLogParseError | EventLogRepoError) -> EventLogDomainError:
     return EventLogDomainError(err.status_code, err.code, err.message)
 
@@ -36,6 +58,8 @@ class EventLogService:
         self._parser = EventLogParser()
         self._repo = EventLogRepository()
         self._stats = EventLogStatistics()
+        # (tenant_id, log_id) → (updated_at, 통계). 수집 중 증분 계산한 값을 읽기에서 재사용
+        self._stats_cache: OrderedDict[tuple[str, str], tuple[Any, dict[str, Any]]] = OrderedDict()
 
     @property
     def _store(self):
@@ -47,18 +71,56 @@ class EventLogService:
 
     def clear(self) -> None:
         self._repo.clear()
+        self._stats_cache.clear()
 
-    def _get_log(self, tenant_id: str, log_id: str) -> EventLogRecord:
+    def _get_log(self, tenant_id: str, log_id: str, include_events: bool = True) -> EventLogRecord:
         try:
-            return self._repo.get(tenant_id, log_id)
+            return self._repo.get(tenant_id, log_id, include_events=include_events)
         except EventLogRepoError as err:
             raise _wrap(err) from err
 
+    def _compute_stats(self, record: EventLogRecord) -> dict[str, Any]:
+        """수집 시 캐시된 통계가 현재 버전(updated_at)과 같으면 재사용, 아니면 청크 스트림으로 재계산."""
+        key = (record.tenant_id, record.log_id)
+        cached = self._stats_cache.get(key)
+        if cached is not None and cached[0] == _version(record.updated_at):
+            self._stats_cache.move_to_end(key)
+            return cached[1]
+        stats = self._stats.compute_stream(
+            self._repo.iter_events(record.tenant_id, record.log_id, chunk_size=settings.EVENT_LOG_READ_CHUNK_SIZE)
+        )
+        self._cache_stats(record, stats)
+        return stats
+
+    def _cache_stats(self, record: EventLogRecord, stats: dict[str, Any]) -> None:
+        key = (record.tenant_id, record.log_id)
+        self._stats_cache[key] = (_version(record.updated_at), stats)
+        self._stats_cache.move_to_end(key)
+        while len(self._stats_cache) > STATS_CACHE_SIZE:
+            self._stats_cache.popitem(last=False)
+
+    @staticmethod
+    def _accumulate(
+        acc: EventLogStatsAccumulator,
+        batches: Iterable[tuple[list[dict[str, Any]], list[dict[str, Any]]]],
+    ) -> Iterator[tuple[list[dict[str, Any]], list[dict[str, Any]]]]:
+        """저장으로 흘러가는 배치를 그대로 넘기면서 통계를 증분 갱신한다."""
+        for rows, items in batches:
+            acc.add_events(items)
+            yield rows, items
+
     def _raise_db_error(self, err: EventLogDbError) -> None:
         sc = 400 if err.code in {"INVALID_REQUEST", "MISSING_COLUMN"} else 503
         raise EventLogDomainError(sc, err.code, err.message) from err
 
-    def ingest(self, tenant_id: str, payload: dict[str, Any], file_bytes: bytes | None = None) -> dict[str, Any]:
+    def ingest(
+        self,
+        tenant_id: str,
+        payload: dict[str, Any],
+        file_bytes: bytes | None = None,
+        file_obj: BinaryIO | None = None,
+    ) -> dict[str, Any]:
+        """이벤트 로그 수집. CSV/XES는 file_obj(또는 file_bytes)를 배치 단위로 파싱해 바로 저장한다."""
         source_type = payload.get("source_type")
         if source_type not in {"csv", "xes", "database"}:
             raise EventLogDomainError(400, "INVALID_SOURCE_TYPE", "source_type must be csv|xes|database")
@@ -66,19 +128,37 @@ class EventLogService:
         if not case_id or not name:
             raise EventLogDomainError(400, "INVALID_REQUEST", "case_id and name are required")
         mapping = payload.get("column_mapping", {})
+        log_id = f"log-{uuid.uuid4()}"
+        created_at = _now_iso()
+        record = EventLogRecord(
+            log_id=log_id, tenant_id=tenant_id, case_id=str(case_id),
+            name=str(name), source_type=source_type, status="completed",
+            created_at=created_at, updated_at=created_at,
+            source_config=payload.get("source_config", {}),
+            options=payload.get("options", {}), filter=payload.get("filter", {}),
+            column_mapping=mapping,
+        )
+        acc = EventLogStatsAccumulator()
         try:
-            if source_type == "csv":
-                if file_bytes is None:
-                    raise EventLogDomainError(400, "INVALID_CSV_FORMAT", "csv file is required")
-                if len(file_bytes) > MAX_FILE_SIZE_BYTES:
-                    raise EventLogDomainError(413, "FILE_TOO_LARGE", "file size exceeds 500MB")
-                events, source_columns, raw_events = self._parser.parse_csv(file_bytes, mapping)
-            elif source_type == "xes":
-                if file_bytes is None:
-                    raise EventLogDomainError(400, "INVALID_XES_FORMAT", "xes file is required")
-                if len(file_bytes) > MAX_FILE_SIZE_BYTES:
+            if source_type in {"csv", "xes"}:
+                code = "INVALID_CSV_FORMAT" if source_type == "csv" else "INVALID_XES_FORMAT"
+                stream = file_obj if file_obj is not None else (
+                    io.BytesIO(file_bytes) if file_bytes is not None else None
+                )
+                if stream is None:
+                    raise EventLogDomainError(400, code, f"{source_type} file is required")
+                if _stream_size(stream) > MAX_FILE_SIZE_BYTES:
                     raise EventLogDomainError(413, "FILE_TOO_LARGE", "file size exceeds 500MB")
-                events, source_columns, raw_events, mapping = self._parser.parse_xes(file_bytes)
+                if source_type == "csv":
+                    _, raw_batches = self._parser.iter_csv_batches(stream, mapping)
+                else:
+                    raw_batches = self._parser.iter_xes_batches(stream)
+                    record.column_mapping = mapping = dict(XES_MAPPING)
+                task_id = self._repo.save_batches(
+                    record, self._accumulate(
+                        acc, ((rows, self._parser.canonical_batch(rows, mapping)) for rows in raw_batches),
+                    ),
+                )
             else:
                 source_cfg = payload.get("source_config") or {}
                 if not source_cfg.get("connection_id") or not source_cfg.get("table_name"):
@@ -93,21 +173,14 @@ class EventLogService:
                 except EventLogDbError as err:
                     self._raise_db_error(err)
                 self._parser.validate_mapping(source_columns, mapping)
-                events = self._parser.build_canonical_events(raw_events, mapping)
+                record.events = self._parser.build_canonical_events(raw_events, mapping)
+                record.raw_events, record.source_columns = raw_events, source_columns
+                acc.add_events(record.events)
+                task_id = self._repo.save(record)
         except EventLogParseError as err:
             raise _wrap(err) from err
-        log_id = f"log-{uuid.uuid4()}"
-        created_at = _now_iso()
-        record = EventLogRecord(
-            log_id=log_id, tenant_id=tenant_id, case_id=str(case_id),
-            name=str(name), source_type=source_type, status="completed",
-            created_at=created_at, updated_at=created_at,
-            source_config=payload.get("source_config", {}),
-            options=payload.get("options", {}), filter=payload.get("filter", {}),
-            column_mapping=mapping, raw_events=raw_events,
-            events=events, source_columns=source_columns,
-        )
-        task_id = self._repo.save(record)
+        if acc.in_order:  # 케이스 내 이벤트가 시간 역순으로 들어오면 변형을 이어 붙일 수 없어 읽기 시 재계산
+            self._cache_stats(record, acc.result())
         return {
             "task_id": task_id, "log_id": log_id, "name": record.name,
             "source_type": record.source_type, "status": "ingesting", "created_at": created_at,
@@ -137,8 +210,8 @@ class EventLogService:
         return {"logs": logs, "total": total}
 
     def get_log(self, tenant_id: str, log_id: str) -> dict[str, Any]:
-        record = self._get_log(tenant_id, log_id)
-        ov = self._stats.compute(record.events)["overview"]
+        record = self._get_log(tenant_id, log_id, include_events=False)
+        ov = self._compute_stats(record)["overview"]
         return {
             "log_id": record.log_id, "case_id": record.case_id,
             "name": record.name, "source_type": record.source_type,
@@ -153,14 +226,15 @@ class EventLogService:
         }
 
     def delete_log(self, tenant_id: str, log_id: str) -> dict[str, Any]:
+        self._stats_cache.pop((tenant_id, log_id), None)
         try:
             return self._repo.delete(tenant_id, log_id)
         except EventLogRepoError as err:
             raise _wrap(err) from err
 
     def get_statistics(self, tenant_id: str, log_id: str) -> dict[str, Any]:
-        record = self._get_log(tenant_id, log_id)
-        stats = self._stats.compute(record.events)
+        record = self._get_log(tenant_id, log_id, include_events=False)
+        stats = self._compute_stats(record)
         return {
             "log_id": record.log_id, "overview": stats["overview"],
             "activities": stats["activities"], "case_duration": stats["case_duration"],
@@ -172,12 +246,18 @@ class EventLogService:
         return {"log_id": record.log_id, "case_id": record.case_id,
                 "name": record.name, "events": list(record.events)}
 
+    def stream_events_for_mining(self, tenant_id: str, log_id: str, chunk_size: int) -> dict[str, Any]:
+        """get_events_for_mining의 청크 버전. chunks는 case_id 순 이벤트 청크 이터레이터."""
+        record = self._get_log(tenant_id, log_id, include_events=False)
+        return {"log_id": record.log_id, "case_id": record.case_id, "name": record.name,
+                "chunks": self._repo.iter_events(tenant_id, log_id, chunk_size=chunk_size)}
+
     def get_preview(self, tenant_id: str, log_id: str, limit: int = 100) -> dict[str, Any]:
-        record = self._get_log(tenant_id, log_id)
+        record = self._get_log(tenant_id, log_id, include_events=False)
         safe_limit = min(max(limit, 1), 100)
+        preview = next(iter(self._repo.iter_events(tenant_id, log_id, chunk_size=safe_limit)), [])
         return {"log_id": record.log_id, "column_mapping": record.column_mapping,
-                "events": record.events[:safe_limit],
-                "total_preview": min(safe_limit, len(record.events))}
+                "events": preview, "total_preview": len(preview)}
 
     def update_column_mapping(self, tenant_id: str, log_id: str, mapping: dict[str, Any]) -> dict[str, Any]:
         record = self._get_log(tenant_id, log_id)
@@ -196,6 +276,7 @@ class EventLogService:
             )
         except EventLogRepoError as err:
             raise _wrap(err) from err
+        self._stats_cache.pop((tenant_id, log_id), None)
         ov = self._stats.compute(new_events)["overview"]
         return {
             "log_id": record.log_id, "column_mapping": mapping,
@@ -228,6 +309,7 @@ class EventLogService:
             )
         except EventLogRepoError as err:
             raise _wrap(err) from err
+        self._stats_cache.pop((tenant_id, log_id), None)
         return {"task_id": f"task-refresh-{uuid.uuid4()}", "log_id": record.log_id,
                 "status": "ingesting", "created_at": _now_iso()}
 
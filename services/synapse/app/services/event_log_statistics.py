@@ -2,23 +2,319 @@
 EventLogStatistics — 이벤트 로그 통계 계산 전담 (DDD-P2-04).
 
 EventLogService에서 추출한 통계 계산 책임.
+
+EventLogStatsAccumulator가 이벤트를 한 번만 훑으며 정수 코드(case/activity/resource)와 epoch µs로
+인코딩하고, numpy 정렬 + 케이스 경계 인덱스로 소요 시간·리소스 케이스 수·변형(경로 해시)을 집계한다.
+  - add_cases: case_id 순으로 정렬된 청크 스트림 — 완료된 케이스는 집계 후 버린다 (읽기 경로)
+  - add_events: 순서 무관 배치 — 케이스별 고정 크기 상태만 유지하며 증분 갱신 (수집 경로)
+케이스 소요 시간 분위수는 DurationSketch(작은 로그는 정확, 큰 로그는 상대오차 1% 근사)로 구한다.
 """
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from statistics import median
-from typing import Any
+import math
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable
+
+import numpy as np
 
 from app.services.event_log_parser import parse_timestamp
-from app.services.mining_utils import percentile
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_PATH_HASH_BASE = 1_000_003
 
-class EventLogStatistics:
-    """이벤트 로그 통계 계산 전담."""
 
-    @staticmethod
-    def compute(events: list[dict[str, Any]]) -> dict[str, Any]:
+class DurationSketch:
+    """병합 가능한 분위수 스케치.
+
+    값이 capacity 이하이면 원본을 그대로 보관해 정확한 분위수(선형 보간)를 내고,
+    넘으면 로그 스케일 버킷(DDSketch 방식, 상대오차 relative_accuracy)으로 압축한다.
+    """
+
+    def __init__(self, capacity: int = 100_000, relative_accuracy: float = 0.01) -> None:
+        self.capacity = capacity
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._values: list[np.ndarray] = []
+        self._buckets: Counter[int] | None = None
+        self._zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add_many(self, values: Iterable[float]) -> None:
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return
+        self.count += len(values)
+        self.total += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        if self._buckets is None:
+            self._values.append(values)
+            if self.count <= self.capacity:
+                return
+            values = np.concatenate(self._values)
+            self._values = []
+            self._buckets = Counter()
+        self._add_to_buckets(values)
+
+    def _add_to_buckets(self, values: np.ndarray) -> None:
+        positive = values[values > 0]
+        self._zeros += len(values) - len(positive)
+        if len(positive):
+            keys, counts = np.unique(np.ceil(np.log(positive) / self._log_gamma).astype(np.int64), return_counts=True)
+            assert self._buckets is not None
+            self._buckets.update(dict(zip(keys.tolist(), counts.tolist())))
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        if self._buckets is None:
+            # statistics.median / mining_utils.percentile와 같은 선형 보간
+            return float(np.quantile(np.concatenate(self._values), q))
+        rank = q * (self.count - 1)
+        if rank < self._zeros:
+            return 0.0
+        seen = self._zeros
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                value = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def copy(self) -> "DurationSketch":
+        other = DurationSketch.__new__(DurationSketch)
+        other.__dict__.update(self.__dict__)
+        other._values = list(self._values)
+        other._buckets = Counter(self._buckets) if self._buckets is not None else None
+        return other
+
+
+def _epoch_us(values: list[Any]) -> np.ndarray:
+    """타임스탬프 목록 → UTC epoch µs. ISO 문자열 외 값/오류는 parse_timestamp로 (동일 오류 코드)."""
+    try:
+        parsed = [datetime.fromisoformat(v) for v in values]
+    except (TypeError, ValueError):
+        parsed = [parse_timestamp(v) for v in values]
+    seconds = np.array([(d if d.tzinfo else d.replace(tzinfo=timezone.utc)).timestamp() for d in parsed])
+    return np.rint(seconds * 1_000_000).astype(np.int64)
+
+
+def _codes(
+    values: list[Any], index: dict[Any, int], key: Callable[[Any], Any] | None = None, optional: bool = False,
+) -> np.ndarray:
+    """값 목록 → int32 코드 배열. 처음 보는 값은 index에 새 코드로 등록한다 (optional이면 빈 값은 -1).
+
+    서로 다른 값마다 한 번만 정규화/등록하고 나머지는 dict 조회(map)로 처리한다.
+    """
+    lookup: dict[Any, int] = {}
+    for value in dict.fromkeys(values):
+        if optional and not value:
+            lookup[value] = -1
+        else:
+            name = value if key is None else key(value)
+            lookup[value] = index.setdefault(name, len(index))
+    return np.fromiter(map(lookup.__getitem__, values), np.int32, len(values))
+
+
+def _iso(epoch_us: int) -> str:
+    return (_EPOCH + timedelta(microseconds=epoch_us)).isoformat()
+
+
+def _grow(values: np.ndarray, size: int) -> np.ndarray:
+    return values if len(values) >= size else np.pad(values, (0, size - len(values)))
+
+
+def _add_counts(total: np.ndarray, codes: np.ndarray, size: int) -> np.ndarray:
+    """코드별 빈도를 누적 배열에 더한다 (새 코드가 생기면 배열을 늘린다)."""
+    total = _grow(total, size)
+    if len(codes):
+        total[:size] += np.bincount(codes, minlength=size)
+    return total
+
+
+def _distinct(sorted_values: np.ndarray) -> np.ndarray:
+    """정렬된 배열의 중복 제거 (np.unique보다 빠른 인접 비교)."""
+    if not len(sorted_values):
+        return sorted_values
+    return sorted_values[np.concatenate(([True], sorted_values[1:] != sorted_values[:-1]))]
+
+
+def _value_counts(values: np.ndarray) -> dict[int, int]:
+    values = np.sort(values)
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1]))) if len(values) else values
+    counts = np.diff(np.append(starts, len(values)))
+    return dict(zip(values[starts].tolist(), counts.tolist()))
+
+
+def _hash_powers(n: int) -> np.ndarray:
+    powers = np.full(n, _PATH_HASH_BASE, dtype=np.uint64)
+    powers[0] = 1
+    return np.cumprod(powers, dtype=np.uint64)  # mod 2^64 (uint64 오버플로 랩어라운드)
+
+
+def _most_common(counter: dict[str, int], n: int | None = None) -> list[tuple[str, int]]:
+    """빈도 내림차순, 동률은 이름순 — 배치 순서/경로(수집 증분 vs 읽기 재계산)와 무관하게 같은 결과."""
+    ranked = sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+    return ranked if n is None else ranked[:n]
+
+
+class _CaseGroups:
+    """이벤트 배치를 (case, ts) 순으로 정렬해 케이스 경계별로 묶은 뷰."""
+
+    def __init__(self, case: np.ndarray, ts: np.ndarray, act: np.ndarray, res: np.ndarray) -> None:
+        order = np.lexsort((ts, case))  # 케이스별 시간순 (동시각은 입력 순서 유지)
+        self.case, self.ts, self.act, self.res = case[order], ts[order], act[order], res[order]
+        self.starts = np.flatnonzero(np.concatenate(([True], self.case[1:] != self.case[:-1])))
+        self.lengths = np.diff(np.append(self.starts, len(order)))
+        self.ids = self.case[self.starts]
+        self.first = self.ts[self.starts]
+        self.last = self.ts[self.starts + self.lengths - 1]
+
+    def path_hashes(self) -> np.ndarray:
+        """케이스별 activity 코드열의 다항식 해시 (h = Σ (a_j+1)·B^(k-1-j) mod 2^64).
+
+        앞선 해시 h0 뒤에 이어 붙이면 h0·B^k + h 이므로 배치를 나눠 받아도 누적할 수 있다.
+        """
+        n = len(self.act)
+        back = np.repeat(self.starts + self.lengths, self.lengths) - 1 - np.arange(n)
+        terms = (self.act.astype(np.uint64) + np.uint64(1)) * _hash_powers(int(back.max()) + 1)[back]
+        return np.add.reduceat(terms, self.starts)
+
+    def resource_pairs(self) -> np.ndarray:
+        """중복 없는 (case, resource) 쌍 키 (case << 32 | resource), 정렬됨."""
+        touched = self.res >= 0
+        keys = self.case[touched].astype(np.int64) << 32
+        keys |= self.res[touched]
+        keys.sort()
+        return _distinct(keys)
+
+
+class EventLogStatsAccumulator:
+    """이벤트 로그 통계 단일 패스 누적기."""
+
+    def __init__(self) -> None:
+        self.total_events = 0
+        self.min_us: int | None = None
+        self.max_us: int | None = None
+        self._activities: dict[str, int] = {}
+        self._resources: dict[str, int] = {}
+        self._activity_counts = np.zeros(0, dtype=np.int64)
+        self._resource_counts = np.zeros(0, dtype=np.int64)
+        self._resource_cases = np.zeros(0, dtype=np.int64)
+        self.variants_counter: Counter[int] = Counter()
+        self.durations = DurationSketch()
+        self.closed_cases = 0
+        self._tail: list[dict[str, Any]] = []
+        # add_events: 케이스별 고정 크기 상태 (first/last µs, 경로 해시) — 이벤트 수가 아니라 케이스 수에 비례
+        self._cases: dict[str, int] = {}
+        self._first = np.zeros(0, dtype=np.int64)
+        self._last = np.zeros(0, dtype=np.int64)
+        self._paths = np.zeros(0, dtype=np.uint64)
+        # 이미 센 (case, resource) 쌍 — 같은 케이스가 다음 배치에 다시 오면 중복 집계를 막는다
+        self._pairs = np.zeros(0, dtype=np.int64)
+        self._pending_pairs: list[np.ndarray] = []
+        # 이미 본 케이스에 더 이른 이벤트가 뒤늦게 오면 경로(변형) 해시를 이어 붙일 수 없다
+        self.in_order = True
+
+    # ── 공통: 인코딩 + 순서 무관 전역 카운터 ──
+
+    def _encode(self, events: list[dict[str, Any]], cases: dict[str, int]) -> _CaseGroups:
+        case = _codes([e["case_id"] for e in events], cases, key=str)
+        act = _codes([e["activity"] for e in events], self._activities)
+        res = _codes([e.get("resource") for e in events], self._resources, key=str, optional=True)
+        ts = _epoch_us([e["timestamp"] for e in events])
+
+        self.total_events += len(events)
+        lo, hi = int(ts.min()), int(ts.max())
+        self.min_us = lo if self.min_us is None else min(self.min_us, lo)
+        self.max_us = hi if self.max_us is None else max(self.max_us, hi)
+        self._activity_counts = _add_counts(self._activity_counts, act, len(self._activities))
+        self._resource_counts = _add_counts(self._resource_counts, res[res >= 0], len(self._resources))
+        return _CaseGroups(case, ts, act, res)
+
+    # ── 읽기 경로: case_id 순 청크 스트림 ──
+
+    def add_cases(self, chunk: list[dict[str, Any]]) -> None:
+        """case_id 순 청크 하나를 반영한다. 청크 끝의 케이스는 다음 청크와 합쳐 처리한다."""
+        if not chunk:
+            return
+        events = self._tail + chunk
+        last_case = str(events[-1]["case_id"])
+        split = len(events)
+        while split and str(events[split - 1]["case_id"]) == last_case:
+            split -= 1
+        self._tail = events[split:]
+        if split:
+            self._close_cases(events[:split])
+
+    def finish(self) -> None:
+        """스트림 끝 — 남은 마지막 케이스를 집계한다."""
+        if self._tail:
+            tail, self._tail = self._tail, []
+            self._close_cases(tail)
+
+    def _close_cases(self, events: list[dict[str, Any]]) -> None:
+        """완료된 케이스들(모든 이벤트 포함)을 한 번에 집계한다. 케이스 코드는 청크 안에서만 쓴다."""
+        groups = self._encode(events, {})
+        self.closed_cases += len(groups.ids)
+        self.durations.add_many((groups.last - groups.first) / 1_000_000)
+        resource_cases = np.bincount(groups.resource_pairs() & 0xFFFFFFFF, minlength=len(self._resources))
+        self._resource_cases = _grow(self._resource_cases, len(self._resources)) + resource_cases
+        self.variants_counter.update(_value_counts(groups.path_hashes()))
+
+    # ── 수집 경로: 순서 무관 증분 배치 ──
+
+    def add_events(self, events: list[dict[str, Any]]) -> None:
+        """임의 순서 배치를 증분 반영한다 (같은 케이스가 여러 배치에 걸쳐도 된다).
+
+        소요 시간·리소스 케이스 수는 순서와 무관하게 정확하다. 변형은 케이스 내 이벤트가 시간순으로
+        도착할 때만 이어 붙일 수 있으므로, 아니면 in_order=False로 표시한다 (호출자는 재계산으로 폴백).
+        """
         if not events:
+            return
+        known = len(self._cases)
+        groups = self._encode(events, self._cases)
+        ids = groups.ids
+        self._first = _grow(self._first, len(self._cases))
+        self._last = _grow(self._last, len(self._cases))
+        self._paths = _grow(self._paths, len(self._cases))
+        seen = ids < known
+        if seen.any():
+            seen_ids = ids[seen]
+            if (groups.first[seen] < self._last[seen_ids]).any():
+                self.in_order = False
+            groups.first[seen] = np.minimum(groups.first[seen], self._first[seen_ids])
+            groups.last[seen] = np.maximum(groups.last[seen], self._last[seen_ids])
+        hashes = groups.path_hashes()
+        hashes += self._paths[ids] * _hash_powers(int(groups.lengths.max()) + 1)[groups.lengths]
+        self._first[ids], self._last[ids], self._paths[ids] = groups.first, groups.last, hashes
+
+        pairs = groups.resource_pairs()
+        revisited = (pairs >> 32) < known  # 새 케이스의 쌍은 이전 배치와 겹칠 수 없다
+        if revisited.any():
+            fresh = np.ones(len(pairs), dtype=bool)
+            for counted in (self._pairs, *self._pending_pairs):
+                if len(counted):
+                    idx = np.searchsorted(counted, pairs).clip(max=len(counted) - 1)
+                    fresh &= counted[idx] != pairs
+            pairs = pairs[fresh | ~revisited]
+        self._resource_cases = _grow(self._resource_cases, len(self._resources)) + np.bincount(
+            pairs & 0xFFFFFFFF, minlength=len(self._resources),
+        )
+        self._pending_pairs.append(pairs)
+        if sum(len(p) for p in self._pending_pairs) > len(self._pairs):
+            # 서로 겹치지 않는 정렬 배열들을 하나로 — 크기가 두 배가 될 때만 (분할 상환 O(N log N))
+            self._pairs = np.sort(np.concatenate([self._pairs, *self._pending_pairs]))
+            self._pending_pairs = []
+
+    # ── 결과 ──
+
+    def result(self) -> dict[str, Any]:
+        if not self.total_events:
             return {
                 "total_events": 0,
                 "total_cases": 0,
@@ -27,38 +323,25 @@ class EventLogStatistics:
                 "ingestion_duration_seconds": 0.0,
             }
 
-        timestamps = [parse_timestamp(item["timestamp"]) for item in events]
-        total_events = len(events)
-        case_map: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        activity_counter: Counter[str] = Counter()
-        resource_counter: Counter[str] = Counter()
-        for event in events:
-            case_map[event["case_id"]].append(event)
-            activity_counter[event["activity"]] += 1
-            if event.get("resource"):
-                resource_counter[str(event["resource"])] += 1
-
-        total_cases = len(case_map)
-        case_durations: list[float] = []
-        variants_counter: Counter[str] = Counter()
-        for case_id, items in case_map.items():
-            sorted_items = sorted(items, key=lambda x: x["timestamp"])
-            first = parse_timestamp(sorted_items[0]["timestamp"])
-            last = parse_timestamp(sorted_items[-1]["timestamp"])
-            case_durations.append((last - first).total_seconds())
-            variant = " > ".join(item["activity"] for item in sorted_items)
-            variants_counter[variant] += 1
-
-        case_durations_sorted = sorted(case_durations)
-        avg_duration = sum(case_durations) / len(case_durations) if case_durations else 0.0
-        unique_activities = len(activity_counter)
-        total_variants = len(variants_counter)
-        top3 = variants_counter.most_common(3)
-        top3_cases = sum(count for _, count in top3)
+        durations = self.durations
+        resource_cases = _grow(self._resource_cases, len(self._resources))
+        variants_counter = self.variants_counter
+        total_cases = self.closed_cases
+        if self._cases:
+            durations = durations.copy()
+            durations.add_many((self._last - self._first) / 1_000_000)
+            variants_counter = variants_counter + Counter(_value_counts(self._paths))
+            total_cases += len(self._cases)
+
+        total_events = self.total_events
+        avg_duration = durations.total / durations.count if durations.count else 0.0
+        unique_activities = len(self._activities)
+        top3_cases = sum(count for _, count in variants_counter.most_common(3))
         top3_coverage = (top3_cases / total_cases) if total_cases else 0.0
 
         activities = []
-        for name, freq in activity_counter.most_common():
+        activity_counts = dict(zip(self._activities, self._activity_counts.tolist()))
+        for name, freq in _most_common(activity_counts):
             activities.append({
                 "name": name,
                 "frequency": freq,
@@ -67,33 +350,57 @@ class EventLogStatistics:
             })
 
         resources = []
-        for name, event_count in resource_counter.most_common(20):
-            touched_cases = len({e["case_id"] for e in events if e.get("resource") == name})
-            resources.append({"name": name, "event_count": event_count, "case_count": touched_cases})
+        resource_counts = {name: n for name, n in zip(self._resources, self._resource_counts.tolist()) if n}
+        case_counts = dict(zip(self._resources, resource_cases.tolist()))
+        for name, event_count in _most_common(resource_counts, 20):
+            resources.append({"name": name, "event_count": event_count, "case_count": case_counts[name]})
 
         overview = {
             "total_events": total_events,
             "total_cases": total_cases,
             "unique_activities": unique_activities,
             "avg_events_per_case": round(total_events / total_cases, 3) if total_cases else 0.0,
-            "date_range_start": min(timestamps).isoformat(),
-            "date_range_end": max(timestamps).isoformat(),
+            "date_range_start": _iso(self.min_us),
+            "date_range_end": _iso(self.max_us),
         }
         case_duration = {
             "avg_seconds": round(avg_duration, 2),
-            "median_seconds": round(median(case_durations_sorted), 2) if case_durations_sorted else 0.0,
-            "min_seconds": round(min(case_durations_sorted), 2) if case_durations_sorted else 0.0,
-            "max_seconds": round(max(case_durations_sorted), 2) if case_durations_sorted else 0.0,
-            "p25_seconds": round(percentile(case_durations_sorted, 0.25), 2),
-            "p75_seconds": round(percentile(case_durations_sorted, 0.75), 2),
-            "p95_seconds": round(percentile(case_durations_sorted, 0.95), 2),
+            "median_seconds": round(durations.quantile(0.5), 2),
+            "min_seconds": round(durations.min, 2) if durations.count else 0.0,
+            "max_seconds": round(durations.max, 2) if durations.count else 0.0,
+            "p25_seconds": round(durations.quantile(0.25), 2),
+            "p75_seconds": round(durations.quantile(0.75), 2),
+            "p95_seconds": round(durations.quantile(0.95), 2),
         }
         return {
             "overview": overview,
             "activities": activities,
             "case_duration": case_duration,
-            "variants": {"total_variants": total_variants, "top_3_coverage": round(top3_coverage, 3)},
+            "variants": {"total_variants": len(variants_counter), "top_3_coverage": round(top3_coverage, 3)},
             "resources": resources,
             "date_range": {"start": overview["date_range_start"], "end": overview["date_range_end"]},
             "ingestion_duration_seconds": 0.0,
         }
+
+
+class EventLogStatistics:
+    """이벤트 로그 통계 계산 전담."""
+
+    @staticmethod
+    def compute(events: list[dict[str, Any]]) -> dict[str, Any]:
+        acc = EventLogStatsAccumulator()
+        acc.add_events(events)
+        return acc.result()
+
+    @staticmethod
+    def compute_stream(chunks: Iterable[list[dict[str, Any]]]) -> dict[str, Any]:
+        """case_id 순 이벤트 청크 스트림에서 통계를 계산한다.
+
+        완료된 케이스는 청크 단위로 집계 후 버리므로 로그 전체를 메모리에 올리지 않는다
+        (케이스 소요 시간은 DurationSketch에만 남는다).
+        """
+        acc = EventLogStatsAccumulator()
+        for chunk in chunks:
+            acc.add_cases(chunk)
+        acc.finish()
+        return acc.result()
@@ -1,11 +1,16 @@
 """
 Event Log 영속 저장소 (Phase S1).
-PostgreSQL에 event_logs 메타데이터 및 events/raw_events 저장.
+PostgreSQL에 event_logs 메타데이터 및 raw_events 저장.
+
+정규화된 이벤트는 case_id 해시 파티션 테이블 event_log_events에 한 행씩 저장하고,
+iter_events()로 (case_id, ts) 순 청크 단위로 읽는다. 이전 버전에서 events JSONB 배열로
+저장된 로그(events_storage='jsonb')는 같은 API로 읽히며,
+migrations/001_event_log_events.sql로 일괄 이전할 수 있다.
 """
 import json
 import sys
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from app.core.config import settings
 
@@ -28,6 +33,44 @@ def _import_psycopg2():
         return psycopg2, RealDictCursor
 
 
+# event_log_events 해시 파티션 수 (migrations/001_event_log_events.sql과 같은 값)
+EVENT_PARTITIONS = 8
+_INSERT_PAGE_SIZE = 1000
+
+
+def _event_rows(
+    log_id: str,
+    tenant_id: str,
+    events: list[dict[str, Any]],
+    start: int = 0,
+    raws: list[dict[str, Any]] | None = None,
+) -> Iterator[tuple]:
+    for seq, event in enumerate(events, start=start):
+        resource = event.get("resource")
+        yield (
+            log_id,
+            tenant_id,
+            str(event["case_id"]),
+            seq,
+            str(event["activity"]),
+            event["timestamp"],
+            None if resource is None else str(resource),
+            json.dumps(event.get("attributes") or {}),
+            None if raws is None else json.dumps(raws[seq - start]),
+        )
+
+
+def _event_from_row(row: tuple) -> dict[str, Any]:
+    case_id, activity, ts, resource, attrs = row
+    return {
+        "case_id": case_id,
+        "activity": activity,
+        "timestamp": ts.astimezone(timezone.utc).isoformat(),
+        "resource": resource,
+        "attributes": attrs or {},
+    }
+
+
 class EventLogStore:
     """Event log metadata and events persisted to PostgreSQL."""
 
@@ -79,6 +122,35 @@ class EventLogStore:
         cur.execute(
             "CREATE INDEX IF NOT EXISTS event_logs_created ON event_logs (created_at DESC)"
         )
+        # 'jsonb': events 배열에 저장된 이전 형식 / 'normalized': event_log_events에 저장
+        cur.execute(
+            "ALTER TABLE event_logs ADD COLUMN IF NOT EXISTS events_storage TEXT NOT NULL DEFAULT 'jsonb'"
+        )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS event_log_events (
+              log_id TEXT NOT NULL,
+              tenant_id TEXT NOT NULL,
+              case_id TEXT NOT NULL,
+              seq INTEGER NOT NULL,
+              activity TEXT NOT NULL,
+              ts TIMESTAMPTZ NOT NULL,
+              resource TEXT,
+              attrs JSONB NOT NULL DEFAULT '{}',
+              raw JSONB,
+              PRIMARY KEY (log_id, case_id, seq)
+            ) PARTITION BY HASH (case_id)
+            """
+        )
+        for idx in range(EVENT_PARTITIONS):
+            cur.execute(
+                f"CREATE TABLE IF NOT EXISTS event_log_events_p{idx} PARTITION OF event_log_events "
+                f"FOR VALUES WITH (MODULUS {EVENT_PARTITIONS}, REMAINDER {idx})"
+            )
+        cur.execute("ALTER TABLE event_log_events ADD COLUMN IF NOT EXISTS raw JSONB")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS event_log_events_log_case_ts ON event_log_events (log_id, case_id, ts)"
+        )
         conn.commit()
         cur.close()
         conn.close()
@@ -109,8 +181,8 @@ class EventLogStore:
             INSERT INTO event_logs (
               log_id, tenant_id, case_id, name, source_type, status,
               source_config, options, filter_config, column_mapping, source_columns,
-              raw_events, events, created_at, updated_at
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+              raw_events, events_storage, created_at, updated_at
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'normalized', %s, %s)
             """,
             (
                 log_id,
@@ -125,25 +197,95 @@ class EventLogStore:
                 json.dumps(column_mapping),
                 json.dumps(source_columns),
                 json.dumps(raw_events),
-                json.dumps(events),
                 now,
                 now,
             ),
         )
+        self._write_events(cur, log_id, tenant_id, events)
         conn.commit()
         cur.close()
         conn.close()
 
-    def get(self, tenant_id: str, log_id: str) -> dict[str, Any] | None:
+    def insert_batches(
+        self,
+        log_id: str,
+        tenant_id: str,
+        case_id: str,
+        name: str,
+        source_type: str,
+        status: str,
+        source_config: dict[str, Any],
+        options: dict[str, Any],
+        filter_config: dict[str, Any],
+        column_mapping: dict[str, Any],
+        batches: Iterable[tuple[list[dict[str, Any]], list[dict[str, Any]]]],
+    ) -> int:
+        """(원본 행, 정규 이벤트) 배치 스트림을 한 트랜잭션으로 저장한다.
+
+        원본 행은 이벤트 행의 raw 컬럼에 함께 저장하고(매핑 변경 재처리용),
+        source_columns는 원본 행 키의 합집합으로 마지막에 기록한다.
+        배치 생성 중 예외(파싱 오류 등)가 나면 롤백되어 로그가 남지 않는다.
+        """
+        self._ensure_schema()
+        now = _now_iso()
+        conn = self._connect()
+        try:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                INSERT INTO event_logs (
+                  log_id, tenant_id, case_id, name, source_type, status,
+                  source_config, options, filter_config, column_mapping,
+                  events_storage, created_at, updated_at
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'normalized', %s, %s)
+                """,
+                (
+                    log_id,
+                    tenant_id,
+                    case_id,
+                    name,
+                    source_type,
+                    status,
+                    json.dumps(source_config),
+                    json.dumps(options),
+                    json.dumps(filter_config),
+                    json.dumps(column_mapping),
+                    now,
+                    now,
+                ),
+            )
+            total = 0
+            source_columns: set[str] = set()
+            for raws, events in batches:
+                for row in raws:
+                    source_columns.update(row)
+                self._write_events(cur, log_id, tenant_id, events, start=total, raws=raws)
+                total += len(events)
+            cur.execute(
+                "UPDATE event_logs SET source_columns = %s WHERE log_id = %s",
+                (json.dumps(sorted(source_columns)), log_id),
+            )
+            conn.commit()
+            cur.close()
+            return total
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def get(self, tenant_id: str, log_id: str, include_events: bool = True) -> dict[str, Any] | None:
+        """로그 레코드 조회. include_events=False면 raw_events/events를 읽지 않는다 (청크 리더와 함께 사용)."""
         self._ensure_schema()
         _, cursor_cls = _import_psycopg2()
         conn = self._connect()
         cur = conn.cursor(cursor_factory=cursor_cls)
+        payload_cols = "raw_events, events" if include_events else "'[]'::jsonb AS raw_events, '[]'::jsonb AS events"
         cur.execute(
-            """
+            f"""
             SELECT log_id, tenant_id, case_id, name, source_type, status,
                    source_config, options, filter_config, column_mapping, source_columns,
-                   raw_events, events, created_at, updated_at
+                   {payload_cols}, events_storage, created_at, updated_at
             FROM event_logs WHERE log_id = %s AND tenant_id = %s
             """,
             (log_id, tenant_id),
@@ -161,10 +303,97 @@ class EventLogStore:
         d["source_columns"] = set(d["source_columns"] or [])
         d["raw_events"] = d["raw_events"] or []
         d["events"] = d["events"] or []
+        if include_events and d.pop("events_storage") == "normalized":
+            d["events"] = [e for chunk in self.iter_events(tenant_id, log_id) for e in chunk]
+            if not d["raw_events"]:
+                d["raw_events"] = self._raw_rows(log_id)
+        d.pop("events_storage", None)
         d["created_at"] = d["created_at"].isoformat() if hasattr(d["created_at"], "isoformat") else str(d["created_at"])
         d["updated_at"] = d["updated_at"].isoformat() if hasattr(d["updated_at"], "isoformat") else str(d["updated_at"])
         return d
 
+    def iter_events(self, tenant_id: str, log_id: str, chunk_size: int = 5000) -> Iterator[list[dict[str, Any]]]:
+        """로그의 정규화 이벤트를 (case_id, ts) 순으로 chunk_size개씩 yield한다.
+
+        서버측(named) 커서로 읽으므로 로그 크기와 무관하게 청크 하나만 메모리에 둔다.
+        같은 case의 이벤트는 항상 연속해서 나온다. events_storage='jsonb'인 이전 로그는
+        JSONB 배열을 서버에서 펼쳐 같은 형식으로 반환한다.
+        """
+        self._ensure_schema()
+        conn = self._connect()
+        try:
+            cur = conn.cursor()
+            cur.execute(
+                "SELECT events_storage FROM event_logs WHERE log_id = %s AND tenant_id = %s",
+                (log_id, tenant_id),
+            )
+            row = cur.fetchone()
+            cur.close()
+            if not row:
+                return
+            stream = conn.cursor(name="event_log_events_stream")
+            stream.itersize = chunk_size
+            if row[0] == "normalized":
+                stream.execute(
+                    """
+                    SELECT case_id, activity, ts, resource, attrs
+                    FROM event_log_events WHERE log_id = %s
+                    ORDER BY case_id, ts, seq
+                    """,
+                    (log_id,),
+                )
+                while rows := stream.fetchmany(chunk_size):
+                    yield [_event_from_row(r) for r in rows]
+            else:
+                stream.execute(
+                    """
+                    SELECT e.value
+                    FROM event_logs l, jsonb_array_elements(l.events) WITH ORDINALITY AS e(value, seq)
+                    WHERE l.log_id = %s AND l.tenant_id = %s
+                    ORDER BY e.value->>'case_id', e.value->>'timestamp', e.seq
+                    """,
+                    (log_id, tenant_id),
+                )
+                while rows := stream.fetchmany(chunk_size):
+                    yield [r[0] for r in rows]
+            stream.close()
+        finally:
+            conn.close()
+
+    def _raw_rows(self, log_id: str) -> list[dict[str, Any]]:
+        """insert_batches로 저장된 원본 행을 파일 순서대로 읽는다."""
+        conn = self._connect()
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT raw FROM event_log_events WHERE log_id = %s AND raw IS NOT NULL ORDER BY seq",
+            (log_id,),
+        )
+        rows = [r[0] for r in cur.fetchall()]
+        cur.close()
+        conn.close()
+        return rows
+
+    @staticmethod
+    def _write_events(
+        cur: Any,
+        log_id: str,
+        tenant_id: str,
+        events: list[dict[str, Any]],
+        start: int = 0,
+        raws: list[dict[str, Any]] | None = None,
+    ) -> None:
+        from psycopg2.extras import execute_values  # type: ignore
+
+        execute_values(
+            cur,
+            """
+            INSERT INTO event_log_events (log_id, tenant_id, case_id, seq, activity, ts, resource, attrs, raw)
+            VALUES %s
+            """,
+            _event_rows(log_id, tenant_id, events, start=start, raws=raws),
+            page_size=_INSERT_PAGE_SIZE,
+        )
+
     def list_by_case(self, tenant_id: str, case_id: str, limit: int, offset: int) -> tuple[list[dict[str, Any]], int]:
         self._ensure_schema()
         _, cursor_cls = _import_psycopg2()
@@ -175,11 +404,38 @@ class EventLogStore:
             (tenant_id, case_id),
         )
         total = cur.fetchone()["count"]
+        # 로그 요약 통계는 DB에서 집계한다 (이벤트를 Python으로 가져오지 않음).
+        # 이전 형식(jsonb) 로그는 events 배열을 서버에서 펼쳐 같은 값을 계산한다.
         cur.execute(
             """
-            SELECT log_id, name, source_type, events, created_at
-            FROM event_logs WHERE tenant_id = %s AND case_id = %s
-            ORDER BY created_at DESC LIMIT %s OFFSET %s
+            SELECT l.log_id, l.name, l.source_type, l.created_at, s.*
+            FROM (
+              SELECT log_id, name, source_type, events, events_storage, created_at
+              FROM event_logs WHERE tenant_id = %s AND case_id = %s
+              ORDER BY created_at DESC LIMIT %s OFFSET %s
+            ) l
+            CROSS JOIN LATERAL (
+              SELECT COUNT(*) AS total_events,
+                     COUNT(DISTINCT e.case_id) AS total_cases,
+                     COUNT(DISTINCT e.activity) AS unique_activities,
+                     MIN(e.ts) AS date_range_start,
+                     MAX(e.ts) AS date_range_end
+              FROM event_log_events e
+              WHERE l.events_storage = 'normalized' AND e.log_id = l.log_id
+            ) n
+            CROSS JOIN LATERAL (
+              SELECT CASE WHEN l.events_storage = 'normalized' THEN n.total_events ELSE COUNT(*) END AS total_events,
+                     CASE WHEN l.events_storage = 'normalized' THEN n.total_cases
+                          ELSE COUNT(DISTINCT j->>'case_id') END AS total_cases,
+                     CASE WHEN l.events_storage = 'normalized' THEN n.unique_activities
+                          ELSE COUNT(DISTINCT j->>'activity') END AS unique_activities,
+                     CASE WHEN l.events_storage = 'normalized' THEN n.date_range_start
+                          ELSE MIN((j->>'timestamp')::timestamptz) END AS date_range_start,
+                     CASE WHEN l.events_storage = 'normalized' THEN n.date_range_end
+                          ELSE MAX((j->>'timestamp')::timestamptz) END AS date_range_end
+              FROM jsonb_array_elements(l.events) AS j
+            ) s
+            ORDER BY l.created_at DESC
             """,
             (tenant_id, case_id, limit, offset),
         )
@@ -188,26 +444,18 @@ class EventLogStore:
         conn.close()
         logs = []
         for row in rows:
-            events = row["events"] or []
-            total_events = len(events)
-            case_ids = {e.get("case_id") for e in events if e.get("case_id")}
-            total_cases = len(case_ids)
-            activities = {e.get("activity") for e in events if e.get("activity")}
-            timestamps = [e.get("timestamp") for e in events if e.get("timestamp")]
-            date_start = min(timestamps) if timestamps else None
-            date_end = max(timestamps) if timestamps else None
             created = row["created_at"]
-            created_at = created.isoformat() if hasattr(created, "isoformat") else str(created)
+            start, end = row["date_range_start"], row["date_range_end"]
             logs.append({
                 "log_id": row["log_id"],
                 "name": row["name"],
                 "source_type": row["source_type"],
-                "total_events": total_events,
-                "total_cases": total_cases,
-                "unique_activities": len(activities),
-                "date_range_start": date_start,
-                "date_range_end": date_end,
-                "created_at": created_at,
+                "total_events": int(row["total_events"]),
+                "total_cases": int(row["total_cases"]),
+                "unique_activities": int(row["unique_activities"]),
+                "date_range_start": start.astimezone(timezone.utc).isoformat() if start else None,
+                "date_range_end": end.astimezone(timezone.utc).isoformat() if end else None,
+                "created_at": created.isoformat() if hasattr(created, "isoformat") else str(created),
             })
         return logs, int(total)
 
@@ -227,19 +475,22 @@ class EventLogStore:
         cur.execute(
             """
             UPDATE event_logs
-            SET column_mapping = %s, raw_events = %s, events = %s, source_columns = %s, updated_at = %s
+            SET column_mapping = %s, raw_events = %s, events = '[]', events_storage = 'normalized',
+                source_columns = %s, updated_at = %s
             WHERE log_id = %s AND tenant_id = %s
             """,
             (
                 json.dumps(column_mapping),
                 json.dumps(raw_events),
-                json.dumps(events),
                 json.dumps(source_columns),
                 now,
                 log_id,
                 tenant_id,
             ),
         )
+        if cur.rowcount:
+            cur.execute("DELETE FROM event_log_events WHERE log_id = %s", (log_id,))
+            self._write_events(cur, log_id, tenant_id, events)
         conn.commit()
         cur.close()
         conn.close()
@@ -250,6 +501,8 @@ class EventLogStore:
         cur = conn.cursor()
         cur.execute("DELETE FROM event_logs WHERE log_id = %s AND tenant_id = %s", (log_id, tenant_id))
         deleted = cur.rowcount > 0
+        if deleted:
+            cur.execute("DELETE FROM event_log_events WHERE log_id = %s", (log_id,))
         conn.commit()
         cur.close()
         conn.close()
@@ -260,6 +513,7 @@ class EventLogStore:
         self._ensure_schema()
         conn = self._connect()
         cur = conn.cursor()
+        cur.execute("DELETE FROM event_log_events")
         cur.execute("DELETE FROM event_logs")
         conn.commit()
         cur.close()
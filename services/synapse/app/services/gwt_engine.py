@@ -18,13 +18,17 @@ import ast
 import json
 import operator
 import re
+import time
 import uuid
 from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 import structlog
 
+from app.core.config import settings
+
 logger = structlog.get_logger()
 
 # ── 보안: ontology_service.py와 동일한 화이트리스트 패턴 ──
@@ -161,8 +165,10 @@ class GWTEvalContext:
     tenant_id: str               # 테넌트 ID
     # _load_context_states()에서 채워지는 온톨로지 상태 스냅샷
     node_states: dict[str, dict[str, Any]] = dataclass_field(default_factory=dict)
-    # 관계 상태 (향후 확장용)
+    # 관계 조건 조회 결과 — _relation_key(cond) → [{"val": ...}] (최대 1건, 없으면 빈 리스트)
     relation_states: dict[str, list[dict]] = dataclass_field(default_factory=dict)
+    # state 조건용 라벨별 스냅샷 — {label: {node_id: props | None(노드 없음)}}
+    layer_states: dict[str, dict[str, dict | None]] = dataclass_field(default_factory=dict)
 
 
 @dataclass
@@ -218,72 +224,110 @@ def safe_eval(expression: str, variables: dict[str, Any]) -> Any:
 
     ❌ 금지: Call, Import, Lambda, FunctionDef, ClassDef, Exec 등
     → ValueError 발생으로 실행 차단
+
+    같은 표현식은 compile_expression() 캐시를 거치므로 ast.parse는 한 번만 수행된다.
+    """
+    return compile_expression(expression)(variables)
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(expression: str) -> Callable[[dict], Any]:
+    """표현식을 검증된 클로저로 컴파일 (표현식 문자열 단위 캐시)
+
+    허용 노드 검사는 컴파일 시점에 끝나므로, 금지 구문이 포함된 표현식은
+    변수와 무관하게 여기서 ValueError로 거부된다. 반환된 함수는 변수 dict만 받아
+    노드 타입 분기 없이 평가한다. (알 수 없는 변수/속성 접근 오류는 평가 시점에 발생)
     """
     tree = ast.parse(expression, mode="eval")
-    return _eval_node(tree.body, variables)
+    return _compile_node(tree.body)
 
 
-def _eval_node(node: ast.AST, variables: dict) -> Any:
-    """AST 노드 재귀 평가 — 허용된 노드 타입만 처리
+def _compile_node(node: ast.AST) -> Callable[[dict], Any]:
+    """AST 노드 → 평가 함수 변환 — 허용된 노드 타입만 처리
 
-    각 노드 타입별로 안전한 연산만 수행한다.
+    각 노드 타입별로 안전한 연산만 수행하는 클로저를 만든다.
     허용되지 않는 노드(Call, Import 등)는 ValueError로 차단한다.
     """
     # 상수 리터럴: 숫자, 문자열, bool, None
     if isinstance(node, ast.Constant):
-        return node.value
+        value = node.value
+        return lambda variables: value
 
     # 변수 참조: state, payload, trigger 등
     if isinstance(node, ast.Name):
-        if node.id not in variables:
-            raise ValueError(f"알 수 없는 변수: {node.id}")
-        return variables[node.id]
+        name = node.id
+
+        def _name(variables: dict) -> Any:
+            if name not in variables:
+                raise ValueError(f"알 수 없는 변수: {name}")
+            return variables[name]
+        return _name
 
     # 속성 접근: state.status → state["status"]로 변환
     if isinstance(node, ast.Attribute):
-        obj = _eval_node(node.value, variables)
-        if isinstance(obj, dict):
-            return obj.get(node.attr)
-        raise ValueError(f"속성 접근 불가: {node.attr}")
+        get_obj = _compile_node(node.value)
+        attr = node.attr
+
+        def _attribute(variables: dict) -> Any:
+            obj = get_obj(variables)
+            if isinstance(obj, dict):
+                return obj.get(attr)
+            raise ValueError(f"속성 접근 불가: {attr}")
+        return _attribute
 
     # 인덱스/키 접근: state["status"], items[0]
     if isinstance(node, ast.Subscript):
-        obj = _eval_node(node.value, variables)
-        key = _eval_node(node.slice, variables)
-        if isinstance(obj, dict):
-            return obj.get(key)
-        if isinstance(obj, (list, tuple)):
-            return obj[key]
-        raise ValueError(f"인덱스 접근 불가: {type(obj)}")
+        get_obj = _compile_node(node.value)
+        get_key = _compile_node(node.slice)
+
+        def _subscript(variables: dict) -> Any:
+            obj = get_obj(variables)
+            key = get_key(variables)
+            if isinstance(obj, dict):
+                return obj.get(key)
+            if isinstance(obj, (list, tuple)):
+                return obj[key]
+            raise ValueError(f"인덱스 접근 불가: {type(obj)}")
+        return _subscript
 
     # 비교 연산: ==, !=, >, <, >=, <=, in, not in
     if isinstance(node, ast.Compare):
-        left = _eval_node(node.left, variables)
+        get_left = _compile_node(node.left)
+        steps: list[tuple[Any, Callable[[dict], Any]]] = []
         for op_node, comparator in zip(node.ops, node.comparators):
             op_func = _SAFE_COMPARE_OPS.get(type(op_node))
             if op_func is None:
                 raise ValueError(
                     f"허용되지 않는 비교 연산자: {type(op_node).__name__}"
                 )
-            right = _eval_node(comparator, variables)
-            if not op_func(left, right):
-                return False
-            left = right
-        return True
+            steps.append((op_func, _compile_node(comparator)))
+
+        def _compare(variables: dict) -> bool:
+            left = get_left(variables)
+            for op_func, get_right in steps:
+                right = get_right(variables)
+                if not op_func(left, right):
+                    return False
+                left = right
+            return True
+        return _compare
 
     # 논리 연산: and, or (단락 평가 지원)
     if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(v) for v in node.values]
         if isinstance(node.op, ast.And):
-            return all(_eval_node(v, variables) for v in node.values)
+            return lambda variables: all(f(variables) for f in operands)
         if isinstance(node.op, ast.Or):
-            return any(_eval_node(v, variables) for v in node.values)
+            return lambda variables: any(f(variables) for f in operands)
 
     # 단항 연산: not, 단항 마이너스(-)
     if isinstance(node, ast.UnaryOp):
         if isinstance(node.op, ast.Not):
-            return not _eval_node(node.operand, variables)
+            get_operand = _compile_node(node.operand)
+            return lambda variables: not get_operand(variables)
         if isinstance(node.op, ast.USub):
-            return -_eval_node(node.operand, variables)
+            get_operand = _compile_node(node.operand)
+            return lambda variables: -get_operand(variables)
 
     # 이항 연산: +, -, *, /, %
     if isinstance(node, ast.BinOp):
@@ -292,15 +336,86 @@ def _eval_node(node: ast.AST, variables: dict) -> Any:
             raise ValueError(
                 f"허용되지 않는 이항 연산자: {type(node.op).__name__}"
             )
-        return op_func(
-            _eval_node(node.left, variables),
-            _eval_node(node.right, variables),
-        )
+        get_left = _compile_node(node.left)
+        get_right = _compile_node(node.right)
+        return lambda variables: op_func(get_left(variables), get_right(variables))
 
     # 허용되지 않는 노드 — Call, Import, Lambda 등 차단
     raise ValueError(f"허용되지 않는 표현식 노드: {type(node).__name__}")
 
 
+# ═══════════════════════════════════════════════════════════════
+# 인프로세스 룰 레지스트리
+# ═══════════════════════════════════════════════════════════════
+
+
+@dataclass
+class _TenantRules:
+    version: int = 0
+    # (case_id, event_type) → (적재 시각, 검증·컴파일된 룰 목록)
+    entries: dict[tuple[str, str], tuple[float, list[GWTRule]]] = dataclass_field(default_factory=dict)
+
+
+class GWTRuleRegistry:
+    """(tenant, case, event_type) → 활성 룰 목록 캐시
+
+    GWTEngine.handle_event가 이벤트마다 Neo4j에서 ActionType을 다시 읽지 않도록
+    검증·컴파일을 마친 룰 목록을 보관한다. 다음 경우에만 다시 불러온다.
+
+      - GWTRuleManager가 룰을 생성/수정/삭제했을 때 (테넌트 버전 증가)
+      - TTL(GWT_RULE_CACHE_TTL_SEC)이 지났을 때 (다른 프로세스의 변경 반영)
+
+    버전 토큰: 로드 시작 시점의 버전을 받아 두었다가 저장 시 비교하므로,
+    로드 도중 룰이 바뀌면 오래된 목록이 캐시에 남지 않는다.
+    """
+
+    def __init__(self, ttl_sec: float | None = None) -> None:
+        self._ttl = ttl_sec if ttl_sec is not None else settings.GWT_RULE_CACHE_TTL_SEC
+        self._tenants: dict[str, _TenantRules] = {}
+
+    def get(self, tenant_id: str, case_id: str, event_type: str) -> list[GWTRule] | None:
+        tenant = self._tenants.get(tenant_id)
+        if tenant is None:
+            return None
+        cached = tenant.entries.get((case_id, event_type))
+        if cached is None:
+            return None
+        loaded_at, rules = cached
+        if time.monotonic() - loaded_at >= self._ttl:
+            return None
+        return rules
+
+    def version(self, tenant_id: str) -> int:
+        """로드 시작 전에 받아 두는 버전 토큰."""
+        return self._tenants.setdefault(tenant_id, _TenantRules()).version
+
+    def store(
+        self,
+        tenant_id: str,
+        version: int,
+        case_id: str,
+        event_type: str,
+        rules: list[GWTRule],
+    ) -> bool:
+        """로드 도중 무효화되지 않았을 때만 저장한다."""
+        tenant = self._tenants.setdefault(tenant_id, _TenantRules())
+        if tenant.version != version:
+            return False
+        tenant.entries[(case_id, event_type)] = (time.monotonic(), list(rules))
+        return True
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        """특정 테넌트(또는 전체) 룰 캐시를 비우고 버전을 올린다."""
+        targets = [tenant_id] if tenant_id is not None else list(self._tenants)
+        for tid in targets:
+            tenant = self._tenants.setdefault(tid, _TenantRules())
+            tenant.version += 1
+            tenant.entries.clear()
+
+
+gwt_rule_registry = GWTRuleRegistry()
+
+
 # ═══════════════════════════════════════════════════════════════
 # GWT 룰 엔진
 # ═══════════════════════════════════════════════════════════════
@@ -329,16 +444,19 @@ class GWTEngine:
         neo4j_client: Any,
         async_publisher: Any,
         dry_run: bool = False,
+        rule_registry: GWTRuleRegistry | None = None,
     ):
         """
         Args:
             neo4j_client: Neo4jClient (execute_read/execute_write 메서드 보유)
             async_publisher: AsyncEventPublisher (publish 메서드 보유)
             dry_run: True이면 Neo4j 쓰기/이벤트 발행 건너뜀 (시뮬레이션 모드)
+            rule_registry: 룰 캐시 (보통 gwt_rule_registry). None이면 이벤트마다 Neo4j 조회
         """
         self._neo4j = neo4j_client
         self._publisher = async_publisher
         self._dry_run = dry_run
+        self._registry = rule_registry
 
     # ── 룰 로딩 ──────────────────────────────────────────────
 
@@ -366,6 +484,54 @@ class GWTEngine:
         })
         return [self._parse_rule(r["a"]) for r in records]
 
+    async def _active_rules(
+        self,
+        case_id: str,
+        tenant_id: str,
+        event_type: str,
+    ) -> list[GWTRule]:
+        """이벤트에 적용할 검증·컴파일된 룰 목록 — 레지스트리 캐시 우선"""
+        if self._registry is not None:
+            cached = self._registry.get(tenant_id, case_id, event_type)
+            if cached is not None:
+                return cached
+            version = self._registry.version(tenant_id)
+        rules = self._prepare_rules(await self.load_rules(case_id, tenant_id, event_type))
+        if self._registry is not None:
+            self._registry.store(tenant_id, version, case_id, event_type, rules)
+        return rules
+
+    @staticmethod
+    def _prepare_rules(rules: list[GWTRule]) -> list[GWTRule]:
+        """화이트리스트 검증 + expression 조건 사전 컴파일 (룰 적재 시 한 번)
+
+        검증에 실패한 룰은 제외한다 (Cypher 인젝션 방지).
+        컴파일에 실패한 expression은 평가 시점에 False로 처리되므로 룰은 유지한다.
+        """
+        prepared: list[GWTRule] = []
+        for rule in rules:
+            try:
+                for cond in rule.given:
+                    cond.validate()
+                for action in rule.then:
+                    action.validate()
+            except ValueError as exc:
+                logger.error(
+                    "gwt_rule_validation_failed",
+                    rule_id=rule.id,
+                    error=str(exc),
+                )
+                continue  # 검증 실패한 룰은 건너뜀
+
+            for cond in rule.given:
+                if cond.type == "expression" and isinstance(cond.value, str):
+                    try:
+                        compile_expression(cond.value)
+                    except (SyntaxError, ValueError):
+                        pass
+            prepared.append(rule)
+        return prepared
+
     # ── Given 조건 평가 ──────────────────────────────────────
 
     async def evaluate_given(
@@ -549,12 +715,12 @@ class GWTEngine:
         """이벤트 하나를 처리하는 메인 진입점
 
         처리 흐름:
-        1. 매칭 룰 로드 (Neo4j에서 case+tenant+event_type으로 조회)
-        2. 컨텍스트 구성 (관련 노드 상태를 Neo4j에서 일괄 조회)
-        3. 각 룰의 화이트리스트 검증 → Given 평가 → Then 실행
+        1. 매칭 룰 로드 (레지스트리 캐시, 없으면 Neo4j 조회 후 검증·컴파일)
+        2. 컨텍스트 구성 (노드 상태 + state/relation 조건 값을 Cypher 한 번으로 조회)
+        3. 각 룰의 Given 평가 → Then 실행
         4. 발행된 이벤트를 EventOutbox에 저장 (dry_run이 아닌 경우)
         """
-        rules = await self.load_rules(case_id, tenant_id, event_type)
+        rules = await self._active_rules(case_id, tenant_id, event_type)
         if not rules:
             return []
 
@@ -568,25 +734,11 @@ class GWTEngine:
             tenant_id=tenant_id,
         )
 
-        # 관련 노드 상태를 Neo4j에서 한 번에 일괄 조회
+        # 관련 노드 상태와 조건 값을 Neo4j에서 한 번에 일괄 조회
         await self._load_context_states(ctx, rules)
 
         results: list[GWTExecutionResult] = []
         for rule in rules:
-            # 모든 조건/액션의 화이트리스트 검증 (Cypher 인젝션 방지)
-            try:
-                for cond in rule.given:
-                    cond.validate()
-                for action in rule.then:
-                    action.validate()
-            except ValueError as exc:
-                logger.error(
-                    "gwt_rule_validation_failed",
-                    rule_id=rule.id,
-                    error=str(exc),
-                )
-                continue  # 검증 실패한 룰은 건너뜀
-
             # Given 조건 평가 → 매칭되면 Then 실행
             if await self.evaluate_given(rule, ctx):
                 exec_result = await self.execute_then(rule, ctx)
@@ -624,27 +776,29 @@ class GWTEngine:
         # 검증된 값만 Cypher 문자열에 삽입 (validate()에서 이미 확인됨)
         label = cond.node_layer.capitalize()
         field_name = cond.field
+        node_id = self._state_node_id(cond, ctx)
 
-        query = f"""
-        MATCH (n:{label} {{case_id: $case_id}})
-        WHERE n.node_id = $node_id
-        RETURN n.{field_name} AS val
-        """
-
-        # $trigger.xxx 형태의 동적 참조 해석
-        node_id = self._resolve_ref(
-            cond.value if isinstance(cond.value, str) and cond.value.startswith("$") else "",
-            ctx,
-        ) or ctx.source_node_id
-
-        records = await self._neo4j.execute_read(query, {
-            "case_id": ctx.case_id,
-            "node_id": node_id,
-        })
-        if not records:
-            return False
+        # _load_context_states()가 미리 읽어 둔 스냅샷이 있으면 재조회하지 않음
+        snapshot = ctx.layer_states.get(label, {})
+        if field_name and isinstance(node_id, str) and node_id in snapshot:
+            props = snapshot[node_id]
+            if props is None:
+                return False
+            actual = props.get(field_name)
+        else:
+            query = f"""
+            MATCH (n:{label} {{case_id: $case_id}})
+            WHERE n.node_id = $node_id
+            RETURN n.{field_name} AS val
+            """
+            records = await self._neo4j.execute_read(query, {
+                "case_id": ctx.case_id,
+                "node_id": node_id,
+            })
+            if not records:
+                return False
+            actual = records[0]["val"]
 
-        actual = records[0]["val"]
         # cond.value가 $참조인 경우 실제 값으로 해석한 뒤 비교
         expected = (
             self._resolve_ref(cond.value, ctx)
@@ -667,18 +821,20 @@ class GWTEngine:
         rel_type = cond.rel_type
         field_name = cond.field
 
-        query = f"""
-        MATCH (a:{src_label} {{case_id: $case_id}})
-              -[r:{rel_type}]->
-              (b:{tgt_label} {{case_id: $case_id}})
-        WHERE a.node_id = $source_id
-        RETURN b.{field_name} AS val
-        """
-
-        records = await self._neo4j.execute_read(query, {
-            "case_id": ctx.case_id,
-            "source_id": ctx.source_node_id,
-        })
+        # _load_context_states()가 미리 읽어 둔 결과가 있으면 재조회하지 않음
+        records = ctx.relation_states.get(self._relation_key(cond))
+        if records is None:
+            query = f"""
+            MATCH (a:{src_label} {{case_id: $case_id}})
+                  -[r:{rel_type}]->
+                  (b:{tgt_label} {{case_id: $case_id}})
+            WHERE a.node_id = $source_id
+            RETURN b.{field_name} AS val
+            """
+            records = await self._neo4j.execute_read(query, {
+                "case_id": ctx.case_id,
+                "source_id": ctx.source_node_id,
+            })
         if not records:
             return False
 
@@ -944,102 +1100,161 @@ class GWTEngine:
             version=node.get("version", 1),
         )
 
+    def _state_node_id(self, cond: GWTCondition, ctx: GWTEvalContext) -> Any:
+        """state 조건의 대상 node_id — $참조 값이면 해석, 아니면 이벤트 발생 노드"""
+        return self._resolve_ref(
+            cond.value if isinstance(cond.value, str) and cond.value.startswith("$") else "",
+            ctx,
+        ) or ctx.source_node_id
+
+    @staticmethod
+    def _relation_key(cond: GWTCondition) -> str:
+        """relation 조건 결과를 ctx.relation_states에 보관할 때 쓰는 키"""
+        return (
+            f"{cond.source_layer.capitalize()}-{cond.rel_type}->"
+            f"{cond.target_layer.capitalize()}.{cond.field}"
+        )
+
     async def _load_context_states(
         self,
         ctx: GWTEvalContext,
         rules: list[GWTRule],
     ) -> None:
-        """룰에서 참조하는 노드의 현재 상태를 선택적으로 조회 (성능 최적화)
+        """룰에서 참조하는 노드 상태와 조건 값을 Cypher 한 번으로 조회 (성능 최적화)
 
-        이전 구현은 각 계층의 모든 노드를 로드했으나, 이제는 룰 조건에서
-        참조되는 node_id만 수집하여 WHERE n.node_id IN $node_ids 필터로
-        필요한 노드만 조회한다. 대규모 온톨로지에서 쿼리 성능이 크게 향상된다.
+        이벤트 하나에 필요한 읽기를 CALL 서브쿼리로 묶어 단일 왕복으로 가져온다.
+        - 계층별 노드 스냅샷: 룰 조건에서 참조되는 node_id만 WHERE n.node_id IN 으로 조회
+          → ctx.node_states(expression 조건/SET old_value용) + ctx.layer_states(state 조건용)
+        - relation 조건: (source)-[rel]->(target) 첫 대상 노드의 필드 값 → ctx.relation_states
 
         참조 node_id 수집 소스:
         - ctx.source_node_id: 이벤트 발생 노드
-        - $trigger.source_node_id 등 조건 값의 $trigger 참조
-        - 조건의 value 필드 중 문자열로 된 노드 ID 후보
+        - $trigger.source_node_id 등 조건 값의 $trigger 참조, state 조건의 $payload 참조
+        - then 액션의 target_node
+
+        _prepare_rules()에서 검증된 룰만 전달되므로 라벨/필드/관계 타입은 화이트리스트를
+        통과한 값이다. 미리 읽지 못한 조건은 평가 시 개별 쿼리로 폴백한다.
         """
-        # 레이어별로 참조되는 node_id를 수집
-        layer_node_ids: dict[str, set[str]] = {}  # {layer: {node_id, ...}}
+        # 라벨별로 참조되는 node_id를 수집
+        layer_node_ids: dict[str, set[str]] = {}  # {label: {node_id, ...}}
+        # state 조건으로 개별 조회가 필요한 (label, node_id) — 스냅샷 완결성 표시용
+        state_targets: dict[str, set[str]] = {}
+        relation_conds: dict[str, GWTCondition] = {}
 
         for rule in rules:
+            # then 액션의 target_node에서 node_id 수집
+            action_ids: set[str] = set()
+            for action in rule.then:
+                if action.target_node:
+                    if action.target_node.startswith("$trigger."):
+                        resolved = self._resolve_ref(action.target_node, ctx)
+                        if isinstance(resolved, str) and resolved:
+                            action_ids.add(resolved)
+                    elif action.target_node.startswith("$"):
+                        pass  # 다른 변수 참조는 무시
+                    else:
+                        action_ids.add(action.target_node)
+
             for cond in rule.given:
-                # 대상 레이어 수집
-                target_layers: list[str] = []
-                if cond.node_layer:
-                    target_layers.append(cond.node_layer)
-                if cond.source_layer:
-                    target_layers.append(cond.source_layer)
-                if cond.target_layer:
-                    target_layers.append(cond.target_layer)
-
-                # 조건에서 참조하는 node_id 수집
-                referenced_ids: set[str] = set()
-
-                # 이벤트 발생 노드는 항상 포함
+                # 대상 계층 수집
+                target_labels = [
+                    layer.capitalize()
+                    for layer in (cond.node_layer, cond.source_layer, cond.target_layer)
+                    if layer
+                ]
+
+                # 조건에서 참조하는 node_id 수집 (이벤트 발생 노드는 항상 포함)
+                referenced_ids: set[str] = set(action_ids)
                 if ctx.source_node_id:
                     referenced_ids.add(ctx.source_node_id)
-
-                # $trigger.* 참조에서 실제 값 추출
                 if isinstance(cond.value, str) and cond.value.startswith("$trigger."):
                     resolved = self._resolve_ref(cond.value, ctx)
                     if isinstance(resolved, str) and resolved:
                         referenced_ids.add(resolved)
 
-                # then 액션의 target_node에서도 node_id 수집
-                for action in rule.then:
-                    if action.target_node:
-                        if action.target_node.startswith("$trigger."):
-                            resolved = self._resolve_ref(action.target_node, ctx)
-                            if isinstance(resolved, str) and resolved:
-                                referenced_ids.add(resolved)
-                        elif action.target_node.startswith("$"):
-                            pass  # 다른 변수 참조는 무시
-                        else:
-                            referenced_ids.add(action.target_node)
-
-                # 수집된 node_id를 각 레이어에 등록
-                for layer in target_layers:
-                    if layer not in layer_node_ids:
-                        layer_node_ids[layer] = set()
-                    layer_node_ids[layer].update(referenced_ids)
-
-        # 각 레이어별로 필요한 노드만 조회
-        for layer, node_ids in layer_node_ids.items():
-            label = layer.capitalize()
+                if cond.type == "state" and cond.node_layer and cond.field:
+                    try:
+                        node_id = self._state_node_id(cond, ctx)
+                    except ValueError:
+                        node_id = None  # 평가 시 개별 경로에서 동일 오류 발생
+                    if isinstance(node_id, str) and node_id:
+                        referenced_ids.add(node_id)
+                        state_targets.setdefault(cond.node_layer.capitalize(), set()).add(node_id)
+                elif (
+                    cond.type == "relation" and cond.field and cond.rel_type
+                    and cond.source_layer and cond.target_layer
+                ):
+                    relation_conds.setdefault(self._relation_key(cond), cond)
+
+                for label in target_labels:
+                    layer_node_ids.setdefault(label, set()).update(referenced_ids)
+
+        subqueries: list[str] = []
+        columns: list[str] = []
+        params: dict[str, Any] = {"case_id": ctx.case_id, "source_id": ctx.source_node_id}
+        layer_columns: dict[str, str] = {}
+        for i, (label, node_ids) in enumerate(sorted(layer_node_ids.items())):
             # 라벨 화이트리스트 검증 후에만 f-string 삽입
             if label not in ALLOWED_LABELS:
                 logger.warning(
                     "gwt_invalid_layer_ignored",
-                    layer=layer,
+                    layer=label,
                 )
                 continue
-
+            column = f"s{i}"
             if node_ids:
-                # 참조된 node_id만 선택적으로 조회 (성능 최적화)
-                query = f"""
-                MATCH (n:{label} {{case_id: $case_id}})
-                WHERE n.node_id IN $node_ids
-                RETURN n.node_id AS id, properties(n) AS props
-                """
-                records = await self._neo4j.execute_read(query, {
-                    "case_id": ctx.case_id,
-                    "node_ids": list(node_ids),
-                })
+                # 참조된 node_id만 선택적으로 조회
+                params[f"ids{i}"] = sorted(node_ids)
+                where = f"WHERE n.node_id IN $ids{i}"
             else:
                 # node_id를 특정할 수 없는 경우 전체 조회 (폴백)
-                query = f"""
-                MATCH (n:{label} {{case_id: $case_id}})
-                RETURN n.node_id AS id, properties(n) AS props
-                """
-                records = await self._neo4j.execute_read(query, {
-                    "case_id": ctx.case_id,
-                })
+                where = ""
+            subqueries.append(
+                f"CALL {{ MATCH (n:{label} {{case_id: $case_id}}) {where} "
+                f"RETURN collect({{id: n.node_id, props: properties(n)}}) AS {column} }}"
+            )
+            columns.append(column)
+            layer_columns[label] = column
+
+        relation_columns: dict[str, str] = {}
+        for j, (key, cond) in enumerate(relation_conds.items()):
+            column = f"r{j}"
+            subqueries.append(
+                f"CALL {{ MATCH (a:{cond.source_layer.capitalize()} {{case_id: $case_id}})"
+                f"-[:{cond.rel_type}]->(b:{cond.target_layer.capitalize()} {{case_id: $case_id}}) "
+                f"WHERE a.node_id = $source_id "
+                f"RETURN collect({{val: b.{cond.field}}})[..1] AS {column} }}"
+            )
+            columns.append(column)
+            relation_columns[key] = column
+
+        if not subqueries:
+            return
 
-            for rec in records:
-                if rec.get("id"):
-                    ctx.node_states[rec["id"]] = rec["props"]
+        query = "\n".join(subqueries) + "\nRETURN " + ", ".join(columns)
+        records = await self._neo4j.execute_read(query, params)
+        row = records[0] if records else {}
+
+        for label, column in layer_columns.items():
+            items = row.get(column)
+            if not isinstance(items, list):
+                continue
+            snapshot: dict[str, dict | None] = {}
+            for item in items:
+                if isinstance(item, dict) and item.get("id"):
+                    ctx.node_states[item["id"]] = item["props"]
+                    snapshot[item["id"]] = item["props"]
+            if layer_node_ids[label]:
+                # 조회한 node_id 중 없는 노드는 None으로 표시 (state 조건 False)
+                ctx.layer_states[label] = {
+                    node_id: snapshot.get(node_id)
+                    for node_id in state_targets.get(label, ())
+                }
+
+        for key, column in relation_columns.items():
+            values = row.get(column)
+            if isinstance(values, list):
+                ctx.relation_states[key] = values
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -1052,17 +1267,34 @@ class GWTRuleManager:
 
     프론트엔드의 도메인 모델러에서 호출된다.
     모든 쿼리는 파라미터화되어 Cypher 인젝션을 방지한다.
+    룰 정의가 바뀌면(생성/수정/삭제) 룰 레지스트리의 해당 테넌트 버전을 올린다.
     """
 
     # link_to_ontology에서 허용되는 관계 타입
     ALLOWED_LINK_REL_TYPES = {"TRIGGERS", "MODIFIES", "CHAINS_TO", "USES_MODEL"}
 
-    def __init__(self, neo4j_client: Any):
+    def __init__(self, neo4j_client: Any, rule_registry: GWTRuleRegistry | None = None):
         """
         Args:
             neo4j_client: Neo4jClient (execute_read/execute_write 메서드 보유)
+            rule_registry: 무효화할 룰 캐시 (기본: gwt_rule_registry)
         """
         self._neo4j = neo4j_client
+        self._registry = rule_registry or gwt_rule_registry
+
+    def _invalidate(self, records: list[dict]) -> None:
+        """쓰기 결과에 tenant_id가 있으면 해당 테넌트만, 없으면 전체 룰 캐시 무효화"""
+        tenant_ids = {
+            tid
+            for rec in records
+            for tid in (rec.get("tenant_ids") or [rec.get("tenant_id")])
+            if tid
+        }
+        if not tenant_ids:
+            self._registry.invalidate()
+            return
+        for tenant_id in tenant_ids:
+            self._registry.invalidate(tenant_id)
 
     async def create_rule(self, rule: GWTRule) -> str:
         """새 ActionType 노드를 Neo4j에 생성
@@ -1119,6 +1351,7 @@ class GWTRuleManager:
             "when_event": rule.when_event,
             "then_actions": then_json,
         })
+        self._registry.invalidate(rule.tenant_id)
         return records[0]["id"]
 
     async def list_rules(
@@ -1166,23 +1399,29 @@ class GWTRuleManager:
         query = f"""
         MATCH (a:ActionType {{id: $rule_id}})
         SET {set_clauses}, a.updated_at = datetime(), a.version = a.version + 1
-        RETURN a.id AS id
+        RETURN a.id AS id, a.tenant_id AS tenant_id
         """
         records = await self._neo4j.execute_write(query, {
             "rule_id": rule_id,
             **updates,
         })
+        if records:
+            self._invalidate(records)
         return len(records) > 0
 
     async def delete_rule(self, rule_id: str) -> bool:
         """ActionType 삭제 (연결된 관계 포함 DETACH DELETE)"""
         query = """
         MATCH (a:ActionType {id: $rule_id})
+        WITH a, a.tenant_id AS tenant_id
         DETACH DELETE a
-        RETURN count(*) AS deleted
+        RETURN count(*) AS deleted, collect(DISTINCT tenant_id) AS tenant_ids
         """
         records = await self._neo4j.execute_write(query, {"rule_id": rule_id})
-        return records[0]["deleted"] > 0
+        deleted = records[0]["deleted"] > 0
+        if deleted:
+            self._invalidate(records)
+        return deleted
 
     async def link_to_ontology(
         self,
@@ -10,6 +10,50 @@ import time
 from typing import Any
 
 from app.core.neo4j_client import neo4j_client
+from app.services.catalog_diff import CatalogDiff, chunked, current_state, desired_state, diff_catalog
+
+# 카탈로그 증분 저장: UNWIND 한 문장에 싣는 행 수
+_CATALOG_CHUNK_SIZE = 1000
+
+_CATALOG_CURRENT_QUERY = """MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds})
+OPTIONAL MATCH (s)-[:HAS_TABLE]->(t:Table) OPTIONAL MATCH (t)-[:HAS_COLUMN]->(c:Column)
+RETURN s.name AS schema_name, t.name AS table_name, c.name AS column_name, c.dtype AS dtype, c.nullable AS nullable"""
+_CATALOG_MERGE_DATASOURCE = "MERGE (d:DataSource {tenant_id:$tid, name:$ds}) SET d.engine=$engine, d.last_extracted=datetime()"
+_CATALOG_ADD_SCHEMAS = """MATCH (d:DataSource {tenant_id:$tid, name:$ds}) UNWIND $rows AS sn
+MERGE (s:Schema {tenant_id:$tid, datasource_name:$ds, name:sn}) MERGE (d)-[:HAS_SCHEMA]->(s)"""
+# 유지되는 스키마도 DataSource에 다시 연결 (HAS_SCHEMA만 빠진 상태 복구)
+_CATALOG_LINK_SCHEMAS = """MATCH (d:DataSource {tenant_id:$tid, name:$ds}) UNWIND $rows AS sn
+MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds, name:sn}) MERGE (d)-[:HAS_SCHEMA]->(s)"""
+_CATALOG_ADD_TABLES = """UNWIND $rows AS row MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds, name:row.schema})
+MERGE (t:Table {tenant_id:$tid, datasource_name:$ds, schema_name:row.schema, name:row.table}) MERGE (s)-[:HAS_TABLE]->(t)"""
+_CATALOG_UPSERT_COLUMNS = """UNWIND $rows AS row
+MATCH (t:Table {tenant_id:$tid, datasource_name:$ds, schema_name:row.schema, name:row.table})
+MERGE (c:Column {tenant_id:$tid, datasource_name:$ds, schema_name:row.schema, table_name:row.table, name:row.name})
+SET c.dtype=row.dtype, c.nullable=row.nullable MERGE (t)-[:HAS_COLUMN]->(c)"""
+_CATALOG_DELETE_COLUMNS = """UNWIND $rows AS row
+MATCH (c:Column {tenant_id:$tid, datasource_name:$ds, schema_name:row.schema, table_name:row.table, name:row.name}) DETACH DELETE c"""
+_CATALOG_DELETE_TABLES = """UNWIND $rows AS row
+MATCH (t:Table {tenant_id:$tid, datasource_name:$ds, schema_name:row.schema, name:row.table}) DETACH DELETE t"""
+_CATALOG_DELETE_SCHEMAS = "UNWIND $rows AS sn MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds, name:sn}) DETACH DELETE s"
+# 데이터소스 삭제 시 하위 Column/Table/Schema 노드까지 datasource_name 기준으로 제거
+_DATASOURCE_DELETE_STATEMENTS = (
+    "MATCH (c:Column {tenant_id:$tid, datasource_name:$ds}) DETACH DELETE c",
+    "MATCH (t:Table {tenant_id:$tid, datasource_name:$ds}) DETACH DELETE t",
+    "MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds}) DETACH DELETE s",
+    "MATCH (d:DataSource {tenant_id:$tid, name:$ds}) DETACH DELETE d",
+)
+_CATALOG_DELETE_FKS = (
+    "MATCH (:Column {tenant_id:$tid, datasource_name:$ds})-[r:FK_TO]->() DELETE r",
+    "MATCH (:Table {tenant_id:$tid, datasource_name:$ds})-[r:FK_TO_TABLE]->() DELETE r",
+)
+_CATALOG_ADD_FKS = """UNWIND $rows AS row
+MATCH (sc:Column {tenant_id:$tid, datasource_name:$ds, schema_name:row.ss, table_name:row.st, name:row.sc})
+MATCH (tc:Column {tenant_id:$tid, datasource_name:$ds, schema_name:row.ts, table_name:row.tt, name:row.tc})
+MERGE (sc)-[r:FK_TO]->(tc) SET r.constraint_name=row.cn
+WITH row
+MATCH (st:Table {tenant_id:$tid, datasource_name:$ds, schema_name:row.ss, name:row.st})
+MATCH (tt:Table {tenant_id:$tid, datasource_name:$ds, schema_name:row.ts, name:row.tt})
+MERGE (st)-[:FK_TO_TABLE]->(tt)"""
 
 
 def _decode_json(value: Any, default: Any) -> Any:
@@ -23,6 +67,45 @@ def _decode_json(value: Any, default: Any) -> Any:
         return default
 
 
+def _foreign_key_rows(foreign_keys: list[dict[str, Any]]) -> list[dict[str, str]]:
+    rows = []
+    for fk in foreign_keys:
+        if not isinstance(fk, dict):
+            continue
+        row = {k: str(fk.get(src) or "").strip() for k, src in (
+            ("ss", "source_schema"), ("st", "source_table"), ("sc", "source_column"),
+            ("ts", "target_schema"), ("tt", "target_table"), ("tc", "target_column"))}
+        if not all(row.values()):
+            continue
+        row["cn"] = str(fk.get("constraint_name") or "").strip() or "fk"
+        rows.append(row)
+    return rows
+
+
+def _catalog_statements(
+    tid: str, ds: str, engine: str, diff: CatalogDiff, fk_rows: list[dict[str, str]], chunk_size: int,
+    existing_schemas: list[str] | None = None,
+) -> list[tuple[str, dict[str, Any]]]:
+    """diff → (query, params) 목록. 삭제는 Column부터, 추가는 Schema부터. 유지되는 스키마는 HAS_SCHEMA 재연결."""
+    base = {"tid": tid, "ds": ds}
+    statements: list[tuple[str, dict[str, Any]]] = [(_CATALOG_MERGE_DATASOURCE, {**base, "engine": engine})]
+
+    def _add(query: str, rows: list[Any]) -> None:
+        statements.extend((query, {**base, "rows": chunk}) for chunk in chunked(rows, chunk_size))
+
+    _add(_CATALOG_DELETE_COLUMNS, [{"schema": s, "table": t, "name": c} for s, t, c in diff.columns_removed])
+    _add(_CATALOG_DELETE_TABLES, [{"schema": s, "table": t} for s, t in diff.tables_removed])
+    _add(_CATALOG_DELETE_SCHEMAS, diff.schemas_removed)
+    _add(_CATALOG_LINK_SCHEMAS, existing_schemas or [])
+    _add(_CATALOG_ADD_SCHEMAS, diff.schemas_added)
+    _add(_CATALOG_ADD_TABLES, [{"schema": s, "table": t} for s, t in diff.tables_added])
+    _add(_CATALOG_UPSERT_COLUMNS, [{"schema": s, "table": t, "name": c, "dtype": dt, "nullable": nl}
+                                   for (s, t, c), (dt, nl) in diff.columns_added + diff.columns_changed])
+    statements.extend((query, base) for query in _CATALOG_DELETE_FKS)
+    _add(_CATALOG_ADD_FKS, fk_rows)
+    return statements
+
+
 class MetadataGraphService:
     """Neo4j 메타데이터 그래프 CRUD. Synapse가 유일한 소유자."""
 
@@ -34,6 +117,16 @@ class MetadataGraphService:
     async def _write(self, query: str, params: dict[str, Any]) -> list[dict[str, Any]]:
         return await self._read(query, params)
 
+    async def _write_tx(self, statements: list[tuple[str, dict[str, Any]]]) -> None:
+        """여러 쓰기 문을 하나의 쓰기 트랜잭션으로 실행 (중간 실패 시 전체 롤백)."""
+        async def _work(tx) -> None:
+            for query, params in statements:
+                result = await tx.run(query, params)
+                await result.consume()
+
+        async with neo4j_client.session() as session:
+            await session.execute_write(_work)
+
     # ──── Snapshot ──── #
 
     async def save_snapshot(self, item: dict[str, Any], tenant_id: str) -> None:
@@ -191,97 +284,30 @@ class MetadataGraphService:
         )
 
     async def delete_datasource(self, name: str, tenant_id: str) -> None:
-        await self._write(
-            "MATCH (d:DataSource {tenant_id:$tenant_id, name:$name}) DETACH DELETE d",
-            {"tenant_id": tenant_id, "name": name},
-        )
+        params = {"tid": tenant_id, "ds": name}
+        await self._write_tx([(query, params) for query in _DATASOURCE_DELETE_STATEMENTS])
 
     async def save_extracted_catalog(
         self, tenant_id: str, datasource_name: str,
         catalog: dict[str, dict[str, list[dict[str, Any]]]],
         engine: str = "postgresql", *, foreign_keys: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
-        fk_list = foreign_keys or []
+        """현재 그래프와 diff 후 추가/변경/삭제분만 청크 UNWIND 문으로 한 트랜잭션에서 반영."""
         start = time.perf_counter()
         tid = tenant_id or ""
-        for q in [
-            "MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds})-[:HAS_TABLE]->(t)-[:HAS_COLUMN]->(c) DETACH DELETE c",
-            "MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds})-[:HAS_TABLE]->(t) DETACH DELETE t",
-            "MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds}) DETACH DELETE s",
-        ]:
-            await self._write(q, {"tid": tid, "ds": datasource_name})
-        await self._write(
-            "MERGE (d:DataSource {tenant_id:$tid, name:$ds}) SET d.engine=$engine, d.last_extracted=datetime()",
-            {"tid": tid, "ds": datasource_name, "engine": engine},
-        )
-        nodes, rels = 0, 0
-        for schema_name, tables in catalog.items():
-            if not isinstance(tables, dict):
-                continue
-            sn = str(schema_name).strip()
-            if not sn:
-                continue
-            await self._write(
-                """MATCH (d:DataSource {tenant_id:$tid, name:$ds})
-                MERGE (s:Schema {tenant_id:$tid, datasource_name:$ds, name:$sn}) MERGE (d)-[:HAS_SCHEMA]->(s)""",
-                {"tid": tid, "ds": datasource_name, "sn": sn},
-            )
-            nodes += 1; rels += 1
-            for tbl_name, columns in tables.items():
-                if not isinstance(columns, list):
-                    continue
-                tn = str(tbl_name).strip()
-                if not tn:
-                    continue
-                await self._write(
-                    """MATCH (s:Schema {tenant_id:$tid, datasource_name:$ds, name:$sn})
-                    MERGE (t:Table {tenant_id:$tid, datasource_name:$ds, schema_name:$sn, name:$tn})
-                    MERGE (s)-[:HAS_TABLE]->(t)""",
-                    {"tid": tid, "ds": datasource_name, "sn": sn, "tn": tn},
-                )
-                nodes += 1; rels += 1
-                for col in columns:
-                    if not isinstance(col, dict):
-                        continue
-                    cn = str(col.get("name") or "").strip()
-                    if not cn:
-                        continue
-                    await self._write(
-                        """MATCH (t:Table {tenant_id:$tid, datasource_name:$ds, schema_name:$sn, name:$tn})
-                        MERGE (c:Column {tenant_id:$tid, datasource_name:$ds, schema_name:$sn, table_name:$tn, name:$cn})
-                        SET c.dtype=$dtype, c.nullable=$nullable MERGE (t)-[:HAS_COLUMN]->(c)""",
-                        {"tid": tid, "ds": datasource_name, "sn": sn, "tn": tn, "cn": cn,
-                         "dtype": str(col.get("data_type") or col.get("type") or "string"),
-                         "nullable": bool(col.get("nullable", True))},
-                    )
-                    nodes += 1; rels += 1
-        for fk in fk_list:
-            if not isinstance(fk, dict):
-                continue
-            ss, st, sc = (str(fk.get(k) or "").strip() for k in ("source_schema", "source_table", "source_column"))
-            ts, tt, tc = (str(fk.get(k) or "").strip() for k in ("target_schema", "target_table", "target_column"))
-            cn = str(fk.get("constraint_name") or "").strip() or "fk"
-            if not all([ss, st, sc, ts, tt, tc]):
-                continue
-            try:
-                await self._write(
-                    """MATCH (sc:Column {tenant_id:$tid, datasource_name:$ds, schema_name:$ss, table_name:$st, name:$sc_})
-                    MATCH (tc:Column {tenant_id:$tid, datasource_name:$ds, schema_name:$ts, table_name:$tt, name:$tc_})
-                    MERGE (sc)-[r:FK_TO]->(tc) SET r.constraint_name=$cn""",
-                    {"tid": tid, "ds": datasource_name, "ss": ss, "st": st, "sc_": sc,
-                     "ts": ts, "tt": tt, "tc_": tc, "cn": cn},
-                )
-                rels += 1
-                await self._write(
-                    """MATCH (st:Table {tenant_id:$tid, datasource_name:$ds, schema_name:$ss, name:$st_})
-                    MATCH (tt:Table {tenant_id:$tid, datasource_name:$ds, schema_name:$ts, name:$tt_})
-                    MERGE (st)-[:FK_TO_TABLE]->(tt)""",
-                    {"tid": tid, "ds": datasource_name, "ss": ss, "st_": st, "ts": ts, "tt_": tt},
-                )
-                rels += 1
-            except Exception:
-                pass
-        return {"nodes_created": nodes, "relationships_created": rels,
+        rows = await self._read(_CATALOG_CURRENT_QUERY, {"tid": tid, "ds": datasource_name})
+        desired = desired_state(catalog)
+        diff = diff_catalog(current_state(rows), desired)
+        fk_rows = _foreign_key_rows(foreign_keys or [])
+        existing_schemas = sorted(desired.schemas - set(diff.schemas_added))
+        await self._write_tx(_catalog_statements(
+            tid, datasource_name, engine, diff, fk_rows, _CATALOG_CHUNK_SIZE, existing_schemas,
+        ))
+        summary = diff.summary()
+        nodes = summary["schemas_added"] + summary["tables_added"] + summary["columns_added"]
+        return {"nodes_created": nodes, "nodes_updated": summary["columns_changed"],
+                "nodes_deleted": summary["schemas_removed"] + summary["tables_removed"] + summary["columns_removed"],
+                "relationships_created": nodes + 2 * len(fk_rows), "diff": summary,
                 "duration_ms": int((time.perf_counter() - start) * 1000)}
 
     # ──── Concept Mapping ──── #
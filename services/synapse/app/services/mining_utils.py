@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 
 def utcnow_iso() -> str:
@@ -38,15 +38,44 @@ def build_case_paths(events: list[dict[str, Any]]) -> dict[str, list[dict[str, A
     return grouped
 
 
+def iter_case_paths(
+    chunks: Iterable[list[dict[str, Any]]],
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """case_id 순으로 정렬된 이벤트 청크 스트림을 (case_id, 시간순 경로) 단위로 묶는다.
+
+    같은 case의 이벤트가 연속해서 온다는 전제(EventLogRepository.iter_events 계약)이므로
+    한 번에 한 케이스만 메모리에 둔다.
+    """
+    current: str | None = None
+    path: list[dict[str, Any]] = []
+    for chunk in chunks:
+        for event in chunk:
+            case_id = str(event["case_id"])
+            if case_id != current:
+                if path:
+                    path.sort(key=lambda item: item["timestamp"])
+                    yield current, path  # type: ignore[misc]
+                current, path = case_id, []
+            path.append(event)
+    if path:
+        path.sort(key=lambda item: item["timestamp"])
+        yield current, path  # type: ignore[misc]
+
+
 def activity_duration_stats(
     case_paths: dict[str, list[dict[str, Any]]],
 ) -> dict[str, list[float]]:
     """활동별 소요 시간(초) 목록 계산."""
     durations: dict[str, list[float]] = defaultdict(list)
     for items in case_paths.values():
-        for idx in range(len(items) - 1):
-            current = items[idx]
-            nxt = items[idx + 1]
-            delta = (parse_ts(nxt["timestamp"]) - parse_ts(current["timestamp"])).total_seconds()
-            durations[current["activity"]].append(max(delta, 0.0))
+        add_activity_durations(durations, items)
     return durations
+
+
+def add_activity_durations(durations: dict[str, list[float]], items: list[dict[str, Any]]) -> None:
+    """한 케이스 경로의 활동별 소요 시간(초)을 durations에 누적."""
+    for idx in range(len(items) - 1):
+        current = items[idx]
+        nxt = items[idx + 1]
+        delta = (parse_ts(nxt["timestamp"]) - parse_ts(current["timestamp"])).total_seconds()
+        durations[current["activity"]].append(max(delta, 0.0))
@@ -13,6 +13,8 @@ class SchemaEditDomainError(Exception):
 
 
 class SchemaEditService:
+    MAX_BULK_TABLES = 500
+
     def __init__(self) -> None:
         self._store = SchemaEditStore()
 
@@ -39,6 +41,22 @@ class SchemaEditService:
         table["has_embedding"] = bool(table["has_embedding"])
         return table
 
+    def get_tables(self, tenant_id: str, table_names: list[Any]) -> dict[str, Any]:
+        names = list(dict.fromkeys(str(name).strip() for name in table_names if str(name or "").strip()))
+        if not names or len(names) > self.MAX_BULK_TABLES:
+            raise SchemaEditDomainError(
+                400, "INVALID_REQUEST", f"tables must contain 1..{self.MAX_BULK_TABLES} names"
+            )
+        tables = self._store.get_tables(tenant_id, names)
+        for table in tables:
+            table["has_embedding"] = bool(table["has_embedding"])
+        found = {table["name"] for table in tables}
+        return {
+            "tables": tables,
+            "missing": [name for name in names if name not in found],
+            "total": len(tables),
+        }
+
     def update_table_description(self, tenant_id: str, table_name: str, description: str) -> dict[str, Any]:
         if not description or len(description) > 500:
             raise SchemaEditDomainError(400, "INVALID_REQUEST", "description must be 1..500 chars")
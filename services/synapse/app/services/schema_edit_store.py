@@ -190,6 +190,62 @@ class SchemaEditStore:
         conn.close()
         return {**dict(table), "columns": [dict(row) for row in columns]}
 
+    def get_tables(self, tenant_id: str, table_names: list[str]) -> list[dict[str, Any]]:
+        """여러 테이블 상세를 두 번의 쿼리로 조회한다 (테이블 1회 + 컬럼 1회)."""
+        self.ensure_seed(tenant_id)
+        _, cursor_cls = _import_psycopg2()
+        conn = self._connect()
+        cur = conn.cursor(cursor_factory=cursor_cls)
+        cur.execute(
+            """
+            SELECT name, description, row_count, column_count, has_embedding, last_updated
+            FROM schema_tables WHERE tenant_id = %s AND name = ANY(%s) ORDER BY name
+            """,
+            (tenant_id, list(table_names)),
+        )
+        tables = [dict(row) for row in cur.fetchall()]
+        cur.execute(
+            """
+            SELECT table_name, name, data_type, description
+            FROM schema_columns WHERE tenant_id = %s AND table_name = ANY(%s) ORDER BY table_name, name
+            """,
+            (tenant_id, [t["name"] for t in tables]),
+        )
+        columns: dict[str, list[dict[str, Any]]] = {}
+        for row in cur.fetchall():
+            item = dict(row)
+            columns.setdefault(item.pop("table_name"), []).append(item)
+        cur.close()
+        conn.close()
+        return [{**table, "columns": columns.get(table["name"], [])} for table in tables]
+
+    @staticmethod
+    def _publish_catalog_changed(
+        conn, tenant_id: str, table_name: str, change_type: str, changed_at: datetime,
+        column_name: str | None = None,
+    ) -> None:
+        """스키마 카탈로그 변경 이벤트를 같은 트랜잭션의 outbox에 기록한다."""
+        from app.events.outbox import EventPublisher
+
+        aggregate_id = f"{tenant_id}:{table_name}"
+        payload: dict[str, Any] = {
+            "tenant_id": tenant_id,
+            "table_name": table_name,
+            "change_type": change_type,
+            "changed_at": changed_at.isoformat(),
+            "idempotency_key": f"SCHEMA_CATALOG_CHANGED:{aggregate_id}:{int(changed_at.timestamp() * 1000)}",
+        }
+        if column_name:
+            payload["column_name"] = column_name
+        EventPublisher.publish(
+            event_type="SCHEMA_CATALOG_CHANGED",
+            aggregate_type="schema_table",
+            aggregate_id=aggregate_id,
+            payload=payload,
+            tenant_id=tenant_id,
+            conn=conn,
+        )
+
     def update_table_description(self, tenant_id: str, table_name: str, description: str) -> str | None:
         self.ensure_seed(tenant_id)
         now = datetime.now(timezone.utc)
@@ -204,6 +260,8 @@ class SchemaEditStore:
             (description, now, tenant_id, table_name),
         )
         updated = cur.rowcount
+        if updated:
+            self._publish_catalog_changed(conn, tenant_id, table_name, "table_description", now)
         conn.commit()
         cur.close()
         conn.close()
@@ -230,6 +288,9 @@ class SchemaEditStore:
                 "UPDATE schema_tables SET last_updated = %s WHERE tenant_id = %s AND name = %s",
                 (now, tenant_id, table_name),
             )
+            self._publish_catalog_changed(
+                conn, tenant_id, table_name, "column_description", now, column_name=column_name,
+            )
         conn.commit()
         cur.close()
         conn.close()
@@ -8,9 +8,10 @@ from __future__ import annotations
 import uuid
 from collections import defaultdict
 from statistics import median
-from typing import Any
+from typing import Any, Iterable
 
-from app.services.mining_utils import build_case_paths, parse_ts
+from app.core.config import settings
+from app.services.mining_utils import iter_case_paths, parse_ts
 
 
 class VariantService:
@@ -23,12 +24,24 @@ class VariantService:
         limit: int,
         min_cases: int,
     ) -> dict[str, Any]:
+        return self.analyze_cases(case_paths.items(), sort_by=sort_by, limit=limit, min_cases=min_cases)
+
+    def analyze_cases(
+        self,
+        cases: Iterable[tuple[str, list[dict[str, Any]]]],
+        sort_by: str,
+        limit: int,
+        min_cases: int,
+    ) -> dict[str, Any]:
+        """(case_id, 시간순 경로) 스트림에서 변형을 집계한다. 케이스 경로는 하나씩만 유지."""
         from app.services.mining_task_coordinator import MiningTaskError
         if sort_by not in {"frequency_desc", "frequency_asc", "duration_desc", "duration_asc"}:
             raise MiningTaskError(400, "INVALID_REQUEST", "invalid sort_by")
 
         bucket: dict[tuple[str, ...], list[float]] = defaultdict(list)
-        for items in case_paths.values():
+        total_cases = 0
+        for _case_id, items in cases:
+            total_cases += 1
             seq = tuple(event["activity"] for event in items)
             if len(items) >= 2:
                 duration = (parse_ts(items[-1]["timestamp"]) - parse_ts(items[0]["timestamp"])).total_seconds()
@@ -36,7 +49,6 @@ class VariantService:
                 duration = 0.0
             bucket[seq].append(max(duration, 0.0))
 
-        total_cases = len(case_paths)
         rows = []
         rank = 1
         for sequence, durations in bucket.items():
@@ -89,16 +101,18 @@ class VariantService:
         if not case_id or not log_id:
             raise MiningTaskError(400, "INVALID_REQUEST", "case_id and log_id are required")
         try:
-            ep = event_log_service.get_events_for_mining(tenant_id, log_id)
+            ep = event_log_service.stream_events_for_mining(
+                tenant_id, log_id, chunk_size=settings.EVENT_LOG_READ_CHUNK_SIZE,
+            )
         except EventLogDomainError as err:
             if err.code == "LOG_NOT_FOUND":
                 raise MiningTaskError(404, "LOG_NOT_FOUND", "event log not found") from err
             raise MiningTaskError(400, "INVALID_LOG_FORMAT", "invalid event log") from err
         event_case_id = ep["case_id"]
-        events = ep["events"]
         if case_id != event_case_id:
             raise MiningTaskError(404, "LOG_NOT_FOUND", "log does not belong to case_id")
-        case_paths = build_case_paths(events)
-        data = self.analyze(case_paths, sort_by=sort_by, limit=limit, min_cases=max(1, min_cases))
+        data = self.analyze_cases(
+            iter_case_paths(ep["chunks"]), sort_by=sort_by, limit=limit, min_cases=max(1, min_cases),
+        )
         data["log_id"] = log_id
         return data
@@ -8,24 +8,31 @@ PROJECTION_RULES에 정의된 Cypher 쿼리를 실행하여
 
 처리 흐름:
   1. 4개 서비스 스트림에서 이벤트 읽기 (consumer group: graph-projector)
-  2. event_type으로 PROJECTION_RULES 조회
-  3. params_map에 따라 payload에서 Cypher 파라미터 추출
-  4. neo4j_client.execute_write로 그래프 업데이트
-  5. 모든 규칙 실행 후 메시지 ACK (실패한 규칙이 있어도 ACK)
+  2. 마이크로 배치 누적 — batch_size개가 모이거나 첫 메시지 후 flush_interval이 지나면 flush
+  3. event_type으로 PROJECTION_RULES 조회, params_map에 따라 규칙별 행(row) 생성
+  4. 규칙마다 `UNWIND $rows AS row CALL { ... }` 쓰기 트랜잭션 한 번으로 그래프 업데이트
+  5. 배치의 모든 규칙 트랜잭션이 끝난 뒤 스트림별로 한 번에 ACK
 
 설계 원칙:
   - Graph Projector는 GWT Consumer보다 먼저 실행되어야 한다 (멱등성으로 보장)
   - 매핑에 없는 이벤트는 조용히 스킵한다 (skipped 카운트만 증가)
-  - 개별 규칙 실패는 로깅하되 나머지 규칙과 ACK는 계속 진행한다
+  - 규칙 배치가 실패하면 해당 규칙만 이벤트 단위로 재실행해 실패 행을 격리한다.
+    개별 행 실패는 로깅하되 나머지 규칙과 ACK는 계속 진행한다
+  - Neo4j 연결 자체가 끊긴 경우에는 ACK하지 않고 배치를 보관했다가 재시도한다
+  - 같은 규칙 안에서는 UNWIND 행 순서 = 이벤트 수신 순서이므로 마지막 쓰기가 우선한다
 """
 from __future__ import annotations
 
 import asyncio
 import json
 import logging
+import re
 import uuid
 from typing import Any
 
+from neo4j.exceptions import ServiceUnavailable, SessionExpired
+
+from app.core.config import settings
 from app.workers.projection_rules import PROJECTION_RULES
 
 logger = logging.getLogger(__name__)
@@ -38,6 +45,34 @@ STREAMS = [
     "axiom:weaver:events",
 ]
 
+# 규칙 Cypher의 $파라미터 → UNWIND 행 필드(row.xxx)로 치환할 때 사용
+_CYPHER_PARAM = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+# 규칙 본문의 WITH 절 — row가 스코프에서 빠지지 않도록 함께 넘긴다.
+# STARTS WITH / ENDS WITH 연산자는 앞 단어까지 함께 매칭해 그대로 둔다
+# (re의 lookbehind는 고정 폭이라 \s+ 를 쓸 수 없음)
+_CYPHER_WITH = re.compile(r"\b(?:(STARTS|ENDS)\s+)?WITH\s+(DISTINCT\s+)?(?!\*)", re.IGNORECASE)
+
+# 재시도 대상 연결 오류 — 이 경우 배치를 ACK하지 않는다
+_CONNECTION_ERRORS = (ServiceUnavailable, SessionExpired, OSError)
+
+
+class _Neo4jUnavailable(Exception):
+    """배치 flush 중 Neo4j 연결이 끊겨 ACK를 보류해야 함을 알린다."""
+
+
+def to_unwind_cypher(cypher: str) -> str:
+    """단건 규칙 Cypher를 행 목록을 받는 UNWIND 배치 Cypher로 변환한다.
+
+    `$name` 파라미터는 `row.name`으로 바뀌고, 본문의 `WITH x`는 `WITH row, x`가 된다.
+    규칙 본문은 행마다 독립된 CALL 서브쿼리로 실행된다
+    (한 행의 MATCH 실패가 다른 행에 영향을 주지 않음).
+    """
+    body = _CYPHER_WITH.sub(
+        lambda m: m.group(0) if m.group(1) else f"WITH {m.group(2) or ''}row, ", cypher.strip()
+    )
+    body = _CYPHER_PARAM.sub(r"row.\1", body)
+    return f"UNWIND $rows AS row\nCALL {{\n    WITH row\n    {body}\n}}"
+
 
 class GraphProjectorWorker:
     """이벤트→Neo4j 그래프 프로젝션 워커.
@@ -55,6 +90,8 @@ class GraphProjectorWorker:
         consumer_group: str = "graph-projector",
         consumer_name: str = "projector-1",
         poll_interval: float = 1.0,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
     ):
         """
         Args:
@@ -64,6 +101,9 @@ class GraphProjectorWorker:
             consumer_group: Redis consumer group 이름
             consumer_name: 이 워커 인스턴스의 고유 이름
             poll_interval: 메시지 없을 때 대기 시간 (초)
+            batch_size: 한 번에 flush할 최대 이벤트 수 (기본: GRAPH_PROJECTOR_BATCH_SIZE)
+            flush_interval: 첫 메시지 이후 flush까지 최대 대기 시간 (초,
+                기본: GRAPH_PROJECTOR_FLUSH_INTERVAL_SEC)
         """
         self._redis = redis_client
         self._neo4j = neo4j_client
@@ -71,13 +111,25 @@ class GraphProjectorWorker:
         self._group = consumer_group
         self._consumer = consumer_name
         self._poll_interval = poll_interval
+        self._batch_size = max(1, batch_size or settings.GRAPH_PROJECTOR_BATCH_SIZE)
+        self._flush_interval = (
+            flush_interval if flush_interval is not None
+            else settings.GRAPH_PROJECTOR_FLUSH_INTERVAL_SEC
+        )
         self._running = False
 
+        # 규칙별 UNWIND 배치 Cypher — 시작 시 한 번만 변환
+        self._batch_cypher: dict[str, list[str]] = {
+            event_type: [to_unwind_cypher(rule["cypher"]) for rule in rules]
+            for event_type, rules in self._rules.items()
+        }
+
         # 통계 카운터: 모니터링 및 디버깅 용도
         self._stats: dict[str, int] = {
             "projected": 0,  # Cypher 실행 성공 횟수
             "skipped": 0,    # 매핑 없어서 스킵한 이벤트 수
             "failed": 0,     # Cypher 실행 실패 횟수
+            "batches": 0,    # flush된 마이크로 배치 수
         }
 
     # ── 라이프사이클 ──────────────────────────────────────────
@@ -86,8 +138,10 @@ class GraphProjectorWorker:
         """워커를 시작한다.
 
         1. 각 스트림에 consumer group을 생성한다 (이미 존재하면 무시).
-        2. 폴링 루프를 시작하여 새 메시지를 처리한다.
-        3. stop()이 호출되거나 CancelledError가 발생하면 종료한다.
+        2. 이전 실행에서 ACK하지 못한 자기 pending 메시지를 먼저 다시 처리한다.
+        3. 폴링 루프에서 메시지를 마이크로 배치로 모아 flush한다.
+        4. stop()이 호출되면 남은 배치를 flush하고 종료한다.
+           (CancelledError로 중단되면 ACK되지 않은 메시지는 다음 시작 시 재처리된다)
         """
         self._running = True
 
@@ -101,31 +155,62 @@ class GraphProjectorWorker:
                 pass  # BUSYGROUP: 이미 존재하는 그룹이면 무시
 
         logger.info(
-            "Graph Projector 시작: rules=%d개 이벤트 타입 매핑, streams=%s",
+            "Graph Projector 시작: rules=%d개 이벤트 타입 매핑, streams=%s, "
+            "batch_size=%d, flush_interval=%.3fs",
             len(self._rules),
             STREAMS,
+            self._batch_size,
+            self._flush_interval,
         )
 
+        loop = asyncio.get_running_loop()
+        pending: list[tuple[str, str, dict]] = []
+        deadline: float | None = None
+        try:
+            pending = await self._read_own_pending()
+            if pending:
+                deadline = loop.time()
+        except Exception as e:
+            logger.error("Graph Projector pending 메시지 조회 실패: %s", e, exc_info=True)
+
         while self._running:
             try:
-                # 모든 스트림에서 미처리 메시지를 한 번에 읽는다
-                messages = await self._redis.xreadgroup(
-                    groupname=self._group,
-                    consumername=self._consumer,
-                    streams={s: ">" for s in STREAMS},
-                    count=100,
-                    block=int(self._poll_interval * 1000),
-                )
-
-                for stream_name, entries in messages:
-                    for msg_id, data in entries:
-                        await self._project(stream_name, msg_id, data)
+                if len(pending) < self._batch_size and (deadline is None or loop.time() < deadline):
+                    # 배치가 비어 있으면 poll_interval, 채우는 중이면 남은 윈도우만큼만 대기
+                    wait = self._poll_interval if deadline is None else deadline - loop.time()
+                    messages = await self._redis.xreadgroup(
+                        groupname=self._group,
+                        consumername=self._consumer,
+                        streams={s: ">" for s in STREAMS},
+                        count=self._batch_size - len(pending),
+                        block=max(1, int(wait * 1000)),
+                    )
+                    for stream_name, entries in messages or []:
+                        for msg_id, data in entries:
+                            pending.append((stream_name, msg_id, data))
+                    if pending and deadline is None:
+                        deadline = loop.time() + self._flush_interval
+
+                if pending and (len(pending) >= self._batch_size or loop.time() >= deadline):
+                    await self._project_batch(pending)
+                    pending, deadline = [], None
 
             except asyncio.CancelledError:
                 break
+            except _Neo4jUnavailable as e:
+                # ACK하지 않은 배치를 보관한 채 대기 후 재시도
+                logger.error("Graph Projector: Neo4j 연결 실패, %d건 재시도 대기: %s", len(pending), e)
+                await asyncio.sleep(self._poll_interval)
             except Exception as e:
                 logger.error("Graph Projector 폴링 오류: %s", e, exc_info=True)
                 await asyncio.sleep(self._poll_interval)
+        else:
+            # stop()으로 정상 종료 — 모아 둔 배치를 마저 반영
+            if pending:
+                try:
+                    await self._project_batch(pending)
+                except Exception as e:
+                    logger.error("Graph Projector 종료 flush 실패: %s", e, exc_info=True)
 
         logger.info("Graph Projector 종료: stats=%s", self._stats)
 
@@ -141,84 +226,111 @@ class GraphProjectorWorker:
 
     # ── 프로젝션 처리 ────────────────────────────────────────
 
-    async def _project(self, stream: str, msg_id: str, data: dict) -> None:
-        """단일 이벤트 메시지를 프로젝션 규칙에 따라 처리한다.
-
-        1. event_type으로 규칙 목록을 조회한다 (없으면 스킵).
-        2. payload를 파싱하고 각 규칙의 params_map을 해석한다.
-        3. 모든 규칙의 Cypher를 순서대로 실행한다.
-        4. 실패한 규칙이 있더라도 나머지 규칙을 계속 실행하고, 마지막에 ACK한다.
+    async def _read_own_pending(self) -> list[tuple[str, str, dict]]:
+        """이 컨슈머에 배달됐지만 ACK되지 않은 메시지를 읽는다 (재시작 시 재처리용)."""
+        messages = await self._redis.xreadgroup(
+            groupname=self._group,
+            consumername=self._consumer,
+            streams={s: "0" for s in STREAMS},
+            count=self._batch_size,
+        )
+        return [
+            (stream_name, msg_id, data or {})
+            for stream_name, entries in messages or []
+            for msg_id, data in entries
+        ]
+
+    async def _project_batch(self, messages: list[tuple[str, str, dict]]) -> None:
+        """마이크로 배치 하나를 프로젝션 규칙에 따라 처리한다.
+
+        1. 메시지마다 event_type으로 규칙을 찾고 params_map을 해석해 규칙별 행 목록에 추가한다.
+        2. 규칙마다 UNWIND 배치 Cypher를 쓰기 트랜잭션 한 번으로 실행한다 (처음 등장한 순서).
+        3. 배치 트랜잭션이 실패하면 그 규칙만 행 단위로 재실행해 실패 행을 격리한다.
+        4. 모든 규칙 처리가 끝난 뒤 스트림별로 ACK한다.
+           Neo4j 연결 오류는 _Neo4jUnavailable로 올려 ACK 없이 재시도하게 한다.
         """
-        event_type = data.get("event_type", "")
-
-        # 매핑 테이블에 없는 이벤트는 조용히 스킵
-        rules = self._rules.get(event_type)
-        if not rules:
-            self._stats["skipped"] += 1
-            await self._redis.xack(stream, self._group, msg_id)
-            return
-
-        # payload 파싱 — 문자열이면 JSON 디코딩
-        payload = data.get("payload", "{}")
-        if isinstance(payload, str):
-            try:
-                payload = json.loads(payload)
-            except json.JSONDecodeError:
-                logger.warning(
-                    "Graph Projector: payload JSON 파싱 실패, event=%s, msg_id=%s",
-                    event_type, msg_id,
-                )
-                payload = {}
-
-        # 공통 파라미터 추출
-        case_id = payload.get("case_id", data.get("case_id", ""))
-        event_id = data.get("event_id", str(uuid.uuid4()))
-
-        # 각 규칙을 순서대로 실행
-        rule_success = 0
-        rule_fail = 0
-
-        for rule in rules:
-            try:
-                # params_map에 따라 Cypher 파라미터를 해석
-                params = self._resolve_params(
+        # (event_type, 규칙 인덱스) → 행 목록. dict 삽입 순서 = 처음 등장 순서
+        groups: dict[tuple[str, int], list[dict[str, Any]]] = {}
+        acks: dict[str, list[str]] = {}
+
+        for stream, msg_id, data in messages:
+            acks.setdefault(stream, []).append(msg_id)
+            event_type = data.get("event_type", "")
+
+            # 매핑 테이블에 없는 이벤트는 조용히 스킵
+            rules = self._rules.get(event_type)
+            if not rules:
+                self._stats["skipped"] += 1
+                continue
+
+            # payload 파싱 — 문자열이면 JSON 디코딩
+            payload = data.get("payload", "{}")
+            if isinstance(payload, str):
+                try:
+                    payload = json.loads(payload)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        "Graph Projector: payload JSON 파싱 실패, event=%s, msg_id=%s",
+                        event_type, msg_id,
+                    )
+                    payload = {}
+
+            # 공통 파라미터 추출
+            case_id = payload.get("case_id", data.get("case_id", ""))
+            event_id = data.get("event_id", str(uuid.uuid4()))
+            full_payload = json.dumps(payload, ensure_ascii=False)
+
+            for index, rule in enumerate(rules):
+                # params_map에 따라 Cypher 파라미터(= UNWIND 행)를 해석
+                groups.setdefault((event_type, index), []).append(self._resolve_params(
                     rule["params_map"],
                     payload=payload,
                     case_id=case_id,
                     event_id=event_id,
-                    full_payload=json.dumps(payload, ensure_ascii=False),
-                )
+                    full_payload=full_payload,
+                ))
+
+        for (event_type, index), rows in groups.items():
+            await self._write_rule_rows(event_type, index, rows)
+
+        # 모든 규칙 트랜잭션 이후 ACK — 부분 실패 행은 로그로 추적하고 필요 시 수동 재처리한다
+        for stream, msg_ids in acks.items():
+            await self._redis.xack(stream, self._group, *msg_ids)
+        self._stats["batches"] += 1
+
+    async def _write_rule_rows(self, event_type: str, index: int, rows: list[dict[str, Any]]) -> None:
+        """규칙 하나의 행 목록을 UNWIND 트랜잭션으로 쓰고, 실패 시 행 단위로 재실행한다."""
+        rule = self._rules[event_type][index]
+        try:
+            await self._neo4j.execute_write(self._batch_cypher[event_type][index], {"rows": rows})
+            self._stats["projected"] += len(rows)
+            logger.debug(
+                "Graph Projection 완료: event=%s, rule='%s', rows=%d",
+                event_type, rule["description"], len(rows),
+            )
+            return
+        except _CONNECTION_ERRORS as e:
+            raise _Neo4jUnavailable(str(e)) from e
+        except Exception as e:
+            logger.warning(
+                "Graph Projection 배치 실패, 행 단위 재실행: event=%s, rule='%s', rows=%d, error=%s",
+                event_type, rule["description"], len(rows), e,
+            )
 
-                # Neo4j 쓰기 트랜잭션으로 Cypher 실행
+        for params in rows:
+            try:
                 await self._neo4j.execute_write(rule["cypher"], params)
-
-                logger.debug(
-                    "Graph Projection 완료: event=%s, rule='%s'",
-                    event_type, rule["description"],
-                )
-                rule_success += 1
                 self._stats["projected"] += 1
-
+            except _CONNECTION_ERRORS as e:
+                raise _Neo4jUnavailable(str(e)) from e
             except Exception as e:
                 logger.error(
                     "Graph Projection 실패: event=%s, rule='%s', error=%s",
                     event_type, rule["description"], e,
                     exc_info=True,
                 )
-                rule_fail += 1
                 self._stats["failed"] += 1
 
-        # 실패 여부와 관계없이 ACK — pending list에 무한히 쌓이는 것을 방지
-        # 실패한 규칙은 로그로 추적하고, 필요 시 수동 재처리한다
-        if rule_fail > 0:
-            logger.warning(
-                "Graph Projector: 부분 실패 후 ACK, event=%s, "
-                "성공=%d, 실패=%d, msg_id=%s",
-                event_type, rule_success, rule_fail, msg_id,
-            )
-
-        await self._redis.xack(stream, self._group, msg_id)
-
     # ── 파라미터 해석 ────────────────────────────────────────
 
     def _resolve_params(
@@ -238,9 +350,9 @@ class GraphProjectorWorker:
           - "payload.xxx"   → payload["xxx"] (없으면 None)
           - 그 외            → 리터럴 문자열 값
 
-        case_id는 항상 자동으로 포함된다.
+        case_id와 event_id는 항상 자동으로 포함된다.
         """
-        resolved: dict[str, Any] = {"case_id": case_id}
+        resolved: dict[str, Any] = {"case_id": case_id, "event_id": event_id}
 
         for param_name, source in params_map.items():
             if source == "$event_id":
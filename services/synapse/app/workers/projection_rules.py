@@ -23,7 +23,8 @@ params_map 해석 규칙:
   - "$full_payload" → payload 전체를 JSON 문자열로 직렬화한다
   - 그 외 문자열    → 리터럴 값으로 사용한다
 
-$case_id는 모든 규칙에 자동 주입되므로 params_map에 별도로 정의하지 않아도 된다.
+$case_id와 $event_id는 모든 규칙에 자동 주입되므로 params_map에 별도로 정의하지 않아도 된다.
+GraphProjectorWorker는 규칙 Cypher의 $xxx를 row.xxx로 바꿔 UNWIND 배치로 실행한다 (to_unwind_cypher).
 """
 
 # ──────────────────────────────────────────────────────────────
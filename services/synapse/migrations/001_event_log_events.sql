@@ -0,0 +1,73 @@
+-- Synapse 이벤트 로그 정규화 저장소
+-- event_logs.events JSONB 배열에 통째로 저장하던 이벤트를 case_id 해시 파티션 테이블
+-- event_log_events로 옮긴다. 통계/변형/병목 분석은 (log_id, case_id, ts) 인덱스 순으로
+-- 청크 단위 스트리밍한다 (EventLogStore.iter_events).
+-- 실행: psql $DATABASE_URL -f migrations/001_event_log_events.sql
+--
+-- 로그 하나씩 커밋하며 이미 이전된 로그(events_storage = 'normalized')는 건너뛰므로
+-- 중단 후 다시 실행해도 안전하다. 이전되지 않은 로그도 서비스는 JSONB 경로로 계속 읽는다.
+-- 파티션 수(8)는 EventLogStore.EVENT_PARTITIONS와 같아야 한다.
+
+SET search_path TO synapse, public;
+
+ALTER TABLE event_logs ADD COLUMN IF NOT EXISTS events_storage TEXT NOT NULL DEFAULT 'jsonb';
+
+CREATE TABLE IF NOT EXISTS event_log_events (
+    log_id TEXT NOT NULL,
+    tenant_id TEXT NOT NULL,
+    case_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    activity TEXT NOT NULL,
+    ts TIMESTAMPTZ NOT NULL,
+    resource TEXT,
+    attrs JSONB NOT NULL DEFAULT '{}',
+    raw JSONB,
+    PRIMARY KEY (log_id, case_id, seq)
+) PARTITION BY HASH (case_id);
+
+DO $$
+BEGIN
+    FOR i IN 0..7 LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS event_log_events_p%s PARTITION OF event_log_events '
+            'FOR VALUES WITH (MODULUS 8, REMAINDER %s)', i, i
+        );
+    END LOOP;
+END
+$$;
+
+-- 스트리밍 수집(insert_batches)이 원본 행을 함께 저장하는 컬럼
+ALTER TABLE event_log_events ADD COLUMN IF NOT EXISTS raw JSONB;
+
+CREATE INDEX IF NOT EXISTS event_log_events_log_case_ts ON event_log_events (log_id, case_id, ts);
+
+-- JSONB → 정규화 행 백필 (로그 단위 트랜잭션)
+DO $$
+DECLARE
+    r RECORD;
+BEGIN
+    FOR r IN SELECT log_id FROM event_logs WHERE events_storage = 'jsonb' ORDER BY created_at LOOP
+        PERFORM 1 FROM event_logs WHERE log_id = r.log_id AND events_storage = 'jsonb' FOR UPDATE SKIP LOCKED;
+        IF NOT FOUND THEN
+            CONTINUE;
+        END IF;
+        DELETE FROM event_log_events WHERE log_id = r.log_id;
+        INSERT INTO event_log_events (log_id, tenant_id, case_id, seq, activity, ts, resource, attrs)
+        SELECT l.log_id,
+               l.tenant_id,
+               e.value->>'case_id',
+               (e.seq - 1)::int,
+               e.value->>'activity',
+               (e.value->>'timestamp')::timestamptz,
+               e.value->>'resource',
+               COALESCE(e.value->'attributes', '{}'::jsonb)
+        FROM event_logs l, jsonb_array_elements(l.events) WITH ORDINALITY AS e(value, seq)
+        WHERE l.log_id = r.log_id;
+        UPDATE event_logs SET events = '[]', events_storage = 'normalized' WHERE log_id = r.log_id;
+        COMMIT;
+    END LOOP;
+END
+$$;
+
+-- 검증: 남은 JSONB 로그 수 (0이어야 함)
+SELECT COUNT(*) AS remaining_jsonb_logs FROM event_logs WHERE events_storage = 'jsonb';
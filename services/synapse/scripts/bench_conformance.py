@@ -0,0 +1,88 @@
+"""적합도(conformance) 검사 벤치마크 — 리스트 스캔 루프 vs 정수 인코딩 벡터 채점.
+
+  - legacy: 케이스마다 `a not in trace` 리스트 스캔 + 모든 케이스의 Deviation 생성 (이전 구현)
+  - vectorized: app.mining.conformance_checker.check_conformance (workers=1 / 병렬 청크)
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_conformance.py --cases 100000 --activities 40 --designed 25
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+from app.mining.conformance_checker import Deviation, check_conformance
+
+
+def _events(cases: int, activities: int, designed: list[str], seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    acts = [f"act_{i}" for i in range(activities)]
+    events = []
+    for c in range(cases):
+        trace = [a for a in designed if rng.random() > 0.05] + rng.sample(acts, rng.randint(0, 3))
+        for k, act in enumerate(trace):
+            events.append({"case_id": f"case-{c}", "activity": act, "timestamp": f"2024-01-01T00:{k // 60:02d}:{k % 60:02d}Z"})
+    return events
+
+
+def _legacy_scores(events: list[dict], designed: list[str]) -> tuple[float, int]:
+    """이전 구현의 채점 루프 — 모든 케이스의 Deviation을 만들던 부분까지 포함."""
+    grouped: dict[str, list[dict]] = defaultdict(list)
+    for event in events:
+        grouped[str(event["case_id"])].append(event)
+    fitness_sum, conformant = 0.0, 0
+    for trace_events in grouped.values():
+        trace_events.sort(key=lambda item: item["timestamp"])
+        trace = [item["activity"] for item in trace_events]
+        missing = [a for a in designed if a not in trace]
+        extra_list = [a for a in trace if a not in designed]
+        denom = max(1, len(trace) + len(designed))
+        fitness_sum += max(0.0, 1.0 - ((len(missing) + len(extra_list)) / denom))
+        conformant += int(not missing and not extra_list)
+        extra_set = set(extra_list)
+        [Deviation(position=i, expected=a, actual="(누락)", type="skipped_activity", description=a)
+         for i, a in enumerate(designed) if a not in trace]
+        [Deviation(position=i, expected="(설계에 없음)", actual=a, type="unexpected_activity", description=a)
+         for i, a in enumerate(trace) if a in extra_set]
+    return fitness_sum / max(1, len(grouped)), conformant
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark conformance checking")
+    parser.add_argument("--cases", type=int, default=100_000)
+    parser.add_argument("--activities", type=int, default=40)
+    parser.add_argument("--designed", type=int, default=25)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    designed = [f"act_{i}" for i in range(args.designed)]
+    events = _events(args.cases, args.activities, designed, args.seed)
+
+    (legacy_fitness, legacy_ok), t_legacy = _timed(lambda: _legacy_scores(events, designed))
+    print(json.dumps({"mode": "legacy_scoring", "cases": args.cases, "events": len(events),
+                      "fitness": round(legacy_fitness, 3), "conformant": legacy_ok, "elapsed_s": round(t_legacy, 3)}))
+    sys.stdout.flush()
+    for workers in sorted({1, args.workers}):
+        result, elapsed = _timed(lambda: check_conformance(events, designed, workers=workers))
+        assert result.conformant_cases == legacy_ok and result.fitness == round(legacy_fitness, 3)
+        print(json.dumps({"mode": "vectorized", "workers": workers, "cases": args.cases, "events": len(events),
+                          "fitness": result.fitness, "conformant": result.conformant_cases,
+                          "elapsed_s": round(elapsed, 3)}))
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+"""DMN 결정 테이블 벤치마크 — 매 평가 파싱 vs 컴파일 + 해시 인덱스 vs DataFrame 일괄 평가.
+
+  - legacy  : 이전 _evaluate_condition — 규칙·조건마다 문자열 파싱 (in [...] 은 매번 ast.literal_eval)
+  - cached  : execute_decision_table — 조건 문자열 단위 캐시(compile_condition), 규칙 전체 순회
+  - compiled: CompiledDecisionTable.execute — 등호 컬럼 해시 인덱스로 후보 규칙만 평가
+  - batch   : CompiledDecisionTable.execute_batch — 입력 DataFrame 한 번에 평가
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_dmn_engine.py --rules 500 --contexts 20000 --hit-policy FIRST COLLECT
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import pandas as pd
+
+from app.services.dmn_engine import (
+    DecisionRule,
+    DecisionTable,
+    HitPolicy,
+    compile_condition,
+    compile_decision_table,
+    execute_decision_table,
+)
+
+REGIONS = [f"R{i:02d}" for i in range(40)]
+SEGMENTS = ["retail", "smb", "enterprise", "public", "partner"]
+
+
+def _table(rules: int, hit_policy: str, seed: int) -> DecisionTable:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(rules):
+        rows.append(DecisionRule(
+            conditions={
+                "region": f"== '{rng.choice(REGIONS)}'" if rng.random() < 0.9 else "-",
+                "segment": f"in {rng.sample(SEGMENTS, 2)}" if rng.random() < 0.7 else "-",
+                "amount": rng.choice([">= 1000", "< 500", "-", f"<= {rng.randrange(100, 5000)}"]),
+                "score": rng.choice(["-", "> 0.5", "not in [0, 1]"]),
+            },
+            outputs={"rule": i, "discount": round(rng.random() * 0.3, 3)},
+            priority=rng.randrange(10),
+        ))
+    return DecisionTable(name="Bench", hit_policy=hit_policy, rules=rows)
+
+
+def _contexts(n: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    return [{
+        "region": rng.choice(REGIONS),
+        "segment": rng.choice(SEGMENTS),
+        "amount": rng.randrange(0, 6000),
+        "score": round(rng.random(), 2),
+    } for _ in range(n)]
+
+
+def _legacy_execute(table: DecisionTable, context: dict) -> list[dict]:
+    """이전 구현 — 캐시 없이 조건 문자열을 매번 파싱한다."""
+    parse = compile_condition.__wrapped__
+    matched = [
+        (rule.priority, rule.outputs) for rule in table.rules
+        if all(parse(cond).test(context.get(name)) for name, cond in rule.conditions.items())
+    ]
+    if not matched:
+        return []
+    if table.hit_policy == HitPolicy.FIRST:
+        return [matched[0][1]]
+    if table.hit_policy == HitPolicy.PRIORITY:
+        matched.sort(key=lambda x: x[0])
+        return [matched[0][1]]
+    return [m[1] for m in matched]
+
+
+def _timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DMN decision table evaluation")
+    parser.add_argument("--rules", type=int, default=500)
+    parser.add_argument("--contexts", type=int, default=20_000)
+    parser.add_argument("--hit-policy", nargs="+", default=[HitPolicy.FIRST, HitPolicy.COLLECT],
+                        choices=[HitPolicy.FIRST, HitPolicy.PRIORITY, HitPolicy.COLLECT])
+    parser.add_argument("--legacy-contexts", type=int, default=2_000,
+                        help="legacy is slow; time this many contexts and extrapolate")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    contexts = _contexts(args.contexts, args.seed)
+    frame = pd.DataFrame(contexts)
+    for hit_policy in args.hit_policy:
+        table = _table(args.rules, hit_policy, args.seed)
+        legacy_n = min(args.legacy_contexts, args.contexts)
+        t_compile, compiled = _timed(lambda: compile_decision_table(table))
+        runs = {
+            "legacy": (legacy_n, lambda: [_legacy_execute(table, c) for c in contexts[:legacy_n]]),
+            "cached": (args.contexts, lambda: [execute_decision_table(table, c) for c in contexts]),
+            "compiled": (args.contexts, lambda: [compiled.execute(c) for c in contexts]),
+            "batch": (args.contexts, lambda: compiled.execute_batch(frame)),
+        }
+        reference = None
+        for mode, (n, fn) in runs.items():
+            elapsed, results = _timed(fn)
+            if reference is None:
+                reference = results
+            assert results[:legacy_n] == reference[:legacy_n], f"{mode} diverged from legacy"
+            print(json.dumps({"mode": mode, "hit_policy": hit_policy, "rules": args.rules, "contexts": n,
+                              "compile_ms": round(t_compile * 1000, 2) if mode in ("compiled", "batch") else None,
+                              "elapsed_s": round(elapsed, 4),
+                              "contexts_per_sec": round(n / elapsed, 1)}))
+            sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,101 @@
+"""이벤트 로그 통계 벤치마크 — 이벤트별 파싱 루프 vs 단일 패스 누적기.
+
+  - legacy: 케이스별 경로를 만들고 이벤트마다 parse_timestamp (첫/끝 이벤트는 재파싱) 하던 이전 compute_stream
+  - stream: EventLogStatistics.compute_stream (청크 단위 정수 인코딩 + numpy 정렬 집계, 완료 케이스는 즉시 버림)
+  - ingest: EventLogStatsAccumulator.add_events — 수집 배치마다 케이스별 상태만 증분 갱신 후 result() (읽기 시 재계산 없음)
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_event_log_statistics.py --cases 50000 --events-per-case 20 --chunk-size 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from app.services.event_log_parser import parse_timestamp
+from app.services.event_log_statistics import EventLogStatistics, EventLogStatsAccumulator
+from app.services.mining_utils import iter_case_paths, percentile
+
+
+def _events(cases: int, per_case: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    acts = [f"act_{i}" for i in range(30)]
+    resources = [f"user_{i}" for i in range(200)]
+    events = []
+    for c in range(cases):
+        start = base + timedelta(minutes=rng.randint(0, 500_000))
+        for k in range(rng.randint(per_case // 2, per_case * 3 // 2)):
+            events.append({
+                "case_id": f"case-{c:07d}",
+                "activity": rng.choice(acts),
+                "timestamp": (start + timedelta(minutes=k * rng.randint(1, 90))).isoformat(),
+                "resource": rng.choice(resources),
+            })
+    events.sort(key=lambda e: (e["case_id"], e["timestamp"]))
+    return events
+
+
+def _legacy_stream(chunks) -> dict:
+    """이전 구현의 집계 루프 (결과 조립 부분 제외)."""
+    total, min_ts, max_ts = 0, None, None
+    activity, resource, resource_cases, variants = Counter(), Counter(), Counter(), Counter()
+    durations = []
+    for _case_id, items in iter_case_paths(chunks):
+        total += len(items)
+        touched = set()
+        for event in items:
+            ts = parse_timestamp(event["timestamp"])
+            min_ts = ts if min_ts is None or ts < min_ts else min_ts
+            max_ts = ts if max_ts is None or ts > max_ts else max_ts
+            activity[event["activity"]] += 1
+            if event.get("resource"):
+                resource[str(event["resource"])] += 1
+                touched.add(str(event["resource"]))
+        resource_cases.update(touched)
+        durations.append((parse_timestamp(items[-1]["timestamp"]) - parse_timestamp(items[0]["timestamp"])).total_seconds())
+        variants[" > ".join(item["activity"] for item in items)] += 1
+    durations.sort()
+    return {"total_events": total, "p95": percentile(durations, 0.95)}
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark event-log statistics")
+    parser.add_argument("--cases", type=int, default=50_000)
+    parser.add_argument("--events-per-case", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    events = _events(args.cases, args.events_per_case, args.seed)
+    chunks = lambda: (events[i:i + args.chunk_size] for i in range(0, len(events), args.chunk_size))  # noqa: E731
+
+    legacy, t_legacy = _timed(lambda: _legacy_stream(chunks()))
+    stream, t_stream = _timed(lambda: EventLogStatistics.compute_stream(chunks()))
+    assert stream["overview"]["total_events"] == legacy["total_events"]
+
+    acc = EventLogStatsAccumulator()
+    _, t_ingest = _timed(lambda: [acc.add_events(chunk) for chunk in chunks()])
+    _, t_read = _timed(acc.result)
+    for mode, elapsed in (("legacy", t_legacy), ("stream", t_stream), ("ingest_add_events", t_ingest),
+                          ("ingest_result", t_read)):
+        print(json.dumps({"mode": mode, "events": len(events), "cases": args.cases, "elapsed_s": round(elapsed, 3),
+                          "p95_seconds": round(legacy["p95"], 2) if mode == "legacy"
+                          else stream["case_duration"]["p95_seconds"]}))
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+"""GWT 엔진 이벤트 처리량 벤치마크 — 기존 경로 vs 레지스트리 + 컴파일 + 일괄 조회.
+
+룰 수(기본 100/1,000)별로 같은 이벤트를 반복 처리해 events/sec를 비교한다.
+  - legacy   : 이벤트마다 룰 조회, 계층별 스냅샷 쿼리, 조건마다 Cypher 조회, 표현식마다 ast.parse
+  - optimized: GWTRuleRegistry 캐시 + compile_expression 캐시 + 상태/관계 값 단일 왕복 조회
+
+Neo4j는 쿼리당 --rtt-ms 만큼 대기하는 가짜 클라이언트로 대체한다 (실서버 왕복 지연 모사).
+룰은 모두 같은 when_event에 걸리는 최악의 경우이며, 각 룰은 state + expression 조건을,
+5개 중 1개는 relation 조건을 추가로 가진다.
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_gwt_engine.py --rules 100 1000 --events 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from typing import Any
+
+from app.services.gwt_engine import (
+    GWTCondition,
+    GWTEngine,
+    GWTEvalContext,
+    GWTRule,
+    GWTRuleRegistry,
+    compile_expression,
+)
+
+_EVENT = "ORDER_PLACED"
+_PROPS = {"node_id": "p1", "status": "PENDING", "priority": 7, "value": 42}
+
+
+class _FakeNeo4j:
+    def __init__(self, rules: list[dict], rtt_s: float) -> None:
+        self._rules = [{"a": r} for r in rules]
+        self._rtt = rtt_s
+        self.round_trips = 0
+
+    async def execute_read(self, query: str, params: dict | None = None) -> list[dict]:
+        self.round_trips += 1
+        if self._rtt:
+            await asyncio.sleep(self._rtt)
+        if "MATCH (a:ActionType" in query:
+            return self._rules
+        if "CALL {" in query:
+            row: dict[str, Any] = {}
+            for column in re.findall(r"AS (\w+) }", query):
+                row[column] = [{"id": "p1", "props": _PROPS}] if column.startswith("s") else [{"val": 42}]
+            return [row]
+        if "properties(n)" in query:
+            return [{"id": "p1", "props": _PROPS}]
+        field = re.search(r"\.(\w+) AS val", query).group(1)
+        return [{"val": _PROPS.get(field)}]
+
+
+class _LegacyEngine(GWTEngine):
+    """최적화 이전 동작 재현: 계층별 스냅샷 쿼리 + 조건별 조회 + 매번 ast.parse."""
+
+    async def _load_context_states(self, ctx: GWTEvalContext, rules: list[GWTRule]) -> None:
+        layers = {
+            layer.capitalize()
+            for rule in rules
+            for cond in rule.given
+            for layer in (cond.node_layer, cond.source_layer, cond.target_layer)
+            if layer
+        }
+        for label in layers:
+            records = await self._neo4j.execute_read(
+                f"MATCH (n:{label} {{case_id: $case_id}}) WHERE n.node_id IN $node_ids "
+                "RETURN n.node_id AS id, properties(n) AS props",
+                {"case_id": ctx.case_id, "node_ids": [ctx.source_node_id]},
+            )
+            for rec in records:
+                ctx.node_states[rec["id"]] = rec["props"]
+
+    def _eval_expression(self, cond: GWTCondition, ctx: GWTEvalContext) -> bool:
+        compiled = compile_expression.__wrapped__(cond.value)
+        return bool(compiled({"state": ctx.node_states, "payload": ctx.payload, "trigger": {}}))
+
+
+def _make_rules(count: int) -> list[dict]:
+    rules = []
+    for i in range(count):
+        given = [
+            {"type": "state", "node_layer": "Process", "field": "status", "op": "==", "value": "PENDING"},
+            {"type": "expression", "value": f"state.p1.priority > {i % 10} and payload.amount >= {i}"},
+        ]
+        if i % 5 == 0:
+            given.append({"type": "relation", "source_layer": "Process", "rel_type": "INFLUENCES",
+                          "target_layer": "Kpi", "field": "value", "op": ">", "value": 40})
+        rules.append({
+            "id": f"rule-{i}", "name": f"rule-{i}", "case_id": "case-1", "tenant_id": "t1",
+            "when_event": _EVENT, "given_conditions": json.dumps(given),
+            "then_actions": json.dumps([{"op": "EMIT", "event_type": "FIRED", "payload": {}}]),
+            "enabled": True, "priority": count - i, "version": 1,
+        })
+    return rules
+
+
+async def _throughput(engine: GWTEngine, events: int) -> tuple[float, int]:
+    payload = {"source_node_id": "p1", "amount": 500}
+    fired = 0
+    start = time.perf_counter()
+    for _ in range(events):
+        fired = len(await engine.handle_event(_EVENT, "agg-1", payload, "case-1", "t1"))
+    return events / (time.perf_counter() - start), fired
+
+
+async def _run(rule_count: int, events: int, rtt_s: float) -> dict:
+    rules = _make_rules(rule_count)
+    legacy_db = _FakeNeo4j(rules, rtt_s)
+    legacy_eps, legacy_fired = await _throughput(_LegacyEngine(legacy_db, None, dry_run=True), events)
+
+    compile_expression.cache_clear()
+    fast_db = _FakeNeo4j(rules, rtt_s)
+    engine = GWTEngine(fast_db, None, dry_run=True, rule_registry=GWTRuleRegistry(ttl_sec=3600))
+    fast_eps, fast_fired = await _throughput(engine, events)
+    assert legacy_fired == fast_fired, (legacy_fired, fast_fired)
+
+    return {
+        "rules": rule_count,
+        "events": events,
+        "matched_rules": fast_fired,
+        "legacy_events_per_s": round(legacy_eps, 1),
+        "legacy_round_trips_per_event": round(legacy_db.round_trips / events, 1),
+        "optimized_events_per_s": round(fast_eps, 1),
+        "optimized_round_trips_per_event": round(fast_db.round_trips / events, 2),
+        "speedup": round(fast_eps / legacy_eps, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark GWT engine event throughput")
+    parser.add_argument("--rules", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--events", type=int, default=50, help="events handled per rule count")
+    parser.add_argument("--rtt-ms", type=float, default=0.5, help="simulated Neo4j round trip per query")
+    args = parser.parse_args()
+
+    for count in args.rules:
+        result = asyncio.run(_run(count, args.events, args.rtt_ms / 1000.0))
+        print(json.dumps(result, ensure_ascii=False))
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -41,3 +41,36 @@ def test_conformance_checker_validates_inputs():
         check_conformance(events=[], designed_activities=["A"])
     with pytest.raises(ValueError):
         check_conformance(events=[{"case_id": "c", "activity": "A", "timestamp": "2024-01-01T00:00:00Z"}], designed_activities=[])
+
+
+def _synthetic_events(cases: int) -> list[dict]:
+    acts = ["주문 접수", "결제 확인", "출하 지시", "배송 완료", "반품 요청"]
+    events = []
+    for c in range(cases):
+        for k, act in enumerate(acts[: 1 + c % 5] + (["기타"] if c % 7 == 0 else [])):
+            events.append({"case_id": f"c{c}", "activity": act, "timestamp": f"2024-01-01T00:{k:02d}:00Z"})
+    return events
+
+
+def test_conformance_checker_stats_order_and_duplicate_design():
+    result = check_conformance(
+        events=_synthetic_events(8),
+        designed_activities=["결제 확인", "주문 접수", "결제 확인"],
+        max_diagnostics_cases=3,
+    )
+    # c0·c5가 결제 확인을 누락 — 설계에 두 번 있으므로 케이스당 2회씩 집계
+    assert result.deviation_statistics["skipped_activities"] == {"결제 확인": 4}
+    assert list(result.deviation_statistics["unexpected_activities"]) == ["기타", "출하 지시", "배송 완료", "반품 요청"]
+    assert [d.position for d in result.case_diagnostics[0].deviations] == [0, 2, 1]
+    assert len(result.case_diagnostics) == 3 and result.total_cases == 8
+
+
+def test_conformance_checker_parallel_chunks_match_serial(monkeypatch):
+    import app.mining.conformance_checker as mod
+
+    events = _synthetic_events(60)
+    designed = ["주문 접수", "결제 확인", "출하 지시"]
+    serial = check_conformance(events, designed, workers=1)
+    monkeypatch.setattr(mod, "_PARALLEL_MIN_CASES", 20)
+    parallel = check_conformance(events, designed, workers=2)
+    assert parallel.model_dump() == serial.model_dump()
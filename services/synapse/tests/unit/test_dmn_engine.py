@@ -1,4 +1,7 @@
 """DMN 규칙 엔진 단위 테스트."""
+import random
+
+import pandas as pd
 import pytest
 
 from app.services.dmn_engine import (
@@ -8,6 +11,8 @@ from app.services.dmn_engine import (
     DecisionTable,
     HitPolicy,
     _evaluate_condition,
+    compile_condition,
+    compile_decision_table,
     create_table_from_dict,
     execute_decision_table,
 )
@@ -70,6 +75,15 @@ class TestEvaluateCondition:
         assert _evaluate_condition("not in ['a', 'b']", "c") is True
         assert _evaluate_condition("not in ['a', 'b']", "a") is False
 
+    def test_unhashable_value_uses_list_membership(self):
+        """해시 불가 값은 원래 리스트의 == 비교 — in / not in 이 서로 반대 결과."""
+        assert _evaluate_condition("in [[1, 2], 'a']", [1, 2]) is True
+        assert _evaluate_condition("not in [[1, 2], 'a']", [1, 2]) is False
+        assert _evaluate_condition("in [1, 2]", [1]) is False
+        assert _evaluate_condition("not in [1, 2]", [1]) is True
+        assert _evaluate_condition("in [{'k': 1}]", {"k": 1}) is True
+        assert _evaluate_condition("not in [{'k': 1}]", {"k": 2}) is True
+
     def test_simple_value_equality(self):
         """연산자 없는 값은 문자열 등호 비교."""
         assert _evaluate_condition("hello", "hello") is True
@@ -187,3 +201,105 @@ class TestCreateTableFromDict:
         assert table.hit_policy == HitPolicy.FIRST
         assert table.inputs == []
         assert table.rules == []
+
+
+# ─── CompiledDecisionTable 테스트 ──────────────────────────
+
+def _random_table(hit_policy: str, n_rules: int = 60, seed: int = 3) -> DecisionTable:
+    """등호 위주 컬럼(region, tier) + 범위 컬럼(amount) + 기타 연산자가 섞인 테이블."""
+    rng = random.Random(seed)
+    rules = []
+    for i in range(n_rules):
+        conditions = {
+            "region": rng.choice(["== 'KR'", "== 'US'", "'JP'", "in ['KR', 'JP']", "-"]),
+            "tier": rng.choice(["== 1", "== 2", "in [2, 3]", "== 3", ""]),
+            "amount": rng.choice([">= 100", "< 50", "-", "!= 0", "not in [10, 20]"]),
+        }
+        if i % 7 == 0:
+            conditions["flag"] = rng.choice(["== true", "True", "-"])
+        rules.append(DecisionRule(conditions=conditions, outputs={"rule": i}, priority=rng.randrange(5)))
+    return DecisionTable(name="Random", hit_policy=hit_policy, rules=rules)
+
+
+def _random_contexts(n: int, seed: int = 11) -> list[dict]:
+    rng = random.Random(seed)
+    contexts = []
+    for _ in range(n):
+        ctx = {
+            "region": rng.choice(["KR", "US", "JP", "CN"]),
+            "tier": rng.choice([1, 2, 3, 4]),
+            "amount": rng.choice([0, 10, 20, 49, 75, 100, 250]),
+            "flag": rng.choice([True, False]),
+        }
+        contexts.append(ctx)
+    return contexts
+
+
+class TestCompiledDecisionTable:
+    """컴파일된 테이블은 execute_decision_table과 같은 결과를 내야 한다."""
+
+    @pytest.mark.parametrize("hit_policy", [HitPolicy.FIRST, HitPolicy.PRIORITY, HitPolicy.COLLECT])
+    def test_matches_interpreted_execution(self, hit_policy):
+        table = _random_table(hit_policy)
+        compiled = compile_decision_table(table)
+        assert {name for name, _, _ in compiled._indexes} >= {"region", "tier"}
+        contexts = _random_contexts(300) + [{"region": ["KR"], "tier": None}, {}]
+        for ctx in contexts:
+            assert compiled.execute(ctx) == execute_decision_table(table, ctx)
+
+    @pytest.mark.parametrize("hit_policy", [HitPolicy.FIRST, HitPolicy.PRIORITY, HitPolicy.COLLECT])
+    def test_execute_batch_matches_per_row(self, hit_policy):
+        table = _random_table(hit_policy)
+        compiled = compile_decision_table(table)
+        contexts = _random_contexts(300)
+        expected = [execute_decision_table(table, ctx) for ctx in contexts]
+        assert compiled.execute_batch(pd.DataFrame(contexts)) == expected
+        assert compiled.execute_batch(contexts) == expected
+
+    def test_execute_batch_mixed_types_and_missing_column(self):
+        table = DecisionTable(name="Mixed", hit_policy=HitPolicy.COLLECT, rules=[
+            DecisionRule(conditions={"v": "> 5"}, outputs={"r": "gt"}),
+            DecisionRule(conditions={"missing": "!= 1"}, outputs={"r": "missing"}),
+            DecisionRule(conditions={"v": "abc"}, outputs={"r": "str"}),
+        ])
+        contexts = [{"v": 10}, {"v": "abc"}, {"v": None}]
+        expected = [execute_decision_table(table, ctx) for ctx in contexts]
+        assert compile_decision_table(table).execute_batch(pd.DataFrame(contexts, dtype=object)) == expected
+
+    def test_execute_batch_missing_key_keeps_int_semantics(self):
+        table = DecisionTable(name="Sparse", hit_policy=HitPolicy.COLLECT, rules=[
+            DecisionRule(conditions={"b": "1"}, outputs={"r": 0}),
+            DecisionRule(conditions={"b": "None"}, outputs={"r": "none"}),
+            DecisionRule(conditions={"b": "== 1"}, outputs={"r": "eq"}),
+        ])
+        contexts = [{"b": 1}, {}, {"b": 2, "c": 3}]
+        expected = [execute_decision_table(table, ctx) for ctx in contexts]
+        compiled = compile_decision_table(table)
+        assert compiled.execute_batch(contexts) == expected
+        assert compiled.execute_batch(contexts)[0] == [{"r": 0}, {"r": "eq"}]
+        # 기본 dtype DataFrame(결측으로 float64 업캐스트)에서도 단건 평가와 같아야 한다
+        frame = pd.DataFrame([{"b": 1}, {"b": None}])
+        assert frame["b"].dtype == "float64"
+        assert compiled.execute_batch(frame) == [compiled.execute(row) for row in frame.to_dict("records")]
+
+    def test_execute_batch_unhashable_values_match_per_row(self):
+        table = DecisionTable(name="Unhashable", hit_policy=HitPolicy.COLLECT, rules=[
+            DecisionRule(conditions={"v": "in [[1, 2], 3]"}, outputs={"r": "in_nested"}),
+            DecisionRule(conditions={"v": "not in [[1, 2], 3]"}, outputs={"r": "not_in_nested"}),
+            DecisionRule(conditions={"v": "in [1, 2]"}, outputs={"r": "in_flat"}),
+            DecisionRule(conditions={"v": "not in [1, 2]"}, outputs={"r": "not_in_flat"}),
+        ])
+        contexts = [{"v": [1, 2]}, {"v": [3]}, {"v": {"k": 1}}, {"v": 3}]
+        expected = [execute_decision_table(table, ctx) for ctx in contexts]
+        assert expected[0] == [{"r": "in_nested"}, {"r": "not_in_flat"}]
+        assert compile_decision_table(table).execute_batch(contexts) == expected
+
+    def test_in_list_parsed_once(self, monkeypatch):
+        calls = []
+        real = __import__("ast").literal_eval
+        monkeypatch.setattr("app.services.dmn_engine.ast.literal_eval", lambda s: calls.append(s) or real(s))
+        compile_condition.cache_clear()
+        for value in range(100):
+            _evaluate_condition("in [1, 2, 3, 4]", value)
+        assert len(calls) == 1
+        assert compile_condition("in [1, 2, 3, 4]").keys == frozenset({1, 2, 3, 4})
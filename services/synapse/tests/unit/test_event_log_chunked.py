@@ -0,0 +1,249 @@
+"""
+이벤트 로그 정규화 저장 + 청크 리더 단위 테스트.
+
+청크 스트림 기반 통계/변형/병목 계산이 전체 리스트 계산과 같은 결과를 내는지,
+EventLogStore.iter_events가 정규화/이전(JSONB) 로그를 같은 형식의 청크로 반환하는지 검증한다.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.bottleneck_service import BottleneckService
+from app.services.event_log_repository import EventLogRecord, EventLogRepository
+from app.services.event_log_service import EventLogService
+from app.services.event_log_statistics import EventLogStatistics
+from app.services.event_log_store import EventLogStore, _event_from_row, _event_rows
+from app.services.mining_task_coordinator import MiningTaskCoordinator
+from app.services.mining_utils import build_case_paths, iter_case_paths
+from app.services.variant_service import VariantService
+
+_BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _events(n_cases: int = 7) -> list[dict]:
+    events = []
+    for c in range(n_cases):
+        acts = ["Start", "Review", "End"] if c % 3 else ["Start", "End"]
+        for i, act in enumerate(acts):
+            events.append({
+                "case_id": f"C{c:02d}",
+                "activity": act,
+                "timestamp": (_BASE + timedelta(hours=c, minutes=15 * i * (c + 1))).isoformat(),
+                "resource": f"R{(c + i) % 3}",
+                "attributes": {},
+            })
+    events.sort(key=lambda e: (e["case_id"], e["timestamp"]))
+    return events
+
+
+def _chunks(events: list[dict], size: int) -> list[list[dict]]:
+    return [events[i:i + size] for i in range(0, len(events), size)]
+
+
+# ═══════════════════════════════════════════════════════════════
+# 스트리밍 계산 == 전체 리스트 계산
+# ═══════════════════════════════════════════════════════════════
+
+
+def test_iter_case_paths_spans_chunk_boundaries():
+    events = _events()
+    streamed = dict(iter_case_paths(_chunks(events, 2)))
+    assert streamed == dict(build_case_paths(events))
+
+
+@pytest.mark.parametrize("size", [1, 4, 1000])
+def test_statistics_stream_matches_compute(size: int):
+    events = _events()
+    assert EventLogStatistics.compute_stream(_chunks(events, size)) == EventLogStatistics.compute(events)
+
+
+def test_variant_and_bottleneck_stream_match_list():
+    events = _events()
+    variants = VariantService()
+    expected = variants.analyze(build_case_paths(events), sort_by="frequency_desc", limit=10, min_cases=1)
+    streamed = variants.analyze_cases(
+        iter_case_paths(_chunks(events, 3)), sort_by="frequency_desc", limit=10, min_cases=1,
+    )
+    assert streamed == expected
+
+    coord = MiningTaskCoordinator()
+    coord._store = None
+    bottlenecks = BottleneckService(coord)
+    expected = bottlenecks.analyze(events, sort_by="bottleneck_score_desc", _sla_source="eventstorming")
+    streamed = bottlenecks.analyze_cases(
+        iter_case_paths(_chunks(events, 3)), sort_by="bottleneck_score_desc", _sla_source="eventstorming",
+    )
+    assert streamed == expected
+
+
+def test_repository_iter_events_in_memory_groups_cases():
+    repo = EventLogRepository()
+    repo._store = None
+    shuffled = list(reversed(_events()))
+    repo.save(EventLogRecord(
+        log_id="log-1", tenant_id="t1", case_id="c1", name="n", source_type="csv",
+        status="completed", created_at="", updated_at="", events=shuffled,
+    ))
+    chunks = list(repo.iter_events("t1", "log-1", chunk_size=4))
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    flat = [e for chunk in chunks for e in chunk]
+    assert flat == _events()
+
+
+def test_service_preview_and_stats_use_chunk_reader():
+    svc = EventLogService()
+    svc._store = None
+    svc._repo.save(EventLogRecord(
+        log_id="log-1", tenant_id="t1", case_id="c1", name="n", source_type="csv",
+        status="completed", created_at="", updated_at="", events=_events(),
+    ))
+    preview = svc.get_preview("t1", "log-1", limit=5)
+    assert preview["total_preview"] == 5 and preview["events"] == _events()[:5]
+    stats = svc.get_statistics("t1", "log-1")
+    assert stats["overview"] == EventLogStatistics.compute(_events())["overview"]
+    ep = svc.stream_events_for_mining("t1", "log-1", chunk_size=3)
+    assert ep["case_id"] == "c1"
+    assert [e for chunk in ep["chunks"] for e in chunk] == _events()
+
+
+# ═══════════════════════════════════════════════════════════════
+# EventLogStore.iter_events (가짜 psycopg2 커넥션)
+# ═══════════════════════════════════════════════════════════════
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConn", name: str | None = None):
+        self._conn = conn
+        self.name = name
+        self.itersize = 0
+        self._rows: list[tuple] = []
+
+    def execute(self, sql: str, params: tuple = ()) -> None:
+        self._conn.statements.append((self.name, " ".join(sql.split())))
+        if "SELECT events_storage" in sql:
+            self._rows = [(self._conn.storage,)] if self._conn.storage else []
+        else:
+            self._rows = list(self._conn.rows)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchmany(self, size: int) -> list[tuple]:
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        self._conn.fetch_sizes.append(len(batch))
+        return batch
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeConn:
+    def __init__(self, storage: str | None, rows: list[tuple]):
+        self.storage = storage
+        self.rows = rows
+        self.statements: list[tuple[str | None, str]] = []
+        self.fetch_sizes: list[int] = []
+        self.closed = False
+
+    def cursor(self, name: str | None = None, cursor_factory=None) -> _FakeCursor:
+        return _FakeCursor(self, name)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _store_with(conn: _FakeConn) -> EventLogStore:
+    store = EventLogStore(database_url="postgresql://unused")
+    store._schema_ready = True
+    store._connect = lambda: conn  # type: ignore[method-assign]
+    return store
+
+
+def test_store_event_rows_roundtrip():
+    events = _events(2)
+    rows = list(_event_rows("log-1", "t1", events))
+    assert [r[3] for r in rows] == list(range(len(events)))
+    # DB가 돌려주는 (case_id, activity, ts, resource, attrs) 형태로 재구성
+    restored = [
+        _event_from_row((r[2], r[4], datetime.fromisoformat(r[5]).astimezone(timezone(timedelta(hours=9))), r[6], {}))
+        for r in rows
+    ]
+    assert restored == events
+
+
+def test_store_iter_events_normalized_streams_server_side():
+    events = _events(3)
+    db_rows = [
+        (e["case_id"], e["activity"], datetime.fromisoformat(e["timestamp"]), e["resource"], {}) for e in events
+    ]
+    conn = _FakeConn("normalized", db_rows)
+    chunks = list(_store_with(conn).iter_events("t1", "log-1", chunk_size=3))
+    assert [e for chunk in chunks for e in chunk] == events
+    name, sql = conn.statements[-1]
+    assert name is not None  # named cursor = 서버측 커서
+    assert "FROM event_log_events" in sql and "ORDER BY case_id, ts, seq" in sql
+    assert max(conn.fetch_sizes) == 3
+    assert conn.closed
+
+
+def test_store_iter_events_legacy_jsonb_and_missing_log():
+    events = _events(2)
+    conn = _FakeConn("jsonb", [(e,) for e in events])
+    assert [e for chunk in _store_with(conn).iter_events("t1", "log-1", chunk_size=2) for e in chunk] == events
+    assert "jsonb_array_elements" in conn.statements[-1][1]
+
+    missing = _FakeConn(None, [])
+    assert list(_store_with(missing).iter_events("t1", "log-x")) == []
+
+
+def test_ingest_maintains_statistics_incrementally(monkeypatch):
+    svc = EventLogService()
+    svc._store = None
+    header = "case_id,activity,timestamp,resource\n"
+    rows = "".join(f"{e['case_id']},{e['activity']},{e['timestamp']},{e['resource']}\n" for e in reversed(_events()))
+    mapping = {"case_id_column": "case_id", "activity_column": "activity",
+               "timestamp_column": "timestamp", "resource_column": "resource"}
+    out = svc.ingest("t1", {"source_type": "csv", "case_id": "c1", "name": "n", "column_mapping": mapping},
+                     file_bytes=(header + rows).encode())
+
+    def _no_recompute(*_args, **_kwargs):
+        raise AssertionError("statistics should come from the ingest-time accumulator")
+
+    monkeypatch.setattr(svc._stats, "compute_stream", _no_recompute)
+    stats = svc.get_statistics("t1", out["log_id"])
+    assert stats["overview"] == EventLogStatistics.compute(_events())["overview"]
+    assert stats["case_duration"] == EventLogStatistics.compute(_events())["case_duration"]
+
+    svc._get_log("t1", out["log_id"]).updated_at = "2099-01-01T00:00:00+00:00"  # 다른 경로로 변경됨
+    with pytest.raises(AssertionError):
+        svc.get_statistics("t1", out["log_id"])
+
+
+def test_accumulator_incremental_batches_and_sketch():
+    from app.services.event_log_statistics import DurationSketch, EventLogStatsAccumulator
+
+    events = _events(30)
+    expected = EventLogStatistics.compute(events)
+    acc = EventLogStatsAccumulator()
+    for batch in _chunks(sorted(events, key=lambda e: e["timestamp"]), 7):  # 케이스가 배치 경계를 넘나든다
+        acc.add_events(batch)
+    assert acc.in_order and acc.result() == expected
+
+    reordered = EventLogStatsAccumulator()
+    for batch in _chunks(list(reversed(events)), 7):  # 케이스 내 시간 역순 — 변형만 이어 붙일 수 없다
+        reordered.add_events(batch)
+    assert not reordered.in_order
+    assert reordered.result()["overview"] == expected["overview"]
+    assert reordered.result()["case_duration"] == expected["case_duration"]
+    assert reordered.result()["resources"] == expected["resources"]
+
+    sketch = DurationSketch(capacity=100, relative_accuracy=0.01)
+    values = [float(v) for v in range(1, 10_001)]
+    for i in range(0, len(values), 1000):
+        sketch.add_many(values[i:i + 1000])
+    assert sketch.count == 10_000 and sketch.min == 1.0 and sketch.max == 10_000.0
+    for q in (0.25, 0.5, 0.95):
+        exact = 1 + q * 9_999
+        assert abs(sketch.quantile(q) - exact) / exact <= 0.011
@@ -0,0 +1,225 @@
+"""
+CSV/XES 스트리밍 수집 단위 테스트.
+
+고정 크기 배치 파싱(csv.reader / ET.iterparse), 배치 스트림 저장, multipart 업로드,
+그리고 1M 이벤트 파일 수집 시 최대 RSS 회귀를 검증한다.
+"""
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.services.event_log_parser import EventLogParseError, EventLogParser
+from app.services.event_log_service import EventLogDomainError, EventLogService, event_log_service
+
+_AUTH = {"Authorization": "Bearer local-oracle-token"}
+_MAPPING = {
+    "case_id_column": "order_id",
+    "activity_column": "event_type",
+    "timestamp_column": "event_time",
+    "resource_column": "handler",
+    "additional_columns": ["amount"],
+}
+
+
+def _csv(n: int) -> bytes:
+    lines = ["order_id,event_type,event_time,handler,amount"]
+    for i in range(n):
+        lines.append(f"ORD-{i // 3},step{i % 3},2024-01-01T00:{i % 60:02d}:00Z,u{i % 5},{i}")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _RecordingStore:
+    """insert_batches 호출만 기록하는 가짜 저장소."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+        self.raw_rows = 0
+        self.meta: dict = {}
+
+    def insert_batches(self, batches, **meta) -> int:
+        self.meta = meta
+        for raws, events in batches:
+            assert len(raws) == len(events)
+            self.batch_sizes.append(len(events))
+            self.raw_rows += len(raws)
+        return sum(self.batch_sizes)
+
+    def clear(self) -> None:
+        pass
+
+
+# ═══════════════════════════════════════════════════════════════
+# 파서
+# ═══════════════════════════════════════════════════════════════
+
+
+def test_csv_batches_are_fixed_size():
+    parser = EventLogParser()
+    columns, batches = parser.iter_csv_batches(io.BytesIO(_csv(25)), _MAPPING, batch_size=10)
+    sizes = [len(b) for b in batches]
+    assert columns == {"order_id", "event_type", "event_time", "handler", "amount"}
+    assert sizes == [10, 10, 5]
+
+
+def test_csv_header_validated_before_reading_rows():
+    parser = EventLogParser()
+    with pytest.raises(EventLogParseError, match="missing"):
+        parser.iter_csv_batches(io.BytesIO(b"a,b\n1,2\n"), _MAPPING)
+    _, batches = parser.iter_csv_batches(io.BytesIO(_csv(0)), _MAPPING)
+    with pytest.raises(EventLogParseError, match="no rows"):
+        list(batches)
+
+
+def test_xes_iterparse_namespaced_and_late_trace_name():
+    xes = b"""<?xml version="1.0"?>
+    <log xmlns="http://www.xes-standard.org/">
+      <trace>
+        <event>
+          <string key="concept:name" value="A"/>
+          <date key="time:timestamp" value="2024-01-01T00:00:00Z"/>
+          <string key="org:resource" value="r1"/>
+        </event>
+        <string key="concept:name" value="case-late"/>
+      </trace>
+      <trace>
+        <string key="concept:name" value="case-2"/>
+        <event>
+          <string key="concept:name" value="B"/>
+          <date key="time:timestamp" value="2024-01-02T00:00:00Z"/>
+          <string key="org:resource" value="r2"/>
+        </event>
+      </trace>
+    </log>"""
+    batches = list(EventLogParser().iter_xes_batches(io.BytesIO(xes), batch_size=1))
+    rows = [row for batch in batches for row in batch]
+    assert [(r["case_id"], r["concept:name"]) for r in rows] == [("case-late", "A"), ("case-2", "B")]
+    assert len(batches) == 2
+
+
+def test_xes_missing_resource_rejected_after_stream():
+    xes = b"""<log><trace><string key="concept:name" value="c"/>
+      <event><string key="concept:name" value="A"/><date key="time:timestamp" value="2024-01-01T00:00:00Z"/></event>
+    </trace></log>"""
+    with pytest.raises(EventLogParseError, match="org:resource"):
+        list(EventLogParser().iter_xes_batches(io.BytesIO(xes)))
+
+
+# ═══════════════════════════════════════════════════════════════
+# 서비스 → 저장소 배치 스트림
+# ═══════════════════════════════════════════════════════════════
+
+
+def _payload(source_type: str = "csv") -> dict:
+    return {"case_id": "case-1", "name": "big", "source_type": source_type, "column_mapping": _MAPPING}
+
+
+def test_ingest_streams_batches_to_store(monkeypatch: pytest.MonkeyPatch):
+    svc = EventLogService()
+    store = _RecordingStore()
+    svc._store = store
+    parser = svc._parser
+    monkeypatch.setattr(
+        parser, "iter_csv_batches",
+        lambda stream, mapping: EventLogParser.iter_csv_batches(parser, stream, mapping, batch_size=7),
+    )
+    result = svc.ingest("t1", _payload(), file_obj=io.BytesIO(_csv(30)))
+    assert store.batch_sizes == [7, 7, 7, 7, 2]
+    assert store.raw_rows == 30
+    assert store.meta["log_id"] == result["log_id"]
+
+
+def test_ingest_parse_error_mid_stream_is_domain_error():
+    svc = EventLogService()
+    svc._store = _RecordingStore()
+    bad = _csv(3) + b"ORD-9,step0,not-a-date,u1,1\n"
+    with pytest.raises(EventLogDomainError) as exc:
+        svc.ingest("t1", _payload(), file_bytes=bad)
+    assert exc.value.code == "INVALID_TIMESTAMP"
+
+
+def test_ingest_in_memory_keeps_canonical_order():
+    svc = EventLogService()
+    svc._store = None
+    result = svc.ingest("t1", _payload(), file_bytes=_csv(9))
+    record = svc._repo.get("t1", result["log_id"])
+    assert len(record.raw_events) == 9
+    assert record.events == sorted(record.events, key=lambda e: (e["case_id"], e["timestamp"]))
+    assert "amount" in record.source_columns
+
+
+@pytest.mark.asyncio
+async def test_api_multipart_upload_streams_file(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(event_log_service, "_store", None)
+    files = {
+        "metadata": (None, '{"case_id": "case-1", "name": "upload", "source_type": "csv", '
+                           '"column_mapping": {"case_id_column": "order_id", "activity_column": "event_type", '
+                           '"timestamp_column": "event_time"}}'),
+        "file": ("events.csv", _csv(5), "text/csv"),
+    }
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.post("/api/v3/synapse/event-logs/ingest", files=files, headers=_AUTH)
+        assert res.status_code == 202, res.text
+        log_id = res.json()["data"]["log_id"]
+        stats = await ac.get(f"/api/v3/synapse/event-logs/{log_id}/statistics", headers=_AUTH)
+    assert stats.json()["data"]["overview"]["total_events"] == 5
+
+
+# ═══════════════════════════════════════════════════════════════
+# 1M 이벤트 최대 RSS 회귀
+# ═══════════════════════════════════════════════════════════════
+
+_RSS_SCRIPT = textwrap.dedent(
+    """
+    import sys
+    from app.services.event_log_service import EventLogService
+
+    class _Sink:
+        def insert_batches(self, batches, **meta):
+            return sum(len(events) for _, events in batches)
+
+    def _status_kb(field):
+        # ru_maxrss는 fork 이전(pytest 프로세스) 값을 물려받으므로 VmHWM을 사용한다
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+
+    svc = EventLogService()
+    svc._store = _Sink()
+    mapping = {"case_id_column": "order_id", "activity_column": "event_type",
+               "timestamp_column": "event_time", "resource_column": "handler",
+               "additional_columns": ["amount"]}
+    payload = {"case_id": "case-1", "name": "big", "source_type": "csv", "column_mapping": mapping}
+    before = _status_kb("VmRSS")
+    with open(sys.argv[1], "rb") as fh:
+        svc.ingest("t1", payload, file_obj=fh)
+    print(_status_kb("VmHWM") - before)
+    """
+)
+
+
+def test_ingest_1m_events_peak_rss_bounded(tmp_path: Path):
+    if not Path("/proc/self/status").exists():
+        pytest.skip("requires /proc for RSS sampling")
+    path = tmp_path / "events.csv"
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write("order_id,event_type,event_time,handler,amount\n")
+        for i in range(1_000_000):
+            fh.write(f"ORD-{i // 10},step{i % 10},2024-01-01T{(i // 3600) % 24:02d}:{(i // 60) % 60:02d}:{i % 60:02d}Z,u{i % 50},{i}\n")
+    service_dir = Path(__file__).resolve().parents[2]
+    out = subprocess.run(
+        [sys.executable, "-c", _RSS_SCRIPT, str(path)],
+        cwd=service_dir, capture_output=True, text=True, timeout=600, check=True,
+    )
+    growth_mb = int(out.stdout.strip().splitlines()[-1]) / 1024
+    # 리스트로 모두 올리면 1GB 이상 — 배치 스트리밍은 배치 몇 개 분량만 늘어나야 한다
+    assert growth_mb < 64, f"peak RSS grew by {growth_mb:.1f}MB"
@@ -0,0 +1,225 @@
+"""
+GraphProjectorWorker 마이크로 배치 단위 테스트.
+
+규칙별 UNWIND 배치 변환, 배치 커밋 이후 ACK, 배치 실패 시 행 단위 격리,
+Neo4j 연결 오류 시 ACK 보류, 크기/시간 기준 flush를 검증한다.
+마지막 테스트는 로컬 Neo4j 컨테이너(CI 서비스)가 있을 때만 처리량을 측정한다.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+import uuid
+
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from app.workers.graph_projector import (
+    GraphProjectorWorker,
+    _Neo4jUnavailable,
+    to_unwind_cypher,
+)
+from app.workers.projection_rules import PROJECTION_RULES
+
+_STREAM = "axiom:weaver:events"
+
+
+def _kpi_event(i: int, case_id: str = "case-1") -> dict:
+    return {
+        "event_type": "INSIGHT_JOB_COMPLETED",
+        "event_id": f"evt-{i}",
+        "payload": json.dumps({"case_id": case_id, "kpi_node_id": f"kpi-{i % 10}", "result_value": i, "trend": "up"}),
+    }
+
+
+class _FakeNeo4j:
+    def __init__(self, log: list, fail_batch: bool = False, fail_value: int | None = None, down: bool = False):
+        self.log = log
+        self.fail_batch = fail_batch
+        self.fail_value = fail_value
+        self.down = down
+        self.writes: list[tuple[str, dict]] = []
+
+    async def execute_write(self, query: str, params: dict) -> list[dict]:
+        if self.down:
+            raise ServiceUnavailable("connection refused")
+        if "UNWIND $rows" in query and self.fail_batch:
+            raise RuntimeError("batch constraint violation")
+        if params.get("value") is not None and params["value"] == self.fail_value:
+            raise RuntimeError("row constraint violation")
+        self.writes.append((query, params))
+        self.log.append(("write", len(params.get("rows", [params]))))
+        return []
+
+
+class _FakeRedis:
+    def __init__(self, log: list, messages: list[tuple[str, str, dict]] | None = None):
+        self.log = log
+        self.queue = list(messages or [])
+        self.acked: list[str] = []
+
+    async def xgroup_create(self, *args, **kwargs) -> None:
+        pass
+
+    async def xreadgroup(self, groupname, consumername, streams, count, block=None):
+        if "0" in streams.values():
+            return []
+        if not self.queue:
+            await asyncio.sleep((block or 0) / 1000)
+            return []
+        taken, self.queue = self.queue[:count], self.queue[count:]
+        return [(_STREAM, [(msg_id, data) for _, msg_id, data in taken])]
+
+    async def xack(self, stream, group, *msg_ids) -> int:
+        self.log.append(("ack", len(msg_ids)))
+        self.acked.extend(msg_ids)
+        return len(msg_ids)
+
+
+def _worker(neo4j, redis, **kwargs) -> GraphProjectorWorker:
+    return GraphProjectorWorker(redis, neo4j, poll_interval=0.01, **kwargs)
+
+
+# ═══════════════════════════════════════════════════════════════
+# UNWIND 변환
+# ═══════════════════════════════════════════════════════════════
+
+
+def test_to_unwind_cypher_keeps_row_in_scope():
+    cypher = to_unwind_cypher(PROJECTION_RULES["CAUSAL_RELATION_DISCOVERED"][0]["cypher"])
+    assert cypher.startswith("UNWIND $rows AS row\nCALL {\n    WITH row\n")
+    assert "$" not in cypher.replace("$rows", "")
+    assert "WITH row, d" in cypher
+    assert "node_id: row.target_node_id" in cypher
+
+
+def test_to_unwind_cypher_leaves_starts_with_and_ends_with_operators():
+    cypher = to_unwind_cypher(
+        "MATCH (n:Node) WHERE n.name STARTS WITH $prefix AND n.code ends\n  with $suffix "
+        "WITH DISTINCT n SET n.flag = $flag"
+    )
+    assert "n.name STARTS WITH row.prefix" in cypher
+    assert "n.code ends\n  with row.suffix" in cypher
+    assert "WITH DISTINCT row, n SET n.flag = row.flag" in cypher
+
+
+# ═══════════════════════════════════════════════════════════════
+# 배치 처리
+# ═══════════════════════════════════════════════════════════════
+
+
+@pytest.mark.asyncio
+async def test_batch_groups_rows_per_rule_and_acks_after_commit():
+    log: list = []
+    neo4j, redis = _FakeNeo4j(log), _FakeRedis(log)
+    worker = _worker(neo4j, redis)
+    process = {"event_type": "PROCESS_INITIATED", "payload": json.dumps({"case_id": "c", "process_node_id": "p"})}
+    messages = [(_STREAM, f"{i}-0", _kpi_event(i)) for i in range(5)]
+    messages += [(_STREAM, "5-0", process), (_STREAM, "6-0", {"event_type": "UNMAPPED"})]
+
+    await worker._project_batch(messages)
+
+    # INSIGHT 규칙 1개(5행) + PROCESS_INITIATED 규칙 2개(각 1행) = 쓰기 트랜잭션 3회
+    assert [len(p["rows"]) for _, p in neo4j.writes] == [5, 1, 1]
+    assert [row["value"] for row in neo4j.writes[0][1]["rows"]] == [0, 1, 2, 3, 4]
+    assert neo4j.writes[2][1]["rows"][0]["event_id"]  # $event_id 자동 주입
+    assert log[-1] == ("ack", 7) and all(entry[0] == "write" for entry in log[:-1])
+    assert worker.stats == {"projected": 7, "skipped": 1, "failed": 0, "batches": 1}
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_row_by_row():
+    log: list = []
+    neo4j, redis = _FakeNeo4j(log, fail_batch=True, fail_value=2), _FakeRedis(log)
+    worker = _worker(neo4j, redis)
+
+    await worker._project_batch([(_STREAM, f"{i}-0", _kpi_event(i)) for i in range(4)])
+
+    assert [p["value"] for _, p in neo4j.writes] == [0, 1, 3]
+    assert worker.stats["projected"] == 3 and worker.stats["failed"] == 1
+    assert redis.acked == ["0-0", "1-0", "2-0", "3-0"]
+
+
+@pytest.mark.asyncio
+async def test_connection_error_leaves_batch_unacked():
+    log: list = []
+    redis = _FakeRedis(log)
+    worker = _worker(_FakeNeo4j(log, down=True), redis)
+    with pytest.raises(_Neo4jUnavailable):
+        await worker._project_batch([(_STREAM, "0-0", _kpi_event(0))])
+    assert redis.acked == []
+
+
+@pytest.mark.asyncio
+async def test_start_flushes_by_size_then_by_interval():
+    log: list = []
+    messages = [(_STREAM, f"{i}-0", _kpi_event(i)) for i in range(7)]
+    neo4j, redis = _FakeNeo4j(log), _FakeRedis(log, messages)
+    worker = _worker(neo4j, redis, batch_size=3, flush_interval=0.05)
+
+    task = asyncio.create_task(worker.start())
+    for _ in range(200):
+        if len(redis.acked) == 7:
+            break
+        await asyncio.sleep(0.01)
+    await worker.stop()
+    await asyncio.wait_for(task, timeout=2)
+
+    assert [len(p["rows"]) for _, p in neo4j.writes] == [3, 3, 1]
+    assert worker.stats["batches"] == 3
+
+
+# ═══════════════════════════════════════════════════════════════
+# 로컬 Neo4j 처리량 (CI neo4j 서비스)
+# ═══════════════════════════════════════════════════════════════
+
+
+@pytest.mark.asyncio
+async def test_batched_projection_throughput_local_neo4j():
+    from app.core.neo4j_client import Neo4jClient
+
+    client = Neo4jClient()
+    try:
+        await asyncio.wait_for(client.driver.verify_connectivity(), timeout=3)
+    except Exception:
+        await client.close()
+        pytest.skip("local Neo4j not reachable")
+
+    events = int(os.getenv("GRAPH_PROJECTOR_BENCH_EVENTS", "1000"))
+    case_id = f"bench-{uuid.uuid4().hex[:8]}"
+    try:
+        await client.execute_write(
+            "UNWIND range(0, 9) AS i CREATE (:Kpi {case_id: $case_id, node_id: 'kpi-' + toString(i)})",
+            {"case_id": case_id},
+        )
+        messages = [(_STREAM, f"{i}-0", _kpi_event(i, case_id)) for i in range(events)]
+        log: list = []
+
+        sequential = _worker(client, _FakeRedis(log), batch_size=1)
+        start = time.perf_counter()
+        for message in messages:
+            await sequential._project_batch([message])
+        sequential_eps = events / (time.perf_counter() - start)
+
+        batched = _worker(client, _FakeRedis(log), batch_size=500)
+        start = time.perf_counter()
+        for i in range(0, events, 500):
+            await batched._project_batch(messages[i:i + 500])
+        batched_eps = events / (time.perf_counter() - start)
+
+        records = await client.execute_read(
+            "MATCH (k:Kpi {case_id: $case_id}) RETURN k.node_id AS id, k.latest_value AS v ORDER BY id",
+            {"case_id": case_id},
+        )
+        # 행 순서대로 적용되므로 노드마다 마지막 이벤트 값이 남는다
+        assert {r["id"]: r["v"] for r in records} == {
+            f"kpi-{k}": max(i for i in range(events) if i % 10 == k) for k in range(10)
+        }
+        assert batched.stats["projected"] == events and batched.stats["failed"] == 0
+        print(f"graph projector: sequential={sequential_eps:.0f} ev/s, batched={batched_eps:.0f} ev/s")
+        assert batched_eps > sequential_eps * 2
+    finally:
+        await client.execute_write("MATCH (k:Kpi {case_id: $case_id}) DETACH DELETE k", {"case_id": case_id})
+        await client.close()
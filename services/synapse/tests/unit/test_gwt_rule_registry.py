@@ -0,0 +1,206 @@
+"""
+GWT 엔진 룰 레지스트리 / 표현식 컴파일 / 일괄 조회 단위 테스트.
+
+- compile_expression: 표현식별 ast.parse 1회, 금지 구문은 컴파일 시점에 거부
+- GWTRuleRegistry: 버전 토큰, TTL, GWTRuleManager 쓰기 시 무효화
+- GWTEngine._load_context_states: state/relation 조건 값을 Cypher 한 번으로 조회하고
+  개별 조회 경로와 같은 평가 결과를 내는지 검증한다.
+"""
+from __future__ import annotations
+
+import json
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.gwt_engine import (
+    GWTCondition,
+    GWTEngine,
+    GWTEvalContext,
+    GWTRule,
+    GWTRuleManager,
+    GWTRuleRegistry,
+    compile_expression,
+)
+
+
+class _FakeGraph:
+    """GWT 엔진이 보내는 읽기 쿼리만 해석하는 인메모리 Neo4j 대역."""
+
+    def __init__(self, rules: list[dict]) -> None:
+        self.rules = rules
+        self.nodes = {
+            "Process": {"p1": {"node_id": "p1", "status": "PENDING", "priority": 7}},
+            "Kpi": {"k1": {"node_id": "k1", "value": 42}},
+        }
+        self.edges = [("Process", "p1", "INFLUENCES", "Kpi", "k1")]
+        self.queries: list[str] = []
+
+    def _rel_vals(self, src: str, rel: str, tgt: str, field: str, source_id: str) -> list[dict]:
+        return [
+            {"val": self.nodes[t][tid].get(field)}
+            for s, sid, r, t, tid in self.edges
+            if (s, r, t) == (src, rel, tgt) and sid == source_id
+        ][:1]
+
+    async def execute_read(self, query: str, params: dict) -> list[dict]:
+        self.queries.append(query)
+        if "MATCH (a:ActionType" in query:
+            return [{"a": r} for r in self.rules]
+        if "CALL {" in query:
+            row: dict = {}
+            for label, ids, col in re.findall(r"MATCH \(n:(\w+) [^)]*\) (?:WHERE n.node_id IN \$(\w+) )?RETURN .*? AS (s\d+)", query):
+                wanted = params.get(ids) if ids else None
+                row[col] = [
+                    {"id": nid, "props": props}
+                    for nid, props in self.nodes.get(label, {}).items()
+                    if wanted is None or nid in wanted
+                ]
+            for src, rel, tgt, field, col in re.findall(r"MATCH \(a:(\w+) [^)]*\)-\[:(\w+)\]->\(b:(\w+) [^)]*\) .*?b\.(\w+)}\)\[\.\.1\] AS (r\d+)", query):
+                row[col] = self._rel_vals(src, rel, tgt, field, params["source_id"])
+            return [row]
+        m = re.search(r"\(a:(\w+).*-\[r:(\w+)\]->\s*\(b:(\w+).*RETURN b\.(\w+) AS val", query, re.S)
+        if m:
+            return self._rel_vals(*m.groups(), params["source_id"])
+        m = re.search(r"MATCH \(n:(\w+).*RETURN n\.(\w+) AS val", query, re.S)
+        props = self.nodes.get(m.group(1), {}).get(params["node_id"])
+        return [] if props is None else [{"val": props.get(m.group(2))}]
+
+
+def _rule_node(rule_id: str, given: list[dict], priority: int = 100) -> dict:
+    return {
+        "id": rule_id, "name": rule_id, "case_id": "case-1", "tenant_id": "t1",
+        "when_event": "ORDER_PLACED", "given_conditions": json.dumps(given),
+        "then_actions": json.dumps([{"op": "EMIT", "event_type": f"{rule_id}_FIRED", "payload": {}}]),
+        "enabled": True, "priority": priority, "version": 1,
+    }
+
+
+_RULES = [
+    _rule_node("state-ok", [{"type": "state", "node_layer": "process", "field": "status", "op": "==", "value": "PENDING"}]),
+    _rule_node("state-miss", [{"type": "state", "node_layer": "Process", "field": "status", "op": "==", "value": "$payload.other"}]),
+    _rule_node("relation-ok", [{"type": "relation", "source_layer": "Process", "rel_type": "INFLUENCES",
+                                "target_layer": "Kpi", "field": "value", "op": ">", "value": 40}]),
+    _rule_node("relation-none", [{"type": "relation", "source_layer": "Process", "rel_type": "CAUSES",
+                                  "target_layer": "Kpi", "field": "value", "op": ">", "value": 0}]),
+    _rule_node("expr", [{"type": "expression", "value": "state.p1.priority > 5 and payload.amount >= 100"}]),
+    _rule_node("bad", [{"type": "state", "node_layer": "Kpi", "field": "a}//inject", "op": "==", "value": "x"}]),
+]
+
+_PAYLOAD = {"source_node_id": "p1", "other": "p-missing", "amount": 150}
+
+
+async def _handle(engine: GWTEngine) -> list[str]:
+    results = await engine.handle_event("ORDER_PLACED", "agg-1", dict(_PAYLOAD), "case-1", "t1")
+    return [r.rule_id for r in results]
+
+
+# ═══════════════════════════════════════════════════════════════
+# 표현식 컴파일
+# ═══════════════════════════════════════════════════════════════
+
+
+def test_compile_expression_parses_once_per_expression():
+    compile_expression.cache_clear()
+    with patch("app.services.gwt_engine.ast.parse", wraps=__import__("ast").parse) as parse:
+        fn = compile_expression("payload.amount * 2 > limit")
+        for amount in range(5):
+            fn({"payload": {"amount": amount}, "limit": 4})
+        assert compile_expression("payload.amount * 2 > limit") is fn
+    assert parse.call_count == 1
+    assert fn({"payload": {"amount": 3}, "limit": 4}) is True
+
+
+def test_compile_expression_rejects_without_variables():
+    with pytest.raises(ValueError, match="허용되지 않는 표현식 노드"):
+        compile_expression("x > 0 or len(y)")
+    fn = compile_expression("missing == 1")
+    with pytest.raises(ValueError, match="알 수 없는 변수"):
+        fn({})
+
+
+# ═══════════════════════════════════════════════════════════════
+# 룰 레지스트리
+# ═══════════════════════════════════════════════════════════════
+
+
+def test_registry_version_token_and_ttl():
+    registry = GWTRuleRegistry(ttl_sec=60)
+    token = registry.version("t1")
+    registry.invalidate("t1")
+    assert registry.store("t1", token, "c", "E", []) is False
+    assert registry.store("t1", registry.version("t1"), "c", "E", []) is True
+    assert registry.get("t1", "c", "E") == []
+    assert registry.get("t1", "c", "OTHER") is None
+
+    expired = GWTRuleRegistry(ttl_sec=0)
+    expired.store("t1", expired.version("t1"), "c", "E", [])
+    assert expired.get("t1", "c", "E") is None
+
+
+@pytest.mark.asyncio
+async def test_engine_reuses_validated_rules_until_manager_write():
+    graph = _FakeGraph(_RULES)
+    registry = GWTRuleRegistry(ttl_sec=60)
+    engine = GWTEngine(graph, AsyncMock(), dry_run=True, rule_registry=registry)
+
+    await _handle(engine)
+    await _handle(engine)
+    assert sum("MATCH (a:ActionType" in q for q in graph.queries) == 1
+    assert all(rule.id != "bad" for rule in registry.get("t1", "case-1", "ORDER_PLACED"))
+
+    manager = GWTRuleManager(AsyncMock(execute_write=AsyncMock(return_value=[{"id": "state-ok", "tenant_id": "t1"}])), registry)
+    await manager.update_rule("state-ok", {"priority": 1})
+    assert registry.get("t1", "case-1", "ORDER_PLACED") is None
+    await _handle(engine)
+    assert sum("MATCH (a:ActionType" in q for q in graph.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_manager_delete_without_tenant_invalidates_all():
+    registry = GWTRuleRegistry(ttl_sec=60)
+    for tenant in ("t1", "t2"):
+        registry.store(tenant, registry.version(tenant), "c", "E", [])
+    manager = GWTRuleManager(AsyncMock(execute_write=AsyncMock(return_value=[{"deleted": 1}])), registry)
+    assert await manager.delete_rule("r1") is True
+    assert registry.get("t1", "c", "E") is None and registry.get("t2", "c", "E") is None
+
+
+# ═══════════════════════════════════════════════════════════════
+# 일괄 조회
+# ═══════════════════════════════════════════════════════════════
+
+
+@pytest.mark.asyncio
+async def test_batched_context_matches_per_condition_queries():
+    graph = _FakeGraph(_RULES)
+    engine = GWTEngine(graph, AsyncMock(), dry_run=True)
+    fired = await _handle(engine)
+    assert fired == ["state-ok", "relation-ok", "expr"]
+    # 룰 조회 1회 + 상태/관계 일괄 조회 1회
+    assert len(graph.queries) == 2
+    assert "CALL {" in graph.queries[1]
+
+    # 미리 읽지 않은 컨텍스트로 개별 쿼리 경로를 타도 같은 결과
+    unbatched = GWTEngine(graph, AsyncMock(), dry_run=True)
+    ctx = GWTEvalContext("ORDER_PLACED", "agg-1", "p1", dict(_PAYLOAD), "case-1", "t1")
+    ctx.node_states["p1"] = graph.nodes["Process"]["p1"]
+    rules = GWTEngine._prepare_rules([unbatched._parse_rule(r) for r in _RULES])
+    matched = [rule.id for rule in rules if await unbatched.evaluate_given(rule, ctx)]
+    assert sorted(matched) == sorted(fired)
+
+
+@pytest.mark.asyncio
+async def test_unprefetched_state_condition_falls_back_to_query():
+    graph = _FakeGraph([])
+    engine = GWTEngine(graph, AsyncMock(), dry_run=True)
+    ctx = GWTEvalContext("E", "agg", "p1", {}, "case-1", "t1")
+    ctx.layer_states["Process"] = {"p1": None}
+    cond = GWTCondition(type="state", node_layer="Process", field="status", op="==", value="PENDING")
+    rule = GWTRule("r", "r", "case-1", "t1", [cond], "E", [])
+    assert await engine.evaluate_given(rule, ctx) is False
+    assert graph.queries == []
+    ctx.layer_states.clear()
+    assert await engine.evaluate_given(rule, ctx) is True
+    assert len(graph.queries) == 1
@@ -0,0 +1,96 @@
+"""MetadataGraphService.save_extracted_catalog 증분 저장 — 현재 그래프와 diff한 변경분만 한 트랜잭션으로 기록."""
+from unittest.mock import patch
+
+import pytest
+
+from app.services import metadata_graph_service as mod
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __aiter__(self):
+        self._it = iter(self._rows)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def consume(self):
+        return None
+
+
+class _Session:
+    def __init__(self, current_rows, log):
+        self._rows, self._log = current_rows, log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def run(self, query, params):
+        assert query == mod._CATALOG_CURRENT_QUERY
+        return _Result(self._rows)
+
+    async def execute_write(self, work):
+        self._log.append([])
+
+        class _Tx:
+            async def run(_self, query, params):
+                self._log[-1].append((query, params))
+                return _Result([])
+
+        await work(_Tx())
+
+
+class _Client:
+    def __init__(self, current_rows):
+        self.current_rows, self.transactions = current_rows, []
+
+    def session(self):
+        return _Session(self.current_rows, self.transactions)
+
+
+@pytest.mark.asyncio
+async def test_catalog_upsert_writes_only_diff_in_single_transaction():
+    current = [
+        {"schema_name": "public", "table_name": "orders", "column_name": "id", "dtype": "integer", "nullable": False},
+        {"schema_name": "public", "table_name": "orders", "column_name": "memo", "dtype": "text", "nullable": True},
+        {"schema_name": "public", "table_name": "legacy", "column_name": "id", "dtype": "integer", "nullable": False},
+    ]
+    catalog = {"public": {
+        "orders": [{"name": "id", "data_type": "integer", "nullable": False},
+                   {"name": "memo", "data_type": "varchar", "nullable": True}],
+        "customers": [{"name": f"c{i}", "data_type": "text"} for i in range(1500)],
+    }}
+    client = _Client(current)
+    with patch.object(mod, "neo4j_client", client):
+        result = await mod.MetadataGraphService().save_extracted_catalog("t1", "ds", catalog)
+
+    assert len(client.transactions) == 1
+    queries = [q for q, _ in client.transactions[0]]
+    assert queries.count(mod._CATALOG_UPSERT_COLUMNS) == 2          # 1,501행 → 1,000행 청크 2개
+    assert queries.count(mod._CATALOG_DELETE_TABLES) == 1 and mod._CATALOG_ADD_SCHEMAS not in queries
+    assert result["diff"] == {"schemas_added": 0, "schemas_removed": 0, "tables_added": 1, "tables_removed": 1,
+                              "columns_added": 1500, "columns_changed": 1, "columns_removed": 1}
+    assert result["nodes_created"] == 1501 and result["nodes_deleted"] == 2
+    # 유지되는 스키마도 HAS_SCHEMA를 다시 MERGE — DataSource를 지웠다 다시 만든 경우 대비
+    assert (mod._CATALOG_LINK_SCHEMAS, {"tid": "t1", "ds": "ds", "rows": ["public"]}) in client.transactions[0]
+
+
+@pytest.mark.asyncio
+async def test_delete_datasource_removes_catalog_subtree_in_single_transaction():
+    client = _Client([])
+    with patch.object(mod, "neo4j_client", client):
+        await mod.MetadataGraphService().delete_datasource("ds", "t1")
+
+    assert client.transactions == [[(q, {"tid": "t1", "ds": "ds"}) for q in mod._DATASOURCE_DELETE_STATEMENTS]]
+    assert [q.split(":")[1].split(" ")[0] for q in mod._DATASOURCE_DELETE_STATEMENTS] == [
+        "Column", "Table", "Schema", "DataSource",
+    ]
@@ -0,0 +1,131 @@
+"""
+SynapseRelayWorker 파이프라인 릴레이 단위 테스트.
+
+asyncpg 풀/커넥션과 Redis 파이프라인을 가짜로 대체해
+배치당 DB·Redis 왕복 횟수, 실패 행 상태 전이, 가득 찬 배치의 연속 처리를 검증한다.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+import app.events.outbox as outbox
+from app.events.outbox import STREAM_KEY, SynapseRelayWorker
+
+
+def _row(i: int, retry_count: int = 0) -> dict:
+    return {
+        "id": f"evt-{i}", "event_type": "ONTOLOGY_UPDATED", "aggregate_type": "Ontology",
+        "aggregate_id": f"o-{i}", "tenant_id": None, "payload": f'{{"n": {i}}}',
+        "created_at": datetime.now(timezone.utc), "retry_count": retry_count,
+    }
+
+
+class _FakeConn:
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.statements: list[str] = []
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+    async def fetch(self, sql: str, limit: int):
+        self.statements.append("claim")
+        taken, self.rows = self.rows[:limit], self.rows[limit:]
+        return taken
+
+    async def execute(self, sql: str, *args):
+        self.statements.append("mark_failed" if "unnest(" in sql else "mark_published")
+        self.last_args = args
+
+
+class _FakePool:
+    def __init__(self, conn: _FakeConn) -> None:
+        self.conn = conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+class _FakeRedis:
+    def __init__(self, reject: set[str] | None = None) -> None:
+        self.reject = reject or set()
+        self.added: list[tuple[str, dict]] = []
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True):
+        redis, queued = self, []
+
+        class _Pipe:
+            def xadd(self, stream, fields, maxlen=None, approximate=True):
+                queued.append((stream, fields))
+
+            async def execute(self, raise_on_error=True):
+                redis.round_trips += 1
+                replies = []
+                for stream, fields in queued:
+                    if fields["event_id"] in redis.reject:
+                        replies.append(RuntimeError("rejected"))
+                    else:
+                        redis.added.append((stream, fields))
+                        replies.append("1-0")
+                return replies
+
+        return _Pipe()
+
+
+@pytest.fixture
+def wire(monkeypatch: pytest.MonkeyPatch):
+    def _wire(rows: list[dict], redis: _FakeRedis) -> _FakeConn:
+        conn = _FakeConn(rows)
+
+        async def _get_pool():
+            return _FakePool(conn)
+
+        monkeypatch.setattr(outbox, "_get_pool", _get_pool)
+        monkeypatch.setattr("app.core.redis_client.get_redis", lambda: redis)
+        return conn
+
+    return _wire
+
+
+@pytest.mark.asyncio
+async def test_publish_once_uses_one_pipeline_and_bulk_updates(wire):
+    redis = _FakeRedis(reject={"evt-3"})
+    conn = wire([_row(i) for i in range(5)], redis)
+
+    result = await SynapseRelayWorker(max_batch=10)._publish_once()
+
+    assert result == {"published": 4, "failed": 1}
+    assert redis.round_trips == 1 and {s for s, _ in redis.added} == {STREAM_KEY}
+    assert redis.added[0][1]["tenant_id"] == "" and redis.added[0][1]["payload"] == '{"n": 0}'
+    assert conn.transactions == 1
+    assert conn.statements == ["claim", "mark_published", "mark_failed"]
+    assert conn.last_args[:3] == (["evt-3"], ["FAILED"], [1])
+
+
+@pytest.mark.asyncio
+async def test_run_drains_full_batches_before_sleeping(wire, monkeypatch: pytest.MonkeyPatch):
+    redis = _FakeRedis()
+    conn = wire([_row(i) for i in range(25)], redis)
+    worker = SynapseRelayWorker(poll_interval=60, max_batch=10)
+    sleeps: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        worker.shutdown()
+
+    monkeypatch.setattr(outbox.asyncio, "sleep", _sleep)
+    await asyncio.wait_for(worker.run(), timeout=2)
+
+    # 10 + 10 + 5: 가득 찬 두 배치는 대기 없이 이어서 처리하고 마지막 부분 배치 뒤에만 대기
+    assert len(redis.added) == 25
+    assert conn.statements.count("claim") == 3
+    assert sleeps == [60]
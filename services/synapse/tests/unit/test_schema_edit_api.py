@@ -77,6 +77,10 @@ def setup_function():
             self._ensure_tenant(tenant_id)
             return self.tables[tenant_id].get(table_name)
 
+        def get_tables(self, tenant_id, table_names):
+            self._ensure_tenant(tenant_id)
+            return [dict(self.tables[tenant_id][n]) for n in table_names if n in self.tables[tenant_id]]
+
         def update_table_description(self, tenant_id, table_name, description):
             self._ensure_tenant(tenant_id)
             row = self.tables[tenant_id].get(table_name)
@@ -207,3 +211,21 @@ async def test_schema_edit_full_flow(ac: AsyncClient):
     deleted = await ac.delete(f"/api/v3/synapse/schema-edit/relationships/{rel_id}", headers=AUTH)
     assert deleted.status_code == 200
     assert deleted.json()["data"]["deleted"] is True
+
+
+@pytest.mark.asyncio
+async def test_schema_edit_bulk_table_details(ac: AsyncClient):
+    res = await ac.post(
+        "/api/v3/synapse/schema-edit/tables/details",
+        json={"tables": ["processes", "organizations", "ghost", "processes"]},
+        headers=AUTH,
+    )
+    assert res.status_code == 200
+    data = res.json()["data"]
+    assert sorted(t["name"] for t in data["tables"]) == ["organizations", "processes"]
+    assert data["missing"] == ["ghost"]
+    processes = next(t for t in data["tables"] if t["name"] == "processes")
+    assert len(processes["columns"]) == 4
+
+    empty = await ac.post("/api/v3/synapse/schema-edit/tables/details", json={"tables": []}, headers=AUTH)
+    assert empty.status_code == 400
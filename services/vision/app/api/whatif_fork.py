@@ -159,6 +159,7 @@ class SimulationEventResponse(BaseModel):
     payload: Any = None
     source: str
     source_rule_id: str | None = None
+    state_delta: Any = None
     state_snapshot: Any = None
     created_at: str | None = None
 
@@ -364,7 +365,7 @@ async def get_branch_events(
 
     # datetime/JSONB 직렬화
     for evt in events:
-        for json_field in ("payload", "state_snapshot"):
+        for json_field in ("payload", "state_delta", "state_snapshot"):
             val = evt.get(json_field)
             if isinstance(val, str):
                 try:
@@ -39,6 +39,7 @@ CREATE TABLE IF NOT EXISTS vision.simulation_branches (
 
     -- 결과
     result_summary  JSONB,                               -- KPI 델타, 영향도 요약
+    state_overlay   JSONB,                               -- 최종 오버레이 diff {node_id: {field: {base, value}}}
     event_count     INTEGER DEFAULT 0,                   -- 시뮬레이션 이벤트 수
 
     -- 감사
@@ -80,7 +81,9 @@ CREATE TABLE IF NOT EXISTS vision.simulation_events (
     source          TEXT NOT NULL DEFAULT 'intervention', -- intervention | gwt_rule | cascade
     source_rule_id  TEXT,                                -- GWT 룰에 의해 생성된 경우 룰 ID
 
-    -- 이 이벤트 적용 후 상태 스냅샷
+    -- 이 이벤트 처리 중 적용된 상태 변경 {node_id: {field: new_value}}
+    state_delta     JSONB,
+    -- 체크포인트 이벤트에만: 처리 직후 누적 오버레이 (기준 상태 대비 쓰기 전체)
     state_snapshot  JSONB,                               -- {node_id: {field: value, ...}, ...}
 
     created_at      TIMESTAMPTZ NOT NULL DEFAULT now(),
@@ -92,6 +95,15 @@ CREATE TABLE IF NOT EXISTS vision.simulation_events (
 -- 브랜치별 이벤트 순서 조회 인덱스
 CREATE INDEX IF NOT EXISTS idx_sim_event_branch_seq
     ON vision.simulation_events (branch_id, sequence_number);
+
+-- 델타 + 체크포인트 저장 방식 (기존 테이블 마이그레이션)
+ALTER TABLE vision.simulation_branches ADD COLUMN IF NOT EXISTS state_overlay JSONB;
+ALTER TABLE vision.simulation_events ADD COLUMN IF NOT EXISTS state_delta JSONB;
+
+-- 체크포인트 이벤트만 빠르게 찾기 위한 부분 인덱스
+CREATE INDEX IF NOT EXISTS idx_sim_event_checkpoint
+    ON vision.simulation_events (branch_id, sequence_number)
+    WHERE state_snapshot IS NOT NULL;
 """
 
 
@@ -12,13 +12,18 @@ BusinessOS 패턴을 Axiom Vision 서비스에 구현:
 - Fork: 이벤트 기반 재생 (결정적, 룰 의존)
 - 둘 다 유지하되 사용자가 모드 선택 가능
 
+성능 구조:
+- 룰은 when_event 기준 인덱스로 묶어 이벤트마다 해당 타입 룰만 평가
+- 시뮬레이션 상태는 기준 상태를 복사하지 않는 copy-on-write 오버레이(_CowState)
+- 이벤트별로 전체 스냅샷 대신 상태 델타를 저장하고, CHECKPOINT_INTERVAL마다
+  누적 오버레이 체크포인트를 남겨 임의 시퀀스의 상태를 재구성한다
+
 DB: psycopg2 동기 (Vision 서비스 패턴 준수)
 Neo4j: neo4j AsyncDriver (온톨로지 스냅샷 + ActionType 룰 로드)
 """
 from __future__ import annotations
 
 import asyncio
-import copy
 import json
 import logging
 import os
@@ -40,6 +45,9 @@ ALLOWED_LABELS = {
     "Entity", "ActionType", "Policy",
 }
 
+# 체크포인트 간격 (이벤트 수) — 이 간격마다 누적 오버레이 전체를 state_snapshot에 저장
+CHECKPOINT_INTERVAL = int(os.getenv("VISION_SIM_CHECKPOINT_INTERVAL", "500"))
+
 # ── 비교 연산자 매핑 ──────────────────────────────────────────── #
 _OPS = {
     "==": lambda a, b: a == b,
@@ -98,6 +106,115 @@ class ForkResult:
         }
 
 
+# ── Copy-on-write 시뮬레이션 상태 ─────────────────────────────── #
+
+def _node_layer(props: dict[str, Any]) -> str:
+    return str(props.get("layer", props.get("label", ""))).lower()
+
+
+class _CowState:
+    """기준 상태(base) 위에 쓰기만 기록하는 copy-on-write 오버레이.
+
+    base는 읽기 전용으로 공유하고 절대 수정하지 않는다 (deepcopy 불필요).
+    필드 값은 통째로 교체만 하므로 노드 단위 얕은 병합으로 충분하다.
+    """
+
+    def __init__(self, base: dict[str, dict[str, Any]]) -> None:
+        self._base = base
+        self._overlay: dict[str, dict[str, Any]] = {}
+        self._merged: dict[str, dict[str, Any]] = {}
+        self._layers: dict[str, list[str]] | None = None
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._overlay or node_id in self._base
+
+    def node(self, node_id: str) -> dict[str, Any]:
+        """병합된 노드 속성 (읽기 전용으로 다룰 것)."""
+        if node_id not in self._overlay:
+            return self._base.get(node_id, {})
+        merged = self._merged.get(node_id)
+        if merged is None:
+            merged = {**self._base.get(node_id, {}), **self._overlay[node_id]}
+            self._merged[node_id] = merged
+        return merged
+
+    def get_field(self, node_id: str, field_name: str) -> Any:
+        changed = self._overlay.get(node_id)
+        if changed is not None and field_name in changed:
+            return changed[field_name]
+        return self._base.get(node_id, {}).get(field_name)
+
+    def set_field(self, node_id: str, field_name: str, value: Any) -> None:
+        is_new = node_id not in self
+        # 계층 색인은 새 노드이거나 layer/label 필드가 바뀔 때만 갱신
+        relayer = self._layers is not None and (is_new or field_name in ("layer", "label"))
+        before = _node_layer(self.node(node_id)) if relayer and not is_new else None
+        self._overlay.setdefault(node_id, {})[field_name] = value
+        self._merged.pop(node_id, None)
+        if relayer:
+            after = _node_layer(self.node(node_id))
+            if before != after:
+                if before is not None:
+                    self._layers[before].remove(node_id)
+                self._layers.setdefault(after, []).append(node_id)
+
+    def items(self):
+        for node_id in self._base:
+            yield node_id, self.node(node_id)
+        for node_id in self._overlay:
+            if node_id not in self._base:
+                yield node_id, self.node(node_id)
+
+    def nodes_in_layer(self, layer: str) -> list[str]:
+        """계층(layer/label, 소문자)별 노드 ID — 첫 호출 시 한 번 색인한다."""
+        if self._layers is None:
+            self._layers = {}
+            for node_id, props in self.items():
+                self._layers.setdefault(_node_layer(props), []).append(node_id)
+        return self._layers.get(layer.lower(), [])
+
+    def changes(self) -> dict[str, dict[str, Any]]:
+        """기준 상태 대비 기록된 쓰기 {node_id: {field: value}} (체크포인트용 사본)."""
+        return {node_id: dict(fields) for node_id, fields in self._overlay.items()}
+
+    def diff(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """실제로 값이 바뀐 필드만 {node_id: {field: {"base": old, "value": new}}}."""
+        out: dict[str, dict[str, dict[str, Any]]] = {}
+        for node_id, fields in self._overlay.items():
+            base = self._base.get(node_id, {})
+            for field_name, value in fields.items():
+                old = base.get(field_name)
+                if field_name in base and old == value:
+                    continue
+                out.setdefault(node_id, {})[field_name] = {"base": old, "value": value}
+        return out
+
+    def materialize(self) -> dict[str, dict[str, Any]]:
+        """최종 상태 dict (쓰기가 있었던 노드만 새 dict, 나머지는 base 공유)."""
+        return {node_id: self.node(node_id) for node_id, _ in self.items()}
+
+
+def replay_overlay(
+    checkpoint: dict[str, dict[str, Any]] | None,
+    deltas: list[dict[str, dict[str, Any]] | None],
+) -> dict[str, dict[str, Any]]:
+    """체크포인트 오버레이에 이후 이벤트 델타를 순서대로 적용해 오버레이를 재구성한다."""
+    overlay = {node_id: dict(fields) for node_id, fields in (checkpoint or {}).items()}
+    for delta in deltas:
+        for node_id, fields in (delta or {}).items():
+            overlay.setdefault(node_id, {}).update(fields)
+    return overlay
+
+
+@dataclass
+class _SimulationRun:
+    """_simulate 결과 (I/O 이전 단계)."""
+    state: _CowState
+    events: list[dict]
+    depth: int
+    converged: bool
+
+
 # ── 경량 GWT 룰 평가기 (인프로세스) ──────────────────────────── #
 
 @dataclass
@@ -185,6 +302,27 @@ class _LightweightGWTEvaluator:
         self._driver = neo4j_driver
         # 로드된 룰 캐시 (cache_key → (timestamp, list[_ActionRule]))
         self._rules_cache: dict[str, tuple[float, list[_ActionRule]]] = {}
+        # when_event 인덱스 캐시 (cache_key → (룰 리스트 id, 인덱스))
+        self._index_cache: dict[str, tuple[int, dict[str, list[_ActionRule]]]] = {}
+
+    @staticmethod
+    def index_rules(rules: list[_ActionRule]) -> dict[str, list[_ActionRule]]:
+        """when_event → 룰 리스트 (우선순위 순서 유지)."""
+        index: dict[str, list[_ActionRule]] = {}
+        for rule in rules:
+            if rule.enabled:
+                index.setdefault(rule.when_event, []).append(rule)
+        return index
+
+    async def load_rule_index(self, case_id: str, tenant_id: str) -> dict[str, list[_ActionRule]]:
+        """load_rules 결과의 when_event 인덱스 — 룰 캐시가 갱신될 때만 다시 만든다."""
+        rules = await self.load_rules(case_id, tenant_id)
+        cache_key = f"{case_id}:{tenant_id}"
+        cached = self._index_cache.get(cache_key)
+        if cached is None or cached[0] != id(rules):
+            cached = (id(rules), self.index_rules(rules))
+            self._index_cache[cache_key] = cached
+        return cached[1]
 
     async def load_rules(self, case_id: str, tenant_id: str) -> list[_ActionRule]:
         """Neo4j에서 해당 case+tenant의 활성 ActionType 노드를 조회하여 룰로 변환."""
@@ -242,7 +380,7 @@ class _LightweightGWTEvaluator:
         self,
         rule: _ActionRule,
         event_type: str,
-        sim_state: dict[str, dict[str, Any]],
+        sim_state: _CowState,
         trigger_payload: dict,
     ) -> _RuleMatchResult:
         """단일 룰을 인메모리 상태에 대해 평가한다.
@@ -273,9 +411,9 @@ class _LightweightGWTEvaluator:
                 # 대상 노드 ID 해석 ($trigger.source_node_id → 실제 ID)
                 target = self._resolve_target(action.target_node, trigger_payload)
                 if target and target in sim_state and action.field_name:
-                    old_value = sim_state[target].get(action.field_name)
+                    old_value = sim_state.get_field(target, action.field_name)
                     new_value = self._resolve_value(action.value, trigger_payload)
-                    sim_state[target][action.field_name] = new_value
+                    sim_state.set_field(target, action.field_name, new_value)
                     state_changes.append({
                         "node_id": target,
                         "field": action.field_name,
@@ -308,18 +446,17 @@ class _LightweightGWTEvaluator:
     def _evaluate_condition(
         self,
         cond: _GWTCondition,
-        sim_state: dict[str, dict[str, Any]],
+        sim_state: _CowState,
         trigger_payload: dict,
     ) -> bool:
         """단일 Given 조건을 인메모리 상태에 대해 평가."""
         if cond.type == "state":
-            # sim_state에서 해당 계층의 노드들을 검색
-            for node_id, props in sim_state.items():
-                # node_layer 필터 (빈 문자열이면 모든 노드 대상)
-                if cond.node_layer:
-                    node_layer = props.get("layer", props.get("label", "")).lower()
-                    if node_layer != cond.node_layer.lower():
-                        continue
+            # node_layer 필터 (빈 문자열이면 모든 노드 대상) — 계층 색인으로 후보만 조회
+            if cond.node_layer:
+                candidates = ((n, sim_state.node(n)) for n in sim_state.nodes_in_layer(cond.node_layer))
+            else:
+                candidates = sim_state.items()
+            for node_id, props in candidates:
                 # 필드 비교
                 if cond.field_name and cond.field_name in props:
                     actual = props[cond.field_name]
@@ -468,9 +605,6 @@ class EventForkEngine:
                 base_timestamp = datetime.fromisoformat(base_timestamp)
             base_state = await self._snapshot_ontology_state(case_id, base_timestamp, tenant_id)
 
-            # 3. 시뮬레이션 상태 = 기준 상태 깊은 복사 (중첩 dict/list 안전)
-            sim_state: dict[str, dict[str, Any]] = copy.deepcopy(base_state)
-
             # intervention 파싱
             interventions_raw = branch["interventions"]
             if isinstance(interventions_raw, str):
@@ -482,116 +616,34 @@ class EventForkEngine:
             if isinstance(gwt_overrides, str):
                 gwt_overrides = json.loads(gwt_overrides)
 
-            # 4. intervention을 초기 이벤트로 변환
-            events: list[dict] = []
-            seq = 0
-
-            for intervention in interventions:
-                # sim_state에 개입 적용
-                if intervention.node_id in sim_state:
-                    sim_state[intervention.node_id][intervention.field] = intervention.value
-                else:
-                    # 노드가 없으면 새로 생성
-                    sim_state[intervention.node_id] = {intervention.field: intervention.value}
-
-                event = {
-                    "id": f"sim_evt_{uuid.uuid4().hex[:12]}",
-                    "event_type": "INTERVENTION_APPLIED",
-                    "aggregate_type": "OntologyNode",
-                    "aggregate_id": intervention.node_id,
-                    "payload": intervention.to_dict(),
-                    "source": "intervention",
-                    "source_rule_id": None,
-                    "sequence": seq,
-                    "state_snapshot": json.dumps(
-                        {intervention.node_id: sim_state.get(intervention.node_id, {})},
-                        ensure_ascii=False,
-                    ),
-                }
-                events.append(event)
-                seq += 1
-
-            # 5. GWT 룰 체인 실행 (경량 인프로세스 평가기)
-            max_depth = 20
-            if isinstance(branch.get("interventions"), str):
-                # max_cascade_depth는 ForkConfig에만 있고 DB에 저장하지 않으므로 기본값 사용
-                pass
-
-            rules = await self._gwt_evaluator.load_rules(case_id, tenant_id)
-            depth = 0
-            pending_events = list(events)
-
-            while pending_events and depth < max_depth:
-                next_events: list[dict] = []
-
-                for evt in pending_events:
-                    for rule in rules:
-                        result = self._gwt_evaluator.evaluate_rule(
-                            rule=rule,
-                            event_type=evt["event_type"],
-                            sim_state=sim_state,
-                            trigger_payload=evt.get("payload", {}),
-                        )
-                        if not result.matched:
-                            continue
+            # 3~5. intervention 적용 + GWT 룰 체인 실행 (CPU 바운드 — 별도 스레드)
+            # max_cascade_depth는 ForkConfig에만 있고 DB에 저장하지 않으므로 기본값 사용
+            rule_index = await self._gwt_evaluator.load_rule_index(case_id, tenant_id)
+            run = await asyncio.to_thread(
+                self._simulate, base_state, interventions, rule_index, 20,
+            )
+            sim_state, events, depth = run.state, run.events, run.depth
 
-                        # 상태 변경은 evaluate_rule 내부에서 이미 sim_state에 적용됨
-                        # 발행된 이벤트를 다음 라운드 트리거로 추가
-                        for emitted in result.emitted_events:
-                            cascade_event = {
-                                "id": f"sim_evt_{uuid.uuid4().hex[:12]}",
-                                "event_type": emitted["event_type"],
-                                "aggregate_type": "ActionType",
-                                "aggregate_id": result.rule_id,
-                                "payload": emitted.get("payload", {}),
-                                "source": "gwt_rule",
-                                "source_rule_id": result.rule_id,
-                                "sequence": seq,
-                                "state_snapshot": None,
-                            }
-                            next_events.append(cascade_event)
-                            events.append(cascade_event)
-                            seq += 1
-
-                        # 체이닝된 액션도 다음 라운드 이벤트로 변환
-                        for chained_id in result.chained_actions:
-                            chain_event = {
-                                "id": f"sim_evt_{uuid.uuid4().hex[:12]}",
-                                "event_type": f"EXECUTE_{chained_id}",
-                                "aggregate_type": "ActionType",
-                                "aggregate_id": chained_id,
-                                "payload": {"chained_from": result.rule_id},
-                                "source": "cascade",
-                                "source_rule_id": result.rule_id,
-                                "sequence": seq,
-                                "state_snapshot": None,
-                            }
-                            next_events.append(chain_event)
-                            events.append(chain_event)
-                            seq += 1
-
-                pending_events = next_events
-                depth += 1
-
-            # 6. KPI 델타 계산
-            kpi_deltas = self._calculate_kpi_deltas(base_state, sim_state)
+            # 6. KPI 델타 계산 (오버레이 diff만 확인)
+            state_diff = sim_state.diff()
+            kpi_deltas = self._kpi_deltas_from_diff(state_diff)
 
             # 7. 결과를 PostgreSQL에 저장
             await self._save_simulation_events(branch_id, events)
             await self._update_branch_result(
-                branch_id, kpi_deltas, len(events), depth,
+                branch_id, kpi_deltas, len(events), depth, state_diff,
             )
 
             fork_result = ForkResult(
                 branch_id=branch_id,
                 branch_name=branch["name"],
                 base_state=base_state,
-                final_state=sim_state,
+                final_state=sim_state.materialize(),
                 events=events,
                 kpi_deltas=kpi_deltas,
                 event_count=len(events),
                 cascade_depth=depth,
-                converged=len(pending_events) == 0,
+                converged=run.converged,
             )
 
             logger.info(
@@ -606,44 +658,174 @@ class EventForkEngine:
             logger.exception("시뮬레이션 실패: branch=%s", branch_id)
             raise
 
+    def _simulate(
+        self,
+        base_state: dict[str, dict[str, Any]],
+        interventions: list[InterventionSpec],
+        rule_index: dict[str, list[_ActionRule]],
+        max_depth: int = 20,
+    ) -> _SimulationRun:
+        """intervention 적용 후 GWT 룰 체인을 인메모리로 실행한다 (I/O 없음).
+
+        이벤트는 sequence 순서대로 처리되므로, 각 이벤트의 state_delta는
+        그 이벤트를 처리하며 적용된 쓰기이고 CHECKPOINT_INTERVAL 번째마다
+        처리 직후의 누적 오버레이를 state_snapshot으로 남긴다.
+        따라서 replay_overlay(체크포인트, 이후 델타들)로 어느 시퀀스의 오버레이든 재구성된다.
+        """
+        sim_state = _CowState(base_state)
+        events: list[dict] = []
+
+        def _record(event: dict, delta: dict[str, dict[str, Any]] | None) -> None:
+            event["state_delta"] = delta or None
+            seq = event["sequence"]
+            event["state_snapshot"] = (
+                sim_state.changes() if CHECKPOINT_INTERVAL > 0 and (seq + 1) % CHECKPOINT_INTERVAL == 0 else None
+            )
+
+        # 4. intervention을 초기 이벤트로 변환
+        for seq, intervention in enumerate(interventions):
+            # sim_state에 개입 적용 (노드가 없으면 새로 생성)
+            sim_state.set_field(intervention.node_id, intervention.field, intervention.value)
+            event = {
+                "id": f"sim_evt_{uuid.uuid4().hex[:12]}",
+                "event_type": "INTERVENTION_APPLIED",
+                "aggregate_type": "OntologyNode",
+                "aggregate_id": intervention.node_id,
+                "payload": intervention.to_dict(),
+                "source": "intervention",
+                "source_rule_id": None,
+                "sequence": seq,
+            }
+            _record(event, {intervention.node_id: {intervention.field: intervention.value}})
+            events.append(event)
+
+        # 5. GWT 룰 체인 실행 — 이벤트 타입별 인덱스의 룰만 평가
+        depth = 0
+        pending_events = list(events)
+
+        while pending_events and depth < max_depth:
+            next_events: list[dict] = []
+
+            for evt in pending_events:
+                delta: dict[str, dict[str, Any]] = {}
+                for rule in rule_index.get(evt["event_type"], ()):
+                    result = self._gwt_evaluator.evaluate_rule(
+                        rule=rule,
+                        event_type=evt["event_type"],
+                        sim_state=sim_state,
+                        trigger_payload=evt.get("payload", {}),
+                    )
+                    if not result.matched:
+                        continue
+
+                    # 상태 변경은 evaluate_rule 내부에서 이미 오버레이에 적용됨
+                    for change in result.state_changes:
+                        delta.setdefault(change["node_id"], {})[change["field"]] = change["new_value"]
+
+                    # 발행된 이벤트를 다음 라운드 트리거로 추가
+                    for emitted in result.emitted_events:
+                        cascade_event = {
+                            "id": f"sim_evt_{uuid.uuid4().hex[:12]}",
+                            "event_type": emitted["event_type"],
+                            "aggregate_type": "ActionType",
+                            "aggregate_id": result.rule_id,
+                            "payload": emitted.get("payload", {}),
+                            "source": "gwt_rule",
+                            "source_rule_id": result.rule_id,
+                            "sequence": len(events),
+                            "state_delta": None,
+                            "state_snapshot": None,
+                        }
+                        next_events.append(cascade_event)
+                        events.append(cascade_event)
+
+                    # 체이닝된 액션도 다음 라운드 이벤트로 변환
+                    for chained_id in result.chained_actions:
+                        chain_event = {
+                            "id": f"sim_evt_{uuid.uuid4().hex[:12]}",
+                            "event_type": f"EXECUTE_{chained_id}",
+                            "aggregate_type": "ActionType",
+                            "aggregate_id": chained_id,
+                            "payload": {"chained_from": result.rule_id},
+                            "source": "cascade",
+                            "source_rule_id": result.rule_id,
+                            "sequence": len(events),
+                            "state_delta": None,
+                            "state_snapshot": None,
+                        }
+                        next_events.append(chain_event)
+                        events.append(chain_event)
+
+                if depth == 0 and evt["source"] == "intervention":
+                    # 개입 이벤트의 룰 쓰기는 모든 개입이 적용된 뒤에 일어나므로
+                    # 재생 순서를 맞추기 위해 마지막 개입 이벤트 델타에 순서대로 합친다
+                    last = events[len(interventions) - 1]
+                    for node_id, fields in delta.items():
+                        last["state_delta"].setdefault(node_id, {}).update(fields)
+                    if evt is last and last["state_snapshot"] is not None:
+                        last["state_snapshot"] = sim_state.changes()
+                else:
+                    _record(evt, delta)
+
+            pending_events = next_events
+            depth += 1
+
+        return _SimulationRun(
+            state=sim_state, events=events, depth=depth, converged=len(pending_events) == 0,
+        )
+
     async def compare_scenarios(self, branch_ids: list[str]) -> dict[str, Any]:
         """여러 시뮬레이션 브랜치의 결과를 비교하는 매트릭스를 생성한다.
 
+        브랜치마다 저장된 상태 오버레이 diff를 직접 비교한다 (이벤트 재생 없음).
+        오버레이가 없는 이전 브랜치는 result_summary의 KPI 델타로 대신한다.
+
         Returns:
             {
                 "scenarios": {branch_id: {name, kpi_deltas, event_count}},
                 "comparison_matrix": {kpi_key: {branch_id: delta}},
+                "state_diff": {node_id::field: {branch_id: value}}  # 브랜치 간 값이 다른 필드
             }
         """
         scenarios: dict[str, dict] = {}
+        overlays: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
 
         def _load_all():
             """모든 브랜치 결과를 한 번에 로드 (커넥션 풀 사용)."""
-            psycopg2 = _import_psycopg2()
+            _import_psycopg2()
             from psycopg2.extras import RealDictCursor
             with get_conn_from_pool() as conn:
                 cur = conn.cursor(cursor_factory=RealDictCursor)
-                for bid in branch_ids:
-                    cur.execute(
-                        """
-                        SELECT name, result_summary, event_count, status
-                        FROM vision.simulation_branches
-                        WHERE id = %s
-                        """,
-                        (bid,),
-                    )
-                    row = cur.fetchone()
-                    if row:
-                        summary = row["result_summary"]
-                        if isinstance(summary, str):
-                            summary = json.loads(summary)
-                        scenarios[bid] = {
-                            "name": row["name"],
-                            "status": row["status"],
-                            "kpi_deltas": summary or {},
-                            "event_count": row["event_count"] or 0,
-                        }
+                cur.execute(
+                    """
+                    SELECT id, name, result_summary, state_overlay, event_count, status
+                    FROM vision.simulation_branches
+                    WHERE id = ANY(%s)
+                    """,
+                    (list(branch_ids),),
+                )
+                rows = {row["id"]: row for row in cur.fetchall()}
                 cur.close()
+            for bid in branch_ids:
+                row = rows.get(bid)
+                if not row:
+                    continue
+                summary = row["result_summary"]
+                if isinstance(summary, str):
+                    summary = json.loads(summary)
+                overlay = row["state_overlay"]
+                if isinstance(overlay, str):
+                    overlay = json.loads(overlay)
+                if overlay is not None:
+                    overlays[bid] = overlay
+                scenarios[bid] = {
+                    "name": row["name"],
+                    "status": row["status"],
+                    "kpi_deltas": (
+                        self._kpi_deltas_from_diff(overlay) if overlay is not None else summary or {}
+                    ),
+                    "event_count": row["event_count"] or 0,
+                }
 
         await asyncio.to_thread(_load_all)
 
@@ -662,22 +844,92 @@ class EventForkEngine:
         return {
             "scenarios": scenarios,
             "comparison_matrix": comparison_matrix,
+            "state_diff": self._diff_overlays(overlays),
         }
 
+    @staticmethod
+    def _diff_overlays(
+        overlays: dict[str, dict[str, dict[str, dict[str, Any]]]],
+    ) -> dict[str, dict[str, Any]]:
+        """브랜치 오버레이들 사이에서 최종 값이 서로 다른 필드만 모은다.
+
+        오버레이에 없는 필드는 기준 값 그대로이므로 다른 브랜치의 base 값으로 채운다.
+        """
+        keys: dict[str, tuple[str, str]] = {}
+        base_values: dict[str, Any] = {}
+        for overlay in overlays.values():
+            for node_id, fields in overlay.items():
+                for field_name, change in fields.items():
+                    key = f"{node_id}::{field_name}"
+                    keys[key] = (node_id, field_name)
+                    base_values.setdefault(key, change["base"])
+
+        state_diff: dict[str, dict[str, Any]] = {}
+        for key in sorted(keys):
+            node_id, field_name = keys[key]
+            values = {
+                bid: overlay.get(node_id, {}).get(field_name, {"value": base_values[key]})["value"]
+                for bid, overlay in overlays.items()
+            }
+            distinct = {json.dumps(v, sort_keys=True, default=str) for v in values.values()}
+            if len(distinct) > 1:
+                state_diff[key] = values
+        return state_diff
+
+    async def reconstruct_overlay(self, branch_id: str, sequence: int) -> dict[str, dict[str, Any]]:
+        """sequence 이벤트 처리 직후의 상태 오버레이(기준 상태 대비 쓰기)를 재구성한다.
+
+        sequence 이하 가장 가까운 체크포인트에서 시작해 이후 이벤트 델타만 적용한다.
+        """
+        def _query():
+            _import_psycopg2()
+            from psycopg2.extras import RealDictCursor
+            with get_conn_from_pool() as conn:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
+                cur.execute(
+                    """
+                    SELECT sequence_number, state_snapshot
+                    FROM vision.simulation_events
+                    WHERE branch_id = %s AND sequence_number <= %s AND state_snapshot IS NOT NULL
+                    ORDER BY sequence_number DESC
+                    LIMIT 1
+                    """,
+                    (branch_id, sequence),
+                )
+                checkpoint = cur.fetchone()
+                start = checkpoint["sequence_number"] if checkpoint else -1
+                cur.execute(
+                    """
+                    SELECT state_delta
+                    FROM vision.simulation_events
+                    WHERE branch_id = %s AND sequence_number > %s AND sequence_number <= %s
+                      AND state_delta IS NOT NULL
+                    ORDER BY sequence_number ASC
+                    """,
+                    (branch_id, start, sequence),
+                )
+                deltas = [row["state_delta"] for row in cur.fetchall()]
+                cur.close()
+            snapshot = checkpoint["state_snapshot"] if checkpoint else None
+            if isinstance(snapshot, str):
+                snapshot = json.loads(snapshot)
+            return replay_overlay(
+                snapshot, [json.loads(d) if isinstance(d, str) else d for d in deltas],
+            )
+
+        return await asyncio.to_thread(_query)
+
     # ── 내부 헬퍼 메서드 ──────────────────────────────────────── #
 
     @staticmethod
-    def _calculate_kpi_deltas(
-        base_state: dict[str, dict[str, Any]],
-        sim_state: dict[str, dict[str, Any]],
+    def _kpi_deltas_from_diff(
+        state_diff: dict[str, dict[str, dict[str, Any]]],
     ) -> dict[str, float]:
-        """base_state와 sim_state 사이의 수치 변화량을 계산한다."""
+        """오버레이 diff에서 수치 필드 변화량을 계산한다 (기준 상태에 있던 필드만)."""
         kpi_deltas: dict[str, float] = {}
-        for node_id, state in sim_state.items():
-            if node_id not in base_state:
-                continue
-            for field_name, new_val in state.items():
-                old_val = base_state[node_id].get(field_name)
+        for node_id, fields in state_diff.items():
+            for field_name, change in fields.items():
+                old_val, new_val = change["base"], change["value"]
                 if isinstance(new_val, (int, float)) and isinstance(old_val, (int, float)):
                     delta = new_val - old_val
                     if abs(delta) > 1e-6:
@@ -784,42 +1036,47 @@ class EventForkEngine:
         await asyncio.to_thread(_update)
 
     async def _save_simulation_events(self, branch_id: str, events: list[dict]) -> None:
-        """시뮬레이션 이벤트를 PostgreSQL에 배치 저장한다."""
+        """시뮬레이션 이벤트를 PostgreSQL에 배치 저장한다 (execute_values, 페이지당 1,000행)."""
         if not events:
             return
 
+        def _json(value: Any) -> str | None:
+            return None if value is None else json.dumps(value, ensure_ascii=False, default=str)
+
+        rows = [
+            (
+                event.get("id", f"sim_evt_{uuid.uuid4().hex[:12]}"),
+                branch_id,
+                event["sequence"],
+                event["event_type"],
+                event.get("aggregate_type"),
+                event.get("aggregate_id", ""),
+                _json(event.get("payload", {})),
+                event.get("source", "unknown"),
+                event.get("source_rule_id"),
+                _json(event.get("state_delta")),
+                _json(event.get("state_snapshot")),
+            )
+            for event in events
+        ]
+
         def _batch_insert():
+            _import_psycopg2()
+            from psycopg2.extras import execute_values
             with get_conn_from_pool() as conn:
                 cur = conn.cursor()
-                for event in events:
-                    payload = event.get("payload", {})
-                    if isinstance(payload, dict):
-                        payload = json.dumps(payload, ensure_ascii=False)
-                    state_snap = event.get("state_snapshot")
-                    if isinstance(state_snap, dict):
-                        state_snap = json.dumps(state_snap, ensure_ascii=False)
-
-                    cur.execute(
-                        """
-                        INSERT INTO vision.simulation_events
-                            (id, branch_id, sequence_number, event_type,
-                             aggregate_type, aggregate_id, payload,
-                             source, source_rule_id, state_snapshot)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        """,
-                        (
-                            event.get("id", f"sim_evt_{uuid.uuid4().hex[:12]}"),
-                            branch_id,
-                            event["sequence"],
-                            event["event_type"],
-                            event.get("aggregate_type"),
-                            event.get("aggregate_id", ""),
-                            payload,
-                            event.get("source", "unknown"),
-                            event.get("source_rule_id"),
-                            state_snap,
-                        ),
-                    )
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO vision.simulation_events
+                        (id, branch_id, sequence_number, event_type,
+                         aggregate_type, aggregate_id, payload,
+                         source, source_rule_id, state_delta, state_snapshot)
+                    VALUES %s
+                    """,
+                    rows,
+                    page_size=1000,
+                )
                 cur.close()
                 conn.commit()
 
@@ -832,9 +1089,11 @@ class EventForkEngine:
         kpi_deltas: dict[str, float],
         event_count: int,
         depth: int,
+        state_diff: dict[str, dict[str, dict[str, Any]]] | None = None,
     ) -> None:
-        """시뮬레이션 완료 후 브랜치 결과 요약을 업데이트한다."""
+        """시뮬레이션 완료 후 브랜치 결과 요약과 최종 상태 오버레이를 업데이트한다."""
         summary_json = json.dumps(kpi_deltas, ensure_ascii=False)
+        overlay_json = json.dumps(state_diff or {}, ensure_ascii=False, default=str)
 
         def _update():
             with get_conn_from_pool() as conn:
@@ -844,11 +1103,12 @@ class EventForkEngine:
                     UPDATE vision.simulation_branches
                     SET status = 'completed',
                         result_summary = %s,
+                        state_overlay = %s,
                         event_count = %s,
                         completed_at = now()
                     WHERE id = %s
                     """,
-                    (summary_json, event_count, branch_id),
+                    (summary_json, overlay_json, event_count, branch_id),
                 )
                 cur.close()
                 conn.commit()
@@ -158,6 +158,8 @@ async def _stop_background_tasks():
                 await task
             except asyncio.CancelledError:
                 pass
+    from app.services.whatif_wizard_service import shutdown_granger_pool
+    shutdown_granger_pool()
     logger.info("Vision background tasks stopped")
 
 
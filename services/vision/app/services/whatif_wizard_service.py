@@ -20,7 +20,10 @@ import asyncio
 import collections
 import json
 import logging
+import multiprocessing
+import os
 import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from enum import Enum
@@ -145,6 +148,194 @@ class WhatIfScenario:
         )
 
 
+# ---------------------------------------------------------------------------
+# 상관 행렬 일괄 계산 -- 변수 쌍 루프 대신 행렬 연산 한 번
+# ---------------------------------------------------------------------------
+
+# Granger 검정 프로세스 풀 워커 수 (0이면 CPU 수)
+WHATIF_GRANGER_WORKERS: int = int(os.getenv("WHATIF_GRANGER_WORKERS", "0"))
+# Granger 검정 전 사전 필터: 래그 0..max_lag 교차상관 절대값 최대치가 이 값 미만인 쌍은 건너뜀
+WHATIF_GRANGER_MIN_CORR: float = float(os.getenv("WHATIF_GRANGER_MIN_CORR", "0.2"))
+# 검정 쌍이 이보다 적으면 프로세스 풀을 거치지 않고 현재 스레드에서 실행
+_GRANGER_POOL_MIN_PAIRS = 16
+
+
+def _series_matrix(data: dict[str, list[float]], variables: list[str]) -> np.ndarray:
+    """변수별 시계열을 (V, L) 행렬로 만든다. 짧은 시계열은 NaN으로 채운다.
+
+    쌍별로 min_len까지 자르고 NaN을 제거하던 기존 동작은
+    "두 행 모두 유효한 인덱스"만 쓰는 것과 같으므로 NaN 패딩으로 그대로 표현된다.
+    """
+    length = max((len(data[v]) for v in variables), default=0)
+    matrix = np.full((len(variables), length), np.nan)
+    for i, v in enumerate(variables):
+        values = np.asarray(data[v], dtype=np.float64)
+        matrix[i, :len(values)] = values
+    return matrix
+
+
+def _pairwise_pearson(x: np.ndarray, y: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """행 쌍별 공통 유효 인덱스 기준 Pearson 상관 행렬과 표본 수 행렬.
+
+    y가 주어지면 corr[i, j] = corr(x[i], y[j]) (래그 교차상관용).
+    """
+    if y is None:
+        y = x
+    mx, my = ~np.isnan(x), ~np.isnan(y)
+    fx, fy = mx.astype(np.float64), my.astype(np.float64)
+    # 행 평균으로 먼저 이동해 합/제곱합 공식의 상쇄 오차를 줄인다 (상관은 이동 불변)
+    x0 = np.where(mx, x, 0.0)
+    y0 = np.where(my, y, 0.0)
+    x0 = np.where(mx, x0 - x0.sum(axis=1, keepdims=True) / np.maximum(fx.sum(axis=1, keepdims=True), 1), 0.0)
+    y0 = np.where(my, y0 - y0.sum(axis=1, keepdims=True) / np.maximum(fy.sum(axis=1, keepdims=True), 1), 0.0)
+
+    n = fx @ fy.T
+    sx = x0 @ fy.T            # 공통 인덱스 위의 x 합
+    sy = fx @ y0.T            # 공통 인덱스 위의 y 합
+    sxx = (x0 * x0) @ fy.T
+    syy = fx @ (y0 * y0).T
+    sxy = x0 @ y0.T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        corr = cov / np.sqrt(var_x * var_y)
+    return np.clip(corr, -1.0, 1.0), n
+
+
+def _pairwise_spearman(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Spearman 상관 행렬과 양측 p-value 행렬.
+
+    NaN 없이 같은 길이인 행끼리는 순위를 한 번만 매겨 Pearson 행렬로 계산하고,
+    유효 인덱스가 쌍마다 달라지는 나머지 쌍만 scipy.stats.spearmanr로 개별 계산한다.
+    """
+    from scipy.stats import rankdata, spearmanr
+    from scipy.stats import t as t_dist
+
+    valid = ~np.isnan(matrix)
+    complete = valid.all(axis=1)          # 패딩 없이 최대 길이를 모두 채운 행
+    ranks = np.full(matrix.shape, np.nan)
+    if complete.any():
+        ranks[complete] = rankdata(matrix[complete], axis=1)
+    corr, n = _pairwise_pearson(ranks)
+
+    incomplete = np.flatnonzero(~complete)
+    for i in incomplete:
+        for j in range(len(matrix)):
+            if i == j:
+                continue
+            both = valid[i] & valid[j]
+            n[i, j] = n[j, i] = both.sum()
+            if both.sum() < 3:
+                corr[i, j] = corr[j, i] = np.nan
+                continue
+            rho, _ = spearmanr(matrix[i, both], matrix[j, both])
+            corr[i, j] = corr[j, i] = rho
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dof = n - 2
+        t_stat = corr * np.sqrt(dof / ((1.0 - corr) * (1.0 + corr)))
+        p_values = 2 * t_dist.sf(np.abs(t_stat), dof)
+    return corr, np.where(np.abs(corr) >= 1.0, 0.0, p_values)
+
+
+def _lagged_max_abs_corr(matrix: np.ndarray, max_lag: int) -> np.ndarray:
+    """out[i, j] = max_k |corr(x_i[t - k], x_j[t])|, k = 0..max_lag (i가 j를 선행)."""
+    best = np.nan_to_num(np.abs(_pairwise_pearson(matrix)[0]))
+    for k in range(1, max_lag + 1):
+        if matrix.shape[1] <= k:
+            break
+        lagged, _ = _pairwise_pearson(matrix[:, :-k], matrix[:, k:])
+        best = np.maximum(best, np.nan_to_num(np.abs(lagged)))
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Granger 검정 -- 프로세스 풀 (CPU 바운드, GIL 회피)
+# ---------------------------------------------------------------------------
+
+_granger_pool: ProcessPoolExecutor | None = None
+_granger_pool_lock = threading.Lock()
+
+
+def _get_granger_pool() -> ProcessPoolExecutor:
+    global _granger_pool
+    with _granger_pool_lock:
+        if _granger_pool is None:
+            workers = WHATIF_GRANGER_WORKERS or os.cpu_count() or 1
+            # 이벤트 루프/스레드를 가진 프로세스에서 fork하지 않도록 spawn 사용
+            _granger_pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _granger_pool
+
+
+def shutdown_granger_pool() -> None:
+    """서비스 종료 시 Granger 프로세스 풀 정리."""
+    global _granger_pool
+    with _granger_pool_lock:
+        if _granger_pool is not None:
+            _granger_pool.shutdown(wait=False, cancel_futures=True)
+            _granger_pool = None
+
+
+def _granger_best_lag(
+    pairs: list[tuple[int, int, np.ndarray, np.ndarray]],
+    max_lag: int,
+) -> list[tuple[int, int, float, int]]:
+    """(src, tgt, src 값, tgt 값) 묶음마다 최소 p-value 래그를 구한다. 프로세스 풀 워커 함수."""
+    from statsmodels.tsa.stattools import grangercausalitytests
+
+    results: list[tuple[int, int, float, int]] = []
+    for i, j, src_valid, tgt_valid in pairs:
+        try:
+            # grangercausalitytests는 (y, x) 컬럼 순서 -- tgt가 종속변수
+            test_data = np.column_stack([tgt_valid, src_valid])
+            # verbose 인자는 statsmodels 0.15에서 제거됨 -- 생략해도 0.14는 출력하지 않는다
+            result = grangercausalitytests(test_data, maxlag=max_lag)
+        except Exception as e:
+            logger.debug("granger_test_skipped", extra={"src": i, "tgt": j, "error": str(e)})
+            continue
+        # 최소 p-value를 가진 래그 찾기
+        best_lag = 1
+        best_p = 1.0
+        for lag_val in range(1, max_lag + 1):
+            if lag_val in result:
+                p = result[lag_val][0]["ssr_ftest"][1]
+                if p < best_p:
+                    best_p = p
+                    best_lag = lag_val
+        results.append((i, j, float(best_p), best_lag))
+    return results
+
+
+async def _run_granger(
+    matrix: np.ndarray,
+    pairs: list[tuple[int, int]],
+    max_lag: int,
+    workers: int | None,
+) -> list[tuple[int, int, float, int]]:
+    """살아남은 쌍의 Granger 검정을 프로세스 풀에 청크 단위로 분배한다."""
+    jobs = []
+    for i, j in pairs:
+        both = ~(np.isnan(matrix[i]) | np.isnan(matrix[j]))
+        jobs.append((i, j, matrix[i, both], matrix[j, both]))
+
+    workers = workers if workers is not None else (WHATIF_GRANGER_WORKERS or os.cpu_count() or 1)
+    if workers <= 1 or len(jobs) < _GRANGER_POOL_MIN_PAIRS:
+        return await asyncio.to_thread(_granger_best_lag, jobs, max_lag)
+
+    pool = _get_granger_pool()
+    loop = asyncio.get_running_loop()
+    # 워커당 여러 청크로 나눠 긴 검정이 한 워커에 몰리지 않게 한다
+    chunk = max(1, -(-len(jobs) // (workers * 4)))
+    futures = [
+        loop.run_in_executor(pool, _granger_best_lag, jobs[k:k + chunk], max_lag)
+        for k in range(0, len(jobs), chunk)
+    ]
+    return [item for part in await asyncio.gather(*futures) for item in part]
+
+
 # ---------------------------------------------------------------------------
 # Step 1: 엣지 탐색 -- 변수 간 상관/인과관계 후보를 반환
 # ---------------------------------------------------------------------------
@@ -154,118 +345,102 @@ async def discover_edges(
     methods: list[str] | None = None,
     threshold: float = 0.3,
     max_lag: int = 5,
+    granger_min_corr: float | None = None,
+    granger_workers: int | None = None,
 ) -> list[EdgeCandidate]:
     """변수 간 상관/인과 엣지를 탐색한다.
 
     Pearson/Spearman 상관 + Granger 인과성 검정을 조합하여 후보 엣지를 반환한다.
     threshold 이상의 상관 또는 p < 0.05 인 Granger 인과만 포함.
 
+    상관은 전체 변수에 대해 행렬 연산 한 번으로 계산하고, Granger 검정은
+    래그 교차상관이 granger_min_corr 이상인 쌍만 프로세스 풀에서 병렬로 수행한다.
+
     Args:
         data: 변수명 -> 시계열 값 리스트
         methods: 사용할 탐색 방법 (pearson, spearman, granger)
         threshold: 상관계수 절대값 임계치
         max_lag: Granger 검정 최대 래그
+        granger_min_corr: Granger 사전 필터 임계치 (None이면 WHATIF_GRANGER_MIN_CORR, 0이면 필터 없음)
+        granger_workers: Granger 프로세스 수 (None이면 WHATIF_GRANGER_WORKERS, 1이면 풀 미사용)
 
     Returns:
         confidence 내림차순 정렬된 엣지 후보 리스트
     """
     if methods is None:
         methods = ["pearson", "granger"]
+    if granger_min_corr is None:
+        granger_min_corr = WHATIF_GRANGER_MIN_CORR
 
-    candidates: list[EdgeCandidate] = []
     variables = list(data.keys())
 
-    # CPU 바운드 계산을 별도 스레드에서 실행
-    def _compute() -> list[EdgeCandidate]:
+    # 상관 행렬 + Granger 후보 쌍 선정 (CPU 바운드 -- 별도 스레드)
+    def _compute() -> tuple[list[EdgeCandidate], np.ndarray, list[tuple[int, int]]]:
         local_candidates: list[EdgeCandidate] = []
-        for i, src in enumerate(variables):
-            for j, tgt in enumerate(variables):
-                if i == j:
-                    continue
-
-                src_data = np.array(data[src], dtype=np.float64)
-                tgt_data = np.array(data[tgt], dtype=np.float64)
-
-                # 데이터 길이 맞추기 -- 최소 10개 이상 필요
-                min_len = min(len(src_data), len(tgt_data))
-                if min_len < 10:
-                    continue
-                src_arr = src_data[:min_len]
-                tgt_arr = tgt_data[:min_len]
-
-                # NaN 제거 -- 공통 유효 인덱스만 사용
-                valid_mask = ~(np.isnan(src_arr) | np.isnan(tgt_arr))
-                if valid_mask.sum() < 10:
-                    continue
-                src_valid = src_arr[valid_mask]
-                tgt_valid = tgt_arr[valid_mask]
-
-                # --- Pearson 상관 ---
-                if "pearson" in methods:
-                    corr = float(np.corrcoef(src_valid, tgt_valid)[0, 1])
-                    if not np.isnan(corr) and abs(corr) >= threshold:
-                        local_candidates.append(EdgeCandidate(
-                            source=src, target=tgt,
-                            method=EdgeMethod.PEARSON,
-                            correlation=round(corr, 4),
-                            confidence=round(abs(corr), 4),
-                        ))
-
-                # --- Spearman 상관 ---
-                if "spearman" in methods:
-                    try:
-                        from scipy.stats import spearmanr
-                        corr_s, p_s = spearmanr(src_valid, tgt_valid)
-                        if not np.isnan(corr_s) and abs(corr_s) >= threshold:
-                            local_candidates.append(EdgeCandidate(
-                                source=src, target=tgt,
-                                method=EdgeMethod.SPEARMAN,
-                                correlation=round(float(corr_s), 4),
-                                p_value=round(float(p_s), 6),
-                                confidence=round(abs(float(corr_s)), 4),
-                            ))
-                    except ImportError:
-                        logger.debug("scipy 미설치 -- spearman 건너뜀")
-                    except Exception as e:
-                        logger.debug("spearman_test_skipped", extra={"src": src, "tgt": tgt, "error": str(e)})
-
-                # --- Granger 인과성 ---
-                if "granger" in methods and min_len > max_lag + 10:
-                    try:
-                        from statsmodels.tsa.stattools import grangercausalitytests
-                        # grangercausalitytests는 (y, x) 컬럼 순서 -- tgt가 종속변수
-                        test_data = np.column_stack([tgt_valid, src_valid])
-                        result = grangercausalitytests(
-                            test_data, maxlag=max_lag, verbose=False,
-                        )
-                        # 최소 p-value를 가진 래그 찾기
-                        best_lag = 1
-                        best_p = 1.0
-                        for lag_val in range(1, max_lag + 1):
-                            if lag_val in result:
-                                p = result[lag_val][0]["ssr_ftest"][1]
-                                if p < best_p:
-                                    best_p = p
-                                    best_lag = lag_val
-                        if best_p < 0.05:
-                            local_candidates.append(EdgeCandidate(
-                                source=src, target=tgt,
-                                method=EdgeMethod.GRANGER,
-                                p_value=round(best_p, 6),
-                                lag=best_lag,
-                                confidence=round(1 - best_p, 4),
-                            ))
-                    except ImportError:
-                        logger.debug("statsmodels 미설치 -- granger 건너뜀")
-                    except Exception as e:
-                        logger.debug(
-                            "granger_test_skipped",
-                            extra={"src": src, "tgt": tgt, "error": str(e)},
-                        )
-
-        return local_candidates
-
-    candidates = await asyncio.to_thread(_compute)
+        matrix = _series_matrix(data, variables)
+        valid = (~np.isnan(matrix)).astype(np.float64)
+        n_common = valid @ valid.T
+        # 쌍별 기존 조건: 공통 유효 표본 10개 이상, 자기 자신 제외
+        eligible = n_common >= 10
+        np.fill_diagonal(eligible, False)
+
+        # --- Pearson 상관 ---
+        if "pearson" in methods:
+            corr, _ = _pairwise_pearson(matrix)
+            for i, j in zip(*np.nonzero(eligible & (np.abs(np.nan_to_num(corr)) >= threshold))):
+                c = float(corr[i, j])
+                local_candidates.append(EdgeCandidate(
+                    source=variables[i], target=variables[j],
+                    method=EdgeMethod.PEARSON,
+                    correlation=round(c, 4),
+                    confidence=round(abs(c), 4),
+                ))
+
+        # --- Spearman 상관 ---
+        if "spearman" in methods:
+            try:
+                corr_s, p_s = _pairwise_spearman(matrix)
+                for i, j in zip(*np.nonzero(eligible & (np.abs(np.nan_to_num(corr_s)) >= threshold))):
+                    c = float(corr_s[i, j])
+                    local_candidates.append(EdgeCandidate(
+                        source=variables[i], target=variables[j],
+                        method=EdgeMethod.SPEARMAN,
+                        correlation=round(c, 4),
+                        p_value=round(float(p_s[i, j]), 6),
+                        confidence=round(abs(c), 4),
+                    ))
+            except ImportError:
+                logger.debug("scipy 미설치 -- spearman 건너뜀")
+
+        # --- Granger 후보 쌍 ---
+        granger_pairs: list[tuple[int, int]] = []
+        if "granger" in methods:
+            lengths = np.array([len(data[v]) for v in variables])
+            min_len = np.minimum.outer(lengths, lengths)
+            candidates_mask = eligible & (min_len > max_lag + 10)
+            if granger_min_corr > 0:
+                candidates_mask &= _lagged_max_abs_corr(matrix, max_lag) >= granger_min_corr
+            granger_pairs = [(int(i), int(j)) for i, j in zip(*np.nonzero(candidates_mask))]
+        return local_candidates, matrix, granger_pairs
+
+    candidates, matrix, granger_pairs = await asyncio.to_thread(_compute)
+
+    # --- Granger 인과성 ---
+    if granger_pairs:
+        try:
+            import statsmodels.tsa.stattools  # noqa: F401
+        except ImportError:
+            logger.debug("statsmodels 미설치 -- granger 건너뜀")
+        else:
+            for i, j, best_p, best_lag in await _run_granger(matrix, granger_pairs, max_lag, granger_workers):
+                if best_p < 0.05:
+                    candidates.append(EdgeCandidate(
+                        source=variables[i], target=variables[j],
+                        method=EdgeMethod.GRANGER,
+                        p_value=round(best_p, 6),
+                        lag=best_lag,
+                        confidence=round(1 - best_p, 4),
+                    ))
 
     # 중복 제거 -- 같은 (source, target) 쌍에서 가장 높은 confidence만 유지
     best: dict[tuple[str, str], EdgeCandidate] = {}
@@ -275,7 +450,10 @@ async def discover_edges(
             best[key] = c
 
     result = sorted(best.values(), key=lambda e: e.confidence, reverse=True)
-    logger.info("edges_discovered: count=%d, variables=%d", len(result), len(variables))
+    logger.info(
+        "edges_discovered: count=%d, variables=%d, granger_pairs=%d",
+        len(result), len(variables), len(granger_pairs),
+    )
     return result
 
 
@@ -297,36 +475,21 @@ async def compute_correlation_matrix(
         {variables, matrix (2D list), method}
     """
     variables = list(data.keys())
-    n = len(variables)
 
     def _compute() -> list[list[float]]:
-        matrix = np.zeros((n, n))
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    matrix[i][j] = 1.0
-                    continue
-                arr_i = np.array(data[variables[i]], dtype=np.float64)
-                arr_j = np.array(data[variables[j]], dtype=np.float64)
-                min_len = min(len(arr_i), len(arr_j))
-                if min_len < 3:
-                    continue
-                a, b = arr_i[:min_len], arr_j[:min_len]
-                # NaN 제거
-                valid = ~(np.isnan(a) | np.isnan(b))
-                if valid.sum() < 3:
-                    continue
-
-                if method == "spearman":
-                    try:
-                        from scipy.stats import spearmanr
-                        corr, _ = spearmanr(a[valid], b[valid])
-                    except ImportError:
-                        corr = float(np.corrcoef(a[valid], b[valid])[0, 1])
-                else:
-                    corr = float(np.corrcoef(a[valid], b[valid])[0, 1])
-
-                matrix[i][j] = round(corr, 4) if not np.isnan(corr) else 0.0
+        series = _series_matrix(data, variables)
+        corr = None
+        if method == "spearman":
+            try:
+                corr, _ = _pairwise_spearman(series)
+            except ImportError:
+                corr = None
+        if corr is None:
+            corr, _ = _pairwise_pearson(series)
+        valid = (~np.isnan(series)).astype(np.float64)
+        # 공통 유효 표본 3개 미만이거나 정의되지 않는 상관은 0
+        matrix = np.where((valid @ valid.T >= 3) & ~np.isnan(corr), np.round(corr, 4), 0.0)
+        np.fill_diagonal(matrix, 1.0)
         return matrix.tolist()
 
     matrix_list = await asyncio.to_thread(_compute)
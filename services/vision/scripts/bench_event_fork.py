@@ -0,0 +1,156 @@
+"""EventForkEngine 시뮬레이션 벤치마크 — 전체 룰 스캔 + deepcopy 스냅샷 vs 룰 인덱스 + COW 델타.
+
+합성 온톨로지 상태(노드 N개)와 ActionType 룰 R개(기본 500, 이벤트 타입 50종에 분산)에 대해
+개입 이벤트 E개(기본 10,000)를 시뮬레이션하고 처리량과 저장 크기를 비교한다.
+  - legacy   : 이전 run_simulation 루프 — 기준 상태 deepcopy, 이벤트마다 룰 전체 평가,
+               state 조건마다 전체 노드 스캔, 이벤트마다 전체 상태 json 스냅샷
+  - optimized: EventForkEngine._simulate — 이벤트 타입별 룰 인덱스, 계층 색인,
+               copy-on-write 오버레이, 이벤트별 델타 + CHECKPOINT_INTERVAL 체크포인트
+
+저장 크기는 이벤트 행에 들어가는 JSON(state_snapshot, state_delta) 바이트 합계다.
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_event_fork.py --events 10000 --rules 500 --nodes 2000
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+from typing import Any
+
+from app.engines.event_fork_engine import (
+    _OPS,
+    EventForkEngine,
+    _ActionRule,
+    _GWTAction,
+    _GWTCondition,
+    _LightweightGWTEvaluator,
+)
+from app.engines.whatif_models import InterventionSpec
+
+_LAYERS = ["kpi", "measure", "process", "resource"]
+
+
+def _make_state(n_nodes: int) -> dict[str, dict[str, Any]]:
+    return {
+        f"n{i}": {"layer": _LAYERS[i % len(_LAYERS)], "value": float(i % 100), "status": "RUNNING", "name": f"node {i}"}
+        for i in range(n_nodes)
+    }
+
+
+def _make_rules(n_rules: int, n_nodes: int, seed: int = 0) -> list[_ActionRule]:
+    rng = random.Random(seed)
+    event_types = ["INTERVENTION_APPLIED"] + [f"EVT_{i}" for i in range(49)]
+    rules = []
+    for i in range(n_rules):
+        when = event_types[i % len(event_types)]
+        then = [{"op": "SET", "target_node": f"n{rng.randrange(n_nodes)}", "field": "status", "value": f"S{i}"}]
+        # 개입 룰 일부만 후속 이벤트를 한 단계 발행 (이벤트 수가 폭증하지 않도록 depth 1)
+        if when == "INTERVENTION_APPLIED" and i % 3 == 0:
+            then.append({"op": "EMIT", "event_type": event_types[1 + i % 49], "payload": {}})
+        rules.append(_ActionRule(
+            id=f"r{i}", name=f"rule {i}", case_id="bench", tenant_id="bench", when_event=when,
+            given=[_GWTCondition.from_dict(
+                {"type": "state", "node_layer": _LAYERS[i % len(_LAYERS)], "field": "value", "op": ">=", "value": 90},
+            )],
+            then=[_GWTAction.from_dict(a) for a in then],
+            priority=i,
+        ))
+    return rules
+
+
+def _interventions(n_events: int, n_nodes: int) -> list[InterventionSpec]:
+    return [
+        InterventionSpec(node_id=f"n{i % n_nodes}", field="value", value=float(i % 100) + 0.5, description="")
+        for i in range(n_events)
+    ]
+
+
+def _legacy_condition(cond: _GWTCondition, state: dict[str, dict[str, Any]]) -> bool:
+    for props in state.values():
+        if cond.node_layer:
+            if props.get("layer", props.get("label", "")).lower() != cond.node_layer.lower():
+                continue
+        if cond.field_name and cond.field_name in props:
+            try:
+                if _OPS[cond.op](props[cond.field_name], cond.value):
+                    return True
+            except (TypeError, ValueError):
+                continue
+    return False
+
+
+def _legacy(base: dict, interventions: list[InterventionSpec], rules: list[_ActionRule], max_depth: int = 20) -> tuple[int, int]:
+    """최적화 이전 run_simulation의 인메모리 루프 (이벤트 수, 스냅샷 바이트 반환)."""
+    state = copy.deepcopy(base)
+    events: list[dict] = []
+    snapshot_bytes = 0
+    for seq, iv in enumerate(interventions):
+        state.setdefault(iv.node_id, {})[iv.field] = iv.value
+        events.append({"event_type": "INTERVENTION_APPLIED", "payload": iv.to_dict(), "sequence": seq})
+        snapshot_bytes += len(json.dumps(state, default=str))
+    pending, depth = list(events), 0
+    while pending and depth < max_depth:
+        next_events = []
+        for evt in pending:
+            for rule in rules:
+                if rule.when_event != evt["event_type"]:
+                    continue
+                if not all(_legacy_condition(c, state) for c in rule.given if c.type == "state"):
+                    continue
+                for action in rule.then:
+                    if action.op == "SET" and action.target_node in state:
+                        state[action.target_node][action.field_name] = action.value
+                    elif action.op == "EMIT":
+                        emitted = {"event_type": action.event_type, "payload": {}, "sequence": len(events)}
+                        next_events.append(emitted)
+                        events.append(emitted)
+                        snapshot_bytes += len(json.dumps(state, default=str))
+        pending, depth = next_events, depth + 1
+    return len(events), snapshot_bytes
+
+
+def _optimized(base: dict, interventions: list[InterventionSpec], rules: list[_ActionRule]) -> tuple[int, int]:
+    engine = EventForkEngine(neo4j_driver=None, db_url="postgresql://unused")
+    run = engine._simulate(base, interventions, _LightweightGWTEvaluator.index_rules(rules))
+    stored = 0
+    for event in run.events:
+        for key in ("state_delta", "state_snapshot"):
+            if event[key] is not None:
+                stored += len(json.dumps(event[key], default=str))
+    return len(run.events), stored
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark EventForkEngine in-memory simulation")
+    parser.add_argument("--events", type=int, default=10000, help="intervention events per run")
+    parser.add_argument("--rules", type=int, default=500)
+    parser.add_argument("--nodes", type=int, default=2000, help="ontology nodes in the base state")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    base = _make_state(args.nodes)
+    rules = _make_rules(args.rules, args.nodes)
+    interventions = _interventions(args.events, args.nodes)
+
+    modes = [("optimized", _optimized)] + ([] if args.skip_legacy else [("legacy", _legacy)])
+    for mode, fn in modes:
+        start = time.perf_counter()
+        n_events, stored_bytes = fn(base, interventions, rules)
+        elapsed = time.perf_counter() - start
+        print(json.dumps({
+            "mode": mode, "interventions": args.events, "rules": args.rules, "nodes": args.nodes,
+            "events": n_events, "elapsed_s": round(elapsed, 2),
+            "events_per_s": round(n_events / max(elapsed, 1e-9), 1),
+            "stored_state_bytes": stored_bytes,
+        }, ensure_ascii=False))
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
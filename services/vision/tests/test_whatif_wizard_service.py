@@ -98,6 +98,83 @@ class TestDiscoverEdges:
         assert len(pairs) == len(set(pairs)), "중복 엣지가 존재합니다"
 
 
+class TestDiscoverEdgesVectorized:
+    """행렬 일괄 상관 + Granger 사전 필터/프로세스 풀 테스트."""
+
+    @staticmethod
+    def _ragged_data(seed: int = 7) -> dict[str, list[float]]:
+        """길이가 다르고 NaN/동순위가 섞인 시계열 -- 쌍별 유효 인덱스가 달라지는 경우."""
+        rng = np.random.default_rng(seed)
+        base = np.cumsum(rng.normal(0, 1, 60))
+        lagged = np.roll(base, 2) + rng.normal(0, 0.3, 60)
+        with_nan = base * 0.5 + rng.normal(0, 0.5, 60)
+        with_nan[[3, 17, 40]] = np.nan
+        return {
+            "base": base.tolist(),
+            "lagged": lagged.tolist(),
+            "nan": with_nan.tolist(),
+            "short": (base[:35] + rng.normal(0, 1, 35)).tolist(),
+            "ties": np.round(base / 3).tolist(),
+            "noise": rng.normal(0, 1, 60).tolist(),
+        }
+
+    @staticmethod
+    def _reference(data: dict[str, list[float]], method: str) -> dict[tuple[str, str], float]:
+        """이전 구현과 같은 쌍별 루프 (min_len 절단 + 공통 NaN 제거)."""
+        from scipy.stats import spearmanr
+
+        out = {}
+        for src in data:
+            for tgt in data:
+                if src == tgt:
+                    continue
+                a, b = np.array(data[src]), np.array(data[tgt])
+                n = min(len(a), len(b))
+                a, b = a[:n], b[:n]
+                ok = ~(np.isnan(a) | np.isnan(b))
+                if ok.sum() < 10:
+                    continue
+                if method == "pearson":
+                    out[(src, tgt)] = float(np.corrcoef(a[ok], b[ok])[0, 1])
+                else:
+                    out[(src, tgt)] = float(spearmanr(a[ok], b[ok])[0])
+        return out
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["pearson", "spearman"])
+    async def test_행렬_상관이_쌍별_계산과_일치(self, method: str):
+        data = self._ragged_data()
+        expected = self._reference(data, method)
+        edges = await discover_edges(data, methods=[method], threshold=0.0)
+        got = {(e.source, e.target): e.correlation for e in edges}
+        assert got.keys() == expected.keys()
+        for key, value in expected.items():
+            assert got[key] == pytest.approx(round(value, 4), abs=1e-4), key
+
+    @pytest.mark.asyncio
+    async def test_스피어만_p값_scipy와_일치(self):
+        from scipy.stats import spearmanr
+
+        data = self._ragged_data()
+        edges = await discover_edges(data, methods=["spearman"], threshold=0.0)
+        edge = next(e for e in edges if (e.source, e.target) == ("base", "ties"))
+        assert edge.p_value == pytest.approx(round(float(spearmanr(data["base"], data["ties"])[1]), 6), abs=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_그레인저_사전필터_및_프로세스풀_결과_동일(self):
+        pytest.importorskip("statsmodels")
+        data = self._ragged_data()
+        exhaustive = await discover_edges(data, methods=["granger"], max_lag=3, granger_min_corr=0, granger_workers=1)
+        pruned = await discover_edges(data, methods=["granger"], max_lag=3, granger_min_corr=0.1, granger_workers=1)
+        pooled = await discover_edges(data, methods=["granger"], max_lag=3, granger_min_corr=0, granger_workers=2)
+
+        assert [e.to_dict() for e in pooled] == [e.to_dict() for e in exhaustive]
+        assert ("base", "lagged") in {(e.source, e.target) for e in exhaustive}
+        # 사전 필터는 교차상관이 약한 noise 쌍만 건너뛰고 강한 선행 관계는 유지한다
+        assert ("base", "lagged") in {(e.source, e.target) for e in pruned}
+        assert {(e.source, e.target) for e in pruned} <= {(e.source, e.target) for e in exhaustive}
+
+
 # ===================================================================
 # Step 2: 상관 행렬 (compute_correlation_matrix)
 # ===================================================================
@@ -0,0 +1,166 @@
+"""EventForkEngine 인메모리 시뮬레이션 단위 테스트.
+
+룰 인덱스, copy-on-write 오버레이, 이벤트별 델타 + 체크포인트 재구성,
+오버레이 기반 시나리오 비교를 DB/Neo4j 없이 검증한다.
+"""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import app.engines.event_fork_engine as fork
+from app.engines.event_fork_engine import (
+    EventForkEngine,
+    _ActionRule,
+    _CowState,
+    _GWTAction,
+    _GWTCondition,
+    _LightweightGWTEvaluator,
+    replay_overlay,
+)
+from app.engines.whatif_models import InterventionSpec
+
+
+def _base_state() -> dict:
+    return {
+        "kpi_cost": {"layer": "Kpi", "value": 100, "tags": ["a"]},
+        "kpi_rev": {"layer": "Kpi", "value": 50},
+        "proc_1": {"label": "Process", "status": "RUNNING"},
+    }
+
+
+def _rule(rule_id: str, when: str, given=(), then=(), priority: int = 100) -> _ActionRule:
+    return _ActionRule(
+        id=rule_id, name=rule_id, case_id="c", tenant_id="t", when_event=when,
+        given=[_GWTCondition.from_dict(g) for g in given],
+        then=[_GWTAction.from_dict(a) for a in then],
+        priority=priority,
+    )
+
+
+_RULES = [
+    # 개입 → 비용 KPI가 80 이상이면 프로세스 상태 변경 + 후속 이벤트 발행
+    _rule("r1", "INTERVENTION_APPLIED",
+          given=[{"type": "state", "node_layer": "kpi", "field": "value", "op": ">=", "value": 80}],
+          then=[{"op": "SET", "target_node": "proc_1", "field": "status", "value": "THROTTLED"},
+                {"op": "EMIT", "event_type": "COST_ALERT", "payload": {"node": "$trigger.node_id"}}]),
+    _rule("r2", "COST_ALERT",
+          then=[{"op": "SET", "target_node": "kpi_rev", "field": "value", "value": 45},
+                {"op": "EXECUTE", "action_id": "r3"}]),
+    _rule("r3", "EXECUTE_r3",
+          then=[{"op": "SET", "target_node": "$trigger.chained_from", "field": "value", "value": 1}]),
+    _rule("never", "UNUSED_EVENT",
+          then=[{"op": "SET", "target_node": "kpi_cost", "field": "value", "value": -1}]),
+]
+
+
+def _engine() -> EventForkEngine:
+    return EventForkEngine(neo4j_driver=None, db_url="postgresql://unused")
+
+
+def _interventions(*pairs) -> list[InterventionSpec]:
+    return [InterventionSpec(node_id=n, field=f, value=v, description="") for n, f, v in pairs]
+
+
+# ═══════════════════════════════════════════════════════════════
+# Copy-on-write 오버레이
+# ═══════════════════════════════════════════════════════════════
+
+
+def test_cow_state_never_mutates_base_and_tracks_layers():
+    base = _base_state()
+    frozen = json.dumps(base, sort_keys=True)
+    state = _CowState(base)
+
+    assert state.nodes_in_layer("KPI") == ["kpi_cost", "kpi_rev"]
+    state.set_field("kpi_cost", "value", 120)
+    state.set_field("proc_1", "label", "Kpi")          # 계층 이동
+    state.set_field("new_node", "layer", "Driver")      # 새 노드
+
+    assert json.dumps(base, sort_keys=True) == frozen
+    assert state.get_field("kpi_cost", "value") == 120 and state.node("kpi_cost")["tags"] == ["a"]
+    assert state.nodes_in_layer("kpi") == ["kpi_cost", "kpi_rev", "proc_1"]
+    assert state.nodes_in_layer("driver") == ["new_node"]
+    assert state.diff() == {
+        "kpi_cost": {"value": {"base": 100, "value": 120}},
+        "proc_1": {"label": {"base": "Process", "value": "Kpi"}},
+        "new_node": {"layer": {"base": None, "value": "Driver"}},
+    }
+    assert state.materialize()["kpi_rev"] is base["kpi_rev"]
+
+
+def test_rule_index_groups_by_event_type_in_priority_order():
+    index = _LightweightGWTEvaluator.index_rules(
+        [_rule("b", "E", priority=5), _rule("a", "E", priority=1), _rule("x", "F")]
+    )
+    assert [r.id for r in index["E"]] == ["b", "a"]
+    assert set(index) == {"E", "F"}
+
+
+# ═══════════════════════════════════════════════════════════════
+# 시뮬레이션 + 델타/체크포인트
+# ═══════════════════════════════════════════════════════════════
+
+
+def test_simulate_applies_cascade_without_touching_base(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(fork, "CHECKPOINT_INTERVAL", 2)
+    base = _base_state()
+    engine = _engine()
+    index = engine._gwt_evaluator.index_rules(_RULES)
+
+    run = engine._simulate(base, _interventions(("kpi_cost", "value", 130), ("kpi_new", "value", 7)), index)
+
+    assert run.converged and run.depth == 3
+    assert [e["event_type"] for e in run.events] == [
+        "INTERVENTION_APPLIED", "INTERVENTION_APPLIED", "COST_ALERT", "COST_ALERT", "EXECUTE_r3", "EXECUTE_r3",
+    ]
+    assert base == _base_state()
+    final = run.state.materialize()
+    assert final["proc_1"]["status"] == "THROTTLED" and final["kpi_rev"]["value"] == 45
+    # 존재하지 않는 노드를 가리키는 SET은 무시된다 (chained_from="r2")
+    assert "r2" not in final and final["kpi_new"] == {"value": 7}
+    # 이전 구현처럼 기준 상태에 있던 수치 필드만 KPI 델타
+    assert engine._kpi_deltas_from_diff(run.state.diff()) == {"kpi_cost::value": 30, "kpi_rev::value": -5}
+
+
+def test_deltas_and_checkpoints_reconstruct_every_sequence(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(fork, "CHECKPOINT_INTERVAL", 2)
+    engine = _engine()
+    index = engine._gwt_evaluator.index_rules(_RULES)
+    run = engine._simulate(_base_state(), _interventions(("kpi_cost", "value", 130), ("proc_1", "status", "X")), index)
+    events = run.events
+
+    assert [e["sequence"] for e in events if e["state_snapshot"] is not None] == [1, 3, 5]
+    # 개입 단계의 룰 쓰기는 마지막 개입 이벤트에 합쳐져 재생 순서가 실제 적용 순서와 같다
+    assert events[1]["state_delta"] == {"proc_1": {"status": "THROTTLED"}}
+    assert events[0]["state_delta"] == {"kpi_cost": {"value": 130}}
+
+    for seq in range(len(events)):
+        full = replay_overlay(None, [e["state_delta"] for e in events[: seq + 1]])
+        checkpoint = max((e for e in events[: seq + 1] if e["state_snapshot"] is not None),
+                         key=lambda e: e["sequence"], default=None)
+        start = checkpoint["sequence"] + 1 if checkpoint else 0
+        from_checkpoint = replay_overlay(
+            checkpoint["state_snapshot"] if checkpoint else None,
+            [e["state_delta"] for e in events[start: seq + 1]],
+        )
+        assert from_checkpoint == full, seq
+    assert full == run.state.changes()
+    json.dumps(events)  # 저장 가능한 형태
+
+
+# ═══════════════════════════════════════════════════════════════
+# 시나리오 비교
+# ═══════════════════════════════════════════════════════════════
+
+
+def test_diff_overlays_reports_only_divergent_fields():
+    a = {"kpi_cost": {"value": {"base": 100, "value": 80}}, "proc_1": {"status": {"base": "R", "value": "T"}}}
+    b = {"kpi_cost": {"value": {"base": 100, "value": 90}}, "proc_1": {"status": {"base": "R", "value": "T"}}}
+    c = {}
+    assert EventForkEngine._diff_overlays({"a": a, "b": b, "c": c}) == {
+        "kpi_cost::value": {"a": 80, "b": 90, "c": 100},
+        "proc_1::status": {"a": "T", "b": "T", "c": "R"},
+    }
+    assert EventForkEngine._diff_overlays({"a": a, "b": a}) == {}
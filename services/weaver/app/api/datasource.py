@@ -231,9 +231,9 @@ async def create_datasource(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload=payload.model_dump())
+    cached = await idempotency_store.ensure(key=idem_key, payload=payload.model_dump())
     if cached:
         return cached["response"]
     _ensure_writer(user)
@@ -272,7 +272,7 @@ async def create_datasource(
         **ds,
         "connection": _sanitize_connection(ds["connection"]),
     }
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint(payload.model_dump()),
         status_code=201,
@@ -307,9 +307,9 @@ async def delete_datasource(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload={"name": name, "op": "delete"})
+    cached = await idempotency_store.ensure(key=idem_key, payload={"name": name, "op": "delete"})
     if cached:
         return cached["response"]
     _ensure_writer(user)
@@ -339,7 +339,7 @@ async def delete_datasource(
             "columns": columns,
         },
     }
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint({"name": name, "op": "delete"}),
         status_code=200,
@@ -367,9 +367,9 @@ async def update_connection(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload={"name": name, **payload.model_dump(exclude_none=True)})
+    cached = await idempotency_store.ensure(key=idem_key, payload={"name": name, **payload.model_dump(exclude_none=True)})
     if cached:
         return cached["response"]
     _ensure_writer(user)
@@ -378,7 +378,7 @@ async def update_connection(
     ds["connection"].update(changed)
     ds["status"] = "connected"
     response = {"name": name, "connection": _sanitize_connection(ds["connection"]), "status": ds["status"]}
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint({"name": name, **payload.model_dump(exclude_none=True)}),
         status_code=200,
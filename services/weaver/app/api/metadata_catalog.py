@@ -11,6 +11,7 @@ from app.core.auth import CurrentUser, auth_service
 from app.core.config import settings
 from app.core.error_codes import external_service_http_exception
 from app.services.audit_log import audit_log_service
+from app.services.glossary_search import SEARCH_MAX_PAGE_SIZE, SEARCH_TYPEAHEAD_K, rank_items
 from app.services.synapse_metadata_client import SynapseMetadataClientError, synapse_metadata_client
 from app.services.postgres_metadata_store import PostgresStoreUnavailableError, postgres_metadata_store
 from app.services.request_guard import idempotency_store, rate_limiter
@@ -287,9 +288,9 @@ async def create_snapshot(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload={"case_id": case_id, "ds_name": ds_name, **payload.model_dump()})
+    cached = await idempotency_store.ensure(key=idem_key, payload={"case_id": case_id, "ds_name": ds_name, **payload.model_dump()})
     if cached:
         return cached["response"]
     _ensure_writer(user)
@@ -335,7 +336,7 @@ async def create_snapshot(
                 duration_ms=int((time.perf_counter() - started) * 1000),
                 metadata={"case_id": case_id, "datasource": ds_name},
             )
-            idempotency_store.set(
+            await idempotency_store.set(
                 idem_key or "",
                 fingerprint=idempotency_store.fingerprint({"case_id": case_id, "ds_name": ds_name, **payload.model_dump()}),
                 status_code=202,
@@ -359,7 +360,7 @@ async def create_snapshot(
                 duration_ms=int((time.perf_counter() - started) * 1000),
                 metadata={"case_id": case_id, "datasource": ds_name},
             )
-            idempotency_store.set(
+            await idempotency_store.set(
                 idem_key or "",
                 fingerprint=idempotency_store.fingerprint({"case_id": case_id, "ds_name": ds_name, **payload.model_dump()}),
                 status_code=202,
@@ -381,7 +382,7 @@ async def create_snapshot(
         duration_ms=int((time.perf_counter() - started) * 1000),
         metadata={"case_id": case_id, "datasource": ds_name},
     )
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint({"case_id": case_id, "ds_name": ds_name, **payload.model_dump()}),
         status_code=202,
@@ -605,9 +606,9 @@ async def delete_snapshot(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(
+    cached = await idempotency_store.ensure(
         key=idem_key,
         payload={"op": "delete_snapshot", "case_id": case_id, "ds_name": ds_name, "snapshot_id": snapshot_id},
     )
@@ -634,7 +635,7 @@ async def delete_snapshot(
             raise HTTPException(status_code=404, detail="SNAPSHOT_NOT_FOUND")
         del bucket[snapshot_id]
     response = {"deleted": True, "snapshot_id": snapshot_id}
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint(
             {"op": "delete_snapshot", "case_id": case_id, "ds_name": ds_name, "snapshot_id": snapshot_id}
@@ -664,9 +665,9 @@ async def create_term(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload=payload.model_dump())
+    cached = await idempotency_store.ensure(key=idem_key, payload=payload.model_dump())
     if cached:
         return cached["response"]
     _ensure_writer(user)
@@ -692,7 +693,7 @@ async def create_term(
                 request_id=_request_id(request, request_id),
                 duration_ms=int((time.perf_counter() - started) * 1000),
             )
-            idempotency_store.set(
+            await idempotency_store.set(
                 idem_key or "",
                 fingerprint=idempotency_store.fingerprint(payload.model_dump()),
                 status_code=201,
@@ -713,7 +714,7 @@ async def create_term(
                 request_id=_request_id(request, request_id),
                 duration_ms=int((time.perf_counter() - started) * 1000),
             )
-            idempotency_store.set(
+            await idempotency_store.set(
                 idem_key or "",
                 fingerprint=idempotency_store.fingerprint(payload.model_dump()),
                 status_code=201,
@@ -732,7 +733,7 @@ async def create_term(
         request_id=_request_id(request, request_id),
         duration_ms=int((time.perf_counter() - started) * 1000),
     )
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint(payload.model_dump()),
         status_code=201,
@@ -764,29 +765,46 @@ async def list_terms(user: CurrentUser = Depends(get_current_user)):
     return {"items": items, "total": len(items)}
 
 
+def _typeahead_item(item: dict[str, Any]) -> dict[str, Any]:
+    return {"id": item["id"], "term": item["term"]}
+
+
 @router.get("/glossary/search")
-async def search_terms(q: str = Query(..., min_length=1), user: CurrentUser = Depends(get_current_user)):
+async def search_terms(
+    q: str = Query(..., min_length=1),
+    limit: int | None = Query(None, ge=1, le=SEARCH_MAX_PAGE_SIZE),
+    cursor: str | None = Query(None),
+    typeahead: bool = Query(False, description="match term names only and return the top-k (id, term)"),
+    k: int = Query(SEARCH_TYPEAHEAD_K, ge=1, le=50),
+    user: CurrentUser = Depends(get_current_user),
+):
     _ensure_reader(user)
-    if settings.metadata_pg_mode:
-        try:
-            items = await postgres_metadata_store.search_glossary_terms(q, tenant_id=_tenant_id(user))
-            return {"items": items, "total": len(items)}
-        except PostgresStoreUnavailableError as exc:
-            raise _svc_error("postgres", "POSTGRES_UNAVAILABLE", exc) from exc
-    if settings.metadata_external_mode:
-        try:
-            items = await synapse_metadata_client.search_glossary_terms(q, tenant_id=_tenant_id(user))
-            return {"items": items, "total": len(items)}
-        except SynapseMetadataClientError as exc:
-            raise _svc_error("synapse", "SYNAPSE_UNAVAILABLE", exc) from exc
-    query = q.lower()
-    items = [
-        x
-        for x in weaver_runtime.glossary.values()
-        if str(x.get("tenant_id") or "") == _tenant_id(user)
-        and (query in x["term"].lower() or query in x["definition"].lower())
-    ]
-    return {"items": items, "total": len(items)}
+    if typeahead:
+        limit, cursor = k, None
+    try:
+        if settings.metadata_pg_mode:
+            try:
+                items, next_cursor = await postgres_metadata_store.search_glossary_page(
+                    q, tenant_id=_tenant_id(user), limit=limit, cursor=cursor, term_only=typeahead,
+                )
+            except PostgresStoreUnavailableError as exc:
+                raise _svc_error("postgres", "POSTGRES_UNAVAILABLE", exc) from exc
+        else:
+            if settings.metadata_external_mode:
+                try:
+                    candidates = await synapse_metadata_client.search_glossary_terms(q, tenant_id=_tenant_id(user))
+                except SynapseMetadataClientError as exc:
+                    raise _svc_error("synapse", "SYNAPSE_UNAVAILABLE", exc) from exc
+            else:
+                candidates = [
+                    x for x in weaver_runtime.glossary.values() if str(x.get("tenant_id") or "") == _tenant_id(user)
+                ]
+            items, next_cursor = rank_items(candidates, q, limit=limit, cursor=cursor, term_only=typeahead)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="INVALID_CURSOR") from exc
+    if typeahead:
+        items, next_cursor = [_typeahead_item(x) for x in items], None
+    return {"items": items, "total": len(items), "next_cursor": next_cursor}
 
 
 @router.get("/glossary/{term_id}")
@@ -819,10 +837,10 @@ async def update_term(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_payload = {"term_id": term_id, **payload.model_dump(exclude_none=True)}
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload=idem_payload)
+    cached = await idempotency_store.ensure(key=idem_key, payload=idem_payload)
     if cached:
         return cached["response"]
     _ensure_writer(user)
@@ -855,7 +873,7 @@ async def update_term(
                 request_id=_request_id(request, request_id),
                 duration_ms=int((time.perf_counter() - started) * 1000),
             )
-            idempotency_store.set(
+            await idempotency_store.set(
                 idem_key or "",
                 fingerprint=idempotency_store.fingerprint(idem_payload),
                 status_code=200,
@@ -876,7 +894,7 @@ async def update_term(
                 request_id=_request_id(request, request_id),
                 duration_ms=int((time.perf_counter() - started) * 1000),
             )
-            idempotency_store.set(
+            await idempotency_store.set(
                 idem_key or "",
                 fingerprint=idempotency_store.fingerprint(idem_payload),
                 status_code=200,
@@ -894,7 +912,7 @@ async def update_term(
         request_id=_request_id(request, request_id),
         duration_ms=int((time.perf_counter() - started) * 1000),
     )
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint(idem_payload),
         status_code=200,
@@ -912,9 +930,9 @@ async def delete_term(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload={"op": "delete_term", "term_id": term_id})
+    cached = await idempotency_store.ensure(key=idem_key, payload={"op": "delete_term", "term_id": term_id})
     if cached:
         return cached["response"]
     _ensure_writer(user)
@@ -938,7 +956,7 @@ async def delete_term(
             raise HTTPException(status_code=404, detail="TERM_NOT_FOUND")
         del weaver_runtime.glossary[key]
     response = {"deleted": True, "term_id": term_id}
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint({"op": "delete_term", "term_id": term_id}),
         status_code=200,
@@ -1082,11 +1100,19 @@ async def entities_by_tag(tag: str, user: CurrentUser = Depends(get_current_user
 
 
 @router.get("/search")
-async def metadata_search(q: str = Query(..., min_length=1), user: CurrentUser = Depends(get_current_user)):
+async def metadata_search(
+    q: str = Query(..., min_length=1),
+    typeahead: bool = Query(False, description="return only the top-k results"),
+    k: int = Query(SEARCH_TYPEAHEAD_K, ge=1, le=50),
+    user: CurrentUser = Depends(get_current_user),
+):
     _ensure_reader(user)
+    limit = k if typeahead else None
     if settings.metadata_pg_mode:
         try:
-            term_items = await postgres_metadata_store.search_glossary_terms(q, tenant_id=_tenant_id(user))
+            term_items, _ = await postgres_metadata_store.search_glossary_page(
+                q, tenant_id=_tenant_id(user), limit=limit, term_only=typeahead,
+            )
             results = [{"type": "term", "name": x["term"], "id": x["id"]} for x in term_items]
             return {"items": results, "total": len(results)}
         except PostgresStoreUnavailableError as exc:
@@ -1094,6 +1120,7 @@ async def metadata_search(q: str = Query(..., min_length=1), user: CurrentUser =
     if settings.metadata_external_mode:
         try:
             term_items = await synapse_metadata_client.search_glossary_terms(q, tenant_id=_tenant_id(user))
+            term_items, _ = rank_items(term_items, q, limit=limit, term_only=typeahead)
             results = [{"type": "term", "name": x["term"], "id": x["id"]} for x in term_items]
             return {"items": results, "total": len(results)}
         except SynapseMetadataClientError as exc:
@@ -1105,11 +1132,14 @@ async def metadata_search(q: str = Query(..., min_length=1), user: CurrentUser =
             continue
         if query in ds["name"].lower():
             results.append({"type": "datasource", "name": ds["name"]})
-    for term in weaver_runtime.glossary.values():
-        if str(term.get("tenant_id") or "") != _tenant_id(user):
-            continue
-        if query in term["term"].lower():
-            results.append({"type": "term", "name": term["term"], "id": term["id"]})
+    terms = [
+        x for x in weaver_runtime.glossary.values() if str(x.get("tenant_id") or "") == _tenant_id(user)
+    ]
+    # in-memory /search has always matched term names only; prefix-only short queries are typeahead-only
+    term_items, _ = rank_items(terms, q, term_only=typeahead, include_definition=False)
+    results.extend({"type": "term", "name": x["term"], "id": x["id"]} for x in term_items)
+    if limit is not None:
+        results = results[:limit]
     return {"items": results, "total": len(results)}
 
 
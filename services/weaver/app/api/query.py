@@ -137,9 +137,9 @@ async def execute_query(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:execute", limit=120)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:execute", limit=120)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload=payload.model_dump())
+    cached = await idempotency_store.ensure(key=idem_key, payload=payload.model_dump())
     if cached:
         return cached["response"]
     _ensure_executor(user)
@@ -173,7 +173,7 @@ async def execute_query(
             duration_ms=int((time.perf_counter() - started) * 1000),
             metadata={"row_count": response["row_count"]},
         )
-        idempotency_store.set(
+        await idempotency_store.set(
             idem_key or "",
             fingerprint=idempotency_store.fingerprint(payload.model_dump()),
             status_code=200,
@@ -203,7 +203,7 @@ async def execute_query(
         duration_ms=int((time.perf_counter() - started) * 1000),
         metadata={"row_count": response["row_count"]},
     )
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint(payload.model_dump()),
         status_code=200,
@@ -251,9 +251,9 @@ async def create_materialized_table(
     idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ):
     started = time.perf_counter()
-    rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
+    await rate_limiter.check(f"{user.user_id}:{request.url.path}:write", limit=60)
     idem_key = _idem_key(user, request.url.path, idempotency_key)
-    cached = idempotency_store.ensure(key=idem_key, payload=payload.model_dump())
+    cached = await idempotency_store.ensure(key=idem_key, payload=payload.model_dump())
     if cached:
         return cached["response"]
     _ensure_executor(user)
@@ -323,7 +323,7 @@ async def create_materialized_table(
         duration_ms=int((time.perf_counter() - started) * 1000),
         metadata={"replace_if_exists": payload.replace_if_exists},
     )
-    idempotency_store.set(
+    await idempotency_store.set(
         idem_key or "",
         fingerprint=idempotency_store.fingerprint(payload.model_dump()),
         status_code=201,
@@ -34,6 +34,8 @@ class Settings:
         self.request_guard_redis_mode = _enabled("WEAVER_REQUEST_GUARD_REDIS_MODE")
         self.redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
         self.request_guard_idempotency_ttl_seconds = int(os.getenv("WEAVER_REQUEST_GUARD_IDEMPOTENCY_TTL_SECONDS", "600"))
+        # fixed | sliding | token_bucket
+        self.request_guard_rate_limit_strategy = os.getenv("WEAVER_REQUEST_GUARD_RATE_LIMIT_STRATEGY", "fixed").strip().lower()
         self.weaver_cors_allowed_origins = _sanitize_origins(
             _csv_list("WEAVER_CORS_ALLOWED_ORIGINS", "https://app.axiom.kr,https://canvas.axiom.kr")
         )
@@ -4,47 +4,80 @@ Tracks columns that appear together in the same query.  Used to replace
 join_edges proxy with real co-occurrence data for DRIVER-DRIVER and
 DRIVER-DIMENSION edges.
 
-Cost control: ``max_cols_per_query`` (default 50) caps per-query pairs
-at O(50^2) = O(2500).
+Counting: with scipy available, pairs are counted in one sparse product
+``X.T @ X`` over the query-by-column incidence matrix, so no per-query column
+cap is needed (``max_cols_per_query=None``).  Without scipy the pure-Python
+pair loop is used and per-query columns are capped at
+``FALLBACK_MAX_COLS_PER_QUERY`` (O(50^2) pairs per query).
+
+Lookup: ``CooccurMatrix`` keeps a column -> {partner: count} adjacency index
+maintained on ``add``; ``top_partners`` reads a per-column sorted view that is
+rebuilt only after that column changes.
 """
 from __future__ import annotations
 
+import logging
 from collections import Counter
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_MAX_COLS_PER_QUERY = 50
 
 
 @dataclass
 class CooccurConfig:
-    max_cols_per_query: int = 50
+    max_cols_per_query: Optional[int] = None
     min_cooccur_count: int = 2
 
 
 @dataclass
 class CooccurMatrix:
-    """Symmetric co-occurrence counts between column keys."""
+    """Symmetric co-occurrence counts between column keys.
+
+    ``pair_counts`` holds sorted ``(a, b)`` keys (``(c, c)`` = self-count).
+    Update counts through ``add`` so the partner index stays in sync.
+    """
 
     pair_counts: Dict[Tuple[str, str], int] = field(default_factory=dict)
     total_queries: int = 0
+    _partners: Dict[str, Dict[str, int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _sorted: Dict[str, List[Tuple[str, int]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for (a, b), cnt in self.pair_counts.items():
+            if a != b:
+                self._partners.setdefault(a, {})[b] = cnt
+                self._partners.setdefault(b, {})[a] = cnt
+
+    def add(self, a: str, b: str, count: int = 1) -> None:
+        """Increment a pair count (or a self-count when ``a == b``)."""
+        key = (a, b) if a <= b else (b, a)
+        total = self.pair_counts.get(key, 0) + count
+        self.pair_counts[key] = total
+        if a == b:
+            return
+        self._partners.setdefault(a, {})[b] = total
+        self._partners.setdefault(b, {})[a] = total
+        self._sorted.pop(a, None)
+        self._sorted.pop(b, None)
 
     def strength(self, a: str, b: str) -> int:
         """Raw co-occurrence count for a pair."""
-        key = tuple(sorted([a, b]))
+        key = (a, b) if a <= b else (b, a)
         return self.pair_counts.get(key, 0)
 
     def top_partners(self, col_key: str, k: int = 10) -> List[Tuple[str, int]]:
         """Return top-k co-occurring partners for a given column."""
-        matches = []
-        for (a, b), cnt in self.pair_counts.items():
-            partner = None
-            if a == col_key:
-                partner = b
-            elif b == col_key:
-                partner = a
-            if partner and partner != col_key:
-                matches.append((partner, cnt))
-        matches.sort(key=lambda x: x[1], reverse=True)
-        return matches[:k]
+        ranked = self._sorted.get(col_key)
+        if ranked is None:
+            partners = self._partners.get(col_key)
+            if not partners:
+                return []
+            ranked = sorted(partners.items(), key=lambda x: x[1], reverse=True)
+            self._sorted[col_key] = ranked
+        return ranked[:k]
 
     def normalize(self, a: str, b: str) -> float:
         """Jaccard-like normalization: cooccur(a,b) / (appear(a) + appear(b) - cooccur(a,b))."""
@@ -69,12 +102,24 @@ def build_cooccur_matrix(
     if config is None:
         config = CooccurConfig()
 
+    try:
+        pair_counts = _count_pairs_sparse(per_query_columns, config)
+    except ImportError:
+        logger.debug("scipy not installed — pure-Python co-occurrence counting")
+        pair_counts = _count_pairs_python(per_query_columns, config)
+
+    return CooccurMatrix(pair_counts=pair_counts, total_queries=len(per_query_columns))
+
+
+def _count_pairs_python(
+    per_query_columns: List[Set[str]],
+    config: CooccurConfig,
+) -> Dict[Tuple[str, str], int]:
+    cap = config.max_cols_per_query or FALLBACK_MAX_COLS_PER_QUERY
     pair_counter: Counter = Counter()
-    total = 0
 
     for cols in per_query_columns:
-        total += 1
-        col_list = sorted(cols)[:config.max_cols_per_query]
+        col_list = sorted(cols)[:cap]
 
         # Self-counts (for normalization)
         for c in col_list:
@@ -87,9 +132,42 @@ def build_cooccur_matrix(
                 pair_counter[key] += 1
 
     # Prune below threshold (keep self-counts)
-    pruned = {
+    return {
         k: v for k, v in pair_counter.items()
         if v >= config.min_cooccur_count or k[0] == k[1]
     }
 
-    return CooccurMatrix(pair_counts=pruned, total_queries=total)
+
+def _count_pairs_sparse(
+    per_query_columns: List[Set[str]],
+    config: CooccurConfig,
+) -> Dict[Tuple[str, str], int]:
+    """Count pairs as the upper triangle of ``X.T @ X`` (X: query x column 0/1)."""
+    import numpy as np
+    from scipy import sparse
+
+    cap = config.max_cols_per_query
+    rows_per_query = [sorted(cols)[:cap] if cap else cols for cols in per_query_columns]
+    # Index columns in sorted order so that i < j  <=>  name_i < name_j (matches pair key order)
+    names = sorted(set().union(*rows_per_query)) if rows_per_query else []
+    if not names:
+        return {}
+    index = {name: i for i, name in enumerate(names)}
+
+    lengths = np.fromiter((len(cols) for cols in rows_per_query), dtype=np.int64, count=len(rows_per_query))
+    col_idx = np.fromiter(
+        (index[c] for cols in rows_per_query for c in cols), dtype=np.int64, count=int(lengths.sum()),
+    )
+    row_idx = np.repeat(np.arange(len(rows_per_query), dtype=np.int64), lengths)
+    incidence = sparse.csr_matrix(
+        (np.ones(len(col_idx), dtype=np.int32), (row_idx, col_idx)),
+        shape=(len(rows_per_query), len(names)),
+    )
+    counts = sparse.triu(incidence.T @ incidence).tocoo()
+
+    # Prune below threshold (keep self-counts)
+    keep = (counts.data >= config.min_cooccur_count) | (counts.row == counts.col)
+    return {
+        (names[a], names[b]): int(v)
+        for a, b, v in zip(counts.row[keep].tolist(), counts.col[keep].tolist(), counts.data[keep].tolist())
+    }
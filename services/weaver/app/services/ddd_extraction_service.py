@@ -2,8 +2,9 @@
 
 BusinessOS ontosys-main 패턴 적용:
   - 시스템 프롬프트로 DDD/이벤트스토밍 전문가 역할 부여
-  - 문서 프래그먼트 순회 → LLM 호출 → 구조화된 JSON 응답
-  - Jaccard 기반 퍼지 중복 제거
+  - 문서 프래그먼트 병렬 처리(동시성 상한) → LLM 호출 → 구조화된 JSON 응답
+  - 프롬프트 내용 해시 기반 LLM 응답 캐시 (재적재 문서는 모델 호출 생략)
+  - Jaccard 기반 퍼지 중복 제거 (정규화 키 + MinHash/LSH 후보 블로킹)
   - confidence 점수로 신뢰도 표시
   - Synapse extract-ontology 엔드포인트로 결과 적용
 
@@ -11,10 +12,14 @@ LLM이 설정되지 않은 경우 (OPENAI_API_KEY 없음) 개발용 mock 결과
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import random
 import re
+from collections import OrderedDict
 from typing import Any
 
 import httpx
@@ -23,6 +28,10 @@ from app.core.config import settings
 
 logger = logging.getLogger("axiom.weaver.ddd_extraction")
 
+EXTRACTION_CONCURRENCY = 8          # 동시에 처리하는 프래그먼트 수 상한
+EXTRACTION_CACHE_SIZE = 10_000      # LLM 응답 LRU 캐시 항목 수 (프래그먼트 단위)
+DEDUP_SIMILARITY_THRESHOLD = 0.85   # 이 값을 넘는 이름 유사도면 같은 엔티티로 병합
+
 # ── LLM 시스템 프롬프트 ──────────────────────────────────────── #
 
 DDD_EXTRACTION_SYSTEM_PROMPT = """\
@@ -73,6 +82,12 @@ class DDDExtractionService:
         self._api_key = os.getenv("OPENAI_API_KEY", "")
         self._model = os.getenv("OPENAI_MODEL", "gpt-4o")
         self._api_base = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+        self._concurrency = int(os.getenv("DDD_EXTRACTION_CONCURRENCY", str(EXTRACTION_CONCURRENCY)))
+        self._cache_size = int(os.getenv("DDD_EXTRACTION_CACHE_SIZE", str(EXTRACTION_CACHE_SIZE)))
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     # ── 메인 추출 ─────────────────────────────────────────────── #
 
@@ -101,15 +116,27 @@ class DDDExtractionService:
             "relations": [],
         }
 
-        # 각 프래그먼트에 대해 LLM 호출
-        for idx, fragment in enumerate(fragments):
-            logger.info(
-                "DDD 추출 진행: fragment %d/%d (page=%s)",
-                idx + 1, len(fragments), fragment.get("page", "?"),
-            )
-            partial = await self._extract_single(fragment, existing_context)
+        # 프래그먼트별 LLM 호출 — 동시성 상한 내에서 병렬, 결과는 입력 순서대로 병합
+        semaphore = asyncio.Semaphore(max(1, self._concurrency))
+        total_fragments = len(fragments)
+
+        async def run(idx: int, fragment: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                logger.debug(
+                    "DDD 추출 진행: fragment %d/%d (page=%s)",
+                    idx + 1, total_fragments, fragment.get("page", "?"),
+                )
+                return await self._extract_single(fragment, existing_context)
+
+        hits_before, misses_before = self.cache_hits, self.cache_misses
+        partials = await asyncio.gather(*(run(i, f) for i, f in enumerate(fragments)))
+        for partial in partials:
             for key in all_results:
                 all_results[key].extend(partial.get(key, []))
+        logger.info(
+            "DDD 추출: fragments=%d, cache_hits=%d, llm_calls=%d",
+            total_fragments, self.cache_hits - hits_before, self.cache_misses - misses_before,
+        )
 
         # 엔티티별 퍼지 중복 제거
         for key in ("aggregates", "commands", "events", "policies"):
@@ -153,10 +180,10 @@ class DDDExtractionService:
 
         # LLM 호출 또는 mock
         if not self._api_key:
-            logger.info("OPENAI_API_KEY 미설정 — mock 추출 결과 반환")
+            logger.debug("OPENAI_API_KEY 미설정 — mock 추출 결과 반환")
             raw = self._mock_extraction(fragment)
         else:
-            raw = await self._call_llm(user_prompt)
+            raw = await self._cached_llm(user_prompt)
 
         result = self._parse_llm_response(raw)
 
@@ -173,6 +200,57 @@ class DDDExtractionService:
 
         return result
 
+    # ── LLM 응답 캐시 ─────────────────────────────────────────── #
+
+    def _cache_key(self, user_prompt: str) -> str:
+        """모델 + 시스템 프롬프트 + 사용자 프롬프트의 내용 해시."""
+        digest = hashlib.sha256()
+        for part in (self._model, DDD_EXTRACTION_SYSTEM_PROMPT, user_prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    async def _cached_llm(self, user_prompt: str) -> str:
+        """같은 프롬프트는 LLM을 다시 부르지 않는다.
+
+        동시에 들어온 동일 프롬프트는 진행 중인 호출 하나를 공유하고,
+        실패 응답("{}")은 캐시하지 않아 다음 적재 때 재시도된다.
+        """
+        key = self._cache_key(user_prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.cache_hits += 1
+            return await asyncio.shield(pending)
+
+        self.cache_misses += 1
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            raw = await self._call_llm(user_prompt)
+            future.set_result(raw)
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # 대기자가 없을 때 "never retrieved" 경고 방지
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        if raw.strip() not in ("", "{}") and self._cache_size > 0:
+            self._cache[key] = raw
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return raw
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     async def _call_llm(self, user_prompt: str) -> str:
         """OpenAI API 호출하여 JSON 응답 텍스트 반환."""
         url = f"{self._api_base}/chat/completions"
@@ -205,8 +283,13 @@ class DDDExtractionService:
         """이름 기반 퍼지 중복 제거 (유사도 > 0.85이면 병합).
 
         동일/유사 이름이면 confidence가 높은 엔티티를 유지한다.
+        유사도(문자 집합 Jaccard)는 정규화 이름의 문자 집합에만 의존하므로 그 집합을
+        블로킹 키로 쓴다: 이미 본 집합이면 dict 조회로 끝나고, 처음 보는 집합만
+        MinHash/LSH 후보와 비교한다 (전체 쌍 비교 O(n²) 회피). 후보 중 가장 먼저
+        등록된 이름에 병합하므로 전수 비교와 같은 결과를 낸다.
         """
-        seen: dict[str, int] = {}  # normalized_name → result 인덱스
+        blocks: dict[frozenset[str], int] = {}  # 문자 집합 → 병합 대상 result 인덱스
+        index = _MinHashLSH()
         result: list[dict[str, Any]] = []
 
         for entity in entities:
@@ -214,20 +297,19 @@ class DDDExtractionService:
             if not name:
                 continue
             name_norm = name.lower().replace("_", "").replace("-", "").replace(" ", "")
+            chars = frozenset(name_norm)
 
             # 기존에 유사한 이름이 있는지 확인
-            duplicate = False
-            for existing_name, idx in seen.items():
-                if self._name_similarity(name_norm, existing_name) > 0.85:
-                    # confidence가 더 높으면 교체
-                    if entity.get("confidence", 0) > result[idx].get("confidence", 0):
-                        result[idx] = entity
-                    duplicate = True
-                    break
-
-            if not duplicate:
-                seen[name_norm] = len(result)
-                result.append(entity)
+            idx = blocks.get(chars)
+            if idx is None:
+                idx = index.match_or_add(chars, len(result), DEDUP_SIMILARITY_THRESHOLD)
+                if idx == len(result):
+                    result.append(entity)
+                blocks[chars] = idx
+
+            # confidence가 더 높으면 교체 (방금 추가된 자기 자신이면 변화 없음)
+            if entity.get("confidence", 0) > result[idx].get("confidence", 0):
+                result[idx] = entity
 
         return result
 
@@ -421,5 +503,74 @@ class DDDExtractionService:
         }
 
 
+_MINHASH_PRIME = (1 << 61) - 1
+
+
+def _minhash_params(count: int, seed: int = 0x5EED) -> list[tuple[int, int]]:
+    """MinHash 해시 계열 (a·x + b) mod p 의 계수 — 고정 시드라 프로세스마다 동일."""
+    rng = random.Random(seed)
+    return [(rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME)) for _ in range(count)]
+
+
+class _MinHashLSH:
+    """문자 집합 MinHash + 밴드 LSH — Jaccard 유사도가 높은 문자 집합 후보를 찾는다.
+
+    후보는 비트마스크 popcount로 정확한 Jaccard를 다시 확인한다. 밴드 16 x 행 4
+    (서명 64개): Jaccard 0.85 쌍을 놓칠 확률 ≈ (1 - 0.85⁴)¹⁶ < 1e-5.
+    """
+
+    BANDS = 16
+    ROWS = 4
+    _PARAMS = _minhash_params(BANDS * ROWS)
+    _char_hashes: dict[str, tuple[int, ...]] = {}
+
+    def __init__(self) -> None:
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        self._masks: dict[int, tuple[int, int]] = {}  # result 인덱스 → (비트마스크, 문자 수)
+        self._bits: dict[str, int] = {}
+
+    @classmethod
+    def _hashes(cls, ch: str) -> tuple[int, ...]:
+        row = cls._char_hashes.get(ch)
+        if row is None:
+            x = ord(ch)
+            row = tuple((a * x + b) % _MINHASH_PRIME for a, b in cls._PARAMS)
+            cls._char_hashes[ch] = row
+        return row
+
+    def _mask(self, chars: frozenset[str]) -> int:
+        mask = 0
+        for ch in chars:
+            bit = self._bits.get(ch)
+            if bit is None:
+                bit = self._bits[ch] = 1 << len(self._bits)
+            mask |= bit
+        return mask
+
+    def match_or_add(self, chars: frozenset[str], new_idx: int, threshold: float) -> int:
+        """Jaccard > threshold 인 가장 먼저 등록된 인덱스, 없으면 new_idx 로 등록 후 반환."""
+        if not chars:
+            return new_idx  # 빈 집합은 자기 자신과만 같다 — 호출 측 블로킹 키가 처리
+        sig = list(map(min, zip(*(self._hashes(ch) for ch in chars))))
+        bands = [(band, tuple(sig[band * self.ROWS:(band + 1) * self.ROWS])) for band in range(self.BANDS)]
+        found: set[int] = set()
+        for bucket in bands:
+            found.update(self._buckets.get(bucket, ()))
+
+        mask, size = self._mask(chars), len(chars)
+        for idx in sorted(found):
+            other, other_size = self._masks[idx]
+            if min(size, other_size) <= threshold * max(size, other_size):
+                continue  # 크기 차이만으로 임계값을 넘을 수 없음
+            inter = (mask & other).bit_count()
+            if inter / (size + other_size - inter) > threshold:
+                return idx
+
+        self._masks[new_idx] = (mask, size)
+        for bucket in bands:
+            self._buckets.setdefault(bucket, []).append(new_idx)
+        return new_idx
+
+
 # 싱글톤 인스턴스
 ddd_extraction_service = DDDExtractionService()
@@ -0,0 +1,91 @@
+"""Glossary search ranking + keyset cursor helpers.
+
+PostgresMetadataStore ranks in SQL (pg_trgm similarity); the in-memory and
+Synapse-backed modes use :func:`rank_items` so every mode orders results the
+same way and shares one opaque cursor format: ``(rank DESC, id ASC)``.
+
+Rank tiers (higher first):
+    3 — term equals the query
+    2 — term starts with the query
+    1 — term contains the query
+    0 — only the definition contains the query
+PostgreSQL adds ``similarity(lower(term), q)`` (0..1) on top of the tier.
+"""
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any
+
+SEARCH_TYPEAHEAD_K = 10
+SEARCH_MAX_PAGE_SIZE = 200
+
+
+def like_escape(q: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (``ESCAPE '\\'``)."""
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def match_rank(term: str, definition: str, q: str) -> float | None:
+    """Rank tier for one glossary term, or None when it does not match at all."""
+    query = q.lower()
+    term_l = term.lower()
+    if term_l == query:
+        return 3.0
+    if term_l.startswith(query):
+        return 2.0
+    if query in term_l:
+        return 1.0
+    if query in definition.lower():
+        return 0.0
+    return None
+
+
+def encode_cursor(rank: float, item_id: str) -> str:
+    raw = json.dumps([rank, item_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    """Inverse of :func:`encode_cursor`; raises ValueError for malformed input."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(rank), str(item_id)
+    except Exception as exc:  # noqa: BLE001
+        raise ValueError("invalid search cursor") from exc
+
+
+def rank_items(
+    items: list[dict[str, Any]],
+    q: str,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+    term_only: bool = False,
+    include_definition: bool | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Filter, rank and keyset-paginate glossary items in memory.
+
+    ``term_only`` is the typeahead mode (term matches only, 1-2 char queries
+    match prefixes only).  ``include_definition`` overrides whether definition
+    matches count; it defaults to ``not term_only``.
+    Returns ``(page, next_cursor)``; ``next_cursor`` is None on the last page.
+    """
+    if include_definition is None:
+        include_definition = not term_only
+    # 1-2 char typeahead matches term prefixes only, like the PostgreSQL path (trigrams need 3 chars)
+    min_rank = 2.0 if term_only and len(q) < 3 else 0.0
+    ranked: list[tuple[float, str, dict[str, Any]]] = []
+    for item in items:
+        rank = match_rank(item.get("term", ""), item.get("definition", "") if include_definition else "", q)
+        if rank is not None and rank >= min_rank:
+            ranked.append((rank, str(item.get("id", "")), item))
+    ranked.sort(key=lambda x: (-x[0], x[1]))
+    if cursor:
+        after_rank, after_id = decode_cursor(cursor)
+        ranked = [r for r in ranked if r[0] < after_rank or (r[0] == after_rank and r[1] > after_id)]
+    if limit is None or len(ranked) <= limit:
+        return [r[2] for r in ranked], None
+    page = ranked[:limit]
+    return [r[2] for r in page], encode_cursor(page[-1][0], page[-1][1])
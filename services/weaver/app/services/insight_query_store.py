@@ -9,6 +9,14 @@ logger = logging.getLogger("weaver.insight_query_store")
 
 MAX_SQL_LENGTH = 100_000  # 100 KB — skip logs exceeding this
 
+# insert_logs switches to COPY + INSERT ... SELECT at this batch size
+BULK_INSERT_MIN_ROWS = 200
+_STAGING_TABLE = "insight_query_logs_stage"
+_STAGING_COLUMNS = (
+    "ordinal", "datasource_id", "query_id", "raw_sql", "normalized_sql",
+    "sql_hash", "executed_at", "duration_ms", "user_id", "source",
+)
+
 # ── time_range utilities ─────────────────────────────────────
 
 _ALLOWED_RANGES = {"7d": 7, "30d": 30, "90d": 90}
@@ -34,6 +42,34 @@ async def insert_batch_record(conn, tenant_id: str, source: str, row_count: int)
     return row["id"]
 
 
+_INSERT_LOG_SQL = """
+    INSERT INTO weaver.insight_query_logs
+        (tenant_id, datasource_id, query_id, raw_sql, normalized_sql,
+         sql_hash, executed_at, received_at, duration_ms, user_id,
+         source, batch_id)
+    VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12)
+    ON CONFLICT (tenant_id, query_id) DO NOTHING
+    RETURNING id
+"""
+
+
+def _filter_oversized(logs: list[dict]) -> tuple[list[dict], int]:
+    """Drop logs whose raw_sql exceeds MAX_SQL_LENGTH; return (kept, skipped)."""
+    kept: list[dict] = []
+    skipped = 0
+    for log in logs:
+        raw_sql = log.get("raw_sql", "")
+        if len(raw_sql) > MAX_SQL_LENGTH:
+            logger.warning(
+                "Skipping query_id=%s: raw_sql length %d exceeds MAX_SQL_LENGTH %d",
+                log.get("query_id", "?"), len(raw_sql), MAX_SQL_LENGTH,
+            )
+            skipped += 1
+            continue
+        kept.append(log)
+    return kept, skipped
+
+
 async def insert_logs(
     conn,
     tenant_id: str,
@@ -46,32 +82,22 @@ async def insert_logs(
         query_id, raw_sql, normalized_sql, sql_hash,
         datasource_id, executed_at, duration_ms, user_id, source
 
+    Batches of at least ``BULK_INSERT_MIN_ROWS`` logs go through
+    :func:`insert_logs_bulk` (COPY + one INSERT ... SELECT); smaller ones
+    are inserted row by row.  Oversized logs count as deduped either way.
+
     Returns ``{"inserted": N, "deduped": M}``.
     """
+    kept, deduped = _filter_oversized(logs)
+    if len(kept) >= BULK_INSERT_MIN_ROWS:
+        return await _copy_logs(conn, tenant_id, kept, deduped, batch_id)
+
     inserted = 0
-    deduped = 0
     now = datetime.now(timezone.utc)
 
-    for log in logs:
-        raw_sql = log.get("raw_sql", "")
-        if len(raw_sql) > MAX_SQL_LENGTH:
-            logger.warning(
-                "Skipping query_id=%s: raw_sql length %d exceeds MAX_SQL_LENGTH %d",
-                log.get("query_id", "?"), len(raw_sql), MAX_SQL_LENGTH,
-            )
-            deduped += 1
-            continue
-
+    for log in kept:
         row = await conn.fetchrow(
-            """
-            INSERT INTO weaver.insight_query_logs
-                (tenant_id, datasource_id, query_id, raw_sql, normalized_sql,
-                 sql_hash, executed_at, received_at, duration_ms, user_id,
-                 source, batch_id)
-            VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12)
-            ON CONFLICT (tenant_id, query_id) DO NOTHING
-            RETURNING id
-            """,
+            _INSERT_LOG_SQL,
             tenant_id,
             log["datasource_id"],
             log["query_id"],
@@ -93,6 +119,104 @@ async def insert_logs(
     return {"inserted": inserted, "deduped": deduped}
 
 
+async def insert_logs_bulk(
+    conn,
+    tenant_id: str,
+    logs: list[dict],
+    batch_id: int | None = None,
+) -> dict:
+    """Bulk insert via a temporary staging table.
+
+    Rows are streamed with ``copy_records_to_table`` into a session-local
+    staging table, then moved with a single
+    ``INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING`` in input order,
+    so the first occurrence of a duplicate ``query_id`` wins exactly as in the
+    row-by-row path.  Two round trips regardless of batch size.
+
+    Returns ``{"inserted": N, "deduped": M}``.
+    """
+    kept, deduped = _filter_oversized(logs)
+    return await _copy_logs(conn, tenant_id, kept, deduped, batch_id)
+
+
+async def _copy_logs(
+    conn,
+    tenant_id: str,
+    kept: list[dict],
+    deduped: int,
+    batch_id: int | None,
+) -> dict:
+    """COPY + INSERT ... SELECT for logs already passed through ``_filter_oversized``.
+
+    ``deduped`` is the count of logs already dropped by the caller.
+    """
+    if not kept:
+        return {"inserted": 0, "deduped": deduped}
+
+    now = datetime.now(timezone.utc)
+    records = [
+        (
+            ordinal,
+            log["datasource_id"],
+            log["query_id"],
+            log["raw_sql"],
+            log["normalized_sql"],
+            log["sql_hash"],
+            log.get("executed_at") or now,
+            log.get("duration_ms"),
+            log.get("user_id"),
+            log.get("source", "oracle"),
+        )
+        for ordinal, log in enumerate(kept)
+    ]
+
+    async with conn.transaction():
+        await conn.execute(
+            f"""
+            CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+                ordinal INT NOT NULL,
+                datasource_id TEXT NOT NULL,
+                query_id TEXT NOT NULL,
+                raw_sql TEXT NOT NULL,
+                normalized_sql TEXT NOT NULL,
+                sql_hash TEXT NOT NULL,
+                executed_at TIMESTAMPTZ NOT NULL,
+                duration_ms INT,
+                user_id TEXT,
+                source TEXT NOT NULL
+            ) ON COMMIT DROP;
+            TRUNCATE {_STAGING_TABLE};
+            """
+        )
+        await conn.copy_records_to_table(
+            _STAGING_TABLE, records=records, columns=_STAGING_COLUMNS,
+        )
+        row = await conn.fetchrow(
+            f"""
+            WITH ins AS (
+                INSERT INTO weaver.insight_query_logs
+                    (tenant_id, datasource_id, query_id, raw_sql, normalized_sql,
+                     sql_hash, executed_at, received_at, duration_ms, user_id,
+                     source, batch_id)
+                SELECT $1, datasource_id, query_id, raw_sql, normalized_sql,
+                       sql_hash, executed_at, $2, duration_ms, user_id,
+                       source, $3
+                FROM {_STAGING_TABLE}
+                ORDER BY ordinal
+                ON CONFLICT (tenant_id, query_id) DO NOTHING
+                RETURNING 1
+            )
+            SELECT count(*) AS inserted FROM ins
+            """,
+            tenant_id,
+            now,
+            batch_id,
+        )
+
+    inserted = int(row["inserted"])
+    return {"inserted": inserted, "deduped": deduped + len(kept) - inserted}
+
+
 # ── KPI list ─────────────────────────────────────────────────
 
 async def fetch_kpis(
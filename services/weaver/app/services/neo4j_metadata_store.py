@@ -4,6 +4,7 @@ import json
 from typing import Any
 
 from app.core.config import settings
+from app.services.catalog_diff import CatalogDiff, chunked, current_state, desired_state, diff_catalog
 from app.services.resilience import CircuitBreakerOpenError, SimpleCircuitBreaker, with_retry
 
 
@@ -11,7 +12,154 @@ class Neo4jStoreUnavailableError(RuntimeError):
     pass
 
 
+_CATALOG_CURRENT_QUERY = """
+MATCH (s:Schema {tenant_id: $tid, datasource_name: $ds})
+OPTIONAL MATCH (s)-[:HAS_TABLE]->(t:Table)
+OPTIONAL MATCH (t)-[:HAS_COLUMN]->(c:Column)
+RETURN s.name AS schema_name, t.name AS table_name, c.name AS column_name,
+       c.dtype AS dtype, c.nullable AS nullable
+"""
+
+_CATALOG_MERGE_DATASOURCE = """
+MERGE (d:DataSource {tenant_id: $tid, name: $ds})
+SET d.engine = $engine, d.last_extracted = datetime()
+"""
+
+_CATALOG_ADD_SCHEMAS = """
+MATCH (d:DataSource {tenant_id: $tid, name: $ds})
+UNWIND $rows AS sn
+MERGE (s:Schema {tenant_id: $tid, datasource_name: $ds, name: sn})
+MERGE (d)-[:HAS_SCHEMA]->(s)
+"""
+
+# 이미 있는 스키마도 DataSource에 다시 연결 — 데이터소스를 지웠다 다시 만든 경우 등 HAS_SCHEMA만 빠진 상태 복구
+_CATALOG_LINK_SCHEMAS = """
+MATCH (d:DataSource {tenant_id: $tid, name: $ds})
+UNWIND $rows AS sn
+MATCH (s:Schema {tenant_id: $tid, datasource_name: $ds, name: sn})
+MERGE (d)-[:HAS_SCHEMA]->(s)
+"""
+
+_CATALOG_ADD_TABLES = """
+UNWIND $rows AS row
+MATCH (s:Schema {tenant_id: $tid, datasource_name: $ds, name: row.schema})
+MERGE (t:Table {tenant_id: $tid, datasource_name: $ds, schema_name: row.schema, name: row.table})
+MERGE (s)-[:HAS_TABLE]->(t)
+"""
+
+_CATALOG_UPSERT_COLUMNS = """
+UNWIND $rows AS row
+MATCH (t:Table {tenant_id: $tid, datasource_name: $ds, schema_name: row.schema, name: row.table})
+MERGE (c:Column {tenant_id: $tid, datasource_name: $ds, schema_name: row.schema, table_name: row.table, name: row.name})
+SET c.dtype = row.dtype, c.nullable = row.nullable
+MERGE (t)-[:HAS_COLUMN]->(c)
+"""
+
+_CATALOG_DELETE_COLUMNS = """
+UNWIND $rows AS row
+MATCH (c:Column {tenant_id: $tid, datasource_name: $ds, schema_name: row.schema, table_name: row.table, name: row.name})
+DETACH DELETE c
+"""
+
+_CATALOG_DELETE_TABLES = """
+UNWIND $rows AS row
+MATCH (t:Table {tenant_id: $tid, datasource_name: $ds, schema_name: row.schema, name: row.table})
+DETACH DELETE t
+"""
+
+_CATALOG_DELETE_SCHEMAS = """
+UNWIND $rows AS sn
+MATCH (s:Schema {tenant_id: $tid, datasource_name: $ds, name: sn})
+DETACH DELETE s
+"""
+
+# 데이터소스 삭제 — 하위 Column/Table/Schema 노드까지 datasource_name 기준으로 함께 지운다
+_DATASOURCE_DELETE_STATEMENTS = (
+    "MATCH (c:Column {tenant_id: $tid, datasource_name: $ds}) DETACH DELETE c",
+    "MATCH (t:Table {tenant_id: $tid, datasource_name: $ds}) DETACH DELETE t",
+    "MATCH (s:Schema {tenant_id: $tid, datasource_name: $ds}) DETACH DELETE s",
+    "MATCH (d:DataSource {tenant_id: $tid, name: $ds}) DETACH DELETE d",
+)
+
+_CATALOG_DELETE_FKS = (
+    "MATCH (:Column {tenant_id: $tid, datasource_name: $ds})-[r:FK_TO]->() DELETE r",
+    "MATCH (:Table {tenant_id: $tid, datasource_name: $ds})-[r:FK_TO_TABLE]->() DELETE r",
+)
+
+_CATALOG_ADD_FKS = """
+UNWIND $rows AS row
+MATCH (sc:Column {tenant_id: $tid, datasource_name: $ds, schema_name: row.src_schema, table_name: row.src_table, name: row.src_col})
+MATCH (tc:Column {tenant_id: $tid, datasource_name: $ds, schema_name: row.tgt_schema, table_name: row.tgt_table, name: row.tgt_col})
+MERGE (sc)-[r:FK_TO]->(tc)
+SET r.constraint_name = row.cname
+WITH row
+MATCH (st:Table {tenant_id: $tid, datasource_name: $ds, schema_name: row.src_schema, name: row.src_table})
+MATCH (tt:Table {tenant_id: $tid, datasource_name: $ds, schema_name: row.tgt_schema, name: row.tgt_table})
+MERGE (st)-[:FK_TO_TABLE]->(tt)
+"""
+
+
+def _foreign_key_rows(foreign_keys: list[dict[str, Any]]) -> list[dict[str, str]]:
+    rows = []
+    for fk in foreign_keys:
+        if not isinstance(fk, dict):
+            continue
+        row = {
+            key: str(fk.get(src) or "").strip()
+            for key, src in (
+                ("src_schema", "source_schema"), ("src_table", "source_table"), ("src_col", "source_column"),
+                ("tgt_schema", "target_schema"), ("tgt_table", "target_table"), ("tgt_col", "target_column"),
+            )
+        }
+        if not all(row.values()):
+            continue
+        row["cname"] = str(fk.get("constraint_name") or "").strip() or "fk"
+        rows.append(row)
+    return rows
+
+
+def _catalog_statements(
+    tid: str,
+    ds: str,
+    engine: str,
+    diff: CatalogDiff,
+    fk_rows: list[dict[str, str]],
+    chunk_size: int,
+    existing_schemas: list[str] | None = None,
+) -> list[tuple[str, dict[str, Any]]]:
+    """diff → (query, params) 목록. 삭제는 하위(Column)부터, 추가는 상위(Schema)부터.
+
+    existing_schemas: 유지되는 기존 스키마 — HAS_SCHEMA 관계를 MERGE로 다시 보장한다.
+    """
+    base = {"tid": tid, "ds": ds}
+    statements: list[tuple[str, dict[str, Any]]] = [(_CATALOG_MERGE_DATASOURCE, {**base, "engine": engine})]
+
+    def _add(query: str, rows: list[Any]) -> None:
+        for chunk in chunked(rows, chunk_size):
+            statements.append((query, {**base, "rows": chunk}))
+
+    _add(_CATALOG_DELETE_COLUMNS, [{"schema": s, "table": t, "name": c} for s, t, c in diff.columns_removed])
+    _add(_CATALOG_DELETE_TABLES, [{"schema": s, "table": t} for s, t in diff.tables_removed])
+    _add(_CATALOG_DELETE_SCHEMAS, diff.schemas_removed)
+    _add(_CATALOG_LINK_SCHEMAS, existing_schemas or [])
+    _add(_CATALOG_ADD_SCHEMAS, diff.schemas_added)
+    _add(_CATALOG_ADD_TABLES, [{"schema": s, "table": t} for s, t in diff.tables_added])
+    _add(
+        _CATALOG_UPSERT_COLUMNS,
+        [
+            {"schema": s, "table": t, "name": c, "dtype": dtype, "nullable": nullable}
+            for (s, t, c), (dtype, nullable) in diff.columns_added + diff.columns_changed
+        ],
+    )
+    statements.extend((query, base) for query in _CATALOG_DELETE_FKS)
+    _add(_CATALOG_ADD_FKS, fk_rows)
+    return statements
+
+
 class Neo4jMetadataStore:
+    # UNWIND 한 문장에 싣는 행 수 — 트랜잭션 하나에 여러 청크 문이 들어간다
+    _CATALOG_CHUNK_SIZE = 1000
+
     def __init__(self) -> None:
         self._driver = None
         self._breaker = SimpleCircuitBreaker(failure_threshold=3, reset_timeout_seconds=20.0)
@@ -57,6 +205,26 @@ class Neo4jMetadataStore:
     async def _write(self, query: str, params: dict[str, Any]) -> list[dict[str, Any]]:
         return await self._read(query, params)
 
+    async def _write_tx(self, statements: list[tuple[str, dict[str, Any]]]) -> None:
+        """여러 쓰기 문을 하나의 쓰기 트랜잭션으로 실행 (중간 실패 시 전체 롤백)."""
+        async def _work(tx) -> None:
+            for query, params in statements:
+                result = await tx.run(query, params)
+                await result.consume()
+
+        async def _call() -> None:
+            driver = await self._get_driver()
+            async with driver.session() as session:
+                await session.execute_write(_work)
+        try:
+            await with_retry(_call, retries=2, base_delay_seconds=0.05)
+            self._breaker.on_success()
+        except CircuitBreakerOpenError as exc:
+            raise Neo4jStoreUnavailableError(str(exc)) from exc
+        except Exception as exc:  # noqa: BLE001
+            self._breaker.on_failure()
+            raise Neo4jStoreUnavailableError(str(exc)) from exc
+
     async def save_snapshot(self, item: dict[str, Any], tenant_id: str | None = None) -> None:
         await self._write(
             """
@@ -293,10 +461,8 @@ class Neo4jMetadataStore:
         )
 
     async def delete_datasource(self, name: str, tenant_id: str | None = None) -> None:
-        await self._write(
-            "MATCH (d:DataSource {tenant_id: $tenant_id, name: $name}) DETACH DELETE d",
-            {"tenant_id": tenant_id or "", "name": name},
-        )
+        params = {"tid": tenant_id or "", "ds": name}
+        await self._write_tx([(query, params) for query in _DATASOURCE_DELETE_STATEMENTS])
 
     async def save_extracted_catalog(
         self,
@@ -311,168 +477,36 @@ class Neo4jMetadataStore:
         추출된 카탈로그를 Neo4j에 DataSource-Schema-Table-Column 구조로 저장.
         catalog: { schema_name: { table_name: [ {name, data_type, nullable} ] } }
         foreign_keys: [{ source_schema, source_table, source_column, target_schema, target_table, target_column, constraint_name }]
-        반환: { "nodes_created": int, "relationships_created": int, "duration_ms": int }
+        반환: { "nodes_created", "nodes_updated", "nodes_deleted", "relationships_created", "diff", "duration_ms" }
+
+        기존 그래프를 지우고 다시 쓰지 않고, 현재 그래프와 비교한 추가/변경/삭제분만
+        청크 단위 UNWIND 문으로 한 트랜잭션에서 반영한다. 재추출 중에도 그래프가 비지 않고,
+        실패하면 전체가 롤백된다. FK 관계는 데이터소스 단위로 같은 트랜잭션 안에서 재구성한다.
         """
-        fk_list = foreign_keys if foreign_keys is not None else []
         import time
         start = time.perf_counter()
         tid = tenant_id or ""
-        # 1) 기존 Schema 하위 그래프 제거 (Column -> Table -> Schema 순)
-        await self._write(
-            """
-            MATCH (s:Schema {tenant_id: $tenant_id, datasource_name: $name})-[:HAS_TABLE]->(t)-[:HAS_COLUMN]->(c)
-            DETACH DELETE c
-            """,
-            {"tenant_id": tid, "name": datasource_name},
-        )
-        await self._write(
-            """
-            MATCH (s:Schema {tenant_id: $tenant_id, datasource_name: $name})-[:HAS_TABLE]->(t)
-            DETACH DELETE t
-            """,
-            {"tenant_id": tid, "name": datasource_name},
-        )
-        await self._write(
-            """
-            MATCH (s:Schema {tenant_id: $tenant_id, datasource_name: $name})
-            DETACH DELETE s
-            """,
-            {"tenant_id": tid, "name": datasource_name},
-        )
-        # 2) DataSource MERGE
-        await self._write(
-            """
-            MERGE (d:DataSource {tenant_id: $tenant_id, name: $name})
-            SET d.engine = $engine, d.last_extracted = datetime()
-            """,
-            {"tenant_id": tid, "name": datasource_name, "engine": engine},
-        )
-        nodes_created = 0
-        rels_created = 0
-        # 2) Schema -> Table -> Column 생성 (tenant_id 포함해 스키마 노드 식별)
-        for schema_name, tables in catalog.items():
-            if not isinstance(tables, dict):
-                continue
-            schema_name = str(schema_name).strip()
-            if not schema_name:
-                continue
-            await self._write(
-                """
-                MATCH (d:DataSource {tenant_id: $tenant_id, name: $name})
-                MERGE (s:Schema {tenant_id: $tenant_id, datasource_name: $datasource_name, name: $schema_name})
-                MERGE (d)-[:HAS_SCHEMA]->(s)
-                """,
-                {
-                    "tenant_id": tid,
-                    "name": datasource_name,
-                    "datasource_name": datasource_name,
-                    "schema_name": schema_name,
-                },
+        rows = await self._read(_CATALOG_CURRENT_QUERY, {"tid": tid, "ds": datasource_name})
+        desired = desired_state(catalog)
+        diff = diff_catalog(current_state(rows), desired)
+        fk_rows = _foreign_key_rows(foreign_keys if foreign_keys is not None else [])
+        existing_schemas = sorted(desired.schemas - set(diff.schemas_added))
+        await self._write_tx(
+            _catalog_statements(
+                tid, datasource_name, engine, diff, fk_rows, self._CATALOG_CHUNK_SIZE, existing_schemas,
             )
-            nodes_created += 1
-            rels_created += 1
-            for table_name, columns in tables.items():
-                if not isinstance(columns, list):
-                    continue
-                table_name = str(table_name).strip()
-                if not table_name:
-                    continue
-                await self._write(
-                    """
-                    MATCH (s:Schema {tenant_id: $tenant_id, datasource_name: $datasource_name, name: $schema_name})
-                    MERGE (t:Table {tenant_id: $tenant_id, datasource_name: $datasource_name, schema_name: $schema_name, name: $table_name})
-                    MERGE (s)-[:HAS_TABLE]->(t)
-                    """,
-                    {
-                        "tenant_id": tid,
-                        "datasource_name": datasource_name,
-                        "schema_name": schema_name,
-                        "table_name": table_name,
-                    },
-                )
-                nodes_created += 1
-                rels_created += 1
-                for col in columns:
-                    if not isinstance(col, dict):
-                        continue
-                    col_name = str(col.get("name") or "").strip()
-                    if not col_name:
-                        continue
-                    dtype = str(col.get("data_type") or col.get("type") or "string")
-                    nullable = bool(col.get("nullable", True))
-                    await self._write(
-                        """
-                        MATCH (t:Table {tenant_id: $tenant_id, datasource_name: $datasource_name, schema_name: $schema_name, name: $table_name})
-                        MERGE (c:Column {tenant_id: $tenant_id, datasource_name: $datasource_name, schema_name: $schema_name, table_name: $table_name, name: $col_name})
-                        SET c.dtype = $dtype, c.nullable = $nullable
-                        MERGE (t)-[:HAS_COLUMN]->(c)
-                        """,
-                        {
-                            "tenant_id": tid,
-                            "datasource_name": datasource_name,
-                            "schema_name": schema_name,
-                            "table_name": table_name,
-                            "col_name": col_name,
-                            "dtype": dtype,
-                            "nullable": nullable,
-                        },
-                    )
-                    nodes_created += 1
-                    rels_created += 1
-        # 3) FK_TO (Column->Column), FK_TO_TABLE (Table->Table) 생성
-        for fk in fk_list:
-            if not isinstance(fk, dict):
-                continue
-            src_schema = str(fk.get("source_schema") or "").strip()
-            src_table = str(fk.get("source_table") or "").strip()
-            src_col = str(fk.get("source_column") or "").strip()
-            tgt_schema = str(fk.get("target_schema") or "").strip()
-            tgt_table = str(fk.get("target_table") or "").strip()
-            tgt_col = str(fk.get("target_column") or "").strip()
-            cname = str(fk.get("constraint_name") or "").strip() or "fk"
-            if not all([src_schema, src_table, src_col, tgt_schema, tgt_table, tgt_col]):
-                continue
-            try:
-                await self._write(
-                    """
-                    MATCH (sc:Column {tenant_id: $tid, datasource_name: $ds, schema_name: $src_schema, table_name: $src_table, name: $src_col})
-                    MATCH (tc:Column {tenant_id: $tid, datasource_name: $ds, schema_name: $tgt_schema, table_name: $tgt_table, name: $tgt_col})
-                    MERGE (sc)-[r:FK_TO]->(tc)
-                    SET r.constraint_name = $cname
-                    """,
-                    {
-                        "tid": tid,
-                        "ds": datasource_name,
-                        "src_schema": src_schema,
-                        "src_table": src_table,
-                        "src_col": src_col,
-                        "tgt_schema": tgt_schema,
-                        "tgt_table": tgt_table,
-                        "tgt_col": tgt_col,
-                        "cname": cname,
-                    },
-                )
-                rels_created += 1
-                await self._write(
-                    """
-                    MATCH (st:Table {tenant_id: $tid, datasource_name: $ds, schema_name: $src_schema, name: $src_table})
-                    MATCH (tt:Table {tenant_id: $tid, datasource_name: $ds, schema_name: $tgt_schema, name: $tgt_table})
-                    MERGE (st)-[:FK_TO_TABLE]->(tt)
-                    """,
-                    {
-                        "tid": tid,
-                        "ds": datasource_name,
-                        "src_schema": src_schema,
-                        "src_table": src_table,
-                        "tgt_schema": tgt_schema,
-                        "tgt_table": tgt_table,
-                    },
-                )
-                rels_created += 1
-            except Exception:
-                pass
+        )
+        summary = diff.summary()
+        nodes_created = summary["schemas_added"] + summary["tables_added"] + summary["columns_added"]
         duration_ms = int((time.perf_counter() - start) * 1000)
-        return {"nodes_created": nodes_created, "relationships_created": rels_created, "duration_ms": duration_ms}
+        return {
+            "nodes_created": nodes_created,
+            "nodes_updated": summary["columns_changed"],
+            "nodes_deleted": summary["schemas_removed"] + summary["tables_removed"] + summary["columns_removed"],
+            "relationships_created": nodes_created + 2 * len(fk_rows),
+            "diff": summary,
+            "duration_ms": duration_ms,
+        }
 
     def _snapshot_row_to_item(self, node: Any) -> dict[str, Any]:
         return {
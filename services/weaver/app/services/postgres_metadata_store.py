@@ -4,6 +4,7 @@ import json
 from typing import Any
 
 from app.core.config import settings
+from app.services.glossary_search import decode_cursor, encode_cursor, like_escape
 from app.services.resilience import CircuitBreakerOpenError, SimpleCircuitBreaker, with_retry
 
 
@@ -17,6 +18,8 @@ class PostgresMetadataStore:
     def __init__(self) -> None:
         self._pool = None
         self._breaker = SimpleCircuitBreaker(failure_threshold=3, reset_timeout_seconds=20.0)
+        # set by _migrate; without pg_trgm search ranks by tier only (no similarity)
+        self._trgm = False
 
     async def _get_pool(self):
         try:
@@ -122,6 +125,33 @@ class PostgresMetadataStore:
                 "CREATE UNIQUE INDEX IF NOT EXISTS uq_weaver_metadata_snapshots_tenant_case_ds_ver ON weaver_metadata_snapshots(tenant_id, case_id, datasource, version)"
             )
             await conn.execute("CREATE INDEX IF NOT EXISTS idx_weaver_metadata_glossary_terms_tenant ON weaver_metadata_glossary_terms(tenant_id)")
+            await self._migrate_search_indexes(conn)
+
+    async def _migrate_search_indexes(self, conn) -> None:
+        """Indexes backing glossary search.
+
+        - btree (tenant_id, LOWER(term) text_pattern_ops): short typeahead prefixes (< 3 chars)
+        - trigram GIN on LOWER(term) / LOWER(definition): substring LIKE '%q%' + similarity ranking
+        """
+        await conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_weaver_metadata_glossary_terms_tenant_term_prefix "
+            "ON weaver_metadata_glossary_terms(tenant_id, LOWER(term) text_pattern_ops)"
+        )
+        try:
+            await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except Exception:  # noqa: BLE001 — no privilege; fall back to checking whether a DBA installed it
+            pass
+        self._trgm = bool(await conn.fetchval("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"))
+        if not self._trgm:
+            return
+        await conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_weaver_metadata_glossary_terms_term_trgm "
+            "ON weaver_metadata_glossary_terms USING gin (LOWER(term) gin_trgm_ops)"
+        )
+        await conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_weaver_metadata_glossary_terms_definition_trgm "
+            "ON weaver_metadata_glossary_terms USING gin (LOWER(definition) gin_trgm_ops)"
+        )
 
     async def health_check(self) -> None:
         pool = await self._get_pool()
@@ -339,29 +369,62 @@ class PostgresMetadataStore:
         return result.endswith("1")
 
     async def search_glossary_terms(self, q: str, tenant_id: str | None = None) -> list[dict[str, Any]]:
+        items, _ = await self.search_glossary_page(q, tenant_id=tenant_id)
+        return items
+
+    async def search_glossary_page(
+        self,
+        q: str,
+        tenant_id: str | None = None,
+        *,
+        limit: int | None = None,
+        cursor: str | None = None,
+        term_only: bool = False,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Ranked substring search with keyset pagination (see app.services.glossary_search).
+
+        ``term_only`` skips definition matches (typeahead).  Returns ``(items, next_cursor)``.
+        Trigrams need at least 3 characters, so shorter typeahead queries match term
+        prefixes only (btree text_pattern_ops index) instead of scanning for substrings.
+        """
+        query = q.lower()
+        contains = f"%{like_escape(query)}%"
+        if term_only and len(query) < 3:
+            contains = f"{like_escape(query)}%"
+        prefix = f"{like_escape(query)}%"
+        after_rank, after_id = decode_cursor(cursor) if cursor else (None, None)
+        params: list[Any] = [query, prefix, contains, after_rank, after_id, limit + 1 if limit else None]
+        tenant_clause = ""
+        if tenant_id is not None:
+            params.append(tenant_id)
+            tenant_clause = f"tenant_id = ${len(params)} AND "
+        definition_clause = "" if term_only else " OR LOWER(definition) LIKE $3 ESCAPE '\\'"
+        similarity = "similarity(LOWER(term), $1)" if self._trgm else "0"
+        sql = f"""
+            WITH ranked AS (
+                SELECT g.*,
+                       (CASE
+                            WHEN LOWER(term) = $1 THEN 3
+                            WHEN LOWER(term) LIKE $2 ESCAPE '\\' THEN 2
+                            WHEN LOWER(term) LIKE $3 ESCAPE '\\' THEN 1
+                            ELSE 0
+                        END + {similarity})::float8 AS search_rank
+                FROM weaver_metadata_glossary_terms g
+                WHERE {tenant_clause}(LOWER(term) LIKE $3 ESCAPE '\\'{definition_clause})
+            )
+            SELECT * FROM ranked
+            WHERE $4::float8 IS NULL OR search_rank < $4 OR (search_rank = $4 AND id > $5::text)
+            ORDER BY search_rank DESC, id
+            LIMIT $6::int
+        """
         pool = await self._get_pool()
-        pattern = f"%{q.lower()}%"
         async with pool.acquire() as conn:
-            if tenant_id is None:
-                rows = await conn.fetch(
-                    """
-                    SELECT * FROM weaver_metadata_glossary_terms
-                    WHERE LOWER(term) LIKE $1 OR LOWER(definition) LIKE $1
-                    ORDER BY created_at DESC
-                    """,
-                    pattern,
-                )
-            else:
-                rows = await conn.fetch(
-                    """
-                    SELECT * FROM weaver_metadata_glossary_terms
-                    WHERE tenant_id = $1 AND (LOWER(term) LIKE $2 OR LOWER(definition) LIKE $2)
-                    ORDER BY created_at DESC
-                    """,
-                    tenant_id,
-                    pattern,
-                )
-        return [self._glossary_row_to_item(r) for r in rows]
+            rows = await conn.fetch(sql, *params)
+        next_cursor = None
+        if limit and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["search_rank"], rows[-1]["id"])
+        return [self._glossary_row_to_item(r) for r in rows], next_cursor
 
     async def stats(self, tenant_id: str | None = None) -> dict[str, int]:
         pool = await self._get_pool()
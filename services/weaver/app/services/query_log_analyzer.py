@@ -348,7 +348,7 @@ async def analyze_query_logs(
     # Build co-occur matrix (PR8)
     cooccur = build_cooccur_matrix(
         per_query_columns=per_query_columns,
-        config=CooccurConfig(max_cols_per_query=50, min_cooccur_count=2),
+        config=CooccurConfig(min_cooccur_count=2),
     )
 
     return AnalysisResult(
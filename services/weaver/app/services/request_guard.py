@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import math
 import time
 from typing import Any
 
@@ -13,8 +14,10 @@ from app.services.metrics import metrics_service
 
 try:
     import redis
+    import redis.asyncio as aioredis
 except Exception:  # pragma: no cover - optional dependency in some environments
     redis = None
+    aioredis = None
 
 logger = logging.getLogger("weaver.request_guard")
 
@@ -37,15 +40,50 @@ def _parse_idempotency_key(key: str) -> str:
     return "unknown"
 
 
+RATE_LIMIT_STRATEGIES = ("fixed", "sliding", "token_bucket")
+
+
+def _raise_rate_limited(mode: str, key: str, retry_after: int) -> None:
+    endpoint, operation = _parse_rate_limit_key(key)
+    metrics_service.inc(
+        "weaver_request_guard_rate_limited_total",
+        labels={"mode": mode, "endpoint": endpoint, "operation": operation},
+    )
+    raise HTTPException(
+        status_code=429,
+        detail={"code": "RATE_LIMITED", "retry_after_seconds": retry_after},
+    )
+
+
 class InMemoryRateLimiter:
-    def __init__(self) -> None:
+    """Process-local limiter with the same strategies as :class:`RedisRateLimiter`.
+
+    - fixed:        counter per window; every attempt (including rejected ones) counts
+    - sliding:      sliding-window counter — previous window weighted by remaining overlap
+    - token_bucket: ``limit`` tokens refilled continuously over ``window_seconds``
+    """
+
+    def __init__(self, strategy: str = "fixed") -> None:
+        if strategy not in RATE_LIMIT_STRATEGIES:
+            raise ValueError(f"unknown rate limit strategy: {strategy!r}")
+        self.strategy = strategy
         self._windows: dict[str, dict[str, float | int]] = {}
 
-    def clear(self) -> None:
+    async def clear(self) -> None:
         self._windows.clear()
 
-    def check(self, key: str, *, limit: int, window_seconds: int = 60) -> None:
+    async def check(self, key: str, *, limit: int, window_seconds: int = 60) -> None:
         now = time.time()
+        if self.strategy == "sliding":
+            retry_after = self._sliding(key, now, limit, window_seconds)
+        elif self.strategy == "token_bucket":
+            retry_after = self._token_bucket(key, now, limit, window_seconds)
+        else:
+            retry_after = self._fixed(key, now, limit, window_seconds)
+        if retry_after:
+            _raise_rate_limited("memory", key, retry_after)
+
+    def _fixed(self, key: str, now: float, limit: int, window_seconds: int) -> int:
         row = self._windows.get(key)
         if not row or now - float(row["start"]) >= window_seconds:
             row = {"start": now, "count": 0}
@@ -53,23 +91,42 @@ class InMemoryRateLimiter:
         count = int(row["count"]) + 1
         row["count"] = count
         if count > limit:
-            retry_after = max(1, window_seconds - int(now - float(row["start"])))
-            endpoint, operation = _parse_rate_limit_key(key)
-            metrics_service.inc(
-                "weaver_request_guard_rate_limited_total",
-                labels={"mode": "memory", "endpoint": endpoint, "operation": operation},
-            )
-            raise HTTPException(
-                status_code=429,
-                detail={"code": "RATE_LIMITED", "retry_after_seconds": retry_after},
-            )
+            return max(1, window_seconds - int(now - float(row["start"])))
+        return 0
+
+    def _sliding(self, key: str, now: float, limit: int, window_seconds: int) -> int:
+        slot = int(now // window_seconds)
+        row = self._windows.get(key)
+        if not row or int(row["slot"]) < slot - 1:
+            row = {"slot": slot, "prev": 0, "cur": 0}
+        elif int(row["slot"]) == slot - 1:
+            row = {"slot": slot, "prev": row["cur"], "cur": 0}
+        self._windows[key] = row
+        elapsed = now - slot * window_seconds
+        estimate = float(row["prev"]) * (1 - elapsed / window_seconds) + int(row["cur"])
+        if estimate + 1 > limit:
+            return max(1, math.ceil(window_seconds - elapsed))
+        row["cur"] = int(row["cur"]) + 1
+        return 0
+
+    def _token_bucket(self, key: str, now: float, limit: int, window_seconds: int) -> int:
+        rate = limit / window_seconds
+        row = self._windows.get(key) or {"tokens": float(limit), "ts": now}
+        tokens = min(float(limit), float(row["tokens"]) + max(0.0, now - float(row["ts"])) * rate)
+        retry_after = 0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = max(1, math.ceil((1 - tokens) / rate))
+        self._windows[key] = {"tokens": tokens, "ts": now}
+        return retry_after
 
 
 class InMemoryIdempotencyStore:
     def __init__(self) -> None:
         self._store: dict[str, dict[str, Any]] = {}
 
-    def clear(self) -> None:
+    async def clear(self) -> None:
         self._store.clear()
 
     @staticmethod
@@ -77,7 +134,10 @@ class InMemoryIdempotencyStore:
         raw = json.dumps(payload, sort_keys=True, ensure_ascii=True)
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
-    def get(self, key: str) -> dict[str, Any] | None:
+    async def get(self, key: str) -> dict[str, Any] | None:
+        return self._get(key)
+
+    def _get(self, key: str) -> dict[str, Any] | None:
         row = self._store.get(key)
         if not row:
             return None
@@ -86,8 +146,8 @@ class InMemoryIdempotencyStore:
             return None
         return row
 
-    def set(self, key: str, *, fingerprint: str, status_code: int, response: Any, ttl_seconds: int = 600) -> None:
-        existing = self.get(key) if key else None
+    async def set(self, key: str, *, fingerprint: str, status_code: int, response: Any, ttl_seconds: int = 600) -> None:
+        existing = self._get(key) if key else None
         if existing and existing["fingerprint"] != fingerprint:
             metrics_service.inc(
                 "weaver_request_guard_idempotency_mismatch_total",
@@ -105,11 +165,11 @@ class InMemoryIdempotencyStore:
             "expires_at": time.time() + ttl_seconds,
         }
 
-    def ensure(self, *, key: str | None, payload: Any) -> dict[str, Any] | None:
+    async def ensure(self, *, key: str | None, payload: Any) -> dict[str, Any] | None:
         if not key:
             return None
         fp = self.fingerprint(payload)
-        existing = self.get(key)
+        existing = self._get(key)
         if not existing:
             self._store[key] = {
                 "fingerprint": fp,
@@ -140,36 +200,109 @@ class InMemoryIdempotencyStore:
         return existing
 
 
+async def _unlink_matching(client: Any, pattern: str, batch_size: int = 500) -> None:
+    """SCAN + batched UNLINK — one round trip per ``batch_size`` keys instead of one per key."""
+    batch: list[str] = []
+    async for key in client.scan_iter(match=pattern, count=1000):
+        batch.append(key)
+        if len(batch) >= batch_size:
+            await client.unlink(*batch)
+            batch = []
+    if batch:
+        await client.unlink(*batch)
+
+
 class RedisRateLimiter:
-    def __init__(self, client: Any, key_prefix: str = "weaver") -> None:
+    """Redis-backed limiter (``redis.asyncio``) — each check is one atomic Lua script call.
+
+    Scripts take ``ARGV = [window_seconds, limit]`` and return ``{allowed, retry_after}``.
+    """
+
+    # INCR + (first hit or missing expiry) EXPIRE + TTL in one call
+    _FIXED_SCRIPT = """
+-- RG_RL_FIXED
+local count = redis.call("INCR", KEYS[1])
+local ttl = redis.call("TTL", KEYS[1])
+if ttl < 0 then
+  redis.call("EXPIRE", KEYS[1], tonumber(ARGV[1]))
+  ttl = tonumber(ARGV[1])
+end
+if count > tonumber(ARGV[2]) then
+  return {0, ttl}
+end
+return {1, ttl}
+"""
+
+    # Sliding-window counter: current + previous fixed window weighted by overlap.
+    # KEYS[1] carries a {hash tag}, so the derived per-window keys share its cluster slot.
+    _SLIDING_SCRIPT = """
+-- RG_RL_SLIDING
+local now = redis.call("TIME")
+local t = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local slot = math.floor(t / window)
+local elapsed = t - slot * window
+local cur_key = KEYS[1] .. ":" .. string.format("%d", slot)
+local prev = tonumber(redis.call("GET", KEYS[1] .. ":" .. string.format("%d", slot - 1)) or "0")
+local cur = tonumber(redis.call("GET", cur_key) or "0")
+if prev * (1 - elapsed / window) + cur + 1 > limit then
+  return {0, math.max(1, math.ceil(window - elapsed))}
+end
+redis.call("INCR", cur_key)
+redis.call("EXPIRE", cur_key, window * 2)
+return {1, 0}
+"""
+
+    # Token bucket: capacity = limit, refill = limit / window_seconds per second
+    _TOKEN_BUCKET_SCRIPT = """
+-- RG_RL_TOKEN_BUCKET
+local now = redis.call("TIME")
+local t = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local window = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local rate = capacity / window
+local data = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(data[1]) or capacity
+local ts = tonumber(data[2]) or t
+tokens = math.min(capacity, tokens + math.max(0, t - ts) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+  allowed = 1
+else
+  retry_after = math.max(1, math.ceil((1 - tokens) / rate))
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(t))
+redis.call("EXPIRE", KEYS[1], math.ceil(window) + 1)
+return {allowed, retry_after}
+"""
+
+    _SCRIPTS = {"fixed": _FIXED_SCRIPT, "sliding": _SLIDING_SCRIPT, "token_bucket": _TOKEN_BUCKET_SCRIPT}
+
+    def __init__(self, client: Any, key_prefix: str = "weaver", strategy: str = "fixed") -> None:
+        if strategy not in RATE_LIMIT_STRATEGIES:
+            raise ValueError(f"unknown rate limit strategy: {strategy!r}")
         self._client = client
         self._key_prefix = key_prefix
+        self.strategy = strategy
+        self._script = client.register_script(self._SCRIPTS[strategy])
 
     def _key(self, raw_key: str) -> str:
         key_hash = hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
-        return f"{self._key_prefix}:rl:{key_hash}"
+        if self.strategy == "fixed":
+            return f"{self._key_prefix}:rl:{key_hash}"
+        return f"{self._key_prefix}:rl:{self.strategy}:{{{key_hash}}}"
 
-    def clear(self) -> None:
-        for key in self._client.scan_iter(f"{self._key_prefix}:rl:*"):
-            self._client.delete(key)
+    async def clear(self) -> None:
+        await _unlink_matching(self._client, f"{self._key_prefix}:rl:*")
 
-    def check(self, key: str, *, limit: int, window_seconds: int = 60) -> None:
-        redis_key = self._key(key)
-        count = int(self._client.incr(redis_key))
-        if count == 1:
-            self._client.expire(redis_key, window_seconds)
-        if count > limit:
-            ttl = int(self._client.ttl(redis_key))
-            retry_after = max(1, ttl if ttl > 0 else window_seconds)
-            endpoint, operation = _parse_rate_limit_key(key)
-            metrics_service.inc(
-                "weaver_request_guard_rate_limited_total",
-                labels={"mode": "redis", "endpoint": endpoint, "operation": operation},
-            )
-            raise HTTPException(
-                status_code=429,
-                detail={"code": "RATE_LIMITED", "retry_after_seconds": retry_after},
-            )
+    async def check(self, key: str, *, limit: int, window_seconds: int = 60) -> None:
+        allowed, retry_after = await self._script(keys=[self._key(key)], args=[window_seconds, limit])
+        if not int(allowed):
+            retry_after = int(retry_after)
+            _raise_rate_limited("redis", key, max(1, retry_after if retry_after > 0 else window_seconds))
 
 
 class RedisIdempotencyStore:
@@ -201,6 +334,8 @@ return {"COMPLETED"}
     def __init__(self, client: Any, key_prefix: str = "weaver") -> None:
         self._client = client
         self._key_prefix = key_prefix
+        self._reserve = client.register_script(self._RESERVE_SCRIPT)
+        self._complete = client.register_script(self._COMPLETE_SCRIPT)
 
     def _key(self, idempotency_key: str) -> str:
         return f"{self._key_prefix}:idem:{idempotency_key}"
@@ -210,19 +345,18 @@ return {"COMPLETED"}
         raw = json.dumps(payload, sort_keys=True, ensure_ascii=True)
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
-    def clear(self) -> None:
-        for key in self._client.scan_iter(f"{self._key_prefix}:idem:*"):
-            self._client.delete(key)
+    async def clear(self) -> None:
+        await _unlink_matching(self._client, f"{self._key_prefix}:idem:*")
 
-    def get(self, key: str) -> dict[str, Any] | None:
+    async def get(self, key: str) -> dict[str, Any] | None:
         if not key:
             return None
-        raw = self._client.get(self._key(key))
+        raw = await self._client.get(self._key(key))
         if not raw:
             return None
         return json.loads(str(raw))
 
-    def set(self, key: str, *, fingerprint: str, status_code: int, response: Any, ttl_seconds: int = 600) -> None:
+    async def set(self, key: str, *, fingerprint: str, status_code: int, response: Any, ttl_seconds: int = 600) -> None:
         if not key:
             return
         ttl = ttl_seconds if ttl_seconds > 0 else settings.request_guard_idempotency_ttl_seconds
@@ -236,7 +370,7 @@ return {"COMPLETED"}
             ensure_ascii=True,
             sort_keys=True,
         )
-        result = self._client.eval(self._COMPLETE_SCRIPT, 1, self._key(key), fingerprint, value, ttl)
+        result = await self._complete(keys=[self._key(key)], args=[fingerprint, value, ttl])
         status = result[0] if isinstance(result, (list, tuple)) and result else result
         if status == "MISMATCH":
             metrics_service.inc(
@@ -248,7 +382,7 @@ return {"COMPLETED"}
                 detail={"code": "IDEMPOTENCY_KEY_REUSE_MISMATCH"},
             )
 
-    def ensure(self, *, key: str | None, payload: Any) -> dict[str, Any] | None:
+    async def ensure(self, *, key: str | None, payload: Any) -> dict[str, Any] | None:
         if not key:
             return None
         fp = self.fingerprint(payload)
@@ -262,18 +396,15 @@ return {"COMPLETED"}
             ensure_ascii=True,
             sort_keys=True,
         )
-        result = self._client.eval(
-            self._RESERVE_SCRIPT,
-            1,
-            self._key(key),
-            reserve,
-            settings.request_guard_idempotency_ttl_seconds,
+        result = await self._reserve(
+            keys=[self._key(key)],
+            args=[reserve, settings.request_guard_idempotency_ttl_seconds],
         )
         status = result[0] if isinstance(result, (list, tuple)) and result else result
         if status == "RESERVED":
             return None
         raw_existing = result[1] if isinstance(result, (list, tuple)) and len(result) > 1 else None
-        existing = json.loads(str(raw_existing)) if raw_existing else self.get(key)
+        existing = json.loads(str(raw_existing)) if raw_existing else await self.get(key)
         if not existing:
             return None
         if existing["fingerprint"] != fp:
@@ -298,23 +429,29 @@ return {"COMPLETED"}
 
 
 def _build_request_guard() -> tuple[Any, Any]:
+    strategy = settings.request_guard_rate_limit_strategy
+    if strategy not in RATE_LIMIT_STRATEGIES:
+        logger.warning("Unknown rate limit strategy %r; using fixed window", strategy)
+        strategy = "fixed"
     if settings.request_guard_redis_mode:
         if redis is None:
             logger.warning("Redis mode enabled but redis package is unavailable; fallback to in-memory request guard")
-            return InMemoryRateLimiter(), InMemoryIdempotencyStore()
+            return InMemoryRateLimiter(strategy), InMemoryIdempotencyStore()
+        options = {"decode_responses": True, "socket_connect_timeout": 1.0, "socket_timeout": 1.0}
         try:
-            client = redis.Redis.from_url(
-                settings.redis_url,
-                decode_responses=True,
-                socket_connect_timeout=1.0,
-                socket_timeout=1.0,
-            )
-            client.ping()
-            logger.info("Redis request guard enabled. redis_url=%s", settings.redis_url)
-            return RedisRateLimiter(client), RedisIdempotencyStore(client)
+            # Startup probe stays synchronous (module import time, no running loop);
+            # request handlers only ever use the asyncio client.
+            probe = redis.Redis.from_url(settings.redis_url, **options)
+            try:
+                probe.ping()
+            finally:
+                probe.close()
+            client = aioredis.Redis.from_url(settings.redis_url, **options)
+            logger.info("Redis request guard enabled. redis_url=%s strategy=%s", settings.redis_url, strategy)
+            return RedisRateLimiter(client, strategy=strategy), RedisIdempotencyStore(client)
         except Exception as exc:
             logger.warning("Redis request guard unavailable; fallback to in-memory: %s", exc)
-    return InMemoryRateLimiter(), InMemoryIdempotencyStore()
+    return InMemoryRateLimiter(strategy), InMemoryIdempotencyStore()
 
 
 rate_limiter, idempotency_store = _build_request_guard()
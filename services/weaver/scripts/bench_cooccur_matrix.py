@@ -0,0 +1,91 @@
+"""Co-occurrence 행렬 벤치마크 — 쿼리 로그 N건(기본 50,000)으로 카운팅 / top_partners 비교.
+
+  - python(cap=50): 기존 방식 — 쿼리별 컬럼 50개 상한 + 이중 루프 Counter
+  - sparse(no cap): 쿼리×컬럼 0/1 희소 행렬의 X.T @ X 상삼각 (scipy)
+  - top_partners: 전체 pair 스캔(기존) vs 파트너 인덱스 조회
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_cooccur_matrix.py --queries 50000 --columns 2000 --lookups 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from app.services.cooccur_matrix import (
+    CooccurConfig,
+    CooccurMatrix,
+    FALLBACK_MAX_COLS_PER_QUERY,
+    _count_pairs_python,
+    _count_pairs_sparse,
+)
+
+
+def _query_logs(queries: int, columns: int, max_cols: int, seed: int) -> list[set[str]]:
+    rng = random.Random(seed)
+    # 소수의 핫 테이블에 컬럼이 몰리는 분포 (실제 쿼리 로그와 유사하게 편향)
+    universe = [f"schema.t{i % 200}.c{i}" for i in range(columns)]
+    weights = [1.0 / (1 + i) ** 0.8 for i in range(columns)]
+    logs = []
+    for _ in range(queries):
+        n = min(max_cols, max(2, int(rng.expovariate(1 / 8))))
+        logs.append(set(rng.choices(universe, weights=weights, k=n)))
+    return logs
+
+
+def _scan_top_partners(pair_counts: dict, col_key: str, k: int) -> list:
+    """인덱스 도입 이전 top_partners — 전체 pair 스캔."""
+    matches = []
+    for (a, b), cnt in pair_counts.items():
+        partner = b if a == col_key else a if b == col_key else None
+        if partner and partner != col_key:
+            matches.append((partner, cnt))
+    matches.sort(key=lambda x: x[1], reverse=True)
+    return matches[:k]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark co-occurrence counting and top-k lookups")
+    parser.add_argument("--queries", type=int, default=50_000)
+    parser.add_argument("--columns", type=int, default=2_000)
+    parser.add_argument("--max-query-cols", type=int, default=120, help="쿼리당 최대 컬럼 수 (넓은 SELECT 포함)")
+    parser.add_argument("--lookups", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    logs = _query_logs(args.queries, args.columns, args.max_query_cols, args.seed)
+    wide = sum(1 for cols in logs if len(cols) > FALLBACK_MAX_COLS_PER_QUERY)
+    cfg = CooccurConfig(min_cooccur_count=2)
+
+    capped, t_python = _timed(lambda: _count_pairs_python(
+        logs, CooccurConfig(max_cols_per_query=FALLBACK_MAX_COLS_PER_QUERY, min_cooccur_count=2)))
+    full, t_sparse = _timed(lambda: _count_pairs_sparse(logs, cfg))
+    for mode, elapsed, pairs in (("python_cap50", t_python, capped), ("sparse_nocap", t_sparse, full)):
+        print(json.dumps({"phase": "count", "mode": mode, "queries": len(logs), "wide_queries": wide,
+                          "pairs": len(pairs), "elapsed_s": round(elapsed, 3)}))
+        sys.stdout.flush()
+
+    matrix, t_index = _timed(lambda: CooccurMatrix(pair_counts=full, total_queries=len(logs)))
+    rng = random.Random(args.seed)
+    keys = [rng.choice(list(matrix._partners)) for _ in range(args.lookups)]
+    scan_n = max(1, args.lookups // 100)  # 전체 스캔은 느리므로 일부만 측정 후 환산
+    _, t_scan = _timed(lambda: [_scan_top_partners(full, key, 10) for key in keys[:scan_n]])
+    _, t_lookup = _timed(lambda: [matrix.top_partners(key, 10) for key in keys])
+    print(json.dumps({"phase": "top_partners", "mode": "scan", "lookups": scan_n,
+                      "us_per_lookup": round(t_scan / scan_n * 1e6, 1)}))
+    print(json.dumps({"phase": "top_partners", "mode": "index", "lookups": args.lookups,
+                      "index_build_s": round(t_index, 3), "us_per_lookup": round(t_lookup / args.lookups * 1e6, 1)}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
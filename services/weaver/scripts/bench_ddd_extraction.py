@@ -0,0 +1,136 @@
+"""DDD 추출 벤치마크 — 순차 추출 + 전수 비교 중복 제거 vs 병렬 추출 + 응답 캐시 + LSH 블로킹.
+
+mock LLM 경로(_mock_extraction)로 프래그먼트 N개(기본 5,000)를 처리한다. 모델 지연은
+--llm-latency-ms 만큼 asyncio.sleep 으로 흉내 내고, 엔티티 이름은 프래그먼트마다 달라지도록
+mock 결과에 도메인 명사를 붙인다 (중복 제거가 실제로 일을 하도록).
+  - legacy  : 이전 구현 — 프래그먼트 순차 처리, 보존된 이름 전체와 Jaccard 전수 비교
+  - parallel: extract_from_fragments — 동시성 상한(--concurrency) 병렬, 콜드 캐시
+  - reingest: 같은 문서 재적재 — 응답 캐시 적중으로 모델 호출 없음
+
+사용:
+  PYTHONPATH=. python3 scripts/bench_ddd_extraction.py --fragments 5000 --llm-latency-ms 50 --concurrency 16
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Any
+
+from app.services.ddd_extraction_service import DDDExtractionService
+
+NOUNS = ["Order", "Customer", "Payment", "Shipment", "Invoice", "Machine", "Sensor", "Maintenance",
+         "Inventory", "Warehouse", "Supplier", "Contract", "Quality", "Batch", "Line", "Alarm"]
+SUFFIXES = ["", "Item", "Plan", "Request", "Report", "Schedule", "Record", "Log", "Case", "Job"]
+
+
+def _fragments(n: int, seed: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [{
+        "id": f"frag-{i}",
+        "doc_id": "bench-doc",
+        "page": i // 20 + 1,
+        "text": f"{rng.choice(NOUNS)}{rng.choice(SUFFIXES)} {rng.choice(NOUNS)} 처리 절차 {i}: "
+                + " ".join(rng.choice(NOUNS).lower() for _ in range(40)),
+    } for i in range(n)]
+
+
+def _mock_llm(latency_s: float):  # type: ignore[no-untyped-def]
+    """_mock_extraction 결과의 이름 앞에 프래그먼트 첫 단어를 붙여 돌려주는 가짜 LLM."""
+    async def call(user_prompt: str) -> str:
+        if latency_s:
+            await asyncio.sleep(latency_s)
+        text = user_prompt.split("---\n", 1)[1]
+        prefix = text.split(" ", 1)[0]
+        mock = json.loads(DDDExtractionService._mock_extraction({"text": text}))
+        for key in ("aggregates", "commands", "events"):
+            for entity in mock[key]:
+                entity["name"] = prefix + entity["name"]
+        return json.dumps(mock, ensure_ascii=False)
+
+    return call
+
+
+def _legacy_dedup(service: DDDExtractionService):  # type: ignore[no-untyped-def]
+    def dedup(entities: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        seen: dict[str, int] = {}
+        result: list[dict[str, Any]] = []
+        for entity in entities:
+            name = entity.get("name", "")
+            if not name:
+                continue
+            norm = name.lower().replace("_", "").replace("-", "").replace(" ", "")
+            for existing, idx in seen.items():
+                if service._name_similarity(norm, existing) > 0.85:
+                    if entity.get("confidence", 0) > result[idx].get("confidence", 0):
+                        result[idx] = entity
+                    break
+            else:
+                seen[norm] = len(result)
+                result.append(entity)
+        return result
+
+    return dedup
+
+
+def _service(args: argparse.Namespace, concurrency: int) -> DDDExtractionService:
+    service = DDDExtractionService()
+    service._api_key = "bench"  # 캐시 경로를 타도록 LLM 모드로, 실제 호출은 mock
+    service._concurrency = concurrency
+    service._cache_size = max(service._cache_size, args.fragments)  # 순차 재적재가 LRU를 밀어내지 않도록
+    service._call_llm = _mock_llm(args.llm_latency_ms / 1000)  # type: ignore[method-assign]
+    return service
+
+
+async def _timed(service: DDDExtractionService, fragments: list[dict[str, Any]]) -> tuple[float, dict[str, Any]]:
+    start = time.perf_counter()
+    result = await service.extract_from_fragments(fragments)
+    return time.perf_counter() - start, result
+
+
+async def _run(args: argparse.Namespace) -> None:
+    fragments = _fragments(args.fragments, args.seed)
+    reference = None
+    shared = _service(args, args.concurrency)
+    for mode in args.modes:
+        if mode == "legacy":
+            service = _service(args, 1)
+            service._deduplicate = _legacy_dedup(service)  # type: ignore[method-assign]
+        else:
+            service = shared
+            if mode == "parallel":
+                service.clear_cache()
+        calls_before = service.cache_misses
+        elapsed, result = await _timed(service, fragments)
+        counts = {k: len(result[k]) for k in ("aggregates", "commands", "events", "policies")}
+        if reference is None:
+            reference = counts
+        assert counts == reference, f"{mode} diverged: {counts} != {reference}"
+        print(json.dumps({"mode": mode, "fragments": args.fragments,
+                          "concurrency": 1 if mode == "legacy" else args.concurrency,
+                          "llm_latency_ms": args.llm_latency_ms,
+                          "llm_calls": service.cache_misses - calls_before,
+                          "entities": result["total_entities"],
+                          "elapsed_s": round(elapsed, 3),
+                          "fragments_per_sec": round(args.fragments / elapsed, 1)}))
+        sys.stdout.flush()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DDD extraction over mock LLM fragments")
+    parser.add_argument("--fragments", type=int, default=5_000)
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--modes", nargs="+", choices=["legacy", "parallel", "reingest"],
+                        default=["legacy", "parallel", "reingest"])
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+"""Glossary 검색 벤치마크 — 인덱스 없는 LIKE 스캔 vs pg_trgm GIN + 순위/커서 페이지네이션.
+
+로컬 PostgreSQL(POSTGRES_DSN)에 PostgresMetadataStore 마이그레이션(pg_trgm 인덱스 포함)을 적용하고
+벤치 전용 테넌트로 용어 N개(기본 100,000)를 COPY로 넣은 뒤, 타이핑을 흉내 낸 질의(접두 2~8자 + 부분 문자열)의
+지연 p50/p95를 모드별로 출력한다.
+  - legacy   : 이전 search_glossary_terms — LOWER(...) LIKE '%q%' + ORDER BY created_at (전체 반환)
+  - page     : search_glossary_page(limit=20) — 순위 + keyset 커서 첫 페이지
+  - typeahead: search_glossary_page(limit=10, term_only=True)
+
+사용:
+  POSTGRES_DSN=postgresql://... PYTHONPATH=. python3 scripts/bench_glossary_search.py --terms 100000 --queries 300
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+from app.services.postgres_metadata_store import postgres_metadata_store
+
+SYLLABLES = ["rev", "en", "ue", "mar", "gin", "cost", "net", "churn", "sale", "ord", "er", "cu", "st",
+             "om", "inv", "ent", "ory", "ship", "ment", "ta", "x", "pro", "fit", "lo", "ss"]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _terms(n: int, tenant_id: str, seed: int) -> list[tuple]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    rows = []
+    for i in range(n):
+        term = " ".join(_word(rng) for _ in range(rng.randint(1, 3))).title()
+        definition = " ".join(_word(rng) for _ in range(rng.randint(6, 14)))
+        rows.append((f"bench-{tenant_id}-{i}", tenant_id, term, definition, "[]", now, now))
+    return rows
+
+
+def _queries(rows: list[tuple], n: int, seed: int) -> list[str]:
+    rng = random.Random(seed + 1)
+    queries = []
+    for _ in range(n):
+        term = rng.choice(rows)[2].lower()
+        if rng.random() < 0.7:
+            queries.append(term[: rng.randint(2, min(8, len(term)))])  # 타이핑 중인 접두
+        else:
+            start = rng.randrange(max(1, len(term) - 4))
+            queries.append(term[start:start + rng.randint(3, 6)])     # 부분 문자열
+    return queries
+
+
+async def _legacy(conn, q: str, tenant_id: str) -> int:
+    rows = await conn.fetch(
+        """
+        SELECT * FROM weaver_metadata_glossary_terms
+        WHERE tenant_id = $1 AND (LOWER(term) LIKE $2 OR LOWER(definition) LIKE $2)
+        ORDER BY created_at DESC
+        """,
+        tenant_id,
+        f"%{q}%",
+    )
+    return len(rows)
+
+
+def _summary(mode: str, samples: list[float], args: argparse.Namespace) -> dict:
+    samples.sort()
+    return {"mode": mode, "terms": args.terms, "queries": len(samples),
+            "p50_ms": round(statistics.median(samples), 2),
+            "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 2),
+            "max_ms": round(samples[-1], 2)}
+
+
+async def _run(args: argparse.Namespace) -> None:
+    tenant_id = f"bench-{uuid.uuid4().hex[:8]}"
+    pool = await postgres_metadata_store._get_pool()
+    rows = _terms(args.terms, tenant_id, args.seed)
+    queries = _queries(rows, args.queries, args.seed)
+    try:
+        async with pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                "weaver_metadata_glossary_terms", schema_name="weaver", records=rows,
+                columns=["id", "tenant_id", "term", "definition", "synonyms_json", "created_at", "updated_at"],
+            )
+            await conn.execute("ANALYZE weaver_metadata_glossary_terms")
+        print(json.dumps({"phase": "setup", "terms": args.terms, "pg_trgm": postgres_metadata_store._trgm}))
+
+        for mode in args.modes:
+            samples = []
+            for q in queries:
+                start = time.perf_counter()
+                if mode == "legacy":
+                    async with pool.acquire() as conn:
+                        await _legacy(conn, q, tenant_id)
+                elif mode == "page":
+                    await postgres_metadata_store.search_glossary_page(q, tenant_id=tenant_id, limit=20)
+                else:
+                    await postgres_metadata_store.search_glossary_page(
+                        q, tenant_id=tenant_id, limit=10, term_only=True,
+                    )
+                samples.append((time.perf_counter() - start) * 1000)
+            print(json.dumps(_summary(mode, samples, args)))
+            sys.stdout.flush()
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM weaver_metadata_glossary_terms WHERE tenant_id = $1", tenant_id)
+        await pool.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark glossary search")
+    parser.add_argument("--terms", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--modes", nargs="+", choices=["legacy", "page", "typeahead"],
+                        default=["legacy", "page", "typeahead"])
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
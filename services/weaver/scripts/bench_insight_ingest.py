@@ -0,0 +1,99 @@
+"""Insight 쿼리 로그 적재 벤치마크 — 행 단위 INSERT vs COPY + INSERT ... SELECT.
+
+로컬 PostgreSQL(POSTGRES_DSN)에 weaver.insight_query_logs를 만들고(insight_store 마이그레이션)
+생성한 로그 N건(기본 100,000, --dup-ratio 만큼 배치 내 중복 포함)을 벤치 전용 테넌트로 적재한다.
+  - row : 기존 경로 — 로그마다 fetchrow(INSERT ... ON CONFLICT DO NOTHING RETURNING id)
+  - bulk: insert_logs_bulk — 배치당 COPY 1회 + INSERT ... SELECT 1회
+
+사용:
+  POSTGRES_DSN=postgresql://... PYTHONPATH=. python3 scripts/bench_insight_ingest.py --logs 100000 --batch 10000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.core.rls_session import rls_session
+from app.services import insight_query_store
+from app.services.insight_store import insight_store
+
+
+def _logs(n: int, dup_ratio: float, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    base = datetime.now(timezone.utc)
+    logs = []
+    for i in range(n):
+        qid = i if rng.random() >= dup_ratio or i == 0 else rng.randrange(i)
+        sql = f"select c{qid % 50}, sum(v) from t{qid % 200} where id = ? group by 1"
+        logs.append({
+            "query_id": f"q{qid}",
+            "raw_sql": sql.upper(),
+            "normalized_sql": sql,
+            "sql_hash": hashlib.sha256(sql.encode()).hexdigest()[:16],
+            "datasource_id": f"ds{qid % 4}",
+            "executed_at": base - timedelta(seconds=qid),
+            "duration_ms": qid % 1000,
+            "user_id": f"u{qid % 30}",
+            "source": "oracle",
+        })
+    return logs
+
+
+async def _ingest(pool, tenant_id: str, logs: list[dict], batch: int, mode: str) -> dict:
+    totals = {"inserted": 0, "deduped": 0}
+    for i in range(0, len(logs), batch):
+        chunk = logs[i:i + batch]
+        async with rls_session(pool, tenant_id) as conn:
+            if mode == "bulk":
+                result = await insight_query_store.insert_logs_bulk(conn, tenant_id, chunk)
+            else:
+                result = await insight_query_store.insert_logs(conn, tenant_id, chunk)
+        totals["inserted"] += result["inserted"]
+        totals["deduped"] += result["deduped"]
+    return totals
+
+
+async def _run(args: argparse.Namespace) -> None:
+    pool = await insight_store.get_pool()
+    logs = _logs(args.logs, args.dup_ratio, args.seed)
+    # 행 단위 경로를 강제하기 위해 bulk 전환 임계값을 배치보다 크게
+    insight_query_store.BULK_INSERT_MIN_ROWS = args.batch + 1
+    tenants = []
+    try:
+        for mode in args.modes:
+            tenant_id = f"bench-{mode}-{uuid.uuid4().hex[:8]}"
+            tenants.append(tenant_id)
+            start = time.perf_counter()
+            totals = await _ingest(pool, tenant_id, logs, args.batch, mode)
+            elapsed = time.perf_counter() - start
+            print(json.dumps({"mode": mode, "logs": args.logs, "batch": args.batch, **totals,
+                              "elapsed_s": round(elapsed, 3),
+                              "logs_per_sec": round(args.logs / elapsed, 1)}))
+            sys.stdout.flush()
+    finally:
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM weaver.insight_query_logs WHERE tenant_id = ANY($1::text[])", tenants)
+        await pool.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark insight query-log ingestion")
+    parser.add_argument("--logs", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=10_000, help="logs per /logs:ingest request")
+    parser.add_argument("--dup-ratio", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--modes", nargs="+", choices=["row", "bulk"], default=["row", "bulk"])
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services.neo4j_metadata_store import Neo4jMetadataStore
+
+
+def _enabled(value: str | None) -> bool:
+    if not value:
+        return False
+    return value.lower() in {"1", "true", "yes", "on"}
+
+
+def _synthetic_catalog(tables: int, columns: int) -> dict:
+    catalog: dict = {}
+    for i in range(tables):
+        catalog.setdefault(f"s{i % 8}", {})[f"t{i}"] = [
+            {"name": f"c{j}", "data_type": "text", "nullable": True} for j in range(columns)
+        ]
+    return catalog
+
+
+@pytest.mark.asyncio
+async def test_catalog_incremental_upsert_against_local_neo4j() -> None:
+    if not _enabled(os.getenv("WEAVER_RUN_NEO4J")):
+        pytest.skip("set WEAVER_RUN_NEO4J=1 (and NEO4J_URI/NEO4J_USER/NEO4J_PASSWORD) to run")
+    missing = [k for k in ("NEO4J_URI", "NEO4J_USER", "NEO4J_PASSWORD") if not os.getenv(k)]
+    if missing:
+        pytest.skip(f"missing env: {', '.join(missing)}")
+
+    settings.neo4j_uri = os.environ["NEO4J_URI"]
+    settings.neo4j_user = os.environ["NEO4J_USER"]
+    settings.neo4j_password = os.environ["NEO4J_PASSWORD"]
+    store = Neo4jMetadataStore()
+    tenant, ds = "tenant-catalog-e2e", f"ds_{int(time.time())}"
+    catalog = _synthetic_catalog(tables=2000, columns=10)
+    try:
+        first = await store.save_extracted_catalog(tenant, ds, catalog)
+        assert first["nodes_created"] == 8 + 2000 + 20000
+
+        del catalog["s0"]["t0"]
+        catalog["s1"]["t1"][0]["data_type"] = "integer"
+        second = await store.save_extracted_catalog(tenant, ds, catalog)
+        assert second["diff"]["tables_removed"] == 1 and second["diff"]["columns_changed"] == 1
+        assert second["nodes_created"] == 0
+
+        rows = await store._read(
+            "MATCH (t:Table {tenant_id: $tid, datasource_name: $ds}) RETURN count(t) AS n",
+            {"tid": tenant, "ds": ds},
+        )
+        assert rows[0]["n"] == 1999
+        print(f"catalog 2000 tables: full={first['duration_ms']}ms incremental={second['duration_ms']}ms")
+    finally:
+        await store._write(
+            """
+            MATCH (d:DataSource {tenant_id: $tid, name: $ds})
+            OPTIONAL MATCH (d)-[:HAS_SCHEMA]->(s)-[:HAS_TABLE]->(t)-[:HAS_COLUMN]->(c)
+            DETACH DELETE c, t, s, d
+            """,
+            {"tid": tenant, "ds": ds},
+        )
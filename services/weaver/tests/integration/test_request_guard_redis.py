@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.request_guard import RATE_LIMIT_STRATEGIES, RedisIdempotencyStore, RedisRateLimiter
+
+
+def _enabled(value: str | None) -> bool:
+    if not value:
+        return False
+    return value.lower() in {"1", "true", "yes", "on"}
+
+
+async def _client():  # type: ignore[no-untyped-def]
+    if not _enabled(os.getenv("WEAVER_RUN_REDIS")):
+        pytest.skip("set WEAVER_RUN_REDIS=1 (and REDIS_URL) to run")
+    if not os.getenv("REDIS_URL"):
+        pytest.skip("missing env: REDIS_URL")
+    import redis.asyncio as aioredis
+
+    return aioredis.Redis.from_url(os.environ["REDIS_URL"], decode_responses=True)
+
+
+async def _admitted(limiter: RedisRateLimiter, key: str, n: int, limit: int) -> int:
+    async def one() -> bool:
+        try:
+            await limiter.check(key, limit=limit, window_seconds=3600)
+            return True
+        except HTTPException:
+            return False
+
+    return sum(await asyncio.gather(*(one() for _ in range(n))))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy", RATE_LIMIT_STRATEGIES)
+async def test_rate_limiter_scripts_are_atomic_against_local_redis(strategy: str) -> None:
+    client = await _client()
+    prefix = f"rg-e2e-{uuid.uuid4().hex[:8]}"
+    limiter = RedisRateLimiter(client, key_prefix=prefix, strategy=strategy)
+    try:
+        # 동시 요청 2,000건 중 정확히 limit 건만 통과해야 한다 (스크립트 1회 = 원자적 판정).
+        # 창을 1시간으로 잡아 token_bucket 리필이 결과에 끼어들지 않게 한다.
+        start = time.perf_counter()
+        assert await _admitted(limiter, "u1:/x:write", n=2_000, limit=100) == 100
+        elapsed = time.perf_counter() - start
+        print({"strategy": strategy, "checks": 2_000, "elapsed_s": round(elapsed, 3)})
+
+        keys = [k async for k in client.scan_iter(match=f"{prefix}:rl:*")]
+        assert keys and all(await client.ttl(k) > 0 for k in keys)
+        await limiter.clear()
+        assert [k async for k in client.scan_iter(match=f"{prefix}:rl:*")] == []
+    finally:
+        await limiter.clear()
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idempotency_store_against_local_redis() -> None:
+    client = await _client()
+    store = RedisIdempotencyStore(client, key_prefix=f"rg-e2e-{uuid.uuid4().hex[:8]}")
+    payload = {"a": 1}
+    try:
+        assert await store.ensure(key="idem-1", payload=payload) is None
+        with pytest.raises(HTTPException):
+            await store.ensure(key="idem-1", payload=payload)
+        await store.set("idem-1", fingerprint=store.fingerprint(payload), status_code=200, response={"ok": True})
+        cached = await store.ensure(key="idem-1", payload=payload)
+        assert cached is not None and cached["response"] == {"ok": True}
+    finally:
+        await store.clear()
+        await client.aclose()
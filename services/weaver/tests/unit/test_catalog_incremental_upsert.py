@@ -0,0 +1,288 @@
+"""Neo4jMetadataStore.save_extracted_catalog 증분 diff-upsert 테스트.
+
+카탈로그 Cypher 문을 해석하는 인메모리 가짜 드라이버로 2,000 테이블 카탈로그를 저장/재추출하며
+(1) 청크 UNWIND 문 수, (2) 변경분만 반영되는지, (3) 모든 쓰기가 트랜잭션 하나로 묶이는지 검증한다.
+"""
+from __future__ import annotations
+
+import pytest
+
+from app.services import neo4j_metadata_store as store_mod
+from app.services.catalog_diff import CatalogState, current_state, desired_state, diff_catalog
+from app.services.neo4j_metadata_store import Neo4jMetadataStore
+
+
+class _Result:
+    def __init__(self, rows: list[dict]) -> None:
+        self._rows = rows
+
+    def __aiter__(self):
+        self._it = iter(self._rows)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def consume(self) -> None:
+        return None
+
+
+class _FakeGraph:
+    """카탈로그 쿼리 상수만 해석하는 최소 그래프 (키 튜플 집합)."""
+
+    def __init__(self) -> None:
+        self.schemas: set[str] = set()
+        self.tables: set[tuple[str, str]] = set()
+        self.columns: dict[tuple[str, str, str], tuple[str, bool]] = {}
+        self.fks: set[tuple] = set()
+        self.datasource = False
+        self.links: set[str] = set()  # DataSource -HAS_SCHEMA-> Schema
+        self.transactions = 0
+        self.statements: list[str] = []
+        self.fail_on: str | None = None
+
+    def read(self, query: str, params: dict) -> list[dict]:
+        assert query == store_mod._CATALOG_CURRENT_QUERY
+        rows = []
+        cols_by_table: dict[tuple[str, str], list] = {}
+        for key, props in self.columns.items():
+            cols_by_table.setdefault(key[:2], []).append((key[2], props))
+        tables_by_schema: dict[str, list[str]] = {}
+        for sn, tn in self.tables:
+            tables_by_schema.setdefault(sn, []).append(tn)
+        for sn in self.schemas:
+            if not tables_by_schema.get(sn):
+                rows.append({"schema_name": sn, "table_name": None, "column_name": None})
+            for tn in tables_by_schema.get(sn, []):
+                cols = cols_by_table.get((sn, tn), [])
+                if not cols:
+                    rows.append({"schema_name": sn, "table_name": tn, "column_name": None})
+                for cn, (dtype, nullable) in cols:
+                    rows.append({"schema_name": sn, "table_name": tn, "column_name": cn,
+                                 "dtype": dtype, "nullable": nullable})
+        return rows
+
+    def apply(self, query: str, params: dict) -> None:
+        self.statements.append(query)
+        if self.fail_on is not None and query == self.fail_on:
+            raise RuntimeError("neo4j write failed")
+        rows = params.get("rows", [])
+        if query == store_mod._CATALOG_MERGE_DATASOURCE:
+            self.datasource = True
+        elif query == store_mod._CATALOG_ADD_SCHEMAS:
+            self.schemas.update(rows)
+            if self.datasource:
+                self.links.update(rows)
+        elif query == store_mod._CATALOG_LINK_SCHEMAS:
+            if self.datasource:
+                self.links.update(sn for sn in rows if sn in self.schemas)
+        elif query == store_mod._CATALOG_ADD_TABLES:
+            self.tables.update((r["schema"], r["table"]) for r in rows if r["schema"] in self.schemas)
+        elif query == store_mod._CATALOG_UPSERT_COLUMNS:
+            for r in rows:
+                if (r["schema"], r["table"]) in self.tables:
+                    self.columns[(r["schema"], r["table"], r["name"])] = (r["dtype"], r["nullable"])
+        elif query == store_mod._CATALOG_DELETE_COLUMNS:
+            for r in rows:
+                self.columns.pop((r["schema"], r["table"], r["name"]), None)
+        elif query == store_mod._CATALOG_DELETE_TABLES:
+            self.tables.difference_update((r["schema"], r["table"]) for r in rows)
+        elif query == store_mod._CATALOG_DELETE_SCHEMAS:
+            self.schemas.difference_update(rows)
+            self.links.difference_update(rows)
+        elif query == store_mod._DATASOURCE_DELETE_STATEMENTS[0]:
+            self.columns.clear()
+            self.fks.clear()
+        elif query == store_mod._DATASOURCE_DELETE_STATEMENTS[1]:
+            self.tables.clear()
+        elif query == store_mod._DATASOURCE_DELETE_STATEMENTS[2]:
+            self.schemas.clear()
+            self.links.clear()
+        elif query == store_mod._DATASOURCE_DELETE_STATEMENTS[3]:
+            self.datasource = False
+            self.links.clear()
+        elif query in store_mod._CATALOG_DELETE_FKS:
+            self.fks.clear()
+        elif query == store_mod._CATALOG_ADD_FKS:
+            self.fks.update(tuple(sorted(r.items())) for r in rows)
+
+
+class _Tx:
+    def __init__(self, graph: _FakeGraph, pending: list) -> None:
+        self._graph, self._pending = graph, pending
+
+    async def run(self, query: str, params: dict) -> _Result:
+        self._pending.append((query, params))
+        return _Result([])
+
+
+class _Session:
+    def __init__(self, graph: _FakeGraph) -> None:
+        self._graph = graph
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def run(self, query: str, params: dict) -> _Result:
+        return _Result(self._graph.read(query, params))
+
+    async def execute_write(self, work):
+        # 커밋 시점에만 그래프에 반영 — 실패하면 아무것도 남지 않는다(롤백)
+        pending: list = []
+        await work(_Tx(self._graph, pending))
+        self._graph.transactions += 1
+        g = self._graph
+        snapshot = (set(g.schemas), set(g.tables), dict(g.columns), set(g.fks), g.datasource, set(g.links))
+        try:
+            for query, params in pending:
+                g.apply(query, params)
+        except Exception:
+            g.schemas, g.tables, g.columns, g.fks, g.datasource, g.links = snapshot
+            raise
+
+
+class _Driver:
+    def __init__(self, graph: _FakeGraph) -> None:
+        self._graph = graph
+
+    def session(self) -> _Session:
+        return _Session(self._graph)
+
+
+def _store(graph: _FakeGraph) -> Neo4jMetadataStore:
+    store = Neo4jMetadataStore()
+    store._driver = _Driver(graph)
+    return store
+
+
+def _synthetic_catalog(tables: int = 2000, columns: int = 8) -> dict:
+    catalog: dict = {}
+    for i in range(tables):
+        schema = f"s{i % 4}"
+        catalog.setdefault(schema, {})[f"t{i}"] = [
+            {"name": f"c{j}", "data_type": "integer" if j == 0 else "text", "nullable": j != 0}
+            for j in range(columns)
+        ]
+    return catalog
+
+
+@pytest.mark.asyncio
+async def test_2000_table_catalog_written_in_one_transaction_with_chunked_unwind():
+    graph = _FakeGraph()
+    store = _store(graph)
+    catalog = _synthetic_catalog()
+    fks = [{"source_schema": "s1", "source_table": "t1", "source_column": "c0",
+            "target_schema": "s0", "target_table": "t0", "target_column": "c0", "constraint_name": "fk_t1_t0"}]
+
+    result = await store.save_extracted_catalog("t1", "ds", catalog, foreign_keys=fks)
+
+    assert graph.transactions == 1
+    assert len(graph.tables) == 2000 and len(graph.columns) == 16000 and len(graph.fks) == 1
+    assert result["nodes_created"] == 4 + 2000 + 16000 and result["nodes_deleted"] == 0
+    # 2,000 테이블 → 2 청크, 16,000 컬럼 → 16 청크 (기존 구현은 컬럼마다 1회 왕복)
+    assert graph.statements.count(store_mod._CATALOG_ADD_TABLES) == 2
+    assert graph.statements.count(store_mod._CATALOG_UPSERT_COLUMNS) == 16
+    assert len(graph.statements) < 30
+
+
+@pytest.mark.asyncio
+async def test_reextraction_applies_only_the_diff():
+    graph = _FakeGraph()
+    store = _store(graph)
+    catalog = _synthetic_catalog()
+    await store.save_extracted_catalog("t1", "ds", catalog)
+    graph.statements.clear()
+
+    del catalog["s0"]["t0"]                                   # 테이블 삭제
+    catalog["s1"]["t1"][1]["data_type"] = "varchar"           # 컬럼 타입 변경
+    catalog["s2"]["t2"].append({"name": "added", "data_type": "text"})  # 컬럼 추가
+    catalog["s3"]["t3"].pop()                                 # 컬럼 삭제
+    result = await store.save_extracted_catalog("t1", "ds", catalog)
+
+    assert result["diff"] == {
+        "schemas_added": 0, "schemas_removed": 0, "tables_added": 0, "tables_removed": 1,
+        "columns_added": 1, "columns_changed": 1, "columns_removed": 9,
+    }
+    assert ("s0", "t0") not in graph.tables and len(graph.tables) == 1999
+    assert graph.columns[("s1", "t1", "c1")] == ("varchar", True)
+    assert ("s2", "t2", "added") in graph.columns and ("s3", "t3", "c7") not in graph.columns
+    assert store_mod._CATALOG_ADD_TABLES not in graph.statements
+
+    graph.statements.clear()
+    unchanged = await store.save_extracted_catalog("t1", "ds", catalog)
+    assert unchanged["nodes_created"] == unchanged["nodes_updated"] == unchanged["nodes_deleted"] == 0
+    assert store_mod._CATALOG_UPSERT_COLUMNS not in graph.statements
+
+
+@pytest.mark.asyncio
+async def test_failed_write_rolls_back_and_keeps_existing_graph(monkeypatch: pytest.MonkeyPatch):
+    async def _no_sleep(*_args):
+        return None
+
+    monkeypatch.setattr("app.services.resilience.asyncio.sleep", _no_sleep)
+    graph = _FakeGraph()
+    store = _store(graph)
+    catalog = _synthetic_catalog(tables=10)
+    await store.save_extracted_catalog("t1", "ds", catalog)
+    before = (set(graph.tables), dict(graph.columns))
+
+    catalog["s0"]["t_new"] = [{"name": "id", "data_type": "integer"}]
+    del catalog["s1"]["t1"]
+    graph.fail_on = store_mod._CATALOG_ADD_TABLES
+    with pytest.raises(store_mod.Neo4jStoreUnavailableError):
+        await store.save_extracted_catalog("t1", "ds", catalog)
+    assert (graph.tables, graph.columns) == before
+
+
+@pytest.mark.asyncio
+async def test_deleted_and_readded_datasource_reextracts_with_linked_schemas():
+    graph = _FakeGraph()
+    store = _store(graph)
+    catalog = _synthetic_catalog(tables=10)
+    await store.save_extracted_catalog("t1", "ds", catalog)
+    assert graph.links == graph.schemas == {"s0", "s1", "s2", "s3"}
+
+    # 데이터소스 삭제 → 하위 Schema/Table/Column까지 함께 사라진다
+    await store.delete_datasource("ds", tenant_id="t1")
+    assert not graph.datasource and not graph.schemas and not graph.tables and not graph.columns
+
+    result = await store.save_extracted_catalog("t1", "ds", catalog)
+    assert result["diff"]["schemas_added"] == 4
+    assert graph.datasource and graph.links == graph.schemas == {"s0", "s1", "s2", "s3"}
+    assert len(graph.tables) == 10
+
+
+@pytest.mark.asyncio
+async def test_reextraction_relinks_existing_schemas_missing_has_schema():
+    graph = _FakeGraph()
+    store = _store(graph)
+    catalog = _synthetic_catalog(tables=10)
+    await store.save_extracted_catalog("t1", "ds", catalog)
+    # 이전 delete_datasource처럼 DataSource만 지워지고 Schema 서브트리가 남은 상태
+    graph.datasource = False
+    graph.links.clear()
+    graph.statements.clear()
+
+    result = await store.save_extracted_catalog("t1", "ds", catalog)
+    assert result["diff"]["schemas_added"] == 0
+    assert graph.links == {"s0", "s1", "s2", "s3"}
+    assert store_mod._CATALOG_ADD_SCHEMAS not in graph.statements
+
+
+def test_diff_catalog_normalizes_like_extraction():
+    desired = desired_state({
+        "public": {"a": [{"name": " id ", "type": "int"}, {"name": ""}, "bad"], " ": {}, "b": "bad"},
+        "bad": [],
+    })
+    assert desired.schemas == {"public"} and desired.tables == {("public", "a")}
+    assert desired.columns == {("public", "a", "id"): ("int", True)}
+    current = current_state([{"schema_name": "public", "table_name": "a", "column_name": "id",
+                              "dtype": "int", "nullable": None}])
+    assert diff_catalog(current, desired).is_empty
+    assert diff_catalog(CatalogState(), desired).summary()["columns_added"] == 1
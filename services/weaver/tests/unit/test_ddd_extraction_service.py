@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+
+import pytest
+
+from app.services.ddd_extraction_service import DDDExtractionService
+
+
+def _service(monkeypatch: pytest.MonkeyPatch, concurrency: int = 4) -> DDDExtractionService:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("DDD_EXTRACTION_CONCURRENCY", str(concurrency))
+    return DDDExtractionService()
+
+
+def _fragments(n: int) -> list[dict]:
+    return [{"id": f"f{i}", "doc_id": "d1", "page": i, "text": f"주문 {i} 생성 후 결제 승인"} for i in range(n)]
+
+
+class _FakeLLM:
+    def __init__(self, delay: float = 0.01, fail: bool = False) -> None:
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._delay = delay
+        self._fail = fail
+
+    async def __call__(self, user_prompt: str) -> str:
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self.active -= 1
+        if self._fail:
+            return "{}"
+        name = "Order" + user_prompt.split("주문 ")[1].split(" ")[0]
+        return json.dumps({"aggregates": [{"name": name, "confidence": 0.9}]})
+
+
+def _legacy_dedup(service: DDDExtractionService, entities: list[dict]) -> list[dict]:
+    """이전 구현 — 보존된 모든 이름과 전수 비교."""
+    seen: dict[str, int] = {}
+    result: list[dict] = []
+    for entity in entities:
+        name = entity.get("name", "")
+        if not name:
+            continue
+        norm = name.lower().replace("_", "").replace("-", "").replace(" ", "")
+        for existing, idx in seen.items():
+            if service._name_similarity(norm, existing) > 0.85:
+                if entity.get("confidence", 0) > result[idx].get("confidence", 0):
+                    result[idx] = entity
+                break
+        else:
+            seen[norm] = len(result)
+            result.append(entity)
+    return result
+
+
+@pytest.mark.asyncio
+async def test_fragments_run_concurrently_in_input_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _service(monkeypatch, concurrency=4)
+    llm = _FakeLLM()
+    monkeypatch.setattr(service, "_call_llm", llm)
+
+    result = await service.extract_from_fragments(_fragments(20))
+
+    assert llm.calls == 20
+    assert 1 < llm.peak <= 4
+    # 이름이 모두 "order<n>" 형태라 일부는 병합되지만, 남은 순서는 프래그먼트 순서를 따른다
+    pages = [e["source_anchor"]["page"] for e in result["aggregates"]]
+    assert pages == sorted(pages)
+
+
+@pytest.mark.asyncio
+async def test_reingested_fragments_skip_llm(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _service(monkeypatch)
+    llm = _FakeLLM(delay=0)
+    monkeypatch.setattr(service, "_call_llm", llm)
+
+    first = await service.extract_from_fragments(_fragments(10))
+    second = await service.extract_from_fragments(_fragments(10))
+    assert llm.calls == 10
+    assert service.cache_hits == 10
+    assert second == first
+
+    # 같은 배치 안의 동일 프래그먼트는 진행 중인 호출 하나를 공유한다
+    service.clear_cache()
+    await service.extract_from_fragments([_fragments(1)[0]] * 5)
+    assert llm.calls == 11
+
+
+@pytest.mark.asyncio
+async def test_failed_llm_responses_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _service(monkeypatch)
+    llm = _FakeLLM(delay=0, fail=True)
+    monkeypatch.setattr(service, "_call_llm", llm)
+
+    await service.extract_from_fragments(_fragments(3))
+    await service.extract_from_fragments(_fragments(3))
+    assert llm.calls == 6
+
+
+def test_deduplicate_matches_pairwise_jaccard(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = _service(monkeypatch)
+    rng = random.Random(3)
+    parts = ["Order", "Cust", "omer", "Pay", "ment", "Ship", "ed", "Create", "Approve", "_", " ", "-", "센서", "정비", ""]
+    entities = [
+        {"name": "".join(rng.choice(parts) for _ in range(rng.randint(1, 4))), "confidence": rng.random()}
+        for _ in range(1_500)
+    ]
+    assert service._deduplicate(entities) == _legacy_dedup(service, entities)
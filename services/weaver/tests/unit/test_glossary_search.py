@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.config import settings
+from app.main import app
+from app.services.glossary_search import decode_cursor, encode_cursor, like_escape, rank_items
+from app.services.weaver_runtime import weaver_runtime
+
+
+@pytest.fixture(autouse=True)
+def clear_runtime() -> None:
+    old_pg, old_ext = settings.metadata_pg_mode, settings.metadata_external_mode
+    settings.metadata_pg_mode = False
+    settings.metadata_external_mode = False
+    weaver_runtime.clear()
+    try:
+        yield
+    finally:
+        settings.metadata_pg_mode, settings.metadata_external_mode = old_pg, old_ext
+
+
+def _headers() -> dict[str, str]:
+    now = datetime.now(timezone.utc)
+    token = jwt.encode(
+        {"sub": "user-admin", "tenant_id": "tenant-1", "role": "admin", "permissions": None,
+         "iat": int(now.timestamp()), "exp": int((now + timedelta(minutes=15)).timestamp())},
+        settings.jwt_secret_key, algorithm=settings.jwt_algorithm,
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _items() -> list[dict]:
+    return [
+        {"id": "t1", "term": "Revenue", "definition": "money in"},
+        {"id": "t2", "term": "Net Revenue", "definition": "after returns"},
+        {"id": "t3", "term": "Revenue Growth", "definition": "yoy"},
+        {"id": "t4", "term": "ARR", "definition": "annual recurring revenue"},
+        {"id": "t5", "term": "Churn", "definition": "lost customers"},
+    ]
+
+
+def test_rank_items_orders_by_tier_then_id():
+    items, next_cursor = rank_items(_items(), "revenue")
+    assert [x["id"] for x in items] == ["t1", "t3", "t2", "t4"]
+    assert next_cursor is None
+    assert [x["id"] for x in rank_items(_items(), "revenue", term_only=True)[0]] == ["t1", "t3", "t2"]
+
+
+def test_rank_items_keyset_pages_cover_all_results_once():
+    items = [{"id": f"id{i:03d}", "term": f"kpi {i % 7}", "definition": "x"} for i in range(50)]
+    seen, cursor = [], None
+    while True:
+        page, cursor = rank_items(items, "kpi", limit=8, cursor=cursor)
+        seen.extend(x["id"] for x in page)
+        if cursor is None:
+            break
+    assert seen == [x["id"] for x in rank_items(items, "kpi")[0]]
+    assert len(set(seen)) == 50
+
+
+def test_rank_items_short_query_prefix_rule_is_typeahead_only():
+    items = [{"id": "a", "term": "Revenue", "definition": ""}, {"id": "b", "term": "Green", "definition": "re"}]
+    assert [x["id"] for x in rank_items(items, "re", term_only=True)[0]] == ["a"]
+    assert [x["id"] for x in rank_items(items, "re", include_definition=False)[0]] == ["a", "b"]
+
+
+def test_cursor_roundtrip_and_like_escape():
+    assert decode_cursor(encode_cursor(2.3456789, "a/b")) == (2.3456789, "a/b")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+    assert like_escape("50%_a\\b") == "50\\%\\_a\\\\b"
+
+
+@pytest.mark.asyncio
+async def test_glossary_search_api_typeahead_and_cursor() -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        for item in _items():
+            res = await client.post(
+                "/api/v1/metadata/glossary",
+                json={"term": item["term"], "definition": item["definition"], "synonyms": []},
+                headers=_headers(),
+            )
+            assert res.status_code == 201
+
+        full = await client.get("/api/v1/metadata/glossary/search", params={"q": "revenue"}, headers=_headers())
+        assert [x["term"] for x in full.json()["items"]][:1] == ["Revenue"]
+        assert full.json()["total"] == 4 and full.json()["next_cursor"] is None
+
+        page1 = await client.get(
+            "/api/v1/metadata/glossary/search", params={"q": "revenue", "limit": 3}, headers=_headers()
+        )
+        page2 = await client.get(
+            "/api/v1/metadata/glossary/search",
+            params={"q": "revenue", "limit": 3, "cursor": page1.json()["next_cursor"]},
+            headers=_headers(),
+        )
+        assert [x["id"] for x in page1.json()["items"] + page2.json()["items"]] == [x["id"] for x in full.json()["items"]]
+
+        typeahead = await client.get(
+            "/api/v1/metadata/glossary/search", params={"q": "rev", "typeahead": True, "k": 2}, headers=_headers()
+        )
+        # "rev"는 Revenue / Revenue Growth 모두 접두 일치(같은 tier) — 순서는 id로 결정
+        assert sorted(x["term"] for x in typeahead.json()["items"]) == ["Revenue", "Revenue Growth"]
+        assert all(set(x) == {"id", "term"} for x in typeahead.json()["items"])
+
+        bad = await client.get(
+            "/api/v1/metadata/glossary/search", params={"q": "revenue", "cursor": "%%%"}, headers=_headers()
+        )
+        assert bad.status_code == 400
+
+        search = await client.get("/api/v1/metadata/search", params={"q": "revenue", "typeahead": True, "k": 1},
+                                  headers=_headers())
+        assert search.json()["items"] == [{"type": "term", "name": "Revenue", "id": full.json()["items"][0]["id"]}]
+
+        for term in ("Green", "Greenhouse Gas"):
+            res = await client.post(
+                "/api/v1/metadata/glossary",
+                json={"term": term, "definition": "revenue adjacent", "synonyms": []},
+                headers=_headers(),
+            )
+            assert res.status_code == 201
+        short = await client.get("/api/v1/metadata/search", params={"q": "re"}, headers=_headers())
+        # 짧은 일반 검색은 부분 일치 전체(접두 제한은 typeahead 전용), 정의 일치는 제외
+        assert {x["name"] for x in short.json()["items"]} == {
+            "Revenue", "Net Revenue", "Revenue Growth", "Green", "Greenhouse Gas",
+        }
@@ -8,29 +8,30 @@ from app.services.metrics import metrics_service
 from app.services.request_guard import InMemoryIdempotencyStore, InMemoryRateLimiter
 
 
-def test_request_guard_metrics_increment() -> None:
+@pytest.mark.asyncio
+async def test_request_guard_metrics_increment() -> None:
     metrics_service.clear()
     limiter = InMemoryRateLimiter()
-    limiter.check("u1:/x:write", limit=1, window_seconds=60)
+    await limiter.check("u1:/x:write", limit=1, window_seconds=60)
     try:
-        limiter.check("u1:/x:write", limit=1, window_seconds=60)
+        await limiter.check("u1:/x:write", limit=1, window_seconds=60)
         assert False, "expected rate limit"
     except Exception:
         pass
 
     store = InMemoryIdempotencyStore()
     payload = {"a": 1}
-    store.set("idem-1", fingerprint=store.fingerprint(payload), status_code=200, response={"ok": True})
+    await store.set("idem-1", fingerprint=store.fingerprint(payload), status_code=200, response={"ok": True})
     try:
-        store.ensure(key="idem-1", payload={"a": 2})
+        await store.ensure(key="idem-1", payload={"a": 2})
         assert False, "expected mismatch"
     except Exception:
         pass
 
     store2 = InMemoryIdempotencyStore()
-    assert store2.ensure(key="idem-2", payload=payload) is None
+    assert (await store2.ensure(key="idem-2", payload=payload)) is None
     try:
-        store2.ensure(key="idem-2", payload=payload)
+        await store2.ensure(key="idem-2", payload=payload)
         assert False, "expected in progress"
     except Exception:
         pass
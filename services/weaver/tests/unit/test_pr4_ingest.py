@@ -134,3 +134,72 @@ class TestInsertLogs:
         batch_id = await insert_batch_record(conn, "t1", "oracle", 10)
         assert batch_id == 42
         conn.fetchrow.assert_called_once()
+
+
+class _BulkConn:
+    """Records COPY payloads; INSERT ... SELECT dedups on query_id like ON CONFLICT DO NOTHING."""
+
+    def __init__(self, existing: set[str] | None = None):
+        self.existing = set(existing or ())
+        self.copied: list[tuple] = []
+        self.fetchrow_calls = 0
+
+    def transaction(self):
+        from contextlib import asynccontextmanager
+
+        @asynccontextmanager
+        async def _tx():
+            yield
+        return _tx()
+
+    async def execute(self, sql, *args):
+        return "OK"
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        self.copied = list(records)
+
+    async def fetchrow(self, sql, *args):
+        self.fetchrow_calls += 1
+        inserted = 0
+        for record in sorted(self.copied):
+            if record[2] not in self.existing:
+                self.existing.add(record[2])
+                inserted += 1
+        return {"inserted": inserted}
+
+
+def _log(i: int, raw_sql: str = "SELECT 1") -> dict:
+    return {
+        "query_id": f"q{i}", "raw_sql": raw_sql, "normalized_sql": raw_sql.lower(),
+        "sql_hash": "h", "datasource_id": "ds1", "executed_at": datetime.now(timezone.utc),
+        "duration_ms": 5, "user_id": None, "source": "oracle",
+    }
+
+
+class TestInsertLogsBulk:
+
+    @pytest.mark.asyncio
+    async def test_large_batch_uses_copy_and_single_insert(self):
+        from app.services.insight_query_store import BULK_INSERT_MIN_ROWS, insert_logs
+
+        n = BULK_INSERT_MIN_ROWS + 50
+        logs = [_log(i) for i in range(n)] + [_log(0), _log(1)]  # 배치 내 중복 2건
+        conn = _BulkConn(existing={"q5"})                          # 기존 행과 충돌 1건
+
+        result = await insert_logs(conn, "t1", logs, batch_id=7)
+
+        assert result == {"inserted": n - 1, "deduped": 3}
+        assert conn.fetchrow_calls == 1
+        assert [r[0] for r in conn.copied] == list(range(n + 2))
+
+    @pytest.mark.asyncio
+    async def test_bulk_filters_oversized_sql(self):
+        from app.services.insight_query_store import MAX_SQL_LENGTH, insert_logs_bulk
+
+        logs = [_log(0), _log(1, raw_sql="x" * (MAX_SQL_LENGTH + 1)), _log(2)]
+        conn = _BulkConn()
+
+        result = await insert_logs_bulk(conn, "t1", logs)
+
+        assert result == {"inserted": 2, "deduped": 1}
+        assert [r[2] for r in conn.copied] == ["q0", "q2"]
@@ -120,6 +120,38 @@ class TestCooccurMatrixMethods:
         m = CooccurMatrix()
         assert m.normalize("x", "y") == 0.0
 
+    def test_top_partners_ranked_and_updated_on_add(self):
+        m = self._make_matrix()
+        m.add("a", "c", 3)
+        assert m.top_partners("a", k=1) == [("c", 5)]
+        m.add("d", "a", 9)
+        assert m.top_partners("a", k=2) == [("d", 9), ("c", 5)]
+        assert m.top_partners("d") == [("a", 9)]
+        assert m.strength("a", "d") == 9 and m.top_partners("zzz") == []
+
+
+class TestCooccurCounting:
+
+    def _queries(self):
+        import random
+        rng = random.Random(7)
+        cols = [f"t{i % 7}.c{i}" for i in range(60)]
+        return [set(rng.sample(cols, rng.randint(1, 12))) for _ in range(300)]
+
+    def test_sparse_and_python_counts_match(self):
+        from app.services.cooccur_matrix import _count_pairs_python, _count_pairs_sparse
+
+        pytest.importorskip("scipy")
+        cfg = CooccurConfig(min_cooccur_count=2)
+        assert _count_pairs_sparse(self._queries(), cfg) == _count_pairs_python(self._queries(), cfg)
+
+    def test_no_column_cap_by_default(self):
+        pytest.importorskip("scipy")
+        wide = {f"col{i:03d}" for i in range(120)}
+        m = build_cooccur_matrix([wide], config=CooccurConfig(min_cooccur_count=1))
+        assert sum(1 for k in m.pair_counts if k[0] != k[1]) == 120 * 119 // 2
+        assert m.strength("col000", "col119") == 1
+
 
 # ── KpiMetricMapper tests ────────────────────────────────────
 
@@ -1,5 +1,8 @@
+import asyncio
 import json
+import time
 
+import pytest
 from fastapi import HTTPException
 
 from app.services.request_guard import (
@@ -11,49 +14,50 @@ from app.services.request_guard import (
 
 
 class _FakeRedis:
-    def __init__(self) -> None:
+    """redis.asyncio 대역 — register_script 는 스크립트 마커로 분기한다."""
+
+    def __init__(self, rtt_seconds: float = 0.0) -> None:
         self._kv: dict[str, str] = {}
         self._counter: dict[str, int] = {}
         self._ttl: dict[str, int] = {}
+        self._rtt = rtt_seconds
+        self.calls = 0
 
-    def scan_iter(self, pattern: str):  # type: ignore[no-untyped-def]
-        prefix = pattern.rstrip("*")
+    async def scan_iter(self, match: str, count: int = 10):  # type: ignore[no-untyped-def]
+        prefix = match.rstrip("*")
         for key in list(self._kv.keys()) + list(self._counter.keys()):
             if key.startswith(prefix):
                 yield key
 
-    def delete(self, key: str) -> None:
-        self._kv.pop(key, None)
-        self._counter.pop(key, None)
-        self._ttl.pop(key, None)
-
-    def incr(self, key: str) -> int:
-        value = self._counter.get(key, 0) + 1
-        self._counter[key] = value
-        return value
-
-    def expire(self, key: str, seconds: int) -> None:
-        self._ttl[key] = seconds
+    async def unlink(self, *keys: str) -> int:
+        self.calls += 1
+        for key in keys:
+            self._kv.pop(key, None)
+            self._counter.pop(key, None)
+            self._ttl.pop(key, None)
+        return len(keys)
 
-    def ttl(self, key: str) -> int:
-        return self._ttl.get(key, -1)
-
-    def get(self, key: str):  # type: ignore[no-untyped-def]
+    async def get(self, key: str):  # type: ignore[no-untyped-def]
         return self._kv.get(key)
 
-    def set(self, key: str, value: str, ex: int, nx: bool = False):  # type: ignore[no-untyped-def]
-        if nx and key in self._kv:
-            return False
-        self._kv[key] = value
-        self._ttl[key] = ex
-        return True
+    def register_script(self, script: str):  # type: ignore[no-untyped-def]
+        async def run(keys: list[str], args: list) -> list:  # type: ignore[type-arg]
+            self.calls += 1
+            if self._rtt:
+                await asyncio.sleep(self._rtt)
+            return self._run(script, keys[0], args)
+
+        return run
 
-    def eval(self, script: str, numkeys: int, *args):  # type: ignore[no-untyped-def]
-        assert numkeys == 1
-        key = str(args[0])
+    def _run(self, script: str, key: str, args: list) -> list:  # type: ignore[type-arg]
+        if "RG_RL_FIXED" in script:
+            count = self._counter.get(key, 0) + 1
+            self._counter[key] = count
+            ttl = self._ttl.setdefault(key, int(args[0]))
+            return [0 if count > int(args[1]) else 1, ttl]
         if "RG_IDEM_RESERVE" in script:
-            reserve_value = str(args[1])
-            ttl = int(args[2])
+            reserve_value = str(args[0])
+            ttl = int(args[1])
             current = self._kv.get(key)
             if current is None:
                 self._kv[key] = reserve_value
@@ -61,9 +65,9 @@ class _FakeRedis:
                 return ["RESERVED"]
             return ["EXISTS", current]
         if "RG_IDEM_COMPLETE" in script:
-            fingerprint = str(args[1])
-            completed_value = str(args[2])
-            ttl = int(args[3])
+            fingerprint = str(args[0])
+            completed_value = str(args[1])
+            ttl = int(args[2])
             current = self._kv.get(key)
             if current is None:
                 self._kv[key] = completed_value
@@ -75,96 +79,192 @@ class _FakeRedis:
             self._kv[key] = completed_value
             self._ttl[key] = ttl
             return ["COMPLETED"]
-        raise AssertionError("unexpected eval script")
+        raise AssertionError("unexpected script")
 
 
-def test_rate_limiter_blocks_after_limit() -> None:
+@pytest.mark.asyncio
+async def test_rate_limiter_blocks_after_limit() -> None:
     limiter = InMemoryRateLimiter()
-    limiter.check("u1:/x:write", limit=2, window_seconds=60)
-    limiter.check("u1:/x:write", limit=2, window_seconds=60)
+    await limiter.check("u1:/x:write", limit=2, window_seconds=60)
+    await limiter.check("u1:/x:write", limit=2, window_seconds=60)
     try:
-        limiter.check("u1:/x:write", limit=2, window_seconds=60)
+        await limiter.check("u1:/x:write", limit=2, window_seconds=60)
         assert False, "expected rate limit exception"
     except HTTPException as exc:
         assert exc.status_code == 429
         assert exc.detail["code"] == "RATE_LIMITED"
 
 
-def test_idempotency_fingerprint_and_replay() -> None:
+@pytest.mark.asyncio
+async def test_idempotency_fingerprint_and_replay() -> None:
     store = InMemoryIdempotencyStore()
     payload = {"a": 1, "b": "x"}
     fp = store.fingerprint(payload)
-    store.set("idem-1", fingerprint=fp, status_code=200, response={"ok": True}, ttl_seconds=60)
-    cached = store.ensure(key="idem-1", payload=payload)
+    await store.set("idem-1", fingerprint=fp, status_code=200, response={"ok": True}, ttl_seconds=60)
+    cached = await store.ensure(key="idem-1", payload=payload)
     assert cached is not None
     assert cached["response"]["ok"] is True
 
 
-def test_idempotency_mismatch_raises_conflict() -> None:
+@pytest.mark.asyncio
+async def test_idempotency_mismatch_raises_conflict() -> None:
     store = InMemoryIdempotencyStore()
     payload = {"a": 1}
-    store.set("idem-1", fingerprint=store.fingerprint(payload), status_code=200, response={"ok": True}, ttl_seconds=60)
+    await store.set("idem-1", fingerprint=store.fingerprint(payload), status_code=200, response={"ok": True}, ttl_seconds=60)
     try:
-        store.ensure(key="idem-1", payload={"a": 2})
+        await store.ensure(key="idem-1", payload={"a": 2})
         assert False, "expected idempotency conflict"
     except HTTPException as exc:
         assert exc.status_code == 409
         assert exc.detail["code"] == "IDEMPOTENCY_KEY_REUSE_MISMATCH"
 
 
-def test_idempotency_in_progress_raises_conflict() -> None:
+@pytest.mark.asyncio
+async def test_idempotency_in_progress_raises_conflict() -> None:
     store = InMemoryIdempotencyStore()
     payload = {"a": 1}
-    assert store.ensure(key="idem-1", payload=payload) is None
+    assert (await store.ensure(key="idem-1", payload=payload)) is None
     try:
-        store.ensure(key="idem-1", payload=payload)
+        await store.ensure(key="idem-1", payload=payload)
         assert False, "expected in progress conflict"
     except HTTPException as exc:
         assert exc.status_code == 409
         assert exc.detail["code"] == "IDEMPOTENCY_IN_PROGRESS"
 
 
-def test_redis_rate_limiter_blocks_after_limit() -> None:
+@pytest.mark.asyncio
+async def test_redis_rate_limiter_blocks_after_limit() -> None:
     limiter = RedisRateLimiter(_FakeRedis(), key_prefix="test")
-    limiter.check("u1:/x:write", limit=2, window_seconds=60)
-    limiter.check("u1:/x:write", limit=2, window_seconds=60)
+    await limiter.check("u1:/x:write", limit=2, window_seconds=60)
+    await limiter.check("u1:/x:write", limit=2, window_seconds=60)
     try:
-        limiter.check("u1:/x:write", limit=2, window_seconds=60)
+        await limiter.check("u1:/x:write", limit=2, window_seconds=60)
         assert False, "expected rate limit exception"
     except HTTPException as exc:
         assert exc.status_code == 429
         assert exc.detail["code"] == "RATE_LIMITED"
 
 
-def test_redis_idempotency_fingerprint_and_replay() -> None:
+@pytest.mark.asyncio
+async def test_redis_idempotency_fingerprint_and_replay() -> None:
     store = RedisIdempotencyStore(_FakeRedis(), key_prefix="test")
     payload = {"a": 1, "b": "x"}
     fp = store.fingerprint(payload)
-    store.set("idem-1", fingerprint=fp, status_code=200, response={"ok": True}, ttl_seconds=60)
-    cached = store.ensure(key="idem-1", payload=payload)
+    await store.set("idem-1", fingerprint=fp, status_code=200, response={"ok": True}, ttl_seconds=60)
+    cached = await store.ensure(key="idem-1", payload=payload)
     assert cached is not None
     assert cached["response"]["ok"] is True
 
 
-def test_redis_idempotency_mismatch_raises_conflict() -> None:
+@pytest.mark.asyncio
+async def test_redis_idempotency_mismatch_raises_conflict() -> None:
     store = RedisIdempotencyStore(_FakeRedis(), key_prefix="test")
     payload = {"a": 1}
-    store.set("idem-1", fingerprint=store.fingerprint(payload), status_code=200, response={"ok": True}, ttl_seconds=60)
+    await store.set("idem-1", fingerprint=store.fingerprint(payload), status_code=200, response={"ok": True}, ttl_seconds=60)
     try:
-        store.ensure(key="idem-1", payload={"a": 2})
+        await store.ensure(key="idem-1", payload={"a": 2})
         assert False, "expected idempotency conflict"
     except HTTPException as exc:
         assert exc.status_code == 409
         assert exc.detail["code"] == "IDEMPOTENCY_KEY_REUSE_MISMATCH"
 
 
-def test_redis_idempotency_in_progress_raises_conflict() -> None:
+@pytest.mark.asyncio
+async def test_redis_idempotency_in_progress_raises_conflict() -> None:
     store = RedisIdempotencyStore(_FakeRedis(), key_prefix="test")
     payload = {"a": 1}
-    assert store.ensure(key="idem-1", payload=payload) is None
+    assert (await store.ensure(key="idem-1", payload=payload)) is None
     try:
-        store.ensure(key="idem-1", payload=payload)
+        await store.ensure(key="idem-1", payload=payload)
         assert False, "expected in progress conflict"
     except HTTPException as exc:
         assert exc.status_code == 409
         assert exc.detail["code"] == "IDEMPOTENCY_IN_PROGRESS"
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_limiter_counts_previous_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [1_000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    limiter = InMemoryRateLimiter("sliding")
+    for _ in range(4):
+        await limiter.check("u1:/x:write", limit=4, window_seconds=10)
+    # 다음 창 25% 지점: 이전 창 4건 x 0.75 = 3 → 1건만 추가 허용
+    clock[0] = 1_012.5
+    await limiter.check("u1:/x:write", limit=4, window_seconds=10)
+    with pytest.raises(HTTPException) as exc:
+        await limiter.check("u1:/x:write", limit=4, window_seconds=10)
+    assert exc.value.status_code == 429
+    # 두 창 이상 지나면 이전 창 기록은 버려진다
+    clock[0] = 1_040.0
+    await limiter.check("u1:/x:write", limit=4, window_seconds=10)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limiter_refills_over_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [1_000.0]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+    limiter = InMemoryRateLimiter("token_bucket")
+    for _ in range(6):
+        await limiter.check("u1:/x:write", limit=6, window_seconds=60)
+    with pytest.raises(HTTPException) as exc:
+        await limiter.check("u1:/x:write", limit=6, window_seconds=60)
+    assert exc.value.detail["retry_after_seconds"] == 10
+    clock[0] += 10  # 6 tokens / 60s → 10초에 1개
+    await limiter.check("u1:/x:write", limit=6, window_seconds=60)
+
+
+def test_rate_limiter_rejects_unknown_strategy() -> None:
+    with pytest.raises(ValueError):
+        InMemoryRateLimiter("leaky")
+    with pytest.raises(ValueError):
+        RedisRateLimiter(_FakeRedis(), strategy="leaky")
+
+
+@pytest.mark.asyncio
+async def test_redis_clear_unlinks_in_batches() -> None:
+    client = _FakeRedis()
+    limiter = RedisRateLimiter(client, key_prefix="test")
+    for i in range(1_200):
+        await limiter.check(f"u{i}:/x:write", limit=5)
+    client.calls = 0
+    await limiter.clear()
+    assert client._counter == {}
+    assert client.calls == 3  # 500 + 500 + 200
+
+
+@pytest.mark.asyncio
+async def test_redis_rate_limiter_does_not_stall_event_loop_at_2k_rps() -> None:
+    """2k req/s 로 check 를 흘려보내는 동안 이벤트 루프 지연(lag)이 작게 유지되어야 한다."""
+    client = _FakeRedis(rtt_seconds=0.002)
+    limiter = RedisRateLimiter(client, key_prefix="test")
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def monitor() -> None:
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - start - 0.005)
+
+    async def one(i: int) -> bool:
+        try:
+            await limiter.check(f"u{i % 50}:/x:write", limit=30, window_seconds=60)
+            return True
+        except HTTPException:
+            return False
+
+    watcher = asyncio.create_task(monitor())
+    tasks = []
+    start = time.perf_counter()
+    for i in range(2_000):
+        tasks.append(asyncio.create_task(one(i)))
+        if i % 20 == 19:  # 20건씩 10ms 간격 → 2,000 req/s
+            await asyncio.sleep(max(0.0, start + (i + 1) / 2_000 - time.perf_counter()))
+    results = await asyncio.gather(*tasks)
+    done.set()
+    await watcher
+
+    assert client.calls == 2_000  # check 1건 = 스크립트 호출 1회
+    assert sum(results) == 50 * 30
+    assert lags and max(lags) < 0.05